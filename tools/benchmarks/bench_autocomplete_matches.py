@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2024, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+# This utility measures the time taken to find the completions matching the
+# word typed in the Query Tool, in a synthetic catalog of a large number of
+# names (e.g. the columns and functions of a large database), with the
+# collection scanned for every keystroke and with the collection indexed.
+
+import argparse
+import builtins
+import os
+import random
+import sys
+import time
+from collections import OrderedDict
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.realpath(__file__)),
+                                '..', '..', 'web'))
+
+builtins.SERVER_MODE = None
+
+import config  # noqa: E402,F401
+from pgadmin.utils.sqlautocomplete import autocomplete  # noqa: E402
+from pgadmin.utils.sqlautocomplete.autocomplete import \
+    SQLAutoComplete  # noqa: E402
+from pgadmin.utils.sqlautocomplete.prioritization import \
+    PrevalenceCounter  # noqa: E402
+
+WORDS = ['customer', 'order', 'item', 'invoice', 'payment', 'address',
+         'product', 'stock', 'price', 'status', 'created', 'updated', 'id',
+         'name', 'code', 'total', 'tax', 'Region', 'user', 'log']
+
+# The words typed, one keystroke after the other.
+TYPED = ['cust', 'invoice_t', 'regi', 'xyz']
+
+
+def catalog(size):
+    rand = random.Random(size)
+    names = []
+    for idx in range(size):
+        name = '_'.join(rand.choice(WORDS) for _ in range(rand.randint(1, 4)))
+        if idx % 50 == 0:
+            name = '"{0}"'.format(name.title())
+        names.append('{0}_{1}'.format(name, idx))
+    return names
+
+
+def measure(collection, mode, indexed):
+    completer = SQLAutoComplete.__new__(SQLAutoComplete)
+    completer.prioritizer = PrevalenceCounter([])
+    completer.match_indexes = OrderedDict()
+    min_size = 0 if indexed else float('inf')
+
+    results = []
+    keystrokes = 0
+    start = time.perf_counter()
+    with patch.object(autocomplete, 'MATCH_INDEX_MIN_SIZE', min_size):
+        for word in TYPED:
+            for end in range(1, len(word) + 1):
+                results.append(completer.find_matches(
+                    word[:end], collection, mode=mode, meta='column'))
+                keystrokes += 1
+    elapsed = time.perf_counter() - start
+
+    return results, elapsed / keystrokes
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Measure the time taken to find the completions of a '
+                    'word in a large catalog, with and without indexing the '
+                    'names.')
+    parser.add_argument('--names', type=int, default=200000,
+                        help='number of names in the catalog')
+    args = parser.parse_args()
+
+    collection = catalog(args.names)
+    print('{0} names, {1} keystrokes'.format(
+        len(collection), sum(len(word) for word in TYPED)))
+    print('{0:>8} {1:>18} {2:>18}'.format(
+        'mode', 'scanned (ms/key)', 'indexed (ms/key)'))
+
+    for mode in ('strict', 'fuzzy'):
+        expected, scanned = measure(collection, mode, False)
+        result, indexed = measure(collection, mode, True)
+        assert result == expected, 'The matches are different'
+
+        print('{0:>8} {1:>18.1f} {2:>18.1f}'.format(
+            mode, scanned * 1000, indexed * 1000))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2024, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+# This utility counts the round-trips to the server and measures the time
+# taken to check which collections of a schema node have objects (as done
+# when the node is expanded in the object explorer), with a query per
+# collection and with the queries of all the collections batched.
+#
+# The server is simulated by a connection adding the given latency to every
+# round-trip, e.g. to reproduce a connection over an SSH tunnel.
+
+import argparse
+import builtins
+import os
+import re
+import sys
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.realpath(__file__)),
+                                '..', '..', 'web'))
+
+builtins.SERVER_MODE = None
+
+import config  # noqa: E402,F401
+from pgadmin.browser import collection  # noqa: E402
+from pgadmin.browser.collection import CollectionNodeModule  # noqa: E402
+from pgadmin.browser.utils import CollectionCountBatch  # noqa: E402
+
+# The collections of a schema node, a third of which are empty.
+SCHEMA_COLLECTIONS = [
+    'aggregate', 'collation', 'domain', 'fts_configuration', 'fts_dictionary',
+    'fts_parser', 'fts_template', 'foreign_table', 'function', 'operator',
+    'mview', 'procedure', 'sequence', 'table', 'trigger_function', 'type',
+    'view', 'synonym', 'package', 'edbfunc'
+]
+
+COUNT_SQL = re.compile(r'FROM (\w+)')
+BATCHED_SQL = re.compile(
+    r'SELECT (\d+) AS idx, c.count FROM \(\n.*?FROM (\w+)', re.S)
+
+
+class Connection:
+    """Connection to a simulated server, counting the round-trips."""
+
+    def __init__(self, latency):
+        self.latency = latency
+        self.round_trips = 0
+
+    def execute_dict(self, sql):
+        self.round_trips += 1
+        time.sleep(self.latency)
+
+        def count(name):
+            return SCHEMA_COLLECTIONS.index(name) % 3
+
+        if 'UNION ALL' in sql:
+            return True, {'rows': [
+                {'idx': int(idx), 'count': count(name)}
+                for idx, name in BATCHED_SQL.findall(sql)
+            ]}
+        return True, {'rows': [
+            {'count': count(COUNT_SQL.search(sql).group(1))}]}
+
+
+def module(node_type):
+    return SimpleNamespace(
+        node_type=node_type, show_system_objects=False,
+        pref_show_empty_coll_nodes=MagicMock(
+            get=MagicMock(return_value=False)))
+
+
+def get_children_nodes(scid):
+    nodes = []
+    for node_type in SCHEMA_COLLECTIONS:
+        if CollectionNodeModule.has_nodes(module(node_type), 1, 2,
+                                          scid=scid,
+                                          base_template_path=node_type):
+            nodes.append({'_type': 'coll-' + node_type, 'label': node_type})
+    return nodes
+
+
+def expand(batched, scid):
+    if not batched:
+        return get_children_nodes(scid)
+
+    with CollectionCountBatch() as batch:
+        return batch.filter(get_children_nodes(scid))
+
+
+def measure(batched, latency, iterations):
+    conn = Connection(latency)
+    manager = MagicMock(server_type='pg', version=160000)
+    manager.connection.return_value = conn
+
+    with patch.object(collection, 'get_driver') as get_driver, \
+            patch.object(collection, 'render_template',
+                         lambda path, **kwargs:
+                         'SELECT COUNT(*)\nFROM {0}\nWHERE nsp = {1};'.format(
+                             path.split('/')[0], kwargs['scid'])):
+        get_driver.return_value.connection_manager.return_value = manager
+
+        start = time.perf_counter()
+        for scid in range(iterations):
+            nodes = expand(batched, scid)
+        elapsed = time.perf_counter() - start
+
+    return nodes, conn.round_trips / iterations, elapsed / iterations
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Count the round-trips to the server when expanding a '
+                    'schema node, with and without batching the queries of '
+                    'the collections.')
+    parser.add_argument('--latency', type=float, default=0.05,
+                        help='latency of a round-trip in seconds')
+    parser.add_argument('--iterations', type=int, default=5)
+    args = parser.parse_args()
+
+    expected, trips, single = measure(False, args.latency, args.iterations)
+    result, batched_trips, batched = measure(True, args.latency,
+                                             args.iterations)
+
+    assert result == expected, 'The nodes are different'
+
+    print('{0} collections, {1} with objects, {2:.0f} ms latency'.format(
+        len(SCHEMA_COLLECTIONS), len(result), args.latency * 1000))
+    print('{0:>24} {1:>12} {2:>16}'.format(
+        'count queries', 'round-trips', 'time/expand (s)'))
+    print('{0:>24} {1:>12.0f} {2:>16.3f}'.format(
+        'one per collection', trips, single))
+    print('{0:>24} {1:>12.0f} {2:>16.3f}'.format(
+        'batched', batched_trips, batched))
+
+
+if __name__ == '__main__':
+    main()
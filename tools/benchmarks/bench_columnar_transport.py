@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2024, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+# This utility compares the JSON and the columnar result transport of the
+# Query Tool poll/fetch endpoints. For a synthetic result set it reports the
+# bytes sent on the wire and the server CPU time spent encoding every 10k
+# rows.
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.realpath(__file__)),
+                                '..', '..', 'web'))
+
+import config  # noqa: E402,F401
+from pgadmin.utils.ajax import DataTypeJSONEncoder  # noqa: E402
+from pgadmin.utils.columnar import encode_frame, decode_frame  # noqa: E402
+
+
+def generate_rows(num_rows, num_cols):
+    """Generate rows shaped like the output of async_fetchmany_2darray."""
+    rnd = random.Random(42)
+    makers = [
+        lambda: rnd.randint(-2 ** 31, 2 ** 31),
+        lambda: rnd.random() * 1000,
+        lambda: rnd.choice((True, False, None)),
+        lambda: 'value-{0}'.format(rnd.randint(0, 10 ** 6)),
+        lambda: None if rnd.random() < 0.2 else '2024-01-{0:02d}'.format(
+            rnd.randint(1, 28)),
+    ]
+    col_makers = [makers[idx % len(makers)] for idx in range(num_cols)]
+    return [tuple(make() for make in col_makers) for _ in range(num_rows)]
+
+
+def encode_json(envelope, rows):
+    envelope['data']['result'] = rows
+    return json.dumps(envelope, cls=DataTypeJSONEncoder,
+                      separators=(',', ':')).encode('utf-8')
+
+
+def encode_columnar(envelope, rows):
+    envelope['data']['result'] = None
+    return encode_frame(envelope, rows)
+
+
+def measure(encoder, decoder, rows, repeat):
+    envelope = {'success': 1, 'errormsg': '', 'info': '', 'result': None,
+                'data': {'status': 'Success', 'result': None}}
+    payload = b''
+    start = time.process_time()
+    for _ in range(repeat):
+        payload = encoder(envelope, rows)
+    encode_time = (time.process_time() - start) / repeat
+
+    start = time.process_time()
+    for _ in range(repeat):
+        decoder(payload)
+    decode_time = (time.process_time() - start) / repeat
+    return len(payload), encode_time, decode_time
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Compare JSON and columnar Query Tool result transport.')
+    parser.add_argument('--rows', type=int, default=10000)
+    parser.add_argument('--columns', type=int, nargs='+',
+                        default=[5, 20, 50])
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    per = 10000.0 / args.rows
+    print('{0:>8} {1:>10} {2:>12} {3:>12} {4:>12}'.format(
+        'columns', 'transport', 'bytes/10k', 'encode ms', 'decode ms'))
+    for num_cols in args.columns:
+        rows = generate_rows(args.rows, num_cols)
+        for name, encoder, decoder in (
+            ('json', encode_json, json.loads),
+            ('columnar', encode_columnar, decode_frame),
+        ):
+            size, enc, dec = measure(encoder, decoder, rows, args.repeat)
+            print('{0:>8} {1:>10} {2:>12.0f} {3:>12.2f} {4:>12.2f}'.format(
+                num_cols, name, size * per, enc * per * 1000,
+                dec * per * 1000))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2024, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+# This utility compares the time taken by the DictWriter (one dict per row,
+# every field prepared through the quote strategy) and the BatchWriter to
+# write a result set as CSV, and checks that both produce the same output.
+
+import argparse
+import os
+import random
+import sys
+import time
+from io import StringIO
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.realpath(__file__)),
+                                '..', '..', 'web'))
+
+import config  # noqa: E402,F401
+from pgadmin.utils import csv  # noqa: E402
+
+
+def build_rows(num_rows):
+    rnd = random.Random(42)
+    return [
+        (idx, 'name {0}'.format(idx), str(rnd.random() * 1000),
+         rnd.random() > 0.5, '{"key": "value \'%d\'"}' % idx,
+         '2024-01-02 10:11:12', None if idx % 7 else 'note, with "quotes"',
+         rnd.randint(-1000, 1000))
+        for idx in range(num_rows)
+    ]
+
+
+def dict_writer(header, batches, params):
+    chunks = []
+    replace_nulls_with = params['replace_nulls_with']
+    for idx, batch in enumerate(batches):
+        res_io = StringIO()
+        writer = csv.DictWriter(res_io, fieldnames=header, **params)
+        if idx == 0:
+            writer.writeheader()
+        rows = [dict(zip(header, row)) for row in batch]
+        if replace_nulls_with is not None:
+            rows = [{k: replace_nulls_with if v is None else v
+                     for k, v in row.items()} for row in rows]
+        writer.writerows(rows)
+        chunks.append(res_io.getvalue())
+    return ''.join(chunks)
+
+
+def batch_writer(header, batches, params):
+    chunks = []
+    res_io = StringIO()
+    writer = csv.BatchWriter(res_io, **params)
+    writer.writeheader(header)
+    for batch in batches:
+        writer.writerows(batch)
+        chunks.append(res_io.getvalue())
+        res_io.seek(0)
+        res_io.truncate()
+    return ''.join(chunks)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Compare the CSV writers used for the query download.')
+    parser.add_argument('--rows', type=int, default=200000)
+    parser.add_argument('--batch', type=int, default=2000)
+    args = parser.parse_args()
+
+    header = ['id', 'name', 'price', 'flag', 'data', 'created', 'note', 'n']
+    rows = build_rows(args.rows)
+    batches = [rows[idx:idx + args.batch]
+               for idx in range(0, len(rows), args.batch)]
+
+    print('{0:>8} {1:>8} {2:>12} {3:>12} {4:>8}'.format(
+        'quoting', 'nulls', 'dict (s)', 'batch (s)', 'speedup'))
+    for quote_name, quoting in (('strings', csv.QUOTE_NONNUMERIC),
+                                ('all', csv.QUOTE_ALL),
+                                ('none', csv.QUOTE_NONE)):
+        for replace_nulls_with in (None, 'NULL'):
+            params = dict(delimiter=',', quoting=quoting, quotechar="'",
+                          replace_nulls_with=replace_nulls_with)
+            start = time.perf_counter()
+            expected = dict_writer(header, batches, params)
+            dict_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            output = batch_writer(header, batches, params)
+            batch_time = time.perf_counter() - start
+
+            if output != expected:
+                raise AssertionError(
+                    'Output differs for quoting={0}'.format(quote_name))
+
+            print('{0:>8} {1:>8} {2:>12.3f} {3:>12.3f} {4:>7.1f}x'.format(
+                quote_name, str(replace_nulls_with), dict_time, batch_time,
+                dict_time / batch_time))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2024, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+# This utility counts the queries run against the configuration database to
+# read the user preferences, with and without the preference cache, for:
+#  - a Query Tool poll (the UI language and on_demand_record_count), and
+#  - loading all the Query Tool preferences (as the preferences dialog does).
+#
+# It uses a temporary configuration database.
+
+import argparse
+import builtins
+import os
+import sys
+import tempfile
+import time
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.realpath(__file__)),
+                                '..', '..', 'web'))
+
+builtins.SERVER_MODE = None
+
+import config  # noqa: E402
+from flask import Flask  # noqa: E402
+from flask_babel import Babel  # noqa: E402
+from sqlalchemy import event  # noqa: E402
+
+from pgadmin.model import db, User  # noqa: E402
+from pgadmin.utils import preferences  # noqa: E402
+from pgadmin.utils.preferences import Preferences  # noqa: E402
+
+
+class QueryCounter:
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, *args, **kwargs):
+        self.count += 1
+
+
+def setup(app, db_file):
+    app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///{0}'.format(db_file)
+    app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+    db.init_app(app)
+    db.create_all()
+
+    user = User(email='bench@example.com', username='bench',
+                password='bench', active=True, auth_source='internal')
+    db.session.add(user)
+    db.session.commit()
+
+    # The preferences are read for the current user, which is not logged in
+    # here.
+    preferences.current_user = SimpleNamespace(id=user.id)
+
+    from pgadmin.tools.sqleditor.utils.query_tool_preferences import \
+        register_query_tool_preferences
+
+    module = SimpleNamespace(preference=Preferences('sqleditor', 'Query Tool'))
+    register_query_tool_preferences(module)
+    module.preference.register(
+        'options', 'on_demand_record_count', 'On demand record count',
+        'integer', 1000)
+    misc = Preferences('misc', 'Miscellaneous')
+    misc.register('user_language', 'user_language', 'User language',
+                  'options', 'en', options=[{'value': 'en'}])
+
+    # Some of the preferences are set by the user.
+    for name in ('on_demand_record_count', 'explain_verbose',
+                 'csv_quoting', 'csv_field_separator'):
+        pref = module.preference.preference(name)
+        pref.set(pref.default)
+    misc.preference('user_language').set('en')
+
+    return module.preference
+
+
+def poll(sqleditor):
+    Preferences.raw_value('misc', 'user_language', 'user_language',
+                          preferences.current_user.id)
+    sqleditor.preference('on_demand_record_count').get()
+
+
+def all_preferences(sqleditor):
+    sqleditor.to_json()
+
+
+def measure(func, sqleditor, iterations):
+    counter = QueryCounter()
+    event.listen(db.engine, 'before_cursor_execute', counter)
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func(sqleditor)
+    elapsed = time.perf_counter() - start
+    event.remove(db.engine, 'before_cursor_execute', counter)
+    return counter.count / iterations, elapsed / iterations * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Count the configuration database queries run to read '
+                    'the user preferences.')
+    parser.add_argument('--iterations', type=int, default=200)
+    args = parser.parse_args()
+
+    app = Flask(__name__)
+    Babel(app)
+    with tempfile.TemporaryDirectory() as tmp_dir, app.app_context():
+        sqleditor = setup(app, os.path.join(tmp_dir, 'pgadmin4.db'))
+
+        print('{0:>18} {1:>8} {2:>16} {3:>12}'.format(
+            'operation', 'cache', 'queries (each)', 'time (ms)'))
+        for name, func in (('poll', poll),
+                           ('all preferences', all_preferences)):
+            for timeout in (0, 60):
+                config.USER_PREFERENCES_CACHE_TIMEOUT = timeout
+                Preferences.invalidate_cache()
+                queries, elapsed = measure(func, sqleditor, args.iterations)
+                print('{0:>18} {1:>8} {2:>16.2f} {3:>12.3f}'.format(
+                    name, 'on' if timeout else 'off', queries, elapsed))
+
+        print('cache: {0}'.format(Preferences.cache_stats()))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2024, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+# This utility compares the time taken by the Schema Diff to compare the
+# objects of a synthetic schema (20000 objects by default, of which 1% are
+# different) with and without the digest of the objects, and checks that
+# both produce the same result.
+
+import argparse
+import builtins
+import copy
+import json
+import os
+import random
+import sys
+import time
+from unittest.mock import MagicMock, patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.realpath(__file__)),
+                                '..', '..', 'web'))
+
+builtins.SERVER_MODE = None
+
+import config  # noqa: E402,F401
+from flask import Flask  # noqa: E402
+from flask_babel import Babel  # noqa: E402
+
+from pgadmin.tools.schema_diff import directory_compare  # noqa: E402
+
+IGNORE_KEYS = ['oid', 'oid-2', 'is_sys_obj', 'schema', 'xmin']
+
+
+def build_object(rnd, idx):
+    return {
+        'oid': 16384 + idx,
+        'name': 'func_{0}'.format(idx),
+        'xmin': str(rnd.randint(1, 100000)),
+        'funcowner': 'postgres',
+        'lanname': 'plpgsql',
+        'prosrc': '\nBEGIN\n    RETURN a + {0};\nEND;\n'.format(idx),
+        'provolatile': 'v',
+        'procost': 100,
+        'description': None if idx % 3 else 'function {0}'.format(idx),
+        'arguments': [
+            {'argid': argid, 'argtype': 'integer', 'argmode': 'IN',
+             'argname': 'a{0}'.format(argid), 'argdefval': None}
+            for argid in range(rnd.randint(0, 4))],
+        'variables': [{'name': 'search_path', 'value': 'public'}],
+        'acl': [{'grantee': 'PUBLIC', 'grantor': 'postgres',
+                 'privileges': [{'privilege_type': 'X', 'privilege': True,
+                                 'with_grant': False}]}],
+        'seclabels': [],
+    }
+
+
+def build_schemas(num_objects, pct_different):
+    rnd = random.Random(42)
+    source = {}
+    target = {}
+    for idx in range(num_objects):
+        obj = build_object(rnd, idx)
+        key = '{0}(integer)'.format(obj['name'])
+        source[key] = obj
+
+        obj = copy.deepcopy(obj)
+        obj['oid'] += 100000
+        obj['xmin'] = str(rnd.randint(1, 100000))
+        if rnd.random() * 100 < pct_different:
+            obj['prosrc'] = obj['prosrc'].replace('a +', 'a -')
+        # The catalog may return the lists in a different order.
+        obj['arguments'].reverse()
+        target[key] = obj
+    return source, target
+
+
+def view_object():
+    view = MagicMock()
+    view.get_sql_from_diff.side_effect = \
+        lambda **kwargs: json.dumps(kwargs, sort_keys=True, default=str)
+    view.get_dependencies.return_value = []
+    return view
+
+
+def compare(source, target):
+    result = directory_compare.compare_dictionaries(
+        view_object=view_object(), source_params={'sid': 1, 'did': 1},
+        target_params={'sid': 2, 'did': 2}, target_schema='public',
+        source_dict=source, target_dict=target, node='function',
+        node_label='Functions', group_name='public', ignore_keys=IGNORE_KEYS,
+        ignore_owner=False, ignore_whitespaces=False,
+        ignore_tablespace=False, ignore_grants=False)
+    for item in result:
+        del item['id']
+    return sorted(result, key=lambda item: item['title'])
+
+
+def measure(source, target, iterations, use_digest):
+    elapsed = 0
+    result = None
+    for _ in range(iterations):
+        if use_digest:
+            start = time.perf_counter()
+            result = compare(source, target)
+        else:
+            with patch.object(directory_compare, 'object_digest',
+                              return_value=None):
+                start = time.perf_counter()
+                result = compare(source, target)
+        elapsed += time.perf_counter() - start
+    return result, elapsed / iterations
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Compare the time taken by the Schema Diff to compare '
+                    'the objects with and without the digest of the objects.')
+    parser.add_argument('--objects', type=int, default=20000)
+    parser.add_argument('--different', type=float, default=1,
+                        help='percentage of the objects which are different')
+    parser.add_argument('--iterations', type=int, default=3)
+    args = parser.parse_args()
+
+    source, target = build_schemas(args.objects, args.different)
+
+    app = Flask(__name__)
+    Babel(app)
+    with app.app_context():
+        expected, deep = measure(source, target, args.iterations, False)
+        result, digest = measure(source, target, args.iterations, True)
+
+    assert result == expected, 'The results are different'
+
+    num_different = len([item for item in result
+                         if item['status'] == 'Different'])
+    print('{0} objects, {1} different'.format(args.objects, num_different))
+    print('{0:>24} {1:>10}'.format('comparison', 'time (s)'))
+    print('{0:>24} {1:>10.3f}'.format('recursive', deep))
+    print('{0:>24} {1:>10.3f}'.format('digest', digest))
+    print('speedup: {0:.1f}x'.format(deep / digest))
+
+
+if __name__ == '__main__':
+    main()
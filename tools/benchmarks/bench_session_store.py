@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2024, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+# This utility compares the session bytes written per request by the file
+# backed and the SQLite session managers, under a simulated Query Tool
+# paging workload: a session holding a few open Query Tool transactions and
+# server manager data, where every request updates one transaction.
+
+import argparse
+import os
+import pickle
+import random
+import secrets
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.realpath(__file__)),
+                                '..', '..', 'web'))
+
+import config  # noqa: E402,F401
+from flask import Flask  # noqa: E402
+from pgadmin.utils.session import FileBackedSessionManager, \
+    SQLiteSessionManager  # noqa: E402
+
+
+def build_session(session, num_transactions, num_servers):
+    rnd = random.Random(42)
+    session['_user_id'] = '1'
+    session['_fresh'] = True
+    session['auth_source_manager'] = {'current_source': 'internal',
+                                      'source_friendly_name': 'internal'}
+    session['__pgsql_server_managers'] = {
+        sid: pickle.dumps({'sid': sid, 'databases': {
+            did: {'conn_id': 'DB:{0}'.format(did), 'database': 'db'}
+            for did in range(20)
+        }, 'password': secrets.token_bytes(64)}, -1)
+        for sid in range(num_servers)
+    }
+    session['gridData'] = {
+        str(trans_id): {
+            'command_obj': secrets.token_bytes(rnd.randint(1500, 3000)),
+            'columns_info': {'col{0}'.format(i): {'type_code': 25}
+                             for i in range(30)},
+            'client_primary_key': '__temp_PK',
+        }
+        for trans_id in range(num_transactions)
+    }
+    return list(session['gridData'].keys())
+
+
+def run(manager, size_of_write, requests, num_transactions, num_servers):
+    app = Flask(__name__)
+    with app.test_request_context('/sqleditor/fetch/1'):
+        session = manager.new_session()
+        trans_ids = build_session(session, num_transactions, num_servers)
+        manager.put(session)
+
+        written = 0
+        start = time.process_time()
+        for idx in range(requests):
+            # A fetch request updates the paged transaction
+            grid_data = session['gridData']
+            grid_data[trans_ids[idx % len(trans_ids)]]['command_obj'] = \
+                secrets.token_bytes(2000)
+            session['gridData'] = grid_data
+            session['last_request'] = idx
+            session.force_write = True
+            manager.put(session)
+            written += size_of_write(session)
+        cpu = time.process_time() - start
+    return written / requests, cpu / requests
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Compare the session bytes written per request.')
+    parser.add_argument('--requests', type=int, default=500)
+    parser.add_argument('--transactions', type=int, default=5)
+    parser.add_argument('--servers', type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_manager = FileBackedSessionManager(
+            os.path.join(tmp_dir, 'sessions'), 'secret', 0)
+
+        sqlite_manager = SQLiteSessionManager(
+            os.path.join(tmp_dir, 'sessions.db'), 'secret', 0)
+        sqlite_written = []
+        write_keys = sqlite_manager._write_keys
+
+        def counting_write_keys(session, changed, removed, current_time):
+            sqlite_written.append(sum(
+                len(sid) + len(key) + len(value)
+                for sid, key, value in changed))
+            write_keys(session, changed, removed, current_time)
+        sqlite_manager._write_keys = counting_write_keys
+
+        results = (
+            ('file', run(
+                file_manager,
+                lambda session: os.path.getsize(
+                    os.path.join(tmp_dir, 'sessions', session.sid)),
+                args.requests, args.transactions, args.servers)),
+            ('sqlite', run(
+                sqlite_manager,
+                lambda session: sqlite_written[-1],
+                args.requests, args.transactions, args.servers)),
+        )
+
+    print('{0:>8} {1:>16} {2:>16}'.format(
+        'backend', 'bytes/request', 'cpu ms/request'))
+    for name, (size, cpu) in results:
+        print('{0:>8} {1:>16.0f} {2:>16.3f}'.format(name, size, cpu * 1000))
+
+
+if __name__ == '__main__':
+    main()
@@ -339,6 +339,11 @@ ALLOW_SAVE_PASSWORD = True
 # Maximum number of history queries stored per user/server/database
 MAX_QUERY_HIST_STORED = 20
 
+# The query history entries saved within this many seconds are written to
+# the configuration database together, from a background thread. Set to 0
+# to write every entry in the request saving it.
+QUERY_HISTORY_WRITE_DELAY = 0.5
+
 ##########################################################################
 # Server-side session storage path
 #
@@ -361,6 +366,20 @@ MAX_QUERY_HIST_STORED = 20
 ##########################################################################
 SESSION_DB_PATH = os.path.join(DATA_DIR, 'sessions')
 
+##########################################################################
+# Server-side session storage backend
+#
+# 'file'   - Each session is stored in a file in SESSION_DB_PATH, the whole
+#            session is rewritten on every update.
+# 'sqlite' - Sessions are stored in the SQLite database SESSION_SQLITE_PATH,
+#            only the top level keys of the session which have been
+#            modified are rewritten on update. Set SESSION_SQLITE_PATH to
+#            SQLITE_PATH to store the sessions in the configuration database.
+##########################################################################
+SESSION_STORE = 'file'
+
+SESSION_SQLITE_PATH = os.path.join(DATA_DIR, 'sessions.db')
+
 SESSION_COOKIE_NAME = 'pga4_session'
 
 ##########################################################################
@@ -435,6 +454,12 @@ CHECK_SUPPORTED_BROWSER = True
 ##########################################################################
 STORAGE_DIR = os.path.join(DATA_DIR, 'storage')
 
+# Number of seconds the listing of a storage directory is reused by the
+# file manager, unless the directory is modified in the meantime. The
+# listings are always refreshed after files are added, renamed or deleted
+# from the file manager. Set to 0 to read the directory every time.
+FILE_MANAGER_LISTING_CACHE_TIMEOUT = 10
+
 ##########################################################################
 # Default locations for binary utilities (pg_dump, pg_restore etc)
 #
@@ -513,6 +538,180 @@ SQLALCHEMY_TRACK_MODIFICATIONS = False
 ##########################################################################
 ON_DEMAND_RECORD_COUNT = 1000
 
+##########################################################################
+# Keep the Query Tool transaction objects in the memory of the pgAdmin
+# process, instead of reading them from the session on every request of the
+# Query Tool. They are still written to the session whenever they are
+# changed (filters, limit, auto commit, new query, fetched rows etc.).
+#
+# The database connections used by the Query Tool are local to the process
+# too, so deployments running multiple worker processes must use sticky
+# sessions. If that is not possible, set this to False to read the
+# transaction object from the session on every request.
+##########################################################################
+QUERY_TOOL_TRANSACTION_REGISTRY = True
+
+##########################################################################
+# Cache the rows of the Query Tool results fetched so far, so that fetching
+# all the rows from the start (select all, copy) and downloading the result
+# do not have to convert the rows fetched earlier again.
+#
+# QUERY_TOOL_RESULT_CACHE_MEMORY is the memory (in bytes) used for the
+# cached rows of all the transactions of a pgAdmin process. Beyond that the
+# rows of the least recently used transactions are evicted. Set
+# QUERY_TOOL_RESULT_CACHE_MEMORY to 0 to disable the cache.
+#
+# QUERY_TOOL_RESULT_CACHE_DISK (disabled by default) allows spilling the
+# rows of the least recently used transactions to temporary files instead,
+# up to the given number of bytes, after which they are evicted. NOTE: The
+# spilled rows (i.e. the query results of the users) are stored on the disk
+# UNENCRYPTED, in the temporary directory of the system, until the result is
+# evicted or the Query Tool closed.
+##########################################################################
+QUERY_TOOL_RESULT_CACHE_MEMORY = 64 * 1024 * 1024
+QUERY_TOOL_RESULT_CACHE_DISK = 0
+
+##########################################################################
+# The rows added in the Data Grid of the Query Tool are saved with a single
+# INSERT statement for up to this many consecutive rows having the same
+# columns, and the rows inserted are then selected back at once. If a batch
+# fails, its rows are inserted one by one to report the row in error. Set
+# to 1 to insert the rows one by one.
+##########################################################################
+DATA_GRID_SAVE_BATCH_SIZE = 1000
+
+##########################################################################
+# The preference values of a user are loaded from the configuration database
+# all at once, and cached in the pgAdmin process for the given number of
+# seconds. The cache is cleared when the preferences are changed, however
+# with multiple worker processes the change may take up to this long to be
+# visible in the other processes. Set to 0 to disable the cache.
+##########################################################################
+USER_PREFERENCES_CACHE_TIMEOUT = 60
+
+##########################################################################
+# Number of worker threads used by Schema Diff to compare the objects of the
+# different schemas and object types concurrently. Every worker opens its
+# own connections to the source and target databases for the duration of
+# the comparison. Set to 1 to compare the objects one after the other over
+# the existing connections.
+##########################################################################
+SCHEMA_DIFF_MAX_WORKERS = 4
+
+##########################################################################
+# Fetch the properties of the objects compared by Schema Diff with a few
+# queries per schema (snapshot), instead of a few queries per object. It is
+# supported by the functions, procedures and trigger functions, and by the
+# tables along with their columns, constraints, indexes and triggers (also
+# loaded by the ERD tool). Set to False to fetch the properties object by
+# object.
+##########################################################################
+SCHEMA_DIFF_CATALOG_SNAPSHOT = True
+
+##########################################################################
+# The ERD tool receives the tables of a database schema by schema, as soon
+# as the tables of every schema are fetched, in messages of up to this many
+# tables. The server then holds the tables of a single schema at a time.
+##########################################################################
+ERD_TABLES_CHUNK_SIZE = 100
+
+##########################################################################
+# The dashboards showing the same graphs of a server or database share a
+# single sampler, which fetches the statistics in the background and pushes
+# them to the dashboards over Socket.IO, instead of every dashboard polling
+# the server. DASHBOARD_SAMPLER_HISTORY is the number of samples kept by a
+# sampler, which are sent to a newly opened dashboard. Set
+# DASHBOARD_SHARED_SAMPLER to False to let every dashboard poll the server.
+##########################################################################
+DASHBOARD_SHARED_SAMPLER = True
+DASHBOARD_SAMPLER_HISTORY = 76
+
+##########################################################################
+# When expanding a node of the object explorer, check whether its child
+# collections have any objects with a single query, instead of a query per
+# collection. Set to False to run a query per collection.
+##########################################################################
+BROWSER_BATCH_COLLECTION_COUNTS = True
+
+##########################################################################
+# Cache the node lists of the object explorer for the objects within a
+# database, so that expanding the same nodes again does not query the
+# catalogs of the database again.
+#
+# CATALOG_CACHE_MEMORY is the memory (in bytes) used for the cached node
+# lists of a pgAdmin process, the least recently used are evicted beyond
+# that. Set to 0 to disable the cache. The node lists of a database are
+# invalidated when its objects are changed through the object explorer, when
+# one of its nodes is refreshed, and after CATALOG_CACHE_TIMEOUT seconds,
+# which bounds how long the changes made outside of this pgAdmin process
+# (and not notified, see below) are not shown in the object explorer.
+#
+# Set CATALOG_CACHE_LISTEN to True to also invalidate them on the
+# notifications of the 'pgadmin_catalog_changed' channel, which are sent by
+# the event trigger described in pgadmin/browser/catalog_cache.py when
+# installed in the database, e.g. on the changes made in the Query Tool.
+# The statistics of the cache are available at /browser/catalog_cache/stats.
+##########################################################################
+CATALOG_CACHE_MEMORY = 32 * 1024 * 1024
+CATALOG_CACHE_TIMEOUT = 30
+CATALOG_CACHE_LISTEN = False
+
+##########################################################################
+# The metadata used by the autocompletion of the Query Tool (keywords,
+# schemas, tables, columns, functions, etc.) is fetched once per database
+# and shared by all the Query Tool tabs connected to it, as long as any of
+# them is open. It is fetched again once the objects of the database are
+# changed through the object explorer or by a DDL statement run in the
+# Query Tool (or notified, see CATALOG_CACHE_LISTEN), and after
+# AUTOCOMPLETE_CACHE_TIMEOUT seconds.
+#
+# AUTOCOMPLETE_CACHE_ROWS is the number of catalog rows kept by a pgAdmin
+# process, the least recently used results are evicted beyond that. Set to
+# 0 to fetch the metadata for every Query Tool tab.
+##########################################################################
+AUTOCOMPLETE_CACHE_ROWS = 500000
+AUTOCOMPLETE_CACHE_TIMEOUT = 600
+
+##########################################################################
+# The Search Objects tool fetches the objects of a database on its first
+# search, and searches their names in memory afterwards. The objects are
+# fetched again once the objects of the database are changed through the
+# object explorer or by a DDL statement run in the Query Tool (or
+# notified, see CATALOG_CACHE_LISTEN), and after
+# SEARCH_OBJECTS_INDEX_TIMEOUT seconds, which bounds how long the changes
+# made outside of this pgAdmin process are not found.
+#
+# SEARCH_OBJECTS_INDEX_MEMORY is the (estimated) memory in bytes used by
+# the name indexes of a pgAdmin process, the least recently used ones are
+# evicted beyond that. The databases with more objects than fit are
+# searched in the catalogs (and their objects fetched again once an hour
+# only). Set to 0 to always search in the catalogs.
+##########################################################################
+SEARCH_OBJECTS_INDEX_MEMORY = 256 * 1024 * 1024
+SEARCH_OBJECTS_INDEX_TIMEOUT = 60
+
+##########################################################################
+# The output of the background processes (backup, restore, maintenance,
+# etc.) is pushed to the process details panel as it is logged, checking
+# the logs every BG_PROCESS_LOG_POLL_INTERVAL seconds, and reading up to
+# BG_PROCESS_LOG_READ_SIZE bytes of every log at a time.
+##########################################################################
+BG_PROCESS_LOG_POLL_INTERVAL = 1
+BG_PROCESS_LOG_READ_SIZE = 1024 * 1024
+
+##########################################################################
+# Number of background processes (backup, restore, maintenance, import/
+# export, etc.) run at once by pgAdmin (BG_PROCESS_MAX_RUNNING), and against
+# the same server (BG_PROCESS_MAX_RUNNING_PER_SERVER). The processes beyond
+# are queued, and started as the running ones complete, by priority and
+# then in turn for the users, oldest first. The completion of the running
+# processes is checked every BG_PROCESS_SCHEDULE_INTERVAL seconds while
+# processes are queued. Set a limit to 0 to remove it.
+##########################################################################
+BG_PROCESS_MAX_RUNNING = 8
+BG_PROCESS_MAX_RUNNING_PER_SERVER = 2
+BG_PROCESS_SCHEDULE_INTERVAL = 2
+
 ##########################################################################
 # Allow users to display Gravatar image for their username in Server mode
 ##########################################################################
@@ -0,0 +1,40 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2024, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""Add the queue time, priority and target server of the background
+processes, which are queued when too many of them are running.
+
+Revision ID: 72c38c1197a6
+Revises: e682438aefa0
+Create Date: 2026-10-18 15:02:27.504113
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '72c38c1197a6'
+down_revision = 'e682438aefa0'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table("process") as batch_op:
+        batch_op.add_column(sa.Column('queued_time', sa.String(),
+                                      nullable=True))
+        batch_op.add_column(sa.Column('priority', sa.Integer(),
+                                      server_default='0', nullable=False))
+        batch_op.add_column(sa.Column('target_server_id', sa.Integer(),
+                                      nullable=True))
+
+
+def downgrade():
+    # pgAdmin only upgrades, downgrade not implemented.
+    pass
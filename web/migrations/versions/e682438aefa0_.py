@@ -0,0 +1,154 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2024, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""Extract the start time, duration, status and query text of the query
+history entries into indexed columns, and index the query text for search.
+
+Revision ID: e682438aefa0
+Revises: ec0f11f9a4e6
+Create Date: 2026-10-18 10:12:41.318532
+
+"""
+import json
+from collections import defaultdict
+
+import sqlalchemy as sa
+from alembic import op, context
+
+# revision identifiers, used by Alembic.
+revision = 'e682438aefa0'
+down_revision = 'ec0f11f9a4e6'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('query_history',
+                  sa.Column('start_time', sa.String(), nullable=True))
+    op.add_column('query_history',
+                  sa.Column('total_time', sa.String(), nullable=True))
+    op.add_column('query_history',
+                  sa.Column('status', sa.Boolean(), nullable=True))
+    op.add_column('query_history',
+                  sa.Column('query_text', sa.String(), nullable=True))
+
+    migrate_history_entries()
+
+    op.create_index('ix_query_history_start_time', 'query_history',
+                    ['uid', 'sid', 'dbname', 'start_time'])
+
+    if context.get_impl().bind.dialect.name == "sqlite":
+        create_history_search_index()
+
+
+def migrate_history_entries():
+    """
+    Fill the new columns from the query info of the entries, and number the
+    entries of every user/server/database in the order they were run (they
+    were numbered cyclically).
+    """
+    meta = sa.MetaData()
+    meta.reflect(op.get_bind(), only=('query_history',))
+    history_table = sa.Table('query_history', meta)
+    columns = history_table.columns
+
+    results = op.get_bind().execute(sa.select(
+        columns.srno, columns.uid, columns.sid, columns.dbname,
+        columns.query_info
+    )).fetchall()
+
+    entries = defaultdict(list)
+    for row in results:
+        try:
+            query_info = json.loads(bytes.fromhex(row.query_info).decode())
+        except Exception:
+            try:
+                query_info = json.loads(row.query_info)
+            except Exception:
+                query_info = {}
+        if not isinstance(query_info, dict):
+            query_info = {}
+
+        entries[(row.uid, row.sid, row.dbname)].append(
+            (row.srno, query_info))
+
+    # Free the numbers of the entries first
+    op.execute(history_table.update().values(srno=-columns.srno))
+
+    for (uid, sid, dbname), key_entries in entries.items():
+        key_entries.sort(
+            key=lambda entry: (str(entry[1].get('start_time') or ''),
+                               entry[0]))
+        for new_srno, (srno, query_info) in enumerate(key_entries, 1):
+            status = query_info.get('status')
+            total_time = query_info.get('total_time')
+            op.execute(
+                history_table.update().where(
+                    columns.uid == uid, columns.sid == sid,
+                    columns.dbname == dbname, columns.srno == -srno
+                ).values(
+                    srno=new_srno,
+                    last_updated_flag='Y'
+                    if new_srno == len(key_entries) else 'N',
+                    start_time=_text(query_info.get('start_time')),
+                    total_time=_text(total_time),
+                    status=status if isinstance(status, bool) else None,
+                    query_text=_text(query_info.get('query'))
+                )
+            )
+
+
+def _text(value):
+    return value if isinstance(value, str) else None
+
+
+def create_history_search_index():
+    """
+    Create the full text index of the query text, kept up to date by
+    triggers. The history is searched with LIKE when FTS5 is not available.
+    """
+    try:
+        op.execute(
+            "CREATE VIRTUAL TABLE query_history_fts USING fts5("
+            "query, uid UNINDEXED, sid UNINDEXED, dbname UNINDEXED, "
+            "srno UNINDEXED)")
+    except Exception:
+        return
+
+    insert_sql = (
+        "INSERT INTO query_history_fts(query, uid, sid, dbname, srno) "
+        "VALUES (new.query_text, new.uid, new.sid, new.dbname, new.srno);")
+    delete_sql = (
+        "DELETE FROM query_history_fts WHERE uid = old.uid AND "
+        "sid = old.sid AND dbname = old.dbname AND srno = old.srno;")
+
+    op.execute(
+        "CREATE TRIGGER query_history_fts_insert AFTER INSERT ON "
+        "query_history WHEN new.query_text IS NOT NULL BEGIN " +
+        insert_sql + " END")
+    op.execute(
+        "CREATE TRIGGER query_history_fts_delete AFTER DELETE ON "
+        "query_history WHEN old.query_text IS NOT NULL BEGIN " +
+        delete_sql + " END")
+    op.execute(
+        "CREATE TRIGGER query_history_fts_update AFTER UPDATE ON "
+        "query_history BEGIN " + delete_sql +
+        " INSERT INTO query_history_fts(query, uid, sid, dbname, srno) "
+        "SELECT new.query_text, new.uid, new.sid, new.dbname, new.srno "
+        "WHERE new.query_text IS NOT NULL; END")
+
+    op.execute(
+        "INSERT INTO query_history_fts(query, uid, sid, dbname, srno) "
+        "SELECT query_text, uid, sid, dbname, srno FROM query_history "
+        "WHERE query_text IS NOT NULL")
+
+
+def downgrade():
+    # pgAdmin only upgrades, downgrade not implemented.
+    pass
@@ -52,6 +52,7 @@ from pgadmin.utils.ajax import make_json_response, internal_server_error, \
 from pgadmin.utils.csrf import pgCSRFProtect
 from pgadmin.utils.preferences import Preferences
 from pgadmin.utils.menu import MenuItem
+from pgadmin.browser.catalog_cache import CatalogCache
 from pgadmin.browser.register_browser_preferences import \
     register_browser_preferences
 from pgadmin.utils.master_password import validate_master_password, \
@@ -635,6 +636,13 @@ def get_nodes():
     return make_json_response(data=nodes)
 
 
+@blueprint.route("/catalog_cache/stats", endpoint="catalog_cache_stats")
+@pga_login_required
+def catalog_cache_stats():
+    """Usage, hit ratio and staleness of the cache of the node lists."""
+    return make_json_response(data=CatalogCache.stats())
+
+
 def form_master_password_response(existing=True, present=False, errmsg=None,
                                   keyring_name='',
                                   invalid_master_password_hook=False):
@@ -0,0 +1,410 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2024, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""
+Process local cache of the node lists of the object explorer.
+
+The responses of the 'nodes' and 'children' requests of the objects within a
+database are cached per server and database, so that expanding the same node
+again (e.g. after reloading the page) does not query the catalogs again.
+The cache holds up to CATALOG_CACHE_MEMORY bytes of responses, the least
+recently used ones are evicted beyond that.
+
+The cached responses of a database are invalidated:
+ - when an object of the database is created, updated or deleted through
+   pgAdmin (any other than GET request to its nodes), the responses of the
+   whole server when the object does not belong to a database,
+ - when a node of the database is refreshed in the object explorer,
+ - when the database notifies the 'pgadmin_catalog_changed' channel, if
+   CATALOG_CACHE_LISTEN is set. This catches the changes made outside of the
+   object explorer (Query Tool, other clients), provided the event trigger
+   below is installed in the database:
+
+    CREATE FUNCTION pgadmin_catalog_changed() RETURNS event_trigger
+    LANGUAGE plpgsql AS $$
+    BEGIN
+        PERFORM pg_catalog.pg_notify('pgadmin_catalog_changed',
+                                     pg_catalog.current_database());
+    END;
+    $$;
+
+    CREATE EVENT TRIGGER pgadmin_catalog_changed ON ddl_command_end
+    EXECUTE FUNCTION pgadmin_catalog_changed();
+    CREATE EVENT TRIGGER pgadmin_catalog_dropped ON sql_drop
+    EXECUTE FUNCTION pgadmin_catalog_changed();
+
+ - after CATALOG_CACHE_TIMEOUT seconds, which bounds how long the changes
+   not notified (or made through another pgAdmin process) go unnoticed.
+
+The responses are only served from the cache while the database is
+connected, otherwise the request is passed to the node view, which reports
+the error of its precondition.
+"""
+
+import re
+import time
+import weakref
+from collections import OrderedDict
+from threading import Lock
+
+from flask import request, Response
+from flask_security import current_user
+
+import config
+from config import PG_DEFAULT_DRIVER
+from pgadmin.utils.driver import get_driver
+from pgadmin.utils.preferences import Preferences
+
+# Channel notified by the event trigger on the changes of the catalogs.
+NOTIFY_CHANNEL = 'pgadmin_catalog_changed'
+
+# Request header sent by the object explorer to refresh a node.
+REFRESH_HEADER = 'X-pgAdmin-Refresh'
+
+# The commands of the nodes, the responses of which are cached.
+CACHED_COMMANDS = ('nodes', 'children')
+
+# The categories of the browser preferences the node lists depend on.
+PREFERENCE_CATEGORIES = ('display', 'node')
+
+# The statements (of a script run in the Query Tool) changing the catalogs.
+# ROLLBACK may undo the changes made earlier in the transaction.
+DDL_RE = re.compile(
+    r'(?:^|;)\s*(?:--[^\n]*\n\s*)*'
+    r'(?:CREATE|ALTER|DROP|COMMENT|GRANT|REVOKE|SECURITY\s+LABEL|'
+    r'IMPORT\s+FOREIGN|ROLLBACK)\b',
+    re.IGNORECASE)
+
+
+class _Entry:
+    __slots__ = ('data', 'mimetype', 'cached_at')
+
+    def __init__(self, data, mimetype, cached_at):
+        self.data = data
+        self.mimetype = mimetype
+        self.cached_at = cached_at
+
+
+class CatalogCache:
+    """
+    class CatalogCache
+
+        Caches the node lists of the object explorer per server and database.
+
+    Class-level Methods:
+    ----------- -------
+    * cacheable(view, kwargs)
+      - Returns whether the response of the request to the node view can be
+        cached.
+
+    * fetch(sid, did, produce)
+      - Returns the cached response of the current request, or the response
+        returned by produce(), which is cached.
+
+    * refreshing()
+      - Returns whether the node is being refreshed by the user, in which
+        case the cached responses must not be used.
+
+    * invalidate(sid, did)
+      - Removes the cached responses of the database (of all the databases
+        of the server if did is None).
+
+    * generation(sid, did)
+      - Returns the number of invalidations of the database, which
+        identifies the state of its catalogs for the other caches.
+
+    * changes_catalogs(sql)
+      - Returns whether the SQL script may change the catalogs.
+
+    * poll(sid, did)
+      - Processes the notifications of the changes of the catalogs of the
+        database received, if CATALOG_CACHE_LISTEN is set.
+
+    * listen(sid, did, conn)
+      - Listens to the notifications of the changes of the catalogs on the
+        connection, and processes the ones received.
+
+    * stats()
+      - Returns the cache usage, hit ratio and staleness.
+    """
+    _lock = Lock()
+    # Least recently used first
+    _entries = OrderedDict()
+    # (sid, did) -> keys of the cached responses
+    _scopes = dict()
+    # Incremented on every invalidation, the responses produced before that
+    # are not added to the cache.
+    _generation = 0
+    # (sid, did) -> invalidations of the database, (sid, None) -> of the
+    # whole server
+    _generations = dict()
+    # psycopg connections listening to the notifications
+    _listening = weakref.WeakKeyDictionary()
+    _size = 0
+    _hits = 0
+    _misses = 0
+    _evictions = 0
+    _invalidations = 0
+    _notifications = 0
+    _hit_age_total = 0.0
+    _max_hit_age = 0.0
+
+    @staticmethod
+    def enabled():
+        return (getattr(config, 'CATALOG_CACHE_MEMORY', 0) or 0) > 0
+
+    @staticmethod
+    def timeout():
+        return getattr(config, 'CATALOG_CACHE_TIMEOUT', 0) or 0
+
+    @classmethod
+    def cacheable(cls, view, kwargs):
+        """
+        Only the node lists of the objects within a database are cached, the
+        databases themselves show the state of their connection.
+        """
+        return cls.enabled() and request.method == 'GET' and \
+            view.cmd in CACHED_COMMANDS and \
+            kwargs.get('did') is not None and \
+            view.node_type != 'database'
+
+    @staticmethod
+    def _connected(sid, did):
+        """
+        Returns whether the database is connected, as checked by the
+        preconditions of the node views.
+        """
+        try:
+            manager = get_driver(PG_DEFAULT_DRIVER).connection_manager(sid)
+            return manager is not None and \
+                manager.connection(did=did).connected()
+        except Exception:
+            return False
+
+    @staticmethod
+    def refreshing():
+        """Returns whether the node is being refreshed by the user."""
+        return bool(request.headers.get(REFRESH_HEADER))
+
+    @staticmethod
+    def _preferences_key():
+        module = Preferences.module('browser', create=False)
+        if module is None:
+            return None
+
+        values = []
+        for name in PREFERENCE_CATEGORIES:
+            category = module.categories.get(name)
+            if category is None:
+                continue
+            for pref_name, pref in sorted(category['preferences'].items()):
+                values.append((pref_name, pref.get()))
+        return hash(tuple(values))
+
+    @classmethod
+    def _key(cls, sid, did):
+        return (current_user.id, sid, did, request.full_path,
+                cls._preferences_key())
+
+    @classmethod
+    def fetch(cls, sid, did, produce):
+        """
+        Returns the cached response of the current request, or the response
+        returned by produce(), which is cached if successful.
+
+        Args:
+            sid: Server id
+            did: Database id
+            produce: function returning the response of the request
+        """
+        if not cls._connected(sid, did):
+            with cls._lock:
+                cls._misses += 1
+            return produce()
+
+        if cls.refreshing():
+            cls.invalidate(sid, did)
+        else:
+            cls.poll(sid, did)
+
+        key = cls._key(sid, did)
+        now = time.time()
+
+        with cls._lock:
+            entry = cls._entries.get(key)
+            if entry is not None and now - entry.cached_at >= cls.timeout():
+                cls._drop(key)
+                entry = None
+
+            if entry is not None:
+                cls._entries.move_to_end(key)
+                age = now - entry.cached_at
+                cls._hits += 1
+                cls._hit_age_total += age
+                cls._max_hit_age = max(cls._max_hit_age, age)
+                return Response(entry.data, status=200,
+                                mimetype=entry.mimetype)
+
+            cls._misses += 1
+            generation = cls._generation
+
+        res = produce()
+
+        if not isinstance(res, Response) or res.status_code != 200 or \
+                res.is_streamed:
+            return res
+
+        data = res.get_data()
+        with cls._lock:
+            if generation == cls._generation and \
+                    len(data) <= config.CATALOG_CACHE_MEMORY:
+                cls._drop(key)
+                cls._entries[key] = _Entry(data, res.mimetype, now)
+                cls._scopes.setdefault((sid, did), set()).add(key)
+                cls._size += len(data)
+                cls._evict()
+
+        return res
+
+    @classmethod
+    def _drop(cls, key):
+        entry = cls._entries.pop(key, None)
+        if entry is None:
+            return
+        cls._size -= len(entry.data)
+        keys = cls._scopes.get(key[1:3])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del cls._scopes[key[1:3]]
+
+    @classmethod
+    def _evict(cls):
+        while cls._entries and cls._size > config.CATALOG_CACHE_MEMORY:
+            cls._drop(next(iter(cls._entries)))
+            cls._evictions += 1
+
+    @classmethod
+    def invalidate(cls, sid, did=None):
+        """
+        Removes the cached responses of the database, or of all the
+        databases of the server if did is None.
+        """
+        with cls._lock:
+            cls._generation += 1
+            cls._generations[(sid, did)] = \
+                cls._generations.get((sid, did), 0) + 1
+            cls._invalidations += 1
+            scopes = [scope for scope in cls._scopes
+                      if scope[0] == sid and (did is None or scope[1] == did)]
+            for scope in scopes:
+                for key in list(cls._scopes.get(scope, ())):
+                    cls._drop(key)
+
+    @classmethod
+    def generation(cls, sid, did):
+        """
+        Returns the number of invalidations of the database (and of its
+        server), which changes whenever its objects may have changed.
+        """
+        with cls._lock:
+            return (cls._generations.get((sid, None), 0),
+                    cls._generations.get((sid, did), 0))
+
+    @staticmethod
+    def changes_catalogs(sql):
+        """Returns whether the SQL script may change the catalogs."""
+        return bool(sql) and DDL_RE.search(sql) is not None
+
+    @classmethod
+    def poll(cls, sid, did):
+        """
+        Processes the notifications of the changes of the catalogs of the
+        database received on its default connection, if enabled.
+        """
+        if not getattr(config, 'CATALOG_CACHE_LISTEN', False):
+            return
+
+        manager = get_driver(PG_DEFAULT_DRIVER).connection_manager(sid)
+        if manager is not None:
+            cls.listen(sid, did, manager.connection(did=did))
+
+    @classmethod
+    def _on_notify(cls, sid, did, notify):
+        if notify.channel == NOTIFY_CHANNEL:
+            with cls._lock:
+                cls._notifications += 1
+            cls.invalidate(sid, did)
+
+    @classmethod
+    def listen(cls, sid, did, conn):
+        """
+        Listens to the notifications of the changes of the catalogs on the
+        given (default) connection to the database, the first time, and
+        processes the notifications received since, without waiting for
+        them.
+        """
+        pg_conn = getattr(conn, 'conn', None)
+        if pg_conn is None or pg_conn.closed:
+            return
+
+        if pg_conn not in cls._listening:
+            status, _ = conn.execute_void('LISTEN {0}'.format(NOTIFY_CHANNEL))
+            if status:
+                pg_conn.add_notify_handler(
+                    lambda notify: cls._on_notify(sid, did, notify))
+                cls._listening[pg_conn] = (sid, did)
+            return
+
+        # Skip it if the connection is in use, the notifications are
+        # processed along with the results of the query running.
+        if not pg_conn.lock.acquire(blocking=False):
+            return
+        try:
+            pgconn = pg_conn.pgconn
+            pgconn.consume_input()
+            notify = pgconn.notifies()
+            while notify is not None:
+                if pgconn.notify_handler:
+                    pgconn.notify_handler(notify)
+                notify = pgconn.notifies()
+        except Exception:
+            return
+        finally:
+            pg_conn.lock.release()
+
+        # The connection does not report the notifications to anyone else.
+        conn.get_notifies()
+
+    @classmethod
+    def stats(cls):
+        """
+        Returns the number and size of the cached responses, the hit ratio,
+        and the age of the responses served from the cache (staleness).
+        """
+        now = time.time()
+        with cls._lock:
+            requests = cls._hits + cls._misses
+            oldest = min((entry.cached_at for entry in cls._entries.values()),
+                         default=None)
+            return {
+                'entries': len(cls._entries),
+                'size': cls._size,
+                'hits': cls._hits,
+                'misses': cls._misses,
+                'hit_ratio': cls._hits / requests if requests else 0.0,
+                'evictions': cls._evictions,
+                'invalidations': cls._invalidations,
+                'notifications': cls._notifications,
+                'mean_hit_age': cls._hit_age_total / cls._hits
+                if cls._hits else 0.0,
+                'max_hit_age': cls._max_hit_age,
+                'oldest_entry_age': now - oldest if oldest is not None
+                else 0.0,
+            }
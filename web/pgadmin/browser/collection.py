@@ -18,7 +18,7 @@ from pgadmin.utils.preferences import Preferences
 from pgadmin.utils.constants import PGADMIN_NODE
 from pgadmin.utils.driver import get_driver
 from config import PG_DEFAULT_DRIVER
-from pgadmin.browser.utils import PGChildNodeView
+from pgadmin.browser.utils import PGChildNodeView, CollectionCountBatch
 
 
 class CollectionNodeModule(PgAdminModule, PGChildModule, metaclass=ABCMeta):
@@ -126,6 +126,12 @@ class CollectionNodeModule(PgAdminModule, PGChildModule, metaclass=ABCMeta):
                 conn=conn
             )
 
+            batch = CollectionCountBatch.current()
+            if batch is not None:
+                # Counted along with the other collections of the node.
+                batch.add(self.node_type, conn, sql)
+                return True
+
             status, res = conn.execute_dict(sql)
 
             return int(res['rows'][0]['count']) > 0 if status \
@@ -18,6 +18,7 @@ from flask import render_template, request, jsonify
 from flask_babel import gettext
 
 from pgadmin.browser.server_groups.servers import databases
+import config
 from config import PG_DEFAULT_DRIVER
 from pgadmin.browser.server_groups.servers.databases.schemas.utils import \
     SchemaChildModule, DataTypeReader
@@ -1350,13 +1351,6 @@ class FunctionView(PGChildNodeView, DataTypeReader, SchemaDiffObjectCompare):
 
         resp_data = res['rows'][0]
 
-        # Get formatted Arguments
-        frmtd_params, frmtd_proargs = (
-            format_arguments_from_db(self.sql_template_path, self.conn,
-                                     resp_data))
-        resp_data.update(frmtd_params)
-        resp_data.update(frmtd_proargs)
-
         # Fetch privileges
         sql = render_template("/".join([self.sql_template_path,
                                         self._ACL_SQL]),
@@ -1365,8 +1359,64 @@ class FunctionView(PGChildNodeView, DataTypeReader, SchemaDiffObjectCompare):
         if not status:
             return internal_server_error(errormsg=res)
 
+        return self._format_properties(resp_data, proaclres['rows'])
+
+    def _fetch_schema_properties(self, scid):
+        """
+        Return the properties of all the Functions of the schema, same as
+        returned by _fetch_properties for each of them, using a single query
+        for the properties, and a single query for the privileges.
+
+        Args:
+            scid: Schema Id
+
+        Returns:
+            (status, dict of the properties by function oid)
+        """
+        sql = render_template("/".join([self.sql_template_path,
+                                        self._PROPERTIES_SQL]),
+                              scid=scid, fnid=None)
+        status, res = self.conn.execute_dict(sql)
+        if not status:
+            return False, res
+
+        sql = render_template("/".join([self.sql_template_path,
+                                        self._ACL_SQL]),
+                              scid=scid, fnid=None)
+        status, proaclres = self.conn.execute_dict(sql)
+        if not status:
+            return False, proaclres
+
+        acls = dict()
+        for row in proaclres['rows']:
+            acls.setdefault(row['oid'], []).append(row)
+
+        properties = dict()
+        for resp_data in res['rows']:
+            properties[resp_data['oid']] = self._format_properties(
+                resp_data, acls.get(resp_data['oid'], []))
+
+        return True, properties
+
+    def _format_properties(self, resp_data, proacl):
+        """
+        Format the properties of the Function fetched from the database.
+
+        Args:
+            resp_data: Function properties
+            proacl: Function privileges
+        """
+        fnid = resp_data['oid']
+
+        # Get formatted Arguments
+        frmtd_params, frmtd_proargs = (
+            format_arguments_from_db(self.sql_template_path, self.conn,
+                                     resp_data))
+        resp_data.update(frmtd_params)
+        resp_data.update(frmtd_proargs)
+
         # Get Formatted Privileges
-        resp_data.update(self._format_proacl_from_db(proaclres['rows']))
+        resp_data.update(self._format_proacl_from_db(proacl))
 
         # Set System Functions Status
         resp_data['sysfunc'] = False
@@ -1718,6 +1768,16 @@ class FunctionView(PGChildNodeView, DataTypeReader, SchemaDiffObjectCompare):
             if not status:
                 return internal_server_error(errormsg=res)
 
+            if config.SCHEMA_DIFF_CATALOG_SNAPSHOT and rset['rows']:
+                status, properties = self._fetch_schema_properties(scid)
+                if not status:
+                    return internal_server_error(errormsg=properties)
+
+                for row in rset['rows']:
+                    if row['oid'] in properties:
+                        res[row['name']] = properties[row['oid']]
+                return res
+
             for row in rset['rows']:
                 data = self._fetch_properties(0, sid, did, scid, row['oid'])
                 if isinstance(data, dict):
@@ -1,10 +1,13 @@
 SELECT
+{% if not fnid %}
+    d.oid,
+{% endif %}
     COALESCE(gt.rolname, 'PUBLIC') AS grantee,
     g.rolname AS grantor, pg_catalog.array_agg(privilege_type) AS privileges,
     pg_catalog.array_agg(is_grantable) AS grantable
 FROM
     (SELECT
-        d.grantee, d.grantor, d.is_grantable,
+        d.grantee, d.grantor, d.is_grantable,{% if not fnid %} d.oid,{% endif %}
         CASE d.privilege_type
         WHEN 'CONNECT' THEN 'c'
         WHEN 'CREATE' THEN 'C'
@@ -24,13 +27,17 @@ FROM
         (SELECT
             (d).grantee AS grantee, (d).grantor AS grantor,
             (d).is_grantable AS is_grantable,
-            (d).privilege_type AS privilege_type
+            (d).privilege_type AS privilege_type{% if not fnid %}, oid{% endif %}
         FROM
-            (SELECT pg_catalog.aclexplode(db.proacl) AS d FROM pg_catalog.pg_proc db
+            (SELECT pg_catalog.aclexplode(db.proacl) AS d, db.oid FROM pg_catalog.pg_proc db
+{% if fnid %}
             WHERE db.oid = {{fnid}}::OID) a ORDER BY privilege_type
+{% else %}
+            WHERE db.pronamespace = {{scid}}::OID) a ORDER BY privilege_type
+{% endif %}
         ) d
     ) d
     LEFT JOIN pg_catalog.pg_roles g ON (d.grantor = g.oid)
     LEFT JOIN pg_catalog.pg_roles gt ON (d.grantee = gt.oid)
-GROUP BY g.rolname, gt.rolname
+GROUP BY g.rolname, gt.rolname{% if not fnid %}, d.oid{% endif %}
 ORDER BY grantee
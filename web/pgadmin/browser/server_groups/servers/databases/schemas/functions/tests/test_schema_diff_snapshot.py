@@ -0,0 +1,170 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2024, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import copy
+import json
+from unittest.mock import patch, MagicMock
+
+from pgadmin.browser.server_groups.servers.databases.schemas import \
+    functions as functions_module
+from pgadmin.browser.server_groups.servers.databases.schemas.functions \
+    import FunctionView, utils as functions_utils
+from pgadmin.tools.schema_diff.directory_compare import compare_dictionaries
+from pgadmin.utils.route import BaseTestGenerator
+
+SCID = 2200
+
+
+def _function(oid, name, **kwargs):
+    row = {
+        'oid': oid, 'name': name, 'proname': name, 'xmin': '1',
+        'proiswindow': False, 'prosrc': 'SELECT 1', 'prosrc_c': 'SELECT 1',
+        'pronamespace': SCID, 'prolang': 14, 'procost': 100, 'prorows': 0,
+        'prokind': 'f', 'prosecdef': False, 'proleakproof': False,
+        'proisstrict': False, 'proretset': False, 'provolatile': 'v',
+        'proparallel': 'u', 'pronargs': 1, 'prorettype': 23,
+        'proallargtypes': None, 'proargmodes': None, 'probin': '-',
+        'proacl': None, 'prorettypename': 'integer', 'typnsp': 'pg_catalog',
+        'lanname': 'sql', 'proargnames': ['a'],
+        'proargtypenames': 'integer', 'proargdefaultvals': None,
+        'pronargdefaults': 0, 'proconfig': None, 'funcowner': 'postgres',
+        'description': None, 'prosupportfunc': '', 'seclabels': None,
+        'is_pure_sql': False, 'prosrc_sql': None
+    }
+    row.update(kwargs)
+    return row
+
+
+FUNCTIONS = [
+    _function(16401, 'add_one'),
+    _function(16402, 'split_pair', pronargs=1, proargmodes=['i', 'o', 'o'],
+              proargnames=['a', 'x', 'y'], proallargtypes=[25, 23, 23],
+              proargtypenames='text', prorettypename='record',
+              proconfig=['search_path=public'],
+              seclabels=['dummy=classified']),
+    _function(16403, 'no_grants', proargdefaultvals='1',
+              pronargdefaults=1, description='comment'),
+]
+
+ACLS = {
+    16401: [{'grantee': 'PUBLIC', 'grantor': 'postgres',
+             'privileges': ['X'], 'grantable': [False]},
+            {'grantee': 'postgres', 'grantor': 'postgres',
+             'privileges': ['X'], 'grantable': [False]}],
+    16402: [{'grantee': 'reader', 'grantor': 'postgres',
+             'privileges': ['X'], 'grantable': [True]}],
+}
+
+
+def _render_template(template, **kwargs):
+    return json.dumps({'template': template.split('/')[-1],
+                       'fnid': kwargs.get('fnid'),
+                       'out_arg_oid': kwargs.get('out_arg_oid')})
+
+
+class _FakeConnection:
+    def __init__(self):
+        self.queries = []
+
+    def _query(self, sql):
+        query = json.loads(sql)
+        self.queries.append(query['template'])
+        return query
+
+    def execute_2darray(self, sql):
+        self._query(sql)
+        return True, {'rows': [
+            {'oid': row['oid'], 'name': '{0}({1})'.format(
+                row['name'], row['proargtypenames'])}
+            for row in FUNCTIONS]}
+
+    def execute_dict(self, sql):
+        query = self._query(sql)
+        fnid = query['fnid']
+        if query['template'] == 'properties.sql':
+            return True, {'rows': [copy.deepcopy(row) for row in FUNCTIONS
+                                   if fnid is None or row['oid'] == fnid]}
+        # Privileges
+        if fnid is not None:
+            return True, {'rows': copy.deepcopy(ACLS.get(fnid, []))}
+        return True, {'rows': [dict(acl, oid=oid)
+                               for oid, acls in ACLS.items()
+                               for acl in copy.deepcopy(acls)]}
+
+    def execute_scalar(self, sql):
+        query = self._query(sql)
+        return True, {23: 'integer', 25: 'text'}[query['out_arg_oid']]
+
+
+class SchemaDiffSnapshotTestCase(BaseTestGenerator):
+    """
+    Check that the functions fetched for the schema diff with the catalog
+    snapshot are identical to the ones fetched one by one, and produce the
+    same diff.
+    """
+
+    scenarios = [
+        ('Compare with the catalog snapshot against one by one',
+         dict(ignore_grants=False)),
+        ('Compare with the catalog snapshot ignoring grants',
+         dict(ignore_grants=True)),
+    ]
+
+    def fetch(self, snapshot):
+        conn = _FakeConnection()
+        manager = MagicMock(server_type='pg', version=140000,
+                            sversion=140000)
+        manager.connection.return_value = conn
+        driver = MagicMock()
+        driver.connection_manager.return_value = manager
+
+        with patch.object(functions_module, 'get_driver',
+                          return_value=driver), \
+                patch.object(functions_module, 'render_template',
+                             side_effect=_render_template), \
+                patch.object(functions_utils, 'render_template',
+                             side_effect=_render_template), \
+                patch.object(functions_module.config,
+                             'SCHEMA_DIFF_CATALOG_SNAPSHOT', snapshot):
+            view = FunctionView(cmd='fetch_objects_to_compare')
+            return view.fetch_objects_to_compare(sid=1, did=1, scid=SCID), \
+                conn.queries
+
+    def diff(self, source):
+        target = copy.deepcopy(source)
+        target['add_one(integer)']['prosrc'] = 'SELECT 2'
+        target['split_pair(text)']['acl'] = []
+        del target['no_grants(integer)']
+
+        view = MagicMock()
+        view.get_sql_from_diff.side_effect = \
+            lambda **kwargs: json.dumps(kwargs, sort_keys=True, default=str)
+        view.get_dependencies.return_value = []
+        result = compare_dictionaries(
+            view_object=view, source_params={'sid': 1, 'did': 1},
+            target_params={'sid': 2, 'did': 2}, target_schema='public',
+            source_dict=source, target_dict=target, node='function',
+            node_label='Functions', group_name='public',
+            ignore_keys=FunctionView.keys_to_ignore,
+            ignore_grants=self.ignore_grants)
+        # The ids are assigned by a global counter
+        for item in result:
+            del item['id']
+        return result
+
+    def runTest(self):
+        expected, queries = self.fetch(snapshot=False)
+        self.assertEqual(len(queries), 1 + 2 * len(FUNCTIONS) + 2)
+
+        result, queries = self.fetch(snapshot=True)
+        self.assertEqual(queries, ['node.sql', 'properties.sql', 'acl.sql',
+                                   'get_out_types.sql', 'get_out_types.sql'])
+
+        self.assertEqual(result, expected)
+        self.assertEqual(self.diff(result), self.diff(expected))
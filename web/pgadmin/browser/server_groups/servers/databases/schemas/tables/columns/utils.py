@@ -112,7 +112,8 @@ def _fetch_inherited_tables(tid, data, fetch_inherited_tables, template_path,
 
 @get_template_path
 def column_formatter(conn, tid, clid, data, edit_types_list=None,
-                     fetch_inherited_tables=True, template_path=None):
+                     fetch_inherited_tables=True, template_path=None,
+                     acl=None):
     """
     This function will return formatted output of query result
     as per client model format for column node
@@ -123,6 +124,8 @@ def column_formatter(conn, tid, clid, data, edit_types_list=None,
     :param edit_types_list:
     :param fetch_inherited_tables:
     :param template_path: Optional template path
+    :param acl: Optional privileges of the column, fetched along with the
+        ones of the other columns
     :return:
     """
 
@@ -157,12 +160,13 @@ def column_formatter(conn, tid, clid, data, edit_types_list=None,
         data['coloptions'] = parse_options_for_column(data['attfdwoptions'])
 
     # We need to parse & convert ACL coming from database to json format
-    SQL = render_template("/".join([template_path, 'acl.sql']),
-                          tid=tid, clid=clid)
-    status, acl = conn.execute_dict(SQL)
+    if acl is None:
+        SQL = render_template("/".join([template_path, 'acl.sql']),
+                              tid=tid, clid=clid)
+        status, acl = conn.execute_dict(SQL)
 
-    if not status:
-        return internal_server_error(errormsg=acl)
+        if not status:
+            return internal_server_error(errormsg=acl)
 
     # We will set get privileges from acl sql so we don't need
     # it from properties sql
@@ -225,10 +229,77 @@ def parse_options_for_column(db_variables):
     return variables_lst
 
 
+def _get_edit_types(conn, type_ids, template_path):
+    """
+    This function will return the types each of the given types can be
+    changed to, in edit mode.
+    :param conn: Connection Object
+    :param type_ids: Type IDs
+    :param template_path: Template path
+    :return: dict of the sorted type names by type id
+    """
+    SQL = render_template("/".join([template_path,
+                                    'edit_mode_types_multi.sql']),
+                          type_ids=",".join(map(lambda x: str(x),
+                                                type_ids)))
+    status, res = conn.execute_2darray(SQL)
+    if not status:
+        raise ExecuteError(res)
+
+    return dict((row['main_oid'], sorted(row['edit_types']))
+                for row in res['rows'])
+
+
+@get_template_path
+def get_columns_of_tables(conn, tids, template_path=None):
+    """
+    This function will fetch the columns of all the given tables, with
+    their privileges and the types they can be changed to, using three
+    queries in all.
+    :param conn: Connection Object
+    :param tids: Table IDs
+    :param template_path: Optional template path
+    :return: dict of the columns by table id, to be passed to
+        get_formatted_columns
+    """
+    tables = dict((tid, {'columns': [], 'acl': {}, 'edit_types': {}})
+                  for tid in tids)
+
+    SQL = render_template("/".join([template_path, 'properties.sql']),
+                          tids=tids, show_sys_objects=False)
+    status, res = conn.execute_dict(SQL)
+    if not status:
+        raise ExecuteError(res)
+
+    type_ids = []
+    for col in res['rows']:
+        tables[col.pop('attrelid')]['columns'].append(col)
+        if col['atttypid'] not in type_ids:
+            type_ids.append(col['atttypid'])
+
+    if len(type_ids) == 0:
+        return tables
+
+    SQL = render_template("/".join([template_path, 'acl.sql']), tids=tids)
+    status, acl = conn.execute_dict(SQL)
+    if not status:
+        raise ExecuteError(acl)
+
+    for row in acl['rows']:
+        tables[row['attrelid']]['acl'].setdefault(
+            row['attnum'], []).append(row)
+
+    edit_types = _get_edit_types(conn, type_ids, template_path)
+    for table in tables.values():
+        table['edit_types'] = edit_types
+
+    return tables
+
+
 @get_template_path
 def get_formatted_columns(conn, tid, data, other_columns,
                           table_or_type, template_path=None,
-                          with_serial=False):
+                          with_serial=False, prefetched=None):
     """
     This function will iterate and return formatted data for all
     the columns.
@@ -238,16 +309,22 @@ def get_formatted_columns(conn, tid, data, other_columns,
     :param other_columns:
     :param table_or_type:
     :param template_path: Optional template path
+    :param prefetched: Optional columns of the table returned by
+        get_columns_of_tables, fetched along with the ones of other tables
     :return:
     """
-    SQL = render_template("/".join([template_path, 'properties.sql']),
-                          tid=tid, show_sys_objects=False)
+    if prefetched is None:
+        SQL = render_template("/".join([template_path, 'properties.sql']),
+                              tid=tid, show_sys_objects=False)
 
-    status, res = conn.execute_dict(SQL)
-    if not status:
-        raise ExecuteError(res)
+        status, res = conn.execute_dict(SQL)
+        if not status:
+            raise ExecuteError(res)
+
+        all_columns = res['rows']
+    else:
+        all_columns = prefetched['columns']
 
-    all_columns = res['rows']
     edit_types = {}
     # Add inherited from details from other columns - type, table
     for col in all_columns:
@@ -282,17 +359,25 @@ def get_formatted_columns(conn, tid, data, other_columns,
     data['columns'] = all_columns
 
     if 'columns' in data and len(data['columns']) > 0:
-        SQL = render_template("/".join([template_path,
-                                        'edit_mode_types_multi.sql']),
-                              type_ids=",".join(map(lambda x: str(x),
-                                                    edit_types.keys())))
-        status, res = conn.execute_2darray(SQL)
-        for row in res['rows']:
-            edit_types[row['main_oid']] = sorted(row['edit_types'])
+        if prefetched is None:
+            type_edit_types = _get_edit_types(conn, edit_types.keys(),
+                                              template_path)
+        else:
+            type_edit_types = prefetched['edit_types']
+
+        # The edit types of each table are updated by column_formatter
+        for type_id in edit_types:
+            if type_id in type_edit_types:
+                edit_types[type_id] = list(type_edit_types[type_id])
 
         for column in data['columns']:
+            acl = None
+            if prefetched is not None:
+                acl = {'rows': prefetched['acl'].get(column['attnum'], [])}
+
             column_formatter(conn, tid, column['attnum'], column,
-                             edit_types[column['atttypid']], False)
+                             edit_types[column['atttypid']], False,
+                             acl=acl)
 
     return data
 
@@ -81,6 +81,31 @@ def get_check_constraints(conn, tid, cid=None, template_path=None):
     return True, result['rows']
 
 
+@get_template_path
+def get_check_constraints_of_tables(conn, tids, template_path=None):
+    """
+    This function is used to fetch information of the check constraints
+    of all the given tables in a single query.
+    :param conn: Connection Object
+    :param tids: Table IDs
+    :param template_path: Template Path
+    :return: dict of the check constraints by table id
+    """
+
+    sql = render_template("/".join(
+        [template_path, 'properties.sql']), tids=tids)
+
+    status, result = conn.execute_dict(sql)
+    if not status:
+        return status, internal_server_error(errormsg=result)
+
+    constraints = dict((tid, []) for tid in tids)
+    for row in result['rows']:
+        constraints[row.pop('conrelid')].append(row)
+
+    return True, constraints
+
+
 def _check_delete_constraint(constraint, data, template_path, conn, sql):
     """
     This function if user deleted any constraint.
@@ -105,17 +105,9 @@ def get_exclusion_constraints(conn, did, tid, exid=None, template_path=None):
         return status, internal_server_error(errormsg=result)
 
     for ex in result['rows']:
-        sql = render_template("/".join([template_path,
-                                        'get_constraint_cols.sql']),
-                              cid=ex['oid'], colcnt=ex['col_count'])
-
-        status, res = conn.execute_dict(sql)
+        status, res = _set_constraint_details(conn, ex, template_path)
         if not status:
-            return status, internal_server_error(errormsg=res)
-
-        columns = _get_columns(res)
-
-        ex['columns'] = columns
+            return status, res
 
         # INCLUDE clause in index is supported from PG-11+
         if conn.manager.version >= 110000:
@@ -128,12 +120,84 @@ def get_exclusion_constraints(conn, did, tid, exid=None, template_path=None):
 
             ex['include'] = [col['colname'] for col in res['rows']]
 
-        if ex.get('amname', '') == "":
-            ex['amname'] = 'btree'
-
     return True, result['rows']
 
 
+def _set_constraint_details(conn, ex, template_path):
+    """
+    This function fetches the columns of the exclusion constraint and
+    sets its default access method.
+    :param conn: Connection Object
+    :param ex: Exclusion Constraint
+    :param template_path: Template Path
+    :return:
+    """
+    sql = render_template("/".join([template_path,
+                                    'get_constraint_cols.sql']),
+                          cid=ex['oid'], colcnt=ex['col_count'])
+
+    status, res = conn.execute_dict(sql)
+    if not status:
+        return status, internal_server_error(errormsg=res)
+
+    ex['columns'] = _get_columns(res)
+
+    if ex.get('amname', '') == "":
+        ex['amname'] = 'btree'
+
+    return True, None
+
+
+@get_template_path
+def get_exclusion_constraints_of_tables(conn, did, tids, template_path=None):
+    """
+    This function is used to fetch information of the exclusion
+    constraints of all the given tables, same as get_exclusion_constraints
+    for each of them. The columns are still fetched per constraint.
+    :param conn: Connection Object
+    :param did: Database ID
+    :param tids: Table IDs
+    :param template_path: Template Path
+    :return: dict of the exclusion constraints by table id
+    """
+    sql = render_template("/".join([template_path, 'properties.sql']),
+                          did=did, tids=tids)
+
+    status, result = conn.execute_dict(sql)
+    if not status:
+        return status, internal_server_error(errormsg=result)
+
+    constraints = dict((tid, []) for tid in tids)
+    if len(result['rows']) == 0:
+        return True, constraints
+
+    # INCLUDE clause in index is supported from PG-11+
+    include = None
+    if conn.manager.version >= 110000:
+        sql = render_template("/".join([template_path,
+                                        'get_constraint_include.sql']),
+                              cids=[ex['oid'] for ex in result['rows']])
+        status, res = conn.execute_dict(sql)
+        if not status:
+            return status, internal_server_error(errormsg=res)
+
+        include = dict()
+        for col in res['rows']:
+            include.setdefault(col['oid'], []).append(col['colname'])
+
+    for ex in result['rows']:
+        status, res = _set_constraint_details(conn, ex, template_path)
+        if not status:
+            return status, res
+
+        if include is not None:
+            ex['include'] = include.get(ex['oid'], [])
+
+        constraints[ex.pop('indrelid')].append(ex)
+
+    return True, constraints
+
+
 def _get_delete_constraint(data, constraint, sql, template_path, conn):
     """
     Check for delete constraints and return sql for it.
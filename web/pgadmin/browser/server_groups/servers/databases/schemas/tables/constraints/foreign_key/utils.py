@@ -66,35 +66,145 @@ def get_foreign_keys(conn, tid, fkid=None, template_path=None):
         if not status:
             return status, internal_server_error(errormsg=res)
 
-        columns = []
-        cols = []
-        for row in res['rows']:
-            columns.append({"local_column": row['conattname'],
-                            "references": fk['confrelid'],
-                            "referenced": row['confattname'],
-                            "references_table_name":
-                                fk['refnsp'] + '.' + fk['reftab']})
-            cols.append(row['conattname'])
-
-        fk['columns'] = columns
-
-        if not fkid:
-            schema, table = get_parent(conn, fk['columns'][0]['references'])
-            fk['remote_schema'] = schema
-            fk['remote_table'] = table
-
-        coveringindex = search_coveringindex(conn, tid, cols)
-        fk['coveringindex'] = coveringindex
-        if coveringindex:
-            fk['autoindex'] = False
-            fk['hasindex'] = True
-        else:
-            fk['autoindex'] = True
-            fk['hasindex'] = False
+        cols = _set_fk_columns(fk, res['rows'], fkid)
+        _set_fk_coveringindex(fk, search_coveringindex(conn, tid, cols))
 
     return True, result['rows']
 
 
+def _set_fk_columns(fk, rows, fkid=None):
+    """
+    This function sets the columns of the foreign key from the given
+    rows of its local and referenced columns.
+    :param fk: Foreign Key
+    :param rows: Rows of the columns
+    :param fkid: Foreign Key ID
+    :return: the local columns
+    """
+    columns = []
+    cols = []
+    for row in rows:
+        columns.append({"local_column": row['conattname'],
+                        "references": fk['confrelid'],
+                        "referenced": row['confattname'],
+                        "references_table_name":
+                            fk['refnsp'] + '.' + fk['reftab']})
+        cols.append(row['conattname'])
+
+    fk['columns'] = columns
+
+    if not fkid:
+        # The schema and name of the referenced table are fetched with the
+        # foreign key already.
+        fk['remote_schema'] = fk['refnsp']
+        fk['remote_table'] = fk['reftab']
+
+    return cols
+
+
+def _set_fk_coveringindex(fk, coveringindex):
+    """
+    This function sets the covering index of the foreign key.
+    :param fk: Foreign Key
+    :param coveringindex: Name of the covering index or None
+    :return:
+    """
+    fk['coveringindex'] = coveringindex
+    if coveringindex:
+        fk['autoindex'] = False
+        fk['hasindex'] = True
+    else:
+        fk['autoindex'] = True
+        fk['hasindex'] = False
+
+
+@get_template_path
+def get_foreign_keys_of_tables(conn, tids, template_path=None):
+    """
+    This function is used to fetch information of the foreign keys of
+    all the given tables, same as get_foreign_keys for each of them, using
+    up to four queries in all.
+    :param conn: Connection Object
+    :param tids: Table IDs
+    :param template_path: Template Path
+    :return: dict of the foreign keys by table id
+    """
+    sql = render_template("/".join(
+        [template_path, FKEY_PROPERTIES_SQL]), tids=tids)
+
+    status, result = conn.execute_dict(sql)
+    if not status:
+        return status, internal_server_error(errormsg=result)
+
+    foreign_keys = dict((tid, []) for tid in tids)
+    if len(result['rows']) == 0:
+        return True, foreign_keys
+
+    sql = render_template("/".join([template_path,
+                                    'get_constraint_cols.sql']),
+                          cids=[fk['oid'] for fk in result['rows']])
+    status, res = conn.execute_dict(sql)
+    if not status:
+        return status, internal_server_error(errormsg=res)
+
+    columns = dict()
+    for row in res['rows']:
+        columns.setdefault(row['oid'], []).append(row)
+
+    coveringindexes = _get_coveringindexes(
+        conn, set(fk['conrelid'] for fk in result['rows']), template_path)
+
+    for fk in result['rows']:
+        tid = fk.pop('conrelid')
+        cols = set(_set_fk_columns(fk, columns.get(fk['oid'], [])))
+        _set_fk_coveringindex(fk, next(
+            (idxname for idxname, index_cols in coveringindexes.get(tid, [])
+             if index_cols == cols), None))
+        foreign_keys[tid].append(fk)
+
+    return True, foreign_keys
+
+
+def _get_coveringindexes(conn, tids, template_path):
+    """
+    This function returns the candidate covering indexes of the given
+    tables with their columns, as searched by search_coveringindex.
+    :param conn: Connection Object
+    :param tids: Table IDs
+    :param template_path: Template Path
+    :return: dict of the (name, columns) of the indexes by table id
+    """
+    SQL = render_template("/".join([template_path,
+                                    'get_constraints.sql']),
+                          tids=sorted(tids))
+    status, constraints = conn.execute_dict(SQL)
+    if not status:
+        raise ExecuteError(constraints)
+
+    if len(constraints['rows']) == 0:
+        return dict()
+
+    sql = render_template(
+        "/".join([template_path, 'get_cols.sql']),
+        constraints=[(constraint['oid'], constraint['col_count'])
+                     for constraint in constraints['rows']])
+    status, rest = conn.execute_dict(sql)
+    if not status:
+        raise ExecuteError(rest)
+
+    index_cols = dict()
+    for r in rest['rows']:
+        index_cols.setdefault(r['oid'], set()).add(r['column'].strip('"'))
+
+    indexes = dict()
+    for constraint in constraints['rows']:
+        indexes.setdefault(constraint['indrelid'], []).append(
+            (constraint['idxname'],
+             index_cols.get(constraint['oid'], set())))
+
+    return indexes
+
+
 @get_template_path
 def search_coveringindex(conn, tid, cols, template_path=None):
     """
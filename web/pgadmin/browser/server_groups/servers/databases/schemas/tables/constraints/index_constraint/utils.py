@@ -108,6 +108,68 @@ def get_index_constraints(conn, did, tid, ctype, cid=None, template_path=None):
     return True, result['rows']
 
 
+@get_template_path
+def get_index_constraints_of_tables(conn, did, tids, ctype,
+                                    template_path=None):
+    """
+    This function is used to fetch information of the index constraints
+    of all the given tables, same as get_index_constraints for each of
+    them, using up to three queries in all.
+    :param conn: Connection Object
+    :param did: Database ID
+    :param tids: Table IDs
+    :param ctype: Constraint Type
+    :param template_path: Template Path
+    :return: dict of the constraints by table id
+    """
+    sql = render_template("/".join([template_path, 'properties.sql']),
+                          did=did, tids=tids, constraint_type=ctype)
+    status, result = conn.execute_dict(sql)
+    if not status:
+        return status, internal_server_error(errormsg=result)
+
+    constraints = dict((tid, []) for tid in tids)
+    if len(result['rows']) == 0:
+        return True, constraints
+
+    sql = render_template("/".join([template_path,
+                                    'get_constraint_cols.sql']),
+                          constraints=[(idx_cons['oid'], idx_cons['col_count'])
+                                       for idx_cons in result['rows']])
+    status, res = conn.execute_dict(sql)
+    if not status:
+        return status, internal_server_error(errormsg=res)
+
+    columns = dict()
+    for r in res['rows']:
+        columns.setdefault(r['oid'], []).append(
+            {"column": r['column'].strip('"')})
+
+    # INCLUDE clause in index is supported from PG-11+
+    include = None
+    if conn.manager.version >= 110000:
+        sql = render_template("/".join([template_path,
+                                        'get_constraint_include.sql']),
+                              cids=[idx_cons['oid']
+                                    for idx_cons in result['rows']])
+        status, res = conn.execute_dict(sql)
+        if not status:
+            return status, internal_server_error(errormsg=res)
+
+        include = dict()
+        for col in res['rows']:
+            include.setdefault(col['oid'], []).append(col['colname'])
+
+    for idx_cons in result['rows']:
+        idx_cons['columns'] = columns.get(idx_cons['oid'], [])
+        if include is not None:
+            idx_cons['include'] = include.get(idx_cons['oid'], [])
+
+        constraints[idx_cons.pop('indrelid')].append(idx_cons)
+
+    return True, constraints
+
+
 def _get_sql_to_delete_constraints(data, constraint, sql, template_path, conn):
     """
     Check for delete constraints.
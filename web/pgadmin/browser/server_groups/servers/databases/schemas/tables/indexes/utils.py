@@ -89,7 +89,8 @@ def _get_column_property_display_data(row, col_str, data):
 
 
 @get_template_path
-def get_column_details(conn, idx, data, mode='properties', template_path=None):
+def get_column_details(conn, idx, data, mode='properties', template_path=None,
+                       rows=None):
     """
     This functional will fetch list of column for index.
 
@@ -98,13 +99,17 @@ def get_column_details(conn, idx, data, mode='properties', template_path=None):
     :param data: Data
     :param mode: 'create' or 'properties'
     :param template_path: Optional template path
+    :param rows: Column details of the index if already fetched
     :return:
     """
 
-    SQL = render_template(
-        "/".join([template_path, 'column_details.sql']), idx=idx
-    )
-    status, rset = conn.execute_2darray(SQL)
+    if rows is not None:
+        status, rset = True, {'rows': rows}
+    else:
+        SQL = render_template(
+            "/".join([template_path, 'column_details.sql']), idx=idx
+        )
+        status, rset = conn.execute_2darray(SQL)
     # Remove column if duplicate column is present in list.
     rset['rows'] = [i for n, i in enumerate(rset['rows']) if
                     i not in rset['rows'][n + 1:]]
@@ -156,7 +161,7 @@ def get_column_details(conn, idx, data, mode='properties', template_path=None):
 
 
 @get_template_path
-def get_include_details(conn, idx, data, template_path=None):
+def get_include_details(conn, idx, data, template_path=None, rows=None):
     """
     This functional will fetch list of include details for index
     supported with Postgres 11+
@@ -165,13 +170,17 @@ def get_include_details(conn, idx, data, template_path=None):
     :param idx: Index ID
     :param data: data
     :param template_path: Optional template path
+    :param rows: Include details of the index if already fetched
     :return:
     """
 
-    SQL = render_template(
-        "/".join([template_path, 'include_details.sql']), idx=idx
-    )
-    status, rset = conn.execute_2darray(SQL)
+    if rows is not None:
+        status, rset = True, {'rows': rows}
+    else:
+        SQL = render_template(
+            "/".join([template_path, 'include_details.sql']), idx=idx
+        )
+        status, rset = conn.execute_2darray(SQL)
     if not status:
         return internal_server_error(errormsg=rset)
 
@@ -181,6 +190,82 @@ def get_include_details(conn, idx, data, template_path=None):
     return data
 
 
+@get_template_path
+def get_indexes_of_tables(conn, did, tids, show_sys_objects, datlastsysoid,
+                          template_path=None):
+    """
+    This function will fetch the properties of the indexes of all the
+    given tables to compare, same as fetch_objects_to_compare of the
+    index view for each of them, using up to four queries in all.
+
+    :param conn: Connection object
+    :param did: Database ID
+    :param tids: Table IDs
+    :param show_sys_objects: Whether the system objects are shown
+    :param datlastsysoid: Last system oid of the database
+    :param template_path: Optional template path
+    :return: dict of the indexes by name by table id
+    """
+    res = dict((tid, dict()) for tid in tids)
+
+    SQL = render_template("/".join([template_path, 'nodes.sql']),
+                          tids=tids, schema_diff=True)
+    status, indexes = conn.execute_2darray(SQL)
+    if not status:
+        raise ExecuteError(indexes)
+
+    if len(indexes['rows']) == 0:
+        return res
+
+    SQL = render_template("/".join([template_path, 'properties.sql']),
+                          did=did, tids=tids, datlastsysoid=datlastsysoid,
+                          show_sys_objects=show_sys_objects)
+    status, properties = conn.execute_dict(SQL)
+    if not status:
+        raise ExecuteError(properties)
+
+    properties = dict((row['oid'], row) for row in properties['rows'])
+    idxs = [row['oid'] for row in indexes['rows']]
+
+    SQL = render_template("/".join([template_path, 'column_details.sql']),
+                          idxs=idxs)
+    status, rset = conn.execute_2darray(SQL)
+    if not status:
+        raise ExecuteError(rset)
+
+    columns = dict()
+    for row in rset['rows']:
+        columns.setdefault(row['indexrelid'], []).append(row)
+
+    # Include details of the index supported with Postgres 11+
+    include = None
+    if conn.manager.version >= 110000:
+        SQL = render_template("/".join([template_path,
+                                        'include_details.sql']), idxs=idxs)
+        status, rset = conn.execute_2darray(SQL)
+        if not status:
+            raise ExecuteError(rset)
+
+        include = dict()
+        for row in rset['rows']:
+            include.setdefault(row['indexrelid'], []).append(row)
+
+    for row in indexes['rows']:
+        if row['oid'] not in properties:
+            continue
+
+        data = dict(properties[row['oid']])
+        data = get_column_details(conn, row['oid'], data,
+                                  rows=columns.get(row['oid'], []))
+        if include is not None:
+            data = get_include_details(conn, row['oid'], data,
+                                       rows=include.get(row['oid'], []))
+
+        res[row['indrelid']][row['name']] = data
+
+    return res
+
+
 def _get_create_sql(data, template_path, conn, mode, name,
                     if_exists_flag=False):
     """
@@ -1,4 +1,4 @@
-SELECT c.oid, conname as name, relname, nspname, description as comment,
+SELECT {% if tids %}conrelid, {% endif %}c.oid, conname as name, relname, nspname, description as comment,
        pg_catalog.pg_get_expr(conbin, conrelid, true) as consrc,
        connoinherit, NOT convalidated as convalidated, conislocal
     FROM pg_catalog.pg_constraint c
@@ -8,7 +8,11 @@ LEFT OUTER JOIN
     pg_catalog.pg_description des ON (des.objoid=c.oid AND
                            des.classoid='pg_constraint'::regclass)
 WHERE contype = 'c'
+{% if tids %}
+    AND conrelid IN ({{ tids|join(', ') }})
+{% else %}
     AND conrelid = {{ tid }}::oid
+{% endif %}
 {% if cid %}
     AND c.oid = {{ cid }}::oid
 {% endif %}
@@ -1,4 +1,4 @@
-SELECT DISTINCT ON (att.attnum) att.attname as name, att.atttypid, att.attlen, att.attnum, att.attndims,
+SELECT DISTINCT ON ({% if tids %}att.attrelid, {% endif %}att.attnum) {% if tids %}att.attrelid, {% endif %}att.attname as name, att.atttypid, att.attlen, att.attnum, att.attndims,
 		att.atttypmod, att.attacl, att.attnotnull, att.attoptions, att.attfdwoptions, att.attstattarget,
 		att.attstorage, att.attidentity,
 		pg_catalog.pg_get_expr(def.adbin, def.adrelid) AS defval,
@@ -30,7 +30,11 @@ FROM pg_catalog.pg_attribute att
   LEFT OUTER JOIN pg_catalog.pg_namespace nspc ON coll.collnamespace=nspc.oid
   LEFT OUTER JOIN pg_catalog.pg_sequence seq ON cs.oid=seq.seqrelid
   LEFT OUTER JOIN pg_catalog.pg_class tab on tab.oid = att.attrelid
+{% if tids %}
+WHERE att.attrelid IN ({{ tids|join(', ') }})
+{% else %}
 WHERE att.attrelid = {{tid}}::oid
+{% endif %}
 {% if clid %}
     AND att.attnum = {{clid}}::int
 {% endif %}
@@ -39,4 +43,4 @@ WHERE att.attrelid = {{tid}}::oid
     AND att.attnum > 0
 {% endif %}
     AND att.attisdropped IS FALSE
-    ORDER BY att.attnum;
+    ORDER BY {% if tids %}att.attrelid, {% endif %}att.attnum;
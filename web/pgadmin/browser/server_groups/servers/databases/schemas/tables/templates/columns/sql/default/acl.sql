@@ -1,11 +1,11 @@
-SELECT 'attacl' as deftype,
+SELECT 'attacl' as deftype,{% if tids %} d.attrelid, d.attnum,{% endif %}
     COALESCE(gt.rolname, 'PUBLIC') grantee,
     g.rolname grantor,
     pg_catalog.array_agg(privilege_type order by privilege_type) as privileges,
     pg_catalog.array_agg(is_grantable) as grantable
 FROM
   (SELECT
-    d.grantee, d.grantor, d.is_grantable,
+    d.grantee, d.grantor, d.is_grantable,{% if tids %} d.attrelid, d.attnum,{% endif %}
     CASE d.privilege_type
         WHEN 'CONNECT' THEN 'c'
         WHEN 'CREATE' THEN 'C'
@@ -22,18 +22,26 @@ FROM
         ELSE 'UNKNOWN'
     END AS privilege_type
   FROM
+{% if not tids %}
     (SELECT attacl
         FROM pg_catalog.pg_attribute att
         WHERE att.attrelid = {{tid}}::oid
         AND att.attnum = {{clid}}::int
     ) acl,
+{% endif %}
     (SELECT (d).grantee AS grantee, (d).grantor AS grantor, (d).is_grantable
-        AS is_grantable, (d).privilege_type AS privilege_type FROM (SELECT
-        pg_catalog.aclexplode(attacl) as d FROM pg_catalog.pg_attribute att
+        AS is_grantable, (d).privilege_type AS privilege_type{% if tids %}, attrelid, attnum{% endif %} FROM (SELECT
+        pg_catalog.aclexplode(attacl) as d, att.attrelid, att.attnum FROM pg_catalog.pg_attribute att
+{% if tids %}
+        WHERE att.attrelid IN ({{ tids|join(', ') }})
+        AND att.attnum > 0
+        AND att.attisdropped IS FALSE) a) d
+{% else %}
         WHERE att.attrelid = {{tid}}::oid
         AND att.attnum = {{clid}}::int) a) d
+{% endif %}
     ) d
   LEFT JOIN pg_catalog.pg_roles g ON (d.grantor = g.oid)
   LEFT JOIN pg_catalog.pg_roles gt ON (d.grantee = gt.oid)
-GROUP BY g.rolname, gt.rolname
+GROUP BY g.rolname, gt.rolname{% if tids %}, d.attrelid, d.attnum{% endif %}
 ORDER BY grantee
@@ -1,3 +1,10 @@
+{% if constraints %}
+{### Columns of all the given (index oid, column count) pairs ###}
+SELECT c.oid, pg_catalog.pg_get_indexdef(c.oid, n, true) AS column
+FROM (VALUES {% for cid, colcnt in constraints %}{% if loop.index != 1 %}, {% endif %}({{ cid|string }}::oid, {{ colcnt|int }}){% endfor %}) c(oid, colcnt),
+    pg_catalog.generate_series(1, c.colcnt) n
+ORDER BY c.oid, n
+{% else %}
 {% for n in range(colcnt|int) %}
 {% if loop.index != 1 %}
 UNION SELECT  pg_catalog.pg_get_indexdef({{ cid|string }}, {{ loop.index|string }}, true) AS column
@@ -5,3 +12,4 @@ UNION SELECT  pg_catalog.pg_get_indexdef({{ cid|string }}, {{ loop.index|string
 SELECT  pg_catalog.pg_get_indexdef({{ cid|string }} , {{ loop.index|string }} , true) AS column
 {% endif %}
 {% endfor %}
+{% endif %}
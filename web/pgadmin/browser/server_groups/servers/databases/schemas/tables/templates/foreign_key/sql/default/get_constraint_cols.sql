@@ -1,3 +1,15 @@
+{% if cids %}
+{### Columns of all the given foreign keys, in the order of their keys ###}
+SELECT ct.oid,
+    a1.attname as conattname,
+    a2.attname as confattname
+FROM pg_catalog.pg_constraint ct
+    CROSS JOIN LATERAL pg_catalog.generate_subscripts(ct.conkey, 1) k
+    JOIN pg_catalog.pg_attribute a1 ON a1.attrelid = ct.conrelid AND a1.attnum = ct.conkey[k]
+    JOIN pg_catalog.pg_attribute a2 ON a2.attrelid = ct.confrelid AND a2.attnum = ct.confkey[k]
+WHERE ct.oid IN ({{ cids|join(', ') }})
+ORDER BY ct.oid, k
+{% else %}
 {% for keypair in keys %}
 {% if loop.index != 1 %}
 UNION ALL
@@ -11,3 +23,4 @@ WHERE a1.attrelid={{tid}}::oid
     AND a2.attrelid={{confrelid}}::oid
     AND a2.attnum={{keypair[0]}}
 {% endfor %}
+{% endif %}
@@ -1,37 +1,37 @@
-SELECT   cls.oid, cls.relname as idxname, indnatts as col_count
+SELECT   {% if tids %}idx.indrelid, {% endif %}cls.oid, cls.relname as idxname, indnatts as col_count
   FROM pg_catalog.pg_index idx
   JOIN pg_catalog.pg_class cls ON cls.oid=indexrelid
   LEFT JOIN pg_catalog.pg_depend dep ON (dep.classid = cls.tableoid AND dep.objid = cls.oid AND dep.refobjsubid = '0' AND dep.refclassid=(SELECT oid FROM pg_catalog.pg_class WHERE relname='pg_constraint') AND dep.deptype='i')
   LEFT OUTER JOIN pg_catalog.pg_constraint con ON (con.tableoid = dep.refclassid AND con.oid = dep.refobjid)
-WHERE idx.indrelid = {{tid}}::oid
+WHERE idx.indrelid {% if tids %}IN ({{ tids|join(', ') }}){% else %}= {{tid}}::oid{% endif %}
     AND con.contype='p'
 
 UNION
 
-SELECT  cls.oid, cls.relname as idxname, indnatts
+SELECT  {% if tids %}idx.indrelid, {% endif %}cls.oid, cls.relname as idxname, indnatts
     FROM pg_catalog.pg_index idx
     JOIN pg_catalog.pg_class cls ON cls.oid=indexrelid
     LEFT JOIN pg_catalog.pg_depend dep ON (dep.classid = cls.tableoid AND dep.objid = cls.oid AND dep.refobjsubid = '0' AND dep.refclassid=(SELECT oid FROM pg_catalog.pg_class WHERE relname='pg_constraint') AND dep.deptype='i')
     LEFT OUTER JOIN pg_catalog.pg_constraint con ON (con.tableoid = dep.refclassid AND con.oid = dep.refobjid)
-WHERE idx.indrelid = {{tid}}::oid
+WHERE idx.indrelid {% if tids %}IN ({{ tids|join(', ') }}){% else %}= {{tid}}::oid{% endif %}
     AND con.contype='x'
 
 UNION
 
-SELECT  cls.oid, cls.relname as idxname, indnatts
+SELECT  {% if tids %}idx.indrelid, {% endif %}cls.oid, cls.relname as idxname, indnatts
     FROM pg_catalog.pg_index idx
     JOIN pg_catalog.pg_class cls ON cls.oid=indexrelid
     LEFT JOIN pg_catalog.pg_depend dep ON (dep.classid = cls.tableoid AND dep.objid = cls.oid AND dep.refobjsubid = '0' AND dep.refclassid=(SELECT oid FROM pg_catalog.pg_class WHERE relname='pg_constraint') AND dep.deptype='i')
     LEFT OUTER JOIN pg_catalog.pg_constraint con ON (con.tableoid = dep.refclassid AND con.oid = dep.refobjid)
-WHERE idx.indrelid = {{tid}}::oid
+WHERE idx.indrelid {% if tids %}IN ({{ tids|join(', ') }}){% else %}= {{tid}}::oid{% endif %}
     AND con.contype='u'
 
 UNION
 
-SELECT  cls.oid, cls.relname as idxname, indnatts
+SELECT  {% if tids %}idx.indrelid, {% endif %}cls.oid, cls.relname as idxname, indnatts
     FROM pg_catalog.pg_index idx
     JOIN pg_catalog.pg_class cls ON cls.oid=indexrelid
     LEFT JOIN pg_catalog.pg_depend dep ON (dep.classid = cls.tableoid AND dep.objid = cls.oid AND dep.refobjsubid = '0' AND dep.refclassid=(SELECT oid FROM pg_catalog.pg_class WHERE relname='pg_constraint') AND dep.deptype='i')
     LEFT OUTER JOIN pg_catalog.pg_constraint con ON (con.tableoid = dep.refclassid AND con.oid = dep.refobjid)
-WHERE idx.indrelid = {{tid}}::oid
+WHERE idx.indrelid {% if tids %}IN ({{ tids|join(', ') }}){% else %}= {{tid}}::oid{% endif %}
    AND conname IS NULL
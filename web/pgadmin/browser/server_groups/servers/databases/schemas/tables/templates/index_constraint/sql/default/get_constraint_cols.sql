@@ -1,3 +1,10 @@
+{% if constraints %}
+{### Columns of all the given (constraint oid, column count) pairs ###}
+SELECT c.oid, pg_catalog.pg_get_indexdef(c.oid, n, true) AS column
+FROM (VALUES {% for cid, colcnt in constraints %}{% if loop.index != 1 %}, {% endif %}({{ cid|string }}::oid, {{ colcnt|int }}){% endfor %}) c(oid, colcnt),
+    pg_catalog.generate_series(1, c.colcnt) n
+ORDER BY c.oid, n
+{% else %}
 {###
 We need outer SELECT & dummy column to preserve the ordering
 because we lose ordering when we use UNION
@@ -12,3 +19,4 @@ SELECT  pg_catalog.pg_get_indexdef({{ cid|string }} , {{ loop.index|string }} ,
 {% endfor %}
 ) tmp
 ORDER BY dummy
+{% endif %}
@@ -1,16 +1,21 @@
 -- pg_get_indexdef did not support INCLUDE columns
 
-SELECT a.attname as colname
+SELECT {% if idxs %}i.indexrelid, {% endif %}a.attname as colname
 FROM (
     SELECT
+      i.indexrelid,
       i.indnkeyatts,
       i.indrelid,
       pg_catalog.unnest(indkey) AS table_colnum,
       pg_catalog.unnest(ARRAY(SELECT pg_catalog.generate_series(1, i.indnatts) AS n)) attnum
     FROM
       pg_catalog.pg_index i
+{% if idxs %}
+    WHERE i.indexrelid IN ({{ idxs|join(', ') }})
+{% else %}
     WHERE i.indexrelid = {{idx}}::OID
+{% endif %}
 ) i JOIN pg_catalog.pg_attribute a
 ON (a.attrelid = i.indrelid AND i.table_colnum = a.attnum)
 WHERE i.attnum > i.indnkeyatts
-ORDER BY i.attnum
+ORDER BY {% if idxs %}i.indexrelid, {% endif %}i.attnum
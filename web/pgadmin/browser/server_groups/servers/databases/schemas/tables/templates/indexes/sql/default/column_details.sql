@@ -22,7 +22,11 @@ FROM (
           pg_catalog.unnest(ARRAY(SELECT pg_catalog.generate_series(1, i.indnatts) AS n)) AS attnum
       FROM
           pg_catalog.pg_index i
+{% if idxs %}
+      WHERE i.indexrelid IN ({{ idxs|join(', ') }})
+{% else %}
       WHERE i.indexrelid = {{idx}}::OID
+{% endif %}
 ) i
     LEFT JOIN pg_catalog.pg_opclass o ON (o.oid = i.indclass[i.attnum - 1])
     LEFT OUTER JOIN pg_catalog.pg_constraint c ON (c.conindid = i.indexrelid)
@@ -30,4 +34,4 @@ FROM (
     LEFT JOIN pg_catalog.pg_attribute a ON (a.attrelid = i.indexrelid AND a.attnum = i.attnum)
     LEFT OUTER JOIN pg_catalog.pg_collation coll ON a.attcollation=coll.oid
     LEFT OUTER JOIN pg_catalog.pg_namespace nspc ON coll.collnamespace=nspc.oid
-ORDER BY i.attnum;
+ORDER BY {% if idxs %}i.indexrelid, {% endif %}i.attnum;
@@ -1,4 +1,4 @@
-SELECT DISTINCT ON(cls.relname) cls.oid, cls.relname as name,
+SELECT DISTINCT ON(cls.relname) {% if tids %}indrelid, {% endif %}cls.oid, cls.relname as name,
 (SELECT (CASE WHEN count(i.inhrelid) > 0 THEN true ELSE false END) FROM pg_inherits i WHERE i.inhrelid = cls.oid) as is_inherited,
 CASE WHEN contype IN ('p', 'u', 'x') THEN desp.description ELSE des.description END AS description
 FROM pg_catalog.pg_index idx
@@ -11,7 +11,11 @@ FROM pg_catalog.pg_index idx
     LEFT OUTER JOIN pg_catalog.pg_constraint con ON (con.tableoid = dep.refclassid AND con.oid = dep.refobjid)
     LEFT OUTER JOIN pg_catalog.pg_description des ON (des.objoid=cls.oid AND des.classoid='pg_class'::regclass)
     LEFT OUTER JOIN pg_catalog.pg_description desp ON (desp.objoid=con.oid AND desp.objsubid = 0 AND desp.classoid='pg_constraint'::regclass)
+{% if tids %}
+WHERE indrelid IN ({{ tids|join(', ') }})
+{% else %}
 WHERE indrelid = {{tid}}::OID
+{% endif %}
 {% if not show_sys_objects %}
     AND conname is NULL
 {% endif %}
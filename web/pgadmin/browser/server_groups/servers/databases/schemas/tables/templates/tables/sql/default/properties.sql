@@ -61,7 +61,7 @@ SELECT rel.oid, rel.relname AS name, rel.reltablespace AS spcoid,rel.relacl AS r
 	(SELECT pg_catalog.array_agg(provider || '=' || label) FROM pg_catalog.pg_seclabels sl1 WHERE sl1.objoid=rel.oid AND sl1.objsubid=0) AS seclabels,
 	(CASE WHEN rel.oid <= {{ datlastsysoid}}::oid THEN true ElSE false END) AS is_sys_table
 	-- Added for partition table
-    {% if tid %}, (CASE WHEN rel.relkind = 'p' THEN pg_catalog.pg_get_partkeydef({{ tid }}::oid) ELSE '' END) AS partition_scheme {% endif %}
+    {% if tid or tids %}, (CASE WHEN rel.relkind = 'p' THEN pg_catalog.pg_get_partkeydef(rel.oid) ELSE '' END) AS partition_scheme {% endif %}
 FROM pg_catalog.pg_class rel
   LEFT OUTER JOIN pg_catalog.pg_tablespace spc on spc.oid=rel.reltablespace
   LEFT OUTER JOIN pg_catalog.pg_description des ON (des.objoid=rel.oid AND des.objsubid=0 AND des.classoid='pg_class'::regclass)
@@ -70,5 +70,5 @@ FROM pg_catalog.pg_class rel
   LEFT JOIN pg_catalog.pg_type typ ON rel.reloftype=typ.oid
 WHERE rel.relkind IN ('r','s','t','p') AND rel.relnamespace = {{ scid }}::oid
 AND NOT rel.relispartition
-{% if tid %}  AND rel.oid = {{ tid }}::oid {% endif %}
+{% if tid %}  AND rel.oid = {{ tid }}::oid {% elif tids %}  AND rel.oid IN ({{ tids|join(', ') }}) {% endif %}
 ORDER BY rel.relname;
@@ -1,4 +1,4 @@
-SELECT pg_catalog.quote_ident(nspname) || '.' || pg_catalog.quote_ident(proname) AS tfunctions
+SELECT {% if tgfoids %}p.oid, {% endif %}pg_catalog.quote_ident(nspname) || '.' || pg_catalog.quote_ident(proname) AS tfunctions
 FROM pg_catalog.pg_proc p, pg_catalog.pg_namespace n, pg_catalog.pg_language l
     WHERE p.pronamespace = n.oid
     AND p.prolang = l.oid
@@ -11,5 +11,7 @@ FROM pg_catalog.pg_proc p, pg_catalog.pg_namespace n, pg_catalog.pg_language l
     -- Find function for specific OID
     {% if tgfoid %}
     AND p.oid = {{tgfoid}}::OID
+    {% elif tgfoids %}
+    AND p.oid IN ({{ tgfoids|join(', ') }})
     {% endif %}
     ORDER BY nspname ASC, proname ASC
@@ -1,8 +1,12 @@
-SELECT t.oid, t.tgname as name, t.tgenabled AS is_enable_trigger, des.description
+SELECT {% if tids %}t.tgrelid, {% endif %}t.oid, t.tgname as name, t.tgenabled AS is_enable_trigger, des.description
 FROM pg_catalog.pg_trigger t
     LEFT OUTER JOIN pg_catalog.pg_description des ON (des.objoid=t.oid AND des.classoid='pg_trigger'::regclass)
 WHERE NOT tgisinternal
+{% if tids %}
+    AND tgrelid IN ({{ tids|join(', ') }})
+{% else %}
     AND tgrelid = {{tid}}::OID
+{% endif %}
 {% if trid %}
     AND t.oid = {{trid}}::OID
 {% endif %}
@@ -0,0 +1,442 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2024, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import copy
+import json
+from unittest.mock import patch, MagicMock
+
+from pgadmin.browser.server_groups.servers.databases.schemas.tables import \
+    utils as tables_utils
+from pgadmin.browser.server_groups.servers.databases.schemas.tables.\
+    columns import utils as column_utils
+from pgadmin.browser.server_groups.servers.databases.schemas.tables.\
+    constraints.check_constraint import utils as check_utils
+from pgadmin.browser.server_groups.servers.databases.schemas.tables.\
+    constraints.exclusion_constraint import utils as exclusion_utils
+from pgadmin.browser.server_groups.servers.databases.schemas.tables.\
+    constraints.foreign_key import utils as fkey_utils
+from pgadmin.browser.server_groups.servers.databases.schemas.tables.\
+    constraints.index_constraint import utils as idxcons_utils
+from pgadmin.browser.server_groups.servers.databases.schemas.tables import \
+    indexes as indexes_module
+from pgadmin.browser.server_groups.servers.databases.schemas.tables.\
+    indexes import utils as index_utils
+from pgadmin.browser.server_groups.servers.databases.schemas.tables import \
+    triggers as triggers_module
+from pgadmin.browser.server_groups.servers.databases.schemas.tables.\
+    triggers import utils as trigger_utils
+from pgadmin.browser.server_groups.servers.databases.schemas.tables.utils \
+    import BaseTableView
+from pgadmin.tools.erd.utils import ERDTableView
+from pgadmin.tools.schema_diff.node_registry import SchemaDiffRegistry
+from pgadmin.utils.route import BaseTestGenerator
+
+SCID = 2200
+CUSTOMERS, ORDERS, AUDIT = 16400, 16410, 16420
+
+
+def _table(oid, name, **kwargs):
+    row = {
+        'oid': oid, 'name': name, 'schema': 'public', 'spcname': None,
+        'relowner': 'postgres', 'reltuples': 0, 'reloptions': None,
+        'toast_reloptions': None, 'typoid': None, 'typname': None,
+        'coll_inherits': [], 'seclabels': None, 'is_partitioned': False,
+        'relispartition': False, 'rlspolicy': False,
+        'forcerlspolicy': False, 'description': None
+    }
+    row.update(kwargs)
+    return row
+
+
+def _column(attnum, name, typname, **kwargs):
+    atttypid = {'integer': 23, 'text': 25}[typname]
+    row = {
+        'attnum': attnum, 'name': name, 'atttypid': atttypid,
+        'typname': typname, 'displaytypname': typname, 'cltype': typname,
+        'typnspname': 'pg_catalog', 'isdup': False, 'attndims': 0,
+        'atttypmod': -1, 'elemoid': atttypid, 'defval': None,
+        'attnotnull': False, 'attoptions': None, 'seclabels': None,
+        'indkey': '1', 'description': None
+    }
+    row.update(kwargs)
+    return row
+
+
+def _acl(grantee, privileges, **kwargs):
+    row = {'deftype': 'relacl', 'grantee': grantee, 'grantor': 'postgres',
+           'privileges': privileges, 'grantable': [False] * len(privileges)}
+    row.update(kwargs)
+    return row
+
+
+TABLES = [
+    _table(AUDIT, 'audit'),
+    _table(CUSTOMERS, 'customers', reltuples=12,
+           seclabels=['dummy=classified']),
+    _table(ORDERS, 'orders', description='orders of the customers'),
+]
+
+TABLE_ACLS = {
+    CUSTOMERS: [_acl('PUBLIC', ['r']), _acl('postgres', ['a', 'r', 'w'])],
+    ORDERS: [_acl('reader', ['r'])],
+}
+
+COLUMNS = {
+    CUSTOMERS: [
+        _column(1, 'id', 'integer',
+                defval="nextval('customers_id_seq'::regclass)"),
+        _column(2, 'name', 'text', attnotnull=True),
+    ],
+    ORDERS: [
+        _column(1, 'id', 'integer'),
+        _column(2, 'customer_id', 'integer'),
+        _column(3, 'note', 'text', description='free text'),
+    ],
+}
+
+COLUMN_ACLS = {
+    (CUSTOMERS, 2): [_acl('reader', ['r'], deftype='attacl')],
+    (ORDERS, 3): [_acl('writer', ['a', 'w'], deftype='attacl')],
+}
+
+EDIT_TYPES = {23: ['bigint', 'numeric', 'text'], 25: ['character varying']}
+
+# Primary keys, unique and exclusion constraints: (table, row, columns)
+INDEX_CONSTRAINTS = {
+    'p': [
+        (CUSTOMERS, {'oid': 16401, 'name': 'customers_pkey',
+                     'col_count': 1, 'comment': None}, ['"id"'], []),
+        (ORDERS, {'oid': 16411, 'name': 'orders_pkey', 'col_count': 1,
+                  'comment': None}, ['"id"'], ['note']),
+    ],
+    'u': [
+        (CUSTOMERS, {'oid': 16402, 'name': 'customers_name_key',
+                     'col_count': 1, 'comment': None}, ['"name"'], []),
+    ],
+}
+
+FOREIGN_KEYS = [
+    (ORDERS, {'oid': 16412, 'name': 'orders_customer_fk',
+              'confrelid': CUSTOMERS, 'confkey': [1], 'conkey': [2],
+              'refnsp': 'public', 'reftab': 'customers',
+              'conislocal': True},
+     [('customer_id', 'id')]),
+]
+
+# Indexes the foreign keys may be covered by: (table, row, columns)
+COVERING_INDEXES = [
+    (CUSTOMERS, {'oid': 16401, 'idxname': 'customers_pkey',
+                 'col_count': 1}, ['"id"']),
+    (ORDERS, {'oid': 16411, 'idxname': 'orders_pkey', 'col_count': 1},
+     ['"id"']),
+    (ORDERS, {'oid': 16414, 'idxname': 'orders_customer_idx',
+              'col_count': 1}, ['"customer_id"']),
+]
+
+CHECK_CONSTRAINTS = [
+    (ORDERS, {'oid': 16413, 'name': 'orders_note_check',
+              'consrc': 'length(note) < 100', 'conislocal': True}),
+]
+
+EXCLUSION_CONSTRAINTS = [
+    (ORDERS, {'oid': 16415, 'name': 'orders_excl', 'col_count': 1,
+              'amname': ''},
+     [{'options': 0, 'coldef': '"customer_id"', 'opcname': None,
+       'oprname': '=', 'datatype': 'integer', 'is_exp': False}],
+     ['note']),
+]
+
+INDEXES = [
+    (ORDERS, {'oid': 16414, 'name': 'orders_customer_idx',
+              'amname': 'btree', 'indisunique': False},
+     [{'attnum': 1, 'attdef': '"customer_id"', 'collnspname': '',
+       'opcname': None, 'is_exp': False, 'statistics': -1,
+       'options': ['DESC', 'NULLS LAST']}],
+     ['note']),
+    (CUSTOMERS, {'oid': 16403, 'name': 'customers_lower_name_idx',
+                 'amname': 'hash', 'indisunique': False},
+     [{'attnum': 1, 'attdef': 'lower(name)', 'collnspname': '',
+       'opcname': None, 'is_exp': True, 'statistics': -1,
+       'options': ['ASC', 'NULLS LAST']}],
+     []),
+]
+
+TRIGGERS = [
+    (ORDERS, {'oid': 16416, 'name': 'orders_audit', 'tgtype': 29,
+              'tgfoid': 16500, 'custom_tgargs': [], 'tgattr': '3',
+              'lanname': 'plpgsql', 'is_enable_trigger': 'O'}),
+    (CUSTOMERS, {'oid': 16404, 'name': 'customers_audit', 'tgtype': 5,
+                 'tgfoid': 16500, 'custom_tgargs': [], 'tgattr': '',
+                 'lanname': 'plpgsql', 'is_enable_trigger': 'O'}),
+]
+
+TRIGGER_FUNCTIONS = {16500: 'public.log_change'}
+
+
+def _render_template(template, **kwargs):
+    query = dict((key, value) for key, value in kwargs.items()
+                 if key not in ('conn', 'data'))
+    if 'keys' in query:
+        query['keys'] = list(query['keys'])
+    if 'data' in kwargs:
+        query['table'] = kwargs['data']['name']
+    query['template'] = '/'.join(
+        [template.split('/')[0], template.split('/')[-1]])
+    return json.dumps(query, default=str)
+
+
+class _FakeConnection:
+    """Answers the queries from the catalog above."""
+
+    def __init__(self):
+        self.queries = []
+        self.manager = MagicMock(server_type='pg', version=140000,
+                                 sversion=140000)
+
+    def _rows(self, query):
+        tids = query.get('tids') or [query.get('tid')]
+        template = query['template']
+        rows = []
+
+        def add(tid, row, key=None, **kwargs):
+            if tid in tids:
+                row = dict(copy.deepcopy(row), **kwargs)
+                if key and query.get('tids'):
+                    row[key] = tid
+                rows.append(row)
+
+        if template == 'tables/nodes.sql':
+            return [{'oid': t['oid'], 'name': t['name']} for t in TABLES]
+        if template == 'tables/properties.sql':
+            for table in TABLES:
+                add(table['oid'], table)
+        elif template == 'tables/acl.sql':
+            for tid, acls in TABLE_ACLS.items():
+                for acl in acls:
+                    add(tid, acl, 'oid')
+        elif template == 'columns/properties.sql':
+            for tid, columns in COLUMNS.items():
+                for column in columns:
+                    add(tid, column, 'attrelid')
+        elif template == 'columns/acl.sql':
+            for (tid, attnum), acls in COLUMN_ACLS.items():
+                for acl in acls:
+                    if query.get('tids'):
+                        add(tid, acl, 'attrelid', attnum=attnum)
+                    elif attnum == query['clid']:
+                        add(tid, acl)
+        elif template == 'columns/edit_mode_types_multi.sql':
+            return [{'main_oid': int(type_id),
+                     'edit_types': EDIT_TYPES[int(type_id)]}
+                    for type_id in query['type_ids'].split(',')]
+        elif template == 'index_constraint/properties.sql':
+            for tid, row, _, _ in \
+                    INDEX_CONSTRAINTS[query['constraint_type']]:
+                add(tid, row, 'indrelid')
+        elif template in ('index_constraint/get_constraint_cols.sql',
+                          'foreign_key/get_cols.sql'):
+            columns = dict((row['oid'], cols) for _, row, cols, _ in
+                           sum(INDEX_CONSTRAINTS.values(), []))
+            columns.update((row['oid'], cols)
+                           for _, row, cols in COVERING_INDEXES)
+            for oid, _ in query.get('constraints') or \
+                    [(query['cid'], query['colcnt'])]:
+                for column in columns[oid]:
+                    rows.append({'column': column})
+                    if query.get('constraints'):
+                        rows[-1]['oid'] = oid
+        elif template in ('index_constraint/get_constraint_include.sql',
+                          'exclusion_constraint/get_constraint_include.sql'):
+            include = dict((row['oid'], cols) for _, row, _, cols in
+                           sum(INDEX_CONSTRAINTS.values(), []) +
+                           EXCLUSION_CONSTRAINTS)
+            for oid in query.get('cids') or [query['cid']]:
+                for colname in include[oid]:
+                    rows.append({'colname': colname})
+                    if query.get('cids'):
+                        rows[-1]['oid'] = oid
+        elif template == 'foreign_key/properties.sql':
+            for tid, row, _ in FOREIGN_KEYS:
+                add(tid, row, 'conrelid')
+        elif template == 'foreign_key/get_constraint_cols.sql':
+            for _, row, columns in FOREIGN_KEYS:
+                if query.get('cids') and row['oid'] in query['cids'] or \
+                        row['conkey'] == [k[1] for k in query['keys']]:
+                    for conattname, confattname in columns:
+                        rows.append({'conattname': conattname,
+                                     'confattname': confattname})
+                        if query.get('cids'):
+                            rows[-1]['oid'] = row['oid']
+        elif template == 'foreign_key/get_constraints.sql':
+            for tid, row, _ in COVERING_INDEXES:
+                add(tid, row, 'indrelid')
+        elif template == 'check_constraint/properties.sql':
+            for tid, row in CHECK_CONSTRAINTS:
+                add(tid, row, 'conrelid')
+        elif template == 'exclusion_constraint/properties.sql':
+            for tid, row, _, _ in EXCLUSION_CONSTRAINTS:
+                add(tid, row, 'indrelid')
+        elif template == 'exclusion_constraint/get_constraint_cols.sql':
+            for _, row, columns, _ in EXCLUSION_CONSTRAINTS:
+                if row['oid'] == query['cid']:
+                    rows.extend(copy.deepcopy(columns))
+        elif template in ('indexes/get_parent.sql',
+                          'triggers/get_parent.sql'):
+            rows.append({'schema': 'public', 'table': 'orders'})
+        elif template in ('indexes/nodes.sql', 'triggers/nodes.sql'):
+            objects = INDEXES if template == 'indexes/nodes.sql' \
+                else TRIGGERS
+            for tid, row in ((o[0], o[1]) for o in objects):
+                add(tid, {'oid': row['oid'], 'name': row['name']},
+                    'indrelid' if objects is INDEXES else 'tgrelid')
+        elif template == 'indexes/properties.sql':
+            for tid, row, _, _ in INDEXES:
+                if query.get('idx') in (None, row['oid']):
+                    add(tid, row, indrelid=tid)
+        elif template == 'indexes/column_details.sql':
+            for _, row, columns, _ in INDEXES:
+                if row['oid'] in (query.get('idxs') or [query.get('idx')]):
+                    rows.extend(dict(column, indexrelid=row['oid'])
+                                for column in copy.deepcopy(columns))
+        elif template == 'indexes/include_details.sql':
+            for _, row, _, include in INDEXES:
+                if row['oid'] in (query.get('idxs') or [query.get('idx')]):
+                    for colname in include:
+                        rows.append({'colname': colname})
+                        if query.get('idxs'):
+                            rows[-1]['indexrelid'] = row['oid']
+        elif template == 'triggers/properties.sql':
+            for tid, row in TRIGGERS:
+                if query.get('trid') in (None, row['oid']):
+                    add(tid, row, tgrelid=tid)
+        elif template == 'triggers/get_triggerfunctions.sql':
+            for oid, name in TRIGGER_FUNCTIONS.items():
+                if oid in (query.get('tgfoids') or [query.get('tgfoid')]):
+                    rows.append({'tfunctions': name})
+                    if query.get('tgfoids'):
+                        rows[-1]['oid'] = oid
+        elif template == 'triggers/get_columns.sql':
+            rows.append({'name': 'note'})
+        else:
+            raise AssertionError('Unexpected query ' + template)
+
+        return rows
+
+    def _query(self, sql):
+        query = json.loads(sql)
+        self.queries.append(query['template'])
+        return query
+
+    def execute_dict(self, sql):
+        return True, {'rows': self._rows(self._query(sql))}
+
+    def execute_2darray(self, sql):
+        return self.execute_dict(sql)
+
+    def execute_scalar(self, sql):
+        query = self._query(sql)
+        return True, {'customers': '12'}[query['table']]
+
+
+class TableSchemaDiffSnapshotTestCase(BaseTestGenerator):
+    """
+    Check that the tables fetched for the ERD and the schema diff with the
+    catalog snapshot are identical to the ones fetched table by table.
+    """
+
+    scenarios = [
+        ('Fetch the tables of a schema with the catalog snapshot',
+         dict(manager_version=140000)),
+        ('Fetch the tables of a schema before PG 11',
+         dict(manager_version=100000)),
+    ]
+
+    def fetch(self, snapshot):
+        conn = _FakeConnection()
+        conn.manager.version = self.manager_version
+        manager = conn.manager
+        manager.connection.return_value = conn
+        driver = MagicMock()
+        driver.connection_manager.return_value = manager
+        preferences = MagicMock()
+        preferences.preference.return_value.get.return_value = 1000
+
+        get_node_view = SchemaDiffRegistry.get_node_view
+
+        def _get_node_view(node):
+            # Rules and policies are always fetched table by table
+            if node in ('index', 'trigger'):
+                return get_node_view(node)
+            view = MagicMock()
+            view.blueprint.server_type = None
+            view.fetch_objects_to_compare.return_value = {}
+            return view
+
+        patches = [
+            patch.object(module, 'render_template',
+                         side_effect=_render_template)
+            for module in (tables_utils, column_utils, idxcons_utils,
+                           fkey_utils, check_utils, exclusion_utils,
+                           indexes_module, index_utils, triggers_module,
+                           trigger_utils)
+        ] + [
+            patch.object(module, 'get_driver', return_value=driver)
+            for module in (tables_utils, indexes_module, triggers_module,
+                           trigger_utils)
+        ] + [
+            patch.object(module.blueprint, 'pref_show_system_objects', None,
+                         create=True)
+            for module in (indexes_module, triggers_module)
+        ] + [
+            patch.object(tables_utils, 'Preferences',
+                         MagicMock(module=MagicMock(
+                             return_value=preferences))),
+            patch.object(tables_utils.SchemaDiffRegistry, 'get_node_view',
+                         side_effect=_get_node_view),
+            patch.object(BaseTableView, 'parse_vacuum_data',
+                         return_value=[]),
+            patch.object(BaseTableView, 'update_autovacuum_properties'),
+            patch.object(tables_utils.config,
+                         'SCHEMA_DIFF_CATALOG_SNAPSHOT', snapshot),
+        ]
+        for p in patches:
+            p.start()
+        try:
+            status, tables = ERDTableView().fetch_all_tables(
+                did=1, sid=1, scid=SCID)
+        finally:
+            for p in reversed(patches):
+                p.stop()
+
+        self.assertTrue(status)
+        return tables, conn.queries
+
+    def runTest(self):
+        expected, queries = self.fetch(snapshot=False)
+        self.assertEqual([table['name'] for table in expected],
+                         ['audit', 'customers', 'orders'])
+
+        result, snapshot_queries = self.fetch(snapshot=True)
+        self.assertEqual(result, expected)
+        self.assertLess(len(snapshot_queries), len(queries))
+
+        # The properties of the tables, their privileges and columns, and
+        # the constraints, indexes and triggers of all the tables are
+        # fetched with a single query each.
+        for template in ('tables/properties.sql', 'tables/acl.sql',
+                         'columns/properties.sql', 'columns/acl.sql',
+                         'foreign_key/properties.sql',
+                         'check_constraint/properties.sql',
+                         'exclusion_constraint/properties.sql',
+                         'indexes/nodes.sql', 'indexes/properties.sql',
+                         'indexes/column_details.sql',
+                         'triggers/nodes.sql', 'triggers/properties.sql'):
+            self.assertEqual(snapshot_queries.count(template), 1, template)
+        self.assertEqual(
+            snapshot_queries.count('index_constraint/properties.sql'), 2)
@@ -90,7 +90,8 @@ def get_column_details(conn, tid, clist, template_path=None):
 
 @get_template_path
 def get_trigger_function_and_columns(conn, data, tid,
-                                     show_system_objects, template_path=None):
+                                     show_system_objects, template_path=None,
+                                     tfunctions=None):
     """
     This function will return trigger function with schema name.
     :param conn: Connection Object
@@ -98,20 +99,24 @@ def get_trigger_function_and_columns(conn, data, tid,
     :param tid: Table ID
     :param show_system_objects: show system object
     :param template_path: Optional Template Path
+    :param tfunctions: Rows of the trigger function if already fetched
     :return:
     """
     # If language is 'edbspl' then trigger function should be
     # 'Inline EDB-SPL' else we will find the trigger function
     # with schema name.
-    SQL = render_template("/".join(
-        [template_path, 'get_triggerfunctions.sql']),
-        tgfoid=data['tgfoid'],
-        show_system_objects=show_system_objects
-    )
+    if tfunctions is not None:
+        result = {'rows': tfunctions}
+    else:
+        SQL = render_template("/".join(
+            [template_path, 'get_triggerfunctions.sql']),
+            tgfoid=data['tgfoid'],
+            show_system_objects=show_system_objects
+        )
 
-    status, result = conn.execute_dict(SQL)
-    if not status:
-        return internal_server_error(errormsg=result)
+        status, result = conn.execute_dict(SQL)
+        if not status:
+            return internal_server_error(errormsg=result)
 
         # Update the trigger function which we have fetched with
         # schema name
@@ -138,6 +143,71 @@ def get_trigger_function_and_columns(conn, data, tid,
     return data
 
 
+@get_template_path
+def get_triggers_of_tables(conn, tids, show_system_objects, datlastsysoid,
+                           template_path=None):
+    """
+    This function will fetch the properties of the triggers of all the
+    given tables to compare, same as fetch_objects_to_compare of the
+    trigger view for each of them. The columns of the triggers are still
+    fetched per trigger.
+    :param conn: Connection Object
+    :param tids: Table IDs
+    :param show_system_objects: show system object
+    :param datlastsysoid: Last system oid of the database
+    :param template_path: Optional Template Path
+    :return: dict of the triggers by name by table id
+    """
+    res = dict((tid, dict()) for tid in tids)
+
+    SQL = render_template("/".join([template_path, 'nodes.sql']),
+                          tids=tids, schema_diff=True)
+    status, triggers = conn.execute_2darray(SQL)
+    if not status:
+        raise ExecuteError(triggers)
+
+    if len(triggers['rows']) == 0:
+        return res
+
+    SQL = render_template("/".join([template_path, 'properties.sql']),
+                          tids=tids, datlastsysoid=datlastsysoid)
+    status, properties = conn.execute_dict(SQL)
+    if not status:
+        raise ExecuteError(properties)
+
+    properties = dict((row['oid'], row) for row in properties['rows'])
+
+    tgfoids = set(row['tgfoid'] for row in properties.values()
+                  if row['tgfoid'])
+    tfunctions = dict()
+    if tgfoids:
+        SQL = render_template("/".join(
+            [template_path, 'get_triggerfunctions.sql']),
+            tgfoids=sorted(tgfoids),
+            show_system_objects=show_system_objects
+        )
+        status, result = conn.execute_dict(SQL)
+        if not status:
+            raise ExecuteError(result)
+
+        for row in result['rows']:
+            tfunctions[row['oid']] = [row]
+
+    for row in triggers['rows']:
+        if row['oid'] not in properties:
+            continue
+
+        data = dict(properties[row['oid']])
+        data = get_trigger_function_and_columns(
+            conn, data, data['tgrelid'], show_system_objects,
+            tfunctions=tfunctions.get(data['tgfoid'], [])
+            if data['tgfoid'] else None)
+
+        res[row['tgrelid']][row['name']] = trigger_definition(data)
+
+    return res
+
+
 @get_template_path
 def get_sql(conn, **kwargs):
     """
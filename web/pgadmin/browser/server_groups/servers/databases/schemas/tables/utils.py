@@ -13,7 +13,7 @@ import re
 import copy
 from functools import wraps
 import json
-from flask import render_template, jsonify, request
+from flask import render_template, jsonify, request, current_app
 from flask_babel import gettext
 
 from pgadmin.browser.server_groups.servers.databases.schemas\
@@ -27,6 +27,8 @@ from pgadmin.browser.server_groups.servers.utils import parse_priv_from_db, \
 from pgadmin.browser.utils import PGChildNodeView
 from pgadmin.utils.compile_template_name import compile_template_path
 from pgadmin.utils.driver import get_driver
+from pgadmin.utils.exception import ExecuteError
+import config
 from config import PG_DEFAULT_DRIVER
 from pgadmin.browser.server_groups.servers.databases.schemas.tables.\
     columns import utils as column_utils
@@ -164,12 +166,14 @@ class BaseTableView(PGChildNodeView, BasePartitionTable, VacuumSettings):
 
         return wrap
 
-    def _formatter(self, did, scid, tid, data, with_serial_cols=False):
+    def _formatter(self, did, scid, tid, data, with_serial_cols=False,
+                   snapshot=None):
         """
         Args:
             data: dict of query result
             scid: schema oid
             tid: table oid
+            snapshot: tables of the schema fetched by _fetch_schema_tables
 
         Returns:
             It will return formatted output of query result
@@ -185,12 +189,15 @@ class BaseTableView(PGChildNodeView, BasePartitionTable, VacuumSettings):
             data['seclabels'] = seclabels
 
         # We need to parse & convert ACL coming from database to json format
-        sql = render_template("/".join([self.table_template_path,
-                                        self._ACL_SQL]),
-                              tid=tid, scid=scid)
-        status, acl = self.conn.execute_dict(sql)
-        if not status:
-            return internal_server_error(errormsg=acl)
+        if snapshot is not None:
+            acl = {'rows': snapshot['acl'][tid]}
+        else:
+            sql = render_template("/".join([self.table_template_path,
+                                            self._ACL_SQL]),
+                                  tid=tid, scid=scid)
+            status, acl = self.conn.execute_dict(sql)
+            if not status:
+                return internal_server_error(errormsg=acl)
 
         BaseTableView._set_privileges_for_properties(data, acl)
 
@@ -232,12 +239,13 @@ class BaseTableView(PGChildNodeView, BasePartitionTable, VacuumSettings):
 
         # We will fetch all the columns for the table using
         # columns properties.sql, so we need to set template path
-        data = column_utils.get_formatted_columns(self.conn, tid,
-                                                  data, other_columns,
-                                                  table_or_type,
-                                                  with_serial=with_serial_cols)
+        data = column_utils.get_formatted_columns(
+            self.conn, tid, data, other_columns, table_or_type,
+            with_serial=with_serial_cols,
+            prefetched=snapshot['columns'][tid] if snapshot is not None
+            else None)
 
-        self._add_constrints_to_output(data, did, tid)
+        self._add_constrints_to_output(data, did, tid, snapshot)
 
         return data
 
@@ -279,15 +287,28 @@ class BaseTableView(PGChildNodeView, BasePartitionTable, VacuumSettings):
             else:
                 data[row['deftype']] = [priv]
 
-    def _add_constrints_to_output(self, data, did, tid):
+    @staticmethod
+    def _get_constraints_from_snapshot(snapshot, key, tid):
+        # Constraints of the table fetched along with the ones of the other
+        # tables of the schema
+        status, constraints = snapshot[key]
+        if not status:
+            return status, constraints
+        return status, constraints.get(tid, [])
+
+    def _add_constrints_to_output(self, data, did, tid, snapshot=None):
         # Here we will add constraint in our output
         index_constraints = {
             'p': 'primary_key', 'u': 'unique_constraint'
         }
         for ctype in index_constraints.keys():
             data[index_constraints[ctype]] = []
-            status, constraints = \
-                idxcons_utils.get_index_constraints(self.conn, did, tid, ctype)
+            if snapshot is not None:
+                status, constraints = self._get_constraints_from_snapshot(
+                    snapshot, index_constraints[ctype], tid)
+            else:
+                status, constraints = idxcons_utils.get_index_constraints(
+                    self.conn, did, tid, ctype)
             if status:
                 for cons in constraints:
                     if not self.\
@@ -296,23 +317,36 @@ class BaseTableView(PGChildNodeView, BasePartitionTable, VacuumSettings):
                             index_constraints[ctype], []).append(cons)
 
         # Add Foreign Keys
-        status, foreign_keys = fkey_utils.get_foreign_keys(self.conn, tid)
+        if snapshot is not None:
+            status, foreign_keys = self._get_constraints_from_snapshot(
+                snapshot, 'foreign_key', tid)
+        else:
+            status, foreign_keys = fkey_utils.get_foreign_keys(self.conn, tid)
         if status:
             for fk in foreign_keys:
                 if not self._is_partition_and_constraint_inherited(fk, data):
                     data.setdefault('foreign_key', []).append(fk)
 
         # Add Check Constraints
-        status, check_constraints = \
-            check_utils.get_check_constraints(self.conn, tid)
+        if snapshot is not None:
+            status, check_constraints = self._get_constraints_from_snapshot(
+                snapshot, 'check_constraint', tid)
+        else:
+            status, check_constraints = \
+                check_utils.get_check_constraints(self.conn, tid)
         if status:
             for cc in check_constraints:
                 if not self._is_partition_and_constraint_inherited(cc, data):
                     data.setdefault('check_constraint', []).append(cc)
 
         # Add Exclusion Constraint
-        status, exclusion_constraints = \
-            exclusion_utils.get_exclusion_constraints(self.conn, did, tid)
+        if snapshot is not None:
+            status, exclusion_constraints = \
+                self._get_constraints_from_snapshot(
+                    snapshot, 'exclude_constraint', tid)
+        else:
+            status, exclusion_constraints = \
+                exclusion_utils.get_exclusion_constraints(self.conn, did, tid)
         if status:
             for ex in exclusion_constraints:
                 data.setdefault('exclude_constraint', []).append(ex)
@@ -530,26 +564,38 @@ class BaseTableView(PGChildNodeView, BasePartitionTable, VacuumSettings):
             if not status:
                 return False, tables
 
+            snapshot = None
+            if config.SCHEMA_DIFF_CATALOG_SNAPSHOT and tables['rows']:
+                status, snapshot = BaseTableView._fetch_schema_tables(
+                    self, did, scid, [row['oid'] for row in tables['rows']])
+                if not status:
+                    return False, snapshot
+
             for row in tables['rows']:
-                status, data = \
-                    self._fetch_table_properties(did, scid, row['oid'])
+                if snapshot is not None:
+                    data = snapshot['tables'].get(row['oid'])
+                    status = data is not None
+                else:
+                    status, data = \
+                        self._fetch_table_properties(did, scid, row['oid'])
 
                 if status:
                     data = BaseTableView.properties(
                         self, 0, sid, did, scid, row['oid'], res=data,
                         with_serial_cols=with_serial_cols,
-                        return_ajax_response=False
+                        return_ajax_response=False, snapshot=snapshot
                     )
 
                     # Get sub module data of a specified table for object
                     # comparison
                     BaseTableView._get_sub_module_data_for_compare(
-                        self, sid, did, scid, data, row)
+                        self, sid, did, scid, data, row, snapshot)
                     res[row['name']] = data
 
             return True, res
 
-    def _get_sub_module_data_for_compare(self, sid, did, scid, data, row):
+    def _get_sub_module_data_for_compare(self, sid, did, scid, data, row,
+                                         snapshot=None):
         # Get sub module data of a specified table for object
         # comparison
         for module in self.tables_sub_modules:
@@ -557,9 +603,12 @@ class BaseTableView(PGChildNodeView, BasePartitionTable, VacuumSettings):
             if module_view.blueprint.server_type is None or \
                 self.manager.server_type in \
                     module_view.blueprint.server_type:
-                sub_data = module_view.fetch_objects_to_compare(
-                    sid=sid, did=did, scid=scid, tid=row['oid'],
-                    oid=None)
+                if snapshot is not None and module in snapshot:
+                    sub_data = snapshot[module][row['oid']]
+                else:
+                    sub_data = module_view.fetch_objects_to_compare(
+                        sid=sid, did=did, scid=scid, tid=row['oid'],
+                        oid=None)
                 data[module] = sub_data
 
     @staticmethod
@@ -601,6 +650,30 @@ class BaseTableView(PGChildNodeView, BasePartitionTable, VacuumSettings):
             return False, gone(
                 gettext(self.not_found_error_msg()))
 
+        status, res = self._format_table_properties(res)
+        if not status:
+            return False, res
+
+        # Fetch privileges
+        sql = render_template("/".join([self.table_template_path,
+                                        self._ACL_SQL]),
+                              tid=tid, scid=scid)
+        status, tblaclres = self.conn.execute_dict(sql)
+        if not status:
+            return internal_server_error(errormsg=res)
+
+        # Get Formatted Privileges
+        res['rows'][0].update(self._format_tbacl_from_db(tblaclres['rows']))
+
+        return True, res
+
+    def _format_table_properties(self, res):
+        """
+        This function is used to format the properties of the table and
+        add its row count.
+        :param res: properties of the table
+        :return:
+        """
         # Update autovacuum properties
         self.update_autovacuum_properties(res['rows'][0])
 
@@ -637,18 +710,107 @@ class BaseTableView(PGChildNodeView, BasePartitionTable, VacuumSettings):
 
             res['rows'][0]['rows_cnt'] = count
 
+        return True, res
+
+    def _fetch_schema_tables(self, did, scid, tids):
+        """
+        This function is used to fetch the properties of all the given
+        tables of the schema, along with their privileges, columns,
+        constraints, indexes and triggers, using a few queries for all the
+        tables instead of a few per table.
+        :param did:
+        :param scid:
+        :param tids:
+        :return: tables of the schema to be passed to properties
+        """
+        sql = render_template(
+            "/".join([self.table_template_path, self._PROPERTIES_SQL]),
+            did=did, scid=scid, tids=tids,
+            datlastsysoid=self._DATABASE_LAST_SYSTEM_OID,
+            conn=self.conn
+        )
+        status, res = self.conn.execute_dict(sql)
+        if not status:
+            return False, internal_server_error(errormsg=res)
+
         # Fetch privileges
         sql = render_template("/".join([self.table_template_path,
                                         self._ACL_SQL]),
-                              tid=tid, scid=scid)
+                              tids=tids, scid=scid)
         status, tblaclres = self.conn.execute_dict(sql)
         if not status:
-            return internal_server_error(errormsg=res)
+            return False, internal_server_error(errormsg=tblaclres)
 
-        # Get Formatted Privileges
-        res['rows'][0].update(self._format_tbacl_from_db(tblaclres['rows']))
+        snapshot = {
+            'tables': dict(),
+            'acl': dict((tid, []) for tid in tids)
+        }
+        for row in tblaclres['rows']:
+            snapshot['acl'][row.pop('oid')].append(row)
 
-        return True, res
+        for row in res['rows']:
+            status, data = self._format_table_properties({'rows': [row]})
+            # Skip the table as done by fetch_tables when fetched by itself
+            if not status:
+                continue
+
+            # Get Formatted Privileges
+            row.update(self._format_tbacl_from_db(
+                snapshot['acl'][row['oid']]))
+            snapshot['tables'][row['oid']] = data
+
+        snapshot['columns'] = column_utils.get_columns_of_tables(
+            self.conn, tids)
+        snapshot['primary_key'] = \
+            idxcons_utils.get_index_constraints_of_tables(
+                self.conn, did, tids, 'p')
+        snapshot['unique_constraint'] = \
+            idxcons_utils.get_index_constraints_of_tables(
+                self.conn, did, tids, 'u')
+        snapshot['foreign_key'] = \
+            fkey_utils.get_foreign_keys_of_tables(self.conn, tids)
+        snapshot['check_constraint'] = \
+            check_utils.get_check_constraints_of_tables(self.conn, tids)
+        snapshot['exclude_constraint'] = \
+            exclusion_utils.get_exclusion_constraints_of_tables(
+                self.conn, did, tids)
+
+        self._fetch_sub_modules_of_tables(did, tids, snapshot)
+
+        return True, snapshot
+
+    def _fetch_sub_modules_of_tables(self, did, tids, snapshot):
+        """
+        This function is used to fetch the indexes and triggers of all the
+        given tables to compare, the objects of the other sub modules are
+        fetched table by table. They are fetched table by table too if
+        the queries fail.
+        :param did:
+        :param tids:
+        :param snapshot: tables of the schema to add them to
+        :return:
+        """
+        # Dynamically load index utils to avoid circular dependency.
+        from pgadmin.browser.server_groups.servers.databases.schemas. \
+            tables.indexes import utils as index_utils
+
+        for module in ('index', 'trigger'):
+            if module not in self.tables_sub_modules:
+                continue
+
+            module_view = SchemaDiffRegistry.get_node_view(module)
+            show_system_objects = module_view.blueprint.show_system_objects
+            try:
+                if module == 'index':
+                    snapshot[module] = index_utils.get_indexes_of_tables(
+                        self.conn, did, tids, show_system_objects,
+                        self._DATABASE_LAST_SYSTEM_OID)
+                else:
+                    snapshot[module] = trigger_utils.get_triggers_of_tables(
+                        self.conn, tids, show_system_objects,
+                        self._DATABASE_LAST_SYSTEM_OID)
+            except ExecuteError as e:
+                current_app.logger.error(e)
 
     def _format_tbacl_from_db(self, tbacl):
         """
@@ -1753,6 +1915,7 @@ class BaseTableView(PGChildNodeView, BasePartitionTable, VacuumSettings):
         res = kwargs.get('res')
         return_ajax_response = kwargs.get('return_ajax_response', True)
         with_serial_cols = kwargs.get('with_serial_cols', False)
+        snapshot = kwargs.get('snapshot')
 
         data = res['rows'][0]
 
@@ -1772,7 +1935,8 @@ class BaseTableView(PGChildNodeView, BasePartitionTable, VacuumSettings):
         ].replace('=', ' = ')
 
         data = self._formatter(did, scid, tid, data,
-                               with_serial_cols=with_serial_cols)
+                               with_serial_cols=with_serial_cols,
+                               snapshot=snapshot)
 
         # Fetch partition of this table if it is partitioned table.
         if 'is_partitioned' in data and data['is_partitioned']:
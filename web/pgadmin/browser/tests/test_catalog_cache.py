@@ -0,0 +1,121 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2024, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+from collections import OrderedDict
+from types import SimpleNamespace
+from unittest.mock import patch, MagicMock
+
+from flask import Flask, Response
+
+from pgadmin.browser import catalog_cache
+from pgadmin.browser.catalog_cache import CatalogCache, REFRESH_HEADER, \
+    NOTIFY_CHANNEL
+from pgadmin.utils.route import BaseTestGenerator
+
+TABLES_URL = '/browser/table/nodes/1/1/5/2200/'
+VIEWS_URL = '/browser/view/nodes/1/1/5/2200/'
+OTHER_DB_URL = '/browser/table/nodes/1/1/6/2200/'
+
+
+class CatalogCacheTestCase(BaseTestGenerator):
+    """
+    Check that the node lists are served from the cache until the objects
+    of their database change, their node is refreshed, or they expire.
+    """
+
+    scenarios = [
+        ('Node lists cached', dict(
+            action=None, produced=['tables', 'views', 'other'])),
+        ('Objects of the database changed', dict(
+            action=lambda: CatalogCache.invalidate(1, 5),
+            produced=['tables', 'views', 'other', 'tables', 'views'])),
+        ('Objects of the server changed', dict(
+            action=lambda: CatalogCache.invalidate(1),
+            produced=['tables', 'views', 'other', 'tables', 'views',
+                      'other'])),
+        ('Catalogs changed notified by the database', dict(
+            action=lambda: CatalogCache._on_notify(
+                1, 5, SimpleNamespace(channel=NOTIFY_CHANNEL)),
+            produced=['tables', 'views', 'other', 'tables', 'views'])),
+        ('Notification of another channel', dict(
+            action=lambda: CatalogCache._on_notify(
+                1, 5, SimpleNamespace(channel='other')),
+            produced=['tables', 'views', 'other'])),
+        ('Node lists expired', dict(
+            action=None, timeout=0,
+            produced=['tables', 'views', 'other'] * 2)),
+        ('Database not connected', dict(
+            # The node view reports the error of its precondition
+            action=None, connected=False,
+            produced=['tables', 'views', 'other'] * 2)),
+        ('Memory limit', dict(
+            # Only two of the node lists fit, the least recently used is
+            # evicted every time.
+            action=None, memory=40,
+            produced=['tables', 'views', 'other'] * 2)),
+    ]
+
+    def fetch(self, url, did, headers=None, user=1):
+        def produce():
+            name = {TABLES_URL: 'tables', VIEWS_URL: 'views'}.get(
+                url, 'other')
+            self.produced.append(name)
+            return Response('{"data": "%s"}' % name, status=200,
+                            mimetype='application/json')
+
+        with self.app.test_request_context(url, headers=headers or {}), \
+                patch.object(catalog_cache, 'current_user',
+                             SimpleNamespace(id=user)):
+            res = CatalogCache.fetch(1, did, produce)
+            return res.get_data(as_text=True)
+
+    def runTest(self):
+        self.app = Flask(__name__)
+        expected = self.produced
+        self.produced = []
+        config = MagicMock(CATALOG_CACHE_MEMORY=getattr(self, 'memory', 1024),
+                           CATALOG_CACHE_TIMEOUT=getattr(self, 'timeout', 60),
+                           CATALOG_CACHE_LISTEN=False)
+
+        with patch.object(catalog_cache, 'config', config), \
+                patch.object(CatalogCache, '_entries', OrderedDict()), \
+                patch.object(CatalogCache, '_scopes', dict()), \
+                patch.object(CatalogCache, '_size', 0), \
+                patch.object(CatalogCache, '_hits', 0), \
+                patch.object(CatalogCache, '_misses', 0), \
+                patch.object(CatalogCache, '_preferences_key',
+                             staticmethod(lambda: None)), \
+                patch.object(CatalogCache, '_connected',
+                             staticmethod(lambda sid, did: getattr(
+                                 self, 'connected', True))):
+            for _ in range(2):
+                self.assertEqual(self.fetch(TABLES_URL, 5),
+                                 '{"data": "tables"}')
+                self.fetch(VIEWS_URL, 5)
+                self.fetch(OTHER_DB_URL, 6)
+                if self.action is not None and len(self.produced) == 3:
+                    self.action()
+
+            self.assertEqual(self.produced, expected)
+
+            stats = CatalogCache.stats()
+            self.assertEqual(stats['misses'], len(expected))
+            self.assertEqual(stats['hits'], 6 - len(expected))
+            self.assertEqual(stats['hit_ratio'], (6 - len(expected)) / 6)
+            self.assertLessEqual(stats['size'], config.CATALOG_CACHE_MEMORY)
+
+            # Refreshing a node fetches its node list again.
+            del self.produced[:]
+            self.fetch(TABLES_URL, 5, headers={REFRESH_HEADER: '1'})
+            self.assertEqual(self.produced, ['tables'])
+
+            # The node lists are cached per user
+            del self.produced[:]
+            self.fetch(TABLES_URL, 5, user=2)
+            self.assertEqual(self.produced, ['tables'])
@@ -0,0 +1,99 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2024, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import re
+from types import SimpleNamespace
+from unittest.mock import patch, MagicMock
+
+from pgadmin.browser import collection
+from pgadmin.browser.collection import CollectionNodeModule
+from pgadmin.browser.utils import CollectionCountBatch
+from pgadmin.utils.route import BaseTestGenerator
+
+COUNTS = {'tables': 3, 'views': 0, 'sequences': 0, 'functions': 1}
+
+COUNT_SQL = re.compile(r'SELECT COUNT\(\*\) FROM (\w+)')
+BATCHED_SQL = re.compile(
+    r'SELECT (\d+) AS idx, c.count FROM \(\nSELECT COUNT\(\*\) FROM (\w+)')
+
+
+class FakeConnection:
+    def __init__(self, batch_fails):
+        self.batch_fails = batch_fails
+        self.executed = []
+
+    def execute_dict(self, sql):
+        self.executed.append(sql)
+        if 'UNION ALL' not in sql:
+            table = COUNT_SQL.match(sql).group(1)
+            return True, {'rows': [{'count': COUNTS[table]}]}
+        if self.batch_fails:
+            return False, 'permission denied'
+        return True, {'rows': [
+            {'idx': int(idx), 'count': COUNTS[table]}
+            for idx, table in BATCHED_SQL.findall(sql)
+        ]}
+
+
+class CollectionCountBatchTestCase(BaseTestGenerator):
+    """
+    Check that the count queries of the collections of a node are run in a
+    single round-trip, and that the empty collections are left out.
+    """
+
+    scenarios = [
+        ('Counts batched', dict(
+            batched=True, batch_fails=False, round_trips=1)),
+        ('Batch failing, counts run one by one', dict(
+            batched=True, batch_fails=True, round_trips=5)),
+        ('Counts not batched', dict(
+            batched=False, batch_fails=False, round_trips=4)),
+    ]
+
+    def runTest(self):
+        conn = FakeConnection(self.batch_fails)
+        manager = MagicMock(server_type='pg', version=160000)
+        manager.connection.return_value = conn
+
+        def module(node_type):
+            return SimpleNamespace(
+                node_type=node_type, show_system_objects=False,
+                pref_show_empty_coll_nodes=MagicMock(
+                    get=MagicMock(return_value=False)))
+
+        def get_nodes(node_type):
+            # As the get_nodes() of the collection modules
+            if CollectionNodeModule.has_nodes(
+                    module(node_type), 1, 2, scid=3,
+                    base_template_path=node_type):
+                yield {'_type': 'coll-' + node_type, 'label': node_type}
+
+        def get_children_nodes():
+            nodes = [{'_type': 'schema', 'label': 'public'}]
+            for node_type in COUNTS:
+                nodes.extend(get_nodes(node_type))
+            return nodes
+
+        with patch.object(collection, 'get_driver') as get_driver, \
+                patch.object(collection, 'render_template',
+                             lambda path, **kwargs: 'SELECT COUNT(*) FROM ' +
+                             path.split('/')[0] + ';\n'):
+            get_driver.return_value.connection_manager.return_value = \
+                manager
+
+            if self.batched:
+                with CollectionCountBatch() as batch:
+                    nodes = batch.filter(get_children_nodes())
+                self.assertIsNone(CollectionCountBatch.current())
+            else:
+                nodes = get_children_nodes()
+
+        self.assertEqual(len(conn.executed), self.round_trips)
+        self.assertEqual([node['label'] for node in nodes],
+                         ['public', 'tables', 'functions'])
@@ -9,6 +9,7 @@
 
 """Browser helper utilities"""
 
+import threading
 from abc import abstractmethod
 
 import flask
@@ -16,12 +17,14 @@ from flask import render_template, current_app
 from flask.views import View, MethodView
 from flask_babel import gettext
 
+import config
 from config import PG_DEFAULT_DRIVER
 from pgadmin.utils.ajax import make_json_response, precondition_required,\
     internal_server_error
 from pgadmin.utils.exception import ConnectionLost, SSHTunnelConnectionLost,\
     CryptKeyMissing
 from pgadmin.utils.constants import DATABASE_LAST_SYSTEM_OID
+from pgadmin.browser.catalog_cache import CatalogCache
 
 
 def underscore_escape(text):
@@ -86,6 +89,124 @@ def is_version_in_range(sversion, min_ver, max_ver):
     return False
 
 
+class CollectionCountBatch():
+    """
+    class CollectionCountBatch
+
+    Collects the count queries of the collection nodes while the children of
+    a node are generated, and runs them together, in a single round-trip per
+    connection, instead of one round-trip per collection.
+
+    Usage:
+        with CollectionCountBatch() as batch:
+            nodes = batch.filter(view.get_children_nodes(manager, **kwargs))
+
+    While the batch is active, CollectionNodeModule.has_nodes adds the count
+    query of its collection to it and assumes the collection is not empty.
+    filter() then runs the queries, and removes the collection nodes found
+    empty.
+    """
+
+    _local = threading.local()
+
+    def __init__(self):
+        self.queries = []
+        self.counts = dict()
+
+    @classmethod
+    def current(cls):
+        """Returns the batch active in the current thread, if any."""
+        return getattr(cls._local, 'batch', None)
+
+    def __enter__(self):
+        self._previous = CollectionCountBatch.current()
+        CollectionCountBatch._local.batch = self
+        return self
+
+    def __exit__(self, *args):
+        CollectionCountBatch._local.batch = self._previous
+
+    def add(self, node_type, conn, sql):
+        """
+        Add the count query of the given collection, to be run over the
+        given connection.
+        """
+        self.queries.append((node_type, conn, sql))
+
+    @staticmethod
+    def _batch_sql(queries):
+        # Every count query becomes a sub-query, the result of which is
+        # tagged with its index in the batch.
+        return '\nUNION ALL\n'.join(
+            'SELECT {0} AS idx, c.count FROM (\n{1}\n) c'.format(
+                idx, sql.strip().rstrip(';'))
+            for idx, (_, _, sql) in queries
+        )
+
+    @staticmethod
+    def _count(conn, sql):
+        try:
+            status, res = conn.execute_dict(sql)
+            return int(res['rows'][0]['count']) if status else None
+        except Exception:
+            return None
+
+    def run(self):
+        """
+        Run the count queries, in a single statement per connection. The
+        queries of a connection are run one by one if the statement fails.
+        """
+        by_conn = dict()
+        for idx, (node_type, conn, sql) in enumerate(self.queries):
+            by_conn.setdefault(id(conn), (conn, []))[1].append(
+                (idx, (node_type, conn, sql)))
+
+        counts = dict()
+        for conn, queries in by_conn.values():
+            if len(queries) == 1:
+                idx, (_, _, sql) = queries[0]
+                counts[idx] = self._count(conn, sql)
+                continue
+
+            try:
+                status, res = conn.execute_dict(self._batch_sql(queries))
+            except Exception:
+                status = False
+
+            if status:
+                for row in res['rows']:
+                    counts.setdefault(row['idx'], int(row['count']))
+            else:
+                for idx, (_, _, sql) in queries:
+                    counts[idx] = self._count(conn, sql)
+
+        # A collection is empty only if all its count queries found nothing.
+        self.counts = dict()
+        for idx, (node_type, _, _) in enumerate(self.queries):
+            count = counts.get(idx)
+            self.counts[node_type] = self.counts.get(node_type, 0) + (
+                1 if count is None else count)
+        self.queries = []
+
+    def is_empty(self, node_type):
+        return self.counts.get(node_type) == 0
+
+    def filter(self, nodes):
+        """
+        Run the count queries collected, and return the given nodes without
+        the empty collections.
+        """
+        self.run()
+        if not isinstance(nodes, list):
+            return nodes
+
+        return [
+            node for node in nodes
+            if not (node.get('_type', '').startswith('coll-') and
+                    self.is_empty(node['_type'][len('coll-'):]))
+        ]
+
+
 class PGChildModule():
     """
     class PGChildModule
@@ -306,7 +427,25 @@ class NodeView(View, metaclass=type(MethodView)):
                 )
             )
 
-        return method(*args, **kwargs)
+        if CatalogCache.cacheable(self, kwargs):
+            return CatalogCache.fetch(
+                kwargs['sid'], kwargs['did'],
+                lambda: method(*args, **kwargs))
+
+        if 'sid' not in kwargs:
+            return method(*args, **kwargs)
+
+        if CatalogCache.refreshing():
+            # The node lists of the node being refreshed are cached under
+            # the nodes of its databases.
+            CatalogCache.invalidate(kwargs['sid'], kwargs.get('did'))
+
+        try:
+            return method(*args, **kwargs)
+        finally:
+            # The objects of the database (or server) may have changed.
+            if http_method != 'get':
+                CatalogCache.invalidate(kwargs['sid'], kwargs.get('did'))
 
     @classmethod
     def register_node_view(cls, blueprint):
@@ -446,12 +585,16 @@ class PGChildNodeView(NodeView):
                 )
             )
 
+        if config.BROWSER_BATCH_COLLECTION_COUNTS:
+            with CollectionCountBatch() as batch:
+                nodes = batch.filter(
+                    self.get_children_nodes(manager, **kwargs))
+        else:
+            nodes = self.get_children_nodes(manager, **kwargs)
+
         # Return sorted nodes based on label
         return make_json_response(
-            data=sorted(
-                self.get_children_nodes(manager, **kwargs),
-                key=lambda c: c['label']
-            )
+            data=sorted(nodes, key=lambda c: c['label'])
         )
 
     def get_dependencies(self, conn, object_id, where=None,
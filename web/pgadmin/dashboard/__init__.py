@@ -10,8 +10,11 @@
 """A blueprint module implementing the dashboard frame."""
 import math
 from functools import wraps
-from flask import render_template, url_for, Response, g, request
+from flask import render_template, url_for, Response, g, request, \
+    copy_current_request_context
 from flask_babel import gettext
+from flask_login import current_user
+from flask_socketio import ConnectionRefusedError
 from pgadmin.user_login_check import pga_login_required
 import json
 from pgadmin.utils import PgAdminModule
@@ -23,7 +26,14 @@ from pgadmin.utils.menu import Panel
 from pgadmin.utils.preferences import Preferences
 from pgadmin.utils.constants import PREF_LABEL_DISPLAY, MIMETYPE_APP_JS, \
     PREF_LABEL_REFRESH_RATES
-
+from pgadmin.authenticate import socket_login_required
+from pgadmin.dashboard.sampler import DashboardSampler, SOCKETIO_NAMESPACE, \
+    check_access
+from pgadmin.dashboard.snapshots import DashboardSnapshots, \
+    activity_row_key, locks_row_key
+from pgadmin import socketio
+
+import config as app_config
 from config import PG_DEFAULT_DRIVER
 
 MODULE_NAME = 'dashboard'
@@ -374,7 +384,8 @@ def index(sid=None, did=None):
         )
 
 
-def get_data(sid, did, template, check_long_running_query=False):
+def get_data(sid, did, template, check_long_running_query=False,
+             row_key=None):
     """
     Generic function to get server stats based on an SQL template
     Args:
@@ -382,6 +393,9 @@ def get_data(sid, did, template, check_long_running_query=False):
         did: The database ID
         template: The SQL template name
         check_long_running_query:
+        row_key: function returning the key of a row, to send only the
+            changes since the last request of the client (given by the
+            client_id and version request arguments).
 
     Returns:
 
@@ -399,6 +413,11 @@ def get_data(sid, did, template, check_long_running_query=False):
     if not status:
         return internal_server_error(errormsg=res)
 
+    client_id = request.args.get('client_id')
+    if row_key is not None and client_id:
+        return get_data_delta(sid, did, template, client_id, res['rows'],
+                              row_key, check_long_running_query)
+
     # Check the long running query status and set the row type.
     if check_long_running_query:
         get_long_running_query_status(res['rows'])
@@ -409,6 +428,35 @@ def get_data(sid, did, template, check_long_running_query=False):
     )
 
 
+def get_data_delta(sid, did, template, client_id, rows, row_key,
+                   check_long_running_query):
+    """
+    Return the rows inserted, changed or removed since the version of the
+    snapshot held by the client, or all the rows if the version does not
+    match.
+    """
+    try:
+        client_version = int(request.args['version'])
+    except (KeyError, ValueError):
+        client_version = None
+
+    annotate = None
+    threshold = None
+    if check_long_running_query:
+        annotate = get_long_running_query_status
+        # The row types depend on the thresholds.
+        threshold = Preferences.module('dashboards').preference(
+            'long_running_query_threshold').get()
+
+    return ajax_response(
+        response=DashboardSnapshots.diff(
+            (current_user.id, client_id, sid, did, template), rows, row_key,
+            client_version=client_version, context=threshold,
+            annotate=annotate),
+        status=200
+    )
+
+
 def get_long_running_query_status(activities):
     """
     This function is used to check the long running query and set the
@@ -486,7 +534,8 @@ def activity(sid=None, did=None):
     :param sid: server id
     :return:
     """
-    return get_data(sid, did, 'activity.sql', True)
+    return get_data(sid, did, 'activity.sql', True,
+                    row_key=activity_row_key)
 
 
 @blueprint.route('/locks/', endpoint='locks')
@@ -502,7 +551,7 @@ def locks(sid=None, did=None):
     :param sid: server id
     :return:
     """
-    return get_data(sid, did, 'locks.sql')
+    return get_data(sid, did, 'locks.sql', row_key=locks_row_key)
 
 
 @blueprint.route('/prepared/', endpoint='prepared')
@@ -696,3 +745,80 @@ def replication_slots(sid=None):
         response=res['rows'],
         status=200
     )
+
+
+@socketio.on('connect', namespace=SOCKETIO_NAMESPACE)
+def connect():
+    """
+    Connect to the server through socket.
+    :return:
+    :rtype:
+    """
+    # Without the shared sampler, the dashboards poll the server.
+    if not app_config.DASHBOARD_SHARED_SAMPLER:
+        raise ConnectionRefusedError("The dashboard sampler is disabled.")
+
+    socketio.emit('connected', {'sid': request.sid},
+                  namespace=SOCKETIO_NAMESPACE,
+                  to=request.sid)
+
+
+@socketio.on('subscribe_stats', namespace=SOCKETIO_NAMESPACE)
+@socket_login_required
+def subscribe_stats(params):
+    """
+    Subscribe to the shared sampler of the graphs of a server or database,
+    and get the samples collected so far.
+
+    :param params: dict(sid, did, chart_names, interval in seconds)
+    """
+    @copy_current_request_context
+    def runner(func):
+        return func()
+
+    try:
+        sid = int(params['sid'])
+        did = int(params['did']) if params.get('did') else None
+        chart_names = [name for name in params.get('chart_names', [])
+                       if name]
+        interval = max(int(params.get('interval', 1)), 1)
+
+        if not chart_names:
+            raise ValueError(gettext('No charts specified.'))
+
+        # The graphs are only shown for a server the user can access, and
+        # is connected to.
+        status, code, msg = check_access(sid, did)
+        if not status:
+            socketio.emit('subscribe_stats_failed',
+                          {'status': code, 'errormsg': msg},
+                          namespace=SOCKETIO_NAMESPACE, to=request.sid)
+            return
+
+        DashboardSampler.unsubscribe(request.sid)
+        sampler, samples, created = DashboardSampler.subscribe(
+            request.sid, sid, did, chart_names, interval, runner)
+
+        socketio.emit('subscribe_stats_success',
+                      {'interval': interval, 'samples': samples},
+                      namespace=SOCKETIO_NAMESPACE, to=request.sid)
+
+        if created:
+            socketio.start_background_task(sampler.run)
+    except Exception as e:
+        socketio.emit('subscribe_stats_failed',
+                      {'status': 500, 'errormsg': str(e)},
+                      namespace=SOCKETIO_NAMESPACE, to=request.sid)
+
+
+@socketio.on('unsubscribe_stats', namespace=SOCKETIO_NAMESPACE)
+def unsubscribe_stats():
+    DashboardSampler.unsubscribe(request.sid)
+
+
+@socketio.on('disconnect', namespace=SOCKETIO_NAMESPACE)
+def disconnect():
+    """
+    Unsubscribe the socket from its sampler on disconnect.
+    """
+    DashboardSampler.unsubscribe(request.sid)
@@ -0,0 +1,276 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2024, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""
+Shared samplers of the dashboard graphs.
+
+Rather than every open dashboard polling the statistics of the server over
+its own connection, the dashboards showing the same graphs of a server (or a
+database) at the same rate subscribe to a single sampler, whichever their
+user. The sampler runs the statistics query in a background task, over a
+connection of its own, keeps the latest samples in a ring buffer, and pushes
+every new sample to the subscribers, which can still view the graphs, over
+Socket.IO. A new subscriber receives the samples of the ring buffer at once.
+"""
+
+import json
+import threading
+import time
+from collections import deque, OrderedDict
+
+from flask import render_template
+from flask_babel import gettext
+from flask_security import current_user
+
+import config
+from config import PG_DEFAULT_DRIVER
+from pgadmin import socketio
+from pgadmin.model import Server
+from pgadmin.utils.driver import get_driver
+
+SOCKETIO_NAMESPACE = '/dashboard'
+
+
+def check_access(sid, did):
+    """
+    Check that the current user can view the graphs of the server (or the
+    database), i.e. owns the server or the server is shared, and is connected
+    to it, like the REST endpoints of the dashboard.
+
+    Returns:
+        (status, HTTP status code, error message)
+    """
+    server = Server.query.filter_by(id=sid).first()
+    if server is None or (server.user_id != current_user.id and
+                          not server.shared):
+        return False, 410, gettext('Could not find the specified server.')
+
+    manager = get_driver(PG_DEFAULT_DRIVER).connection_manager(sid)
+    if manager is None:
+        return False, 410, gettext('Could not find the specified server.')
+
+    conn = manager.connection(did=did) if did is not None \
+        else manager.connection()
+    if not conn.connected():
+        return False, 428, gettext(
+            'Please connect to the selected {0} to view the graph.'
+        ).format('database' if did is not None else 'server')
+
+    return True, 200, None
+
+
+class DashboardSampler:
+    """
+    Samples the statistics of the given charts of a server or database every
+    interval seconds, for as long as it has subscribers.
+
+    The statistics are fetched over a connection owned by the sampler, using
+    a detached copy of the server manager of one of the subscribers, so that
+    it is not closed when that subscriber leaves. Every subscriber provides a
+    runner, which runs the given function within its request context. The
+    access of every subscriber is checked before the samples are pushed to
+    it.
+    """
+
+    _lock = threading.Lock()
+    _samplers = dict()
+    _subscriptions = dict()
+    _next_id = 0
+
+    def __init__(self, key, sid, did, chart_names, interval):
+        DashboardSampler._next_id += 1
+        self.key = key
+        self.sid = sid
+        self.did = did
+        self.chart_names = chart_names
+        self.interval = interval
+        self.conn_id = 'dashboard_sampler_{0}'.format(
+            DashboardSampler._next_id)
+        self.samples = deque(maxlen=max(config.DASHBOARD_SAMPLER_HISTORY, 1))
+        self.subscribers = OrderedDict()
+        # Only used by the sampling task
+        self.manager = None
+
+    @classmethod
+    def subscribe(cls, socket_id, sid, did, chart_names, interval, runner):
+        """
+        Subscribe the socket to the sampler of the given charts, creating the
+        sampler if required. The socket must be unsubscribed from its
+        previous sampler first, and its access to the graphs checked.
+
+        Returns:
+            (sampler, samples in the ring buffer, whether the sampler has
+            been created and must be started)
+        """
+        key = (sid, did, tuple(sorted(chart_names)), interval)
+        with cls._lock:
+            sampler = cls._samplers.get(key)
+            created = sampler is None
+            if created:
+                sampler = cls(key, sid, did, list(key[2]), interval)
+                cls._samplers[key] = sampler
+
+            sampler.subscribers[socket_id] = runner
+            cls._subscriptions[socket_id] = key
+            return sampler, list(sampler.samples), created
+
+    @classmethod
+    def unsubscribe(cls, socket_id):
+        """
+        Unsubscribe the socket from its sampler.
+
+        Returns:
+            The sampler, or None if the socket was not subscribed.
+        """
+        with cls._lock:
+            key = cls._subscriptions.pop(socket_id, None)
+            sampler = cls._samplers.get(key)
+            if sampler is None:
+                return None
+
+            sampler.subscribers.pop(socket_id, None)
+            if not sampler.subscribers:
+                # The sampling task stops on its next iteration, and
+                # releases the connection.
+                cls._samplers.pop(key)
+
+        return sampler
+
+    @classmethod
+    def stats(cls):
+        """Number of samplers and of subscribers."""
+        with cls._lock:
+            return {'samplers': len(cls._samplers),
+                    'subscribers': len(cls._subscriptions)}
+
+    def is_running(self):
+        with DashboardSampler._lock:
+            return DashboardSampler._samplers.get(self.key) is self
+
+    def run(self):
+        """
+        Sample the statistics every interval seconds, until there are no
+        more subscribers.
+        """
+        try:
+            while self.is_running():
+                started = time.monotonic()
+                self.sample()
+                socketio.sleep(
+                    max(self.interval - (time.monotonic() - started), 0))
+        finally:
+            self._release()
+
+    def sample(self):
+        """
+        Fetch the statistics, and push them to the subscribers, which can
+        still view the graphs.
+        """
+        with DashboardSampler._lock:
+            subscribers = list(self.subscribers.items())
+
+        viewers = []
+        for socket_id, runner in subscribers:
+            status, code, res = self._run(runner, self._check_access)
+            if status:
+                viewers.append(socket_id)
+            else:
+                self._emit('dashboard_stats_failed',
+                           {'status': code, 'errormsg': res}, [socket_id])
+
+        if not viewers:
+            return
+
+        # Within the request context of a viewer, which is required to
+        # connect, and to log the queries.
+        status, code, res = self._run(
+            dict(subscribers)[viewers[0]], self._fetch)
+
+        if not status:
+            # The series of the counters is interrupted.
+            self.samples.clear()
+            self._emit('dashboard_stats_failed',
+                       {'status': code, 'errormsg': res}, viewers)
+            return
+
+        sample = {'time': int(time.time()), 'data': res}
+        self.samples.append(sample)
+        self._emit('dashboard_stats', sample, viewers)
+
+    @staticmethod
+    def _run(runner, func):
+        try:
+            return runner(func)
+        except Exception as e:
+            return False, 500, str(e)
+
+    def _emit(self, event, data, socket_ids):
+        # Skip the sockets, which unsubscribed meanwhile.
+        with DashboardSampler._lock:
+            socket_ids = [socket_id for socket_id in socket_ids
+                          if socket_id in self.subscribers]
+
+        for socket_id in socket_ids:
+            socketio.emit(event, data, namespace=SOCKETIO_NAMESPACE,
+                          to=socket_id)
+
+    def _check_access(self):
+        return check_access(self.sid, self.did)
+
+    def _connection(self):
+        if self.did is not None:
+            return self.manager.connection(
+                did=self.did, conn_id=self.conn_id, async_=False)
+        return self.manager.connection(conn_id=self.conn_id, async_=False)
+
+    def _fetch(self):
+        """
+        Fetch the statistics, within the request context of a viewer.
+
+        Returns:
+            (status, HTTP status code, charts data or error message)
+        """
+        if self.manager is None or not self._connection().connected():
+            # (Re)connect with the credentials of the current viewer.
+            self._release()
+            manager = get_driver(PG_DEFAULT_DRIVER).connection_manager(
+                self.sid)
+            if manager is None:
+                return False, 410, gettext(
+                    'Could not find the specified server.')
+            self.manager = manager.detached()
+
+            status, msg = self._connection().connect()
+            if not status:
+                self._release()
+                return False, 500, msg
+
+        sql = render_template(
+            "/".join(['dashboard/sql/#{0}#'.format(self.manager.version),
+                      'dashboard_stats.sql']),
+            did=self.did, chart_names=self.chart_names
+        )
+        status, res = self._connection().execute_dict(sql)
+        if not status:
+            # Reconnect on the next sample, in case the connection is lost.
+            self._release()
+            return False, 500, res
+
+        return True, 200, {
+            row['chart_name']: json.loads(row['chart_data'])
+            for row in res['rows']
+        }
+
+    def _release(self):
+        """
+        Release the connection of the sampler.
+        """
+        manager, self.manager = self.manager, None
+        if manager is not None:
+            manager.release(conn_id=self.conn_id)
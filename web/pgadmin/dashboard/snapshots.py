@@ -0,0 +1,137 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2024, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""
+Incremental refresh of the dashboard tables.
+
+The last snapshot of the rows sent to every dashboard table (client) is kept
+in the process. On refresh, the client sends the version of the snapshot it
+holds, and only gets the rows which have been inserted, changed or removed
+since. The client gets all the rows again when the versions do not match
+(e.g. the snapshot has been evicted, or the request was served by another
+process).
+"""
+
+import threading
+from collections import OrderedDict
+
+# Maximum number of snapshots kept in the process.
+MAX_SNAPSHOTS = 256
+
+# The columns identifying a lock held or awaited by a process.
+LOCK_KEY_COLUMNS = ('pid', 'locktype', 'datname', 'relation', 'page',
+                    'tuple', 'transactionid', 'classid', 'objid', 'objsubid',
+                    'virtualtransaction', 'mode')
+
+
+def activity_row_key(row):
+    """The sessions are identified by the process id."""
+    return str(row['pid'])
+
+
+def locks_row_key(row):
+    """The locks are identified by the locked object, the process and the
+    mode."""
+    return '|'.join(str(row.get(col)) for col in LOCK_KEY_COLUMNS)
+
+
+class _Snapshot:
+    def __init__(self, version, rows, context):
+        self.version = version
+        self.rows = rows
+        self.context = context
+
+
+class DashboardSnapshots:
+    """
+    Process-local registry of the last snapshot of the rows sent to every
+    client, in the order they have been used.
+    """
+
+    _lock = threading.Lock()
+    _snapshots = OrderedDict()
+    _version = 0
+
+    @classmethod
+    def _next_version(cls):
+        cls._version += 1
+        return cls._version
+
+    @staticmethod
+    def _index(rows, row_key):
+        index = OrderedDict()
+        for row in rows:
+            key = row_key(row)
+            if key in index:
+                # Rows which can not be told apart
+                suffix = 1
+                while '{0}#{1}'.format(key, suffix) in index:
+                    suffix += 1
+                key = '{0}#{1}'.format(key, suffix)
+            index[key] = row
+        return index
+
+    @classmethod
+    def diff(cls, client_key, rows, row_key, client_version=None,
+             context=None, annotate=None):
+        """
+        Keep the given rows as the last snapshot of the client, and return
+        the changes since the snapshot with the given version.
+
+        Args:
+            client_key: Identifies the client, and what its rows are
+            rows: All the rows fetched from the server
+            row_key: function returning the key of a row
+            client_version: Version of the snapshot held by the client
+            context: Anything else the rows sent depend on. All the rows are
+                sent again when it changes.
+            annotate: function updating the rows to be sent, in place
+
+        Returns:
+            dict(version, full=True, rows=all the rows), or
+            dict(version, full=False, upserted=rows inserted or changed,
+            removed=keys of the rows removed)
+            Every row sent has its key in 'row_key'.
+        """
+        index = cls._index(rows, row_key)
+
+        with cls._lock:
+            previous = cls._snapshots.pop(client_key, None)
+            version = cls._next_version()
+            cls._snapshots[client_key] = _Snapshot(version, index, context)
+            while len(cls._snapshots) > MAX_SNAPSHOTS:
+                cls._snapshots.popitem(last=False)
+
+        if previous is None or client_version is None or \
+                previous.version != client_version or \
+                previous.context != context:
+            return {
+                'version': version,
+                'full': True,
+                'rows': cls._rows_to_send(index, index.keys(), annotate),
+            }
+
+        upserted = [key for key, row in index.items()
+                    if previous.rows.get(key) != row]
+        removed = [key for key in previous.rows if key not in index]
+
+        return {
+            'version': version,
+            'full': False,
+            'upserted': cls._rows_to_send(index, upserted, annotate),
+            'removed': removed,
+        }
+
+    @staticmethod
+    def _rows_to_send(index, keys, annotate):
+        # The rows of the snapshot are kept as fetched.
+        rows = [dict(index[key], row_key=key) for key in keys]
+        if annotate is not None:
+            annotate(rows)
+        return rows
@@ -6,7 +6,7 @@
 // This software is released under the PostgreSQL Licence
 //
 //////////////////////////////////////////////////////////////
-import React, { useEffect, useMemo, useState } from 'react';
+import React, { useEffect, useMemo, useRef, useState } from 'react';
 import gettext from 'sources/gettext';
 import PropTypes from 'prop-types';
 import getApiInstance from 'sources/api_instance';
@@ -48,6 +48,38 @@ function parseData(data) {
   return res;
 }
 
+/* The sessions and locks are refreshed incrementally, the server sends
+ * only the rows inserted, changed or removed since the version of the
+ * snapshot held, or all the rows if the version does not match. */
+export function applyDelta(snapshot, data) {
+  if(data.full) {
+    snapshot.rows = data.rows;
+  } else {
+    let upserted = {};
+    data.upserted.forEach((row)=>{
+      upserted[row.row_key] = row;
+    });
+    let removed = new Set(data.removed);
+
+    let rows = [];
+    snapshot.rows.forEach((row)=>{
+      if(removed.has(row.row_key)) {
+        return;
+      }
+      if(row.row_key in upserted) {
+        rows.push(upserted[row.row_key]);
+        delete upserted[row.row_key];
+      } else {
+        rows.push(row);
+      }
+    });
+    /* The rows inserted, in the order of the server */
+    snapshot.rows = _.sortBy(rows.concat(Object.values(upserted)), ['pid', 'locktype']);
+  }
+  snapshot.version = data.version;
+  return snapshot.rows;
+}
+
 const useStyles = makeStyles((theme) => ({
   emptyPanel: {
     width: '100%',
@@ -153,6 +185,12 @@ function Dashboard({
   const [schemaDict, setSchemaDict] = React.useState({});
   const [systemStatsTabVal, setSystemStatsTabVal] = useState(0);
   const [ldid, setLdid] = useState(0);
+  const snapshot = useRef({
+    clientId: _.uniqueId('dashboard_') + '_' + Math.random().toString(36).slice(2),
+    url: null,
+    version: null,
+    rows: [],
+  });
 
   const systemStatsTabChanged = (e, tabVal) => {
     setSystemStatsTabVal(tabVal);
@@ -746,14 +784,36 @@ function Dashboard({
       const api = getApiInstance();
       if (node) {
         if (mainTabVal == 0) {
+          let params = {};
+          if (tabVal === 0 || tabVal === 1) {
+            if (snapshot.current.url !== url) {
+              snapshot.current.url = url;
+              snapshot.current.version = null;
+              snapshot.current.rows = [];
+            }
+            params = {
+              client_id: snapshot.current.clientId,
+              version: snapshot.current.version ?? undefined,
+            };
+          }
           api({
             url: url,
             type: 'GET',
+            params: params,
           })
             .then((res) => {
-              setDashData(parseData(res.data));
+              let rows = res.data;
+              if (!_.isArray(rows) && !_.isUndefined(rows?.version)) {
+                if (snapshot.current.url !== url) {
+                  /* The tab has changed since */
+                  return;
+                }
+                rows = applyDelta(snapshot.current, rows);
+              }
+              setDashData(parseData(rows));
             })
             .catch((error) => {
+              snapshot.current.version = null;
               pgAdmin.Browser.notifier.alert(
                 gettext('Failed to retrieve data from the server.'),
                 _.isUndefined(error.response) ? error.message : error.response.data.errormsg
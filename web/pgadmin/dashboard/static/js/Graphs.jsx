@@ -17,6 +17,7 @@ import {useInterval, usePrevious} from 'sources/custom_hooks';
 import PropTypes from 'prop-types';
 import StreamingChart from '../../../static/js/components/PgChart/StreamingChart';
 import { Grid } from '@mui/material';
+import { openSocket } from '../../../static/js/socket_instance';
 
 export const X_AXIS_LENGTH = 75;
 
@@ -91,6 +92,8 @@ const chartsDefault = {
 export default function Graphs({preferences, sid, did, pageVisible, enablePoll=true, isTest}) {
   const refreshOn = useRef(null);
   const prevPrefernces = usePrevious(preferences);
+  const preferencesRef = useRef(preferences);
+  preferencesRef.current = preferences;
 
   const [sessionStats, sessionStatsReduce] = useReducer(statsReducer, chartsDefault['session_stats']);
   const [tpsStats, tpsStatsReduce] = useReducer(statsReducer, chartsDefault['tps_stats']);
@@ -98,11 +101,13 @@ export default function Graphs({preferences, sid, did, pageVisible, enablePoll=t
   const [toStats, toStatsReduce] = useReducer(statsReducer, chartsDefault['to_stats']);
   const [bioStats, bioStatsReduce] = useReducer(statsReducer, chartsDefault['bio_stats']);
 
-  const [counterData, setCounterData] = useState({});
+  const counterData = useRef({});
 
   const [errorMsg, setErrorMsg] = useState(null);
   const [pollDelay, setPollDelay] = useState(1000);
   const [chartDrawnOnce, setChartDrawnOnce] = useState(false);
+  /* Use the shared sampler of the server, or poll if not available */
+  const [useSampler, setUseSampler] = useState(true);
 
   useEffect(()=>{
     let calcPollDelay = false;
@@ -144,8 +149,8 @@ export default function Graphs({preferences, sid, did, pageVisible, enablePoll=t
     }
   }, [pageVisible]);
 
-  useInterval(()=>{
-    const currEpoch = getEpoch();
+  /* Get the names of the charts to be refreshed at the given epoch */
+  const getChartsDue = (currEpoch)=>{
     if(refreshOn.current === null) {
       let tmpRef = {};
       Object.keys(chartsDefault).forEach((name)=>{
@@ -158,9 +163,103 @@ export default function Graphs({preferences, sid, did, pageVisible, enablePoll=t
     Object.keys(chartsDefault).forEach((name)=>{
       if(currEpoch >= refreshOn.current[name]) {
         getFor.push(name);
-        refreshOn.current[name] = currEpoch + preferences[name+'_refresh'];
+        refreshOn.current[name] = currEpoch + preferencesRef.current[name+'_refresh'];
       }
     });
+    return getFor;
+  };
+
+  const updateCharts = (data)=>{
+    setErrorMsg(null);
+    sessionStatsReduce({incoming: data['session_stats']});
+    tpsStatsReduce({incoming: data['tps_stats'], counter: true, counterData: counterData.current['tps_stats']});
+    tiStatsReduce({incoming: data['ti_stats'], counter: true, counterData: counterData.current['ti_stats']});
+    toStatsReduce({incoming: data['to_stats'], counter: true, counterData: counterData.current['to_stats']});
+    bioStatsReduce({incoming: data['bio_stats'], counter: true, counterData: counterData.current['bio_stats']});
+
+    counterData.current = {
+      ...counterData.current,
+      ...data,
+    };
+  };
+
+  const resetCharts = ()=>{
+    sessionStatsReduce({reset: chartsDefault['session_stats']});
+    tpsStatsReduce({reset:chartsDefault['tps_stats']});
+    tiStatsReduce({reset:chartsDefault['ti_stats']});
+    toStatsReduce({reset:chartsDefault['to_stats']});
+    bioStatsReduce({reset:chartsDefault['bio_stats']});
+    counterData.current = {};
+    refreshOn.current = null;
+  };
+
+  const setErrorStatus = (status)=>{
+    resetCharts();
+    if (status === 428) {
+      setErrorMsg(gettext('Please connect to the selected server to view the graph.'));
+    } else if(status) {
+      setErrorMsg(gettext('An error occurred whilst rendering the graph.'));
+    } else {
+      setErrorMsg(gettext('Not connected to the server or the connection to the server has been closed.'));
+    }
+  };
+
+  /* Subscribe to the sampler while the dashboard is visible. The samples
+   * collected so far are received first, followed by every new sample. */
+  useEffect(()=>{
+    if(!enablePoll || !useSampler || !pageVisible) {
+      return;
+    }
+
+    let socket = null;
+    let closed = false;
+    const onSample = (sample)=>{
+      let data = {};
+      getChartsDue(sample.time).forEach((name)=>{
+        if(name in sample.data) {
+          data[name] = sample.data[name];
+        }
+      });
+      updateCharts(data);
+    };
+
+    openSocket('/dashboard')
+      .then((sock)=>{
+        socket = sock;
+        if(closed) {
+          socket.disconnect();
+          return;
+        }
+        socket.on('subscribe_stats_success', (res)=>{
+          resetCharts();
+          setErrorMsg(null);
+          res.samples.forEach(onSample);
+        });
+        socket.on('dashboard_stats', onSample);
+        socket.on('subscribe_stats_failed', (err)=>setErrorStatus(err.status));
+        socket.on('dashboard_stats_failed', (err)=>setErrorStatus(err.status));
+        socket.emit('subscribe_stats', {
+          sid: sid,
+          did: did > 0 ? did : null,
+          chart_names: Object.keys(chartsDefault),
+          interval: pollDelay/1000,
+        });
+      })
+      .catch(()=>{
+        /* The sampler is disabled or not reachable */
+        if(!closed) {
+          setUseSampler(false);
+        }
+      });
+
+    return ()=>{
+      closed = true;
+      socket?.disconnect();
+    };
+  }, [sid, did, pollDelay, pageVisible, enablePoll, useSampler]);
+
+  useInterval(()=>{
+    let getFor = getChartsDue(getEpoch());
 
     let path = getStatsUrl(sid, did, getFor);
     if (!pageVisible){
@@ -168,44 +267,22 @@ export default function Graphs({preferences, sid, did, pageVisible, enablePoll=t
     }
     axios.get(path)
       .then((resp)=>{
-        let data = resp.data;
-        setErrorMsg(null);
-        sessionStatsReduce({incoming: data['session_stats']});
-        tpsStatsReduce({incoming: data['tps_stats'], counter: true, counterData: counterData['tps_stats']});
-        tiStatsReduce({incoming: data['ti_stats'], counter: true, counterData: counterData['ti_stats']});
-        toStatsReduce({incoming: data['to_stats'], counter: true, counterData: counterData['to_stats']});
-        bioStatsReduce({incoming: data['bio_stats'], counter: true, counterData: counterData['bio_stats']});
-
-        setCounterData((prevCounterData)=>{
-          return {
-            ...prevCounterData,
-            ...data,
-          };
-        });
+        updateCharts(resp.data);
       })
       .catch((error)=>{
         if(!errorMsg) {
-          sessionStatsReduce({reset: chartsDefault['session_stats']});
-          tpsStatsReduce({reset:chartsDefault['tps_stats']});
-          tiStatsReduce({reset:chartsDefault['ti_stats']});
-          toStatsReduce({reset:chartsDefault['to_stats']});
-          bioStatsReduce({reset:chartsDefault['bio_stats']});
-          setCounterData({});
           if(error.response) {
-            if (error.response.status === 428) {
-              setErrorMsg(gettext('Please connect to the selected server to view the graph.'));
-            } else {
-              setErrorMsg(gettext('An error occurred whilst rendering the graph.'));
-            }
+            setErrorStatus(error.response.status);
           } else if(error.request) {
-            setErrorMsg(gettext('Not connected to the server or the connection to the server has been closed.'));
+            setErrorStatus(null);
             return;
           } else {
+            resetCharts();
             console.error(error);
           }
         }
       });
-  }, enablePoll ? pollDelay : -1);
+  }, (enablePoll && !useSampler) ? pollDelay : -1);
 
   return (
     <>
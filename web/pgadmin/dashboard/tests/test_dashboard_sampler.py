@@ -0,0 +1,150 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2024, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+from unittest.mock import patch, MagicMock
+
+from pgadmin.dashboard import sampler as sampler_module
+from pgadmin.dashboard.sampler import DashboardSampler
+from pgadmin.utils.route import BaseTestGenerator
+
+CHARTS = ['session_stats', 'tps_stats']
+
+
+class DashboardSamplerTestCase(BaseTestGenerator):
+    """
+    Check that the dashboards showing the same graphs share a sampler, which
+    fetches the statistics once for all of them, whichever their user, that
+    the samples are only pushed to the subscribers which can view the graphs,
+    and that a new subscriber gets the samples collected so far.
+    """
+
+    scenarios = [
+        ('Shared sampler', dict(fail=False)),
+        ('Shared sampler failing to fetch the statistics', dict(fail=True)),
+    ]
+
+    def runTest(self):
+        fetched_by = []
+        denied = set()
+        released = []
+        context = []
+
+        def runner(name):
+            def run(func):
+                context.append(name)
+                try:
+                    return func()
+                finally:
+                    context.pop()
+            return run
+
+        def check_access():
+            if context[-1] in denied:
+                return False, 428, 'Not connected'
+            return True, 200, None
+
+        def fetch():
+            fetched_by.append(context[-1])
+            if self.fail and len(fetched_by) == 3:
+                return False, 500, 'Failed'
+            return True, 200, {'session_stats': {'Total': len(fetched_by)}}
+
+        def emitted(socketio):
+            events = [(call.kwargs['to'], call.args[0])
+                      for call in socketio.emit.call_args_list]
+            socketio.emit.reset_mock()
+            return events
+
+        socketio = MagicMock()
+        with patch.object(sampler_module, 'socketio', socketio), \
+                patch.object(sampler_module, 'config',
+                             MagicMock(DASHBOARD_SAMPLER_HISTORY=2)), \
+                patch.object(DashboardSampler, '_samplers', dict()), \
+                patch.object(DashboardSampler, '_subscriptions', dict()), \
+                patch.object(DashboardSampler, '_check_access',
+                             lambda self: check_access()), \
+                patch.object(DashboardSampler, '_fetch',
+                             lambda self: fetch()), \
+                patch.object(DashboardSampler, '_release',
+                             lambda self: released.append(self.conn_id)):
+            first, samples, created = DashboardSampler.subscribe(
+                'socket1', 1, None, CHARTS, 5, runner('socket1'))
+            self.assertTrue(created)
+            self.assertEqual(samples, [])
+
+            # The same graphs in any order share the sampler, whichever the
+            # user.
+            second, samples, created = DashboardSampler.subscribe(
+                'socket2', 1, None, list(reversed(CHARTS)), 5,
+                runner('socket2'))
+            self.assertIs(second, first)
+            self.assertFalse(created)
+
+            # Other graphs, database or rate use another sampler
+            other, _, created = DashboardSampler.subscribe(
+                'socket3', 1, 5, CHARTS, 5, runner('socket3'))
+            self.assertTrue(created)
+            self.assertIsNot(other, first)
+            self.assertEqual(DashboardSampler.stats(),
+                             {'samplers': 2, 'subscribers': 3})
+
+            for _ in range(2):
+                first.sample()
+
+            # Fetched once for all the subscribers, and pushed to each of
+            # them.
+            self.assertEqual(fetched_by, ['socket1'] * 2)
+            self.assertEqual(emitted(socketio),
+                             [('socket1', 'dashboard_stats'),
+                              ('socket2', 'dashboard_stats')] * 2)
+
+            # A subscriber, which can no longer view the graphs, is not sent
+            # the samples, and is not used to fetch them.
+            denied.add('socket1')
+            first.sample()
+            self.assertEqual(fetched_by[-1], 'socket2')
+            if self.fail:
+                self.assertEqual(emitted(socketio),
+                                 [('socket1', 'dashboard_stats_failed'),
+                                  ('socket2', 'dashboard_stats_failed')])
+                # The history is cleared as the series is interrupted
+                expected = []
+            else:
+                self.assertEqual(emitted(socketio),
+                                 [('socket1', 'dashboard_stats_failed'),
+                                  ('socket2', 'dashboard_stats')])
+                # Only the latest samples are kept
+                expected = [{'session_stats': {'Total': 2}},
+                            {'session_stats': {'Total': 3}}]
+
+            DashboardSampler.unsubscribe('socket3')
+            _, samples, created = DashboardSampler.subscribe(
+                'socket3', 1, None, CHARTS, 5, runner('socket3'))
+            self.assertFalse(created)
+            self.assertEqual([sample['data'] for sample in samples],
+                             expected)
+
+            # Nothing is fetched, when no subscriber can view the graphs.
+            denied.update(['socket2', 'socket3'])
+            first.sample()
+            self.assertEqual(len(fetched_by), 3)
+
+            DashboardSampler.unsubscribe('socket1')
+            self.assertTrue(first.is_running())
+            DashboardSampler.unsubscribe('socket2')
+            DashboardSampler.unsubscribe('socket3')
+            self.assertFalse(first.is_running())
+            self.assertFalse(other.is_running())
+            self.assertEqual(DashboardSampler.stats(),
+                             {'samplers': 0, 'subscribers': 0})
+
+            # The sampling task releases the connection of the sampler once
+            # stopped.
+            first.run()
+            self.assertEqual(released, [first.conn_id])
@@ -0,0 +1,130 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2024, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import copy
+from collections import OrderedDict
+from unittest.mock import patch
+
+from pgadmin.dashboard.snapshots import DashboardSnapshots, \
+    activity_row_key, locks_row_key
+from pgadmin.utils.route import BaseTestGenerator
+
+
+def _session(pid, state='idle', query=''):
+    return {'pid': pid, 'datname': 'postgres', 'state': state,
+            'query': query}
+
+
+def _lock(pid, mode, relation='tab', granted=True):
+    return {'pid': pid, 'locktype': 'relation', 'datname': 'postgres',
+            'relation': relation, 'page': None, 'tuple': None,
+            'transactionid': None, 'classid': None, 'objid': None,
+            'objsubid': None, 'virtualtransaction': '3/10', 'mode': mode,
+            'granted': granted, 'fastpath': False}
+
+
+class DashboardSnapshotsTestCase(BaseTestGenerator):
+    """
+    Check that the dashboard tables get the rows inserted, changed or
+    removed since their last refresh, and all the rows again when their
+    snapshot version does not match.
+    """
+
+    scenarios = [
+        ('Sessions', dict(
+            row_key=activity_row_key,
+            rows=[_session(10), _session(11, 'active', 'SELECT 1'),
+                  _session(12)],
+            changed=[_session(10), _session(11, 'idle', 'SELECT 1'),
+                     _session(13)],
+            upserted=['11', '13'],
+            removed=['12'],
+        )),
+        ('Locks', dict(
+            row_key=locks_row_key,
+            rows=[_lock(10, 'AccessShareLock'),
+                  _lock(10, 'AccessShareLock'),
+                  _lock(11, 'RowExclusiveLock', granted=False)],
+            changed=[_lock(10, 'AccessShareLock'),
+                     _lock(11, 'RowExclusiveLock', granted=True),
+                     _lock(12, 'AccessShareLock', relation='other')],
+            upserted=[
+                locks_row_key(_lock(11, 'RowExclusiveLock')),
+                locks_row_key(_lock(12, 'AccessShareLock',
+                                    relation='other'))],
+            removed=[locks_row_key(_lock(10, 'AccessShareLock')) + '#1'],
+        )),
+    ]
+
+    def runTest(self):
+        annotated = []
+
+        def annotate(rows):
+            annotated.extend(row['row_key'] for row in rows)
+            for row in rows:
+                row['row_type'] = 'warning'
+
+        with patch.object(DashboardSnapshots, '_snapshots', OrderedDict()):
+            rows = copy.deepcopy(self.rows)
+            res = DashboardSnapshots.diff('client', rows, self.row_key,
+                                          annotate=annotate)
+            self.assertTrue(res['full'])
+            self.assertEqual(len(res['rows']), len(self.rows))
+            self.assertEqual(len(annotated), len(self.rows))
+            # The rows fetched are not modified
+            self.assertEqual(rows, self.rows)
+
+            # Only the changes since the version held are sent
+            del annotated[:]
+            delta = DashboardSnapshots.diff(
+                'client', copy.deepcopy(self.changed), self.row_key,
+                client_version=res['version'], annotate=annotate)
+            self.assertFalse(delta['full'])
+            self.assertGreater(delta['version'], res['version'])
+            self.assertEqual([row['row_key'] for row in delta['upserted']],
+                             self.upserted)
+            self.assertEqual(delta['removed'], self.removed)
+            self.assertEqual(annotated, self.upserted)
+
+            # Applying the changes to the rows held gives the rows fetched
+            held = OrderedDict((row['row_key'], row) for row in res['rows'])
+            for key in delta['removed']:
+                del held[key]
+            for row in delta['upserted']:
+                held[row['row_key']] = row
+            self.assertEqual(
+                sorted((dict((k, v) for k, v in row.items()
+                             if k not in ('row_key', 'row_type'))
+                        for row in held.values()), key=repr),
+                sorted(self.changed, key=repr))
+
+            # Nothing changed
+            same = DashboardSnapshots.diff(
+                'client', copy.deepcopy(self.changed), self.row_key,
+                client_version=delta['version'])
+            self.assertEqual((same['upserted'], same['removed']), ([], []))
+
+            # Version mismatch
+            full = DashboardSnapshots.diff(
+                'client', copy.deepcopy(self.changed), self.row_key,
+                client_version=delta['version'])
+            self.assertTrue(full['full'])
+            self.assertEqual(len(full['rows']), len(self.changed))
+
+            # The context (e.g. the thresholds) changed
+            full = DashboardSnapshots.diff(
+                'client', copy.deepcopy(self.changed), self.row_key,
+                client_version=full['version'], context='1|2')
+            self.assertTrue(full['full'])
+
+            # Other clients have their own snapshot
+            other = DashboardSnapshots.diff(
+                'other', copy.deepcopy(self.changed), self.row_key,
+                client_version=full['version'], context='1|2')
+            self.assertTrue(other['full'])
@@ -81,10 +81,10 @@ if os.path.exists(system_config_dir + '/config_system.py'):
 
 def evaluate_and_patch_config(config: dict) -> dict:
     # Update settings for 'LOG_FILE', 'SQLITE_PATH', 'SESSION_DB_PATH',
-    # 'AZURE_CREDENTIAL_CACHE_DIR', 'KERBEROS_CCACHE_DIR', 'STORAGE_DIR'
-    # of DATA_DIR is user defined
+    # 'SESSION_SQLITE_PATH', 'AZURE_CREDENTIAL_CACHE_DIR',
+    # 'KERBEROS_CCACHE_DIR', 'STORAGE_DIR' of DATA_DIR is user defined
     data_dir_dependent_settings = \
-        ['LOG_FILE', 'SQLITE_PATH', 'SESSION_DB_PATH',
+        ['LOG_FILE', 'SQLITE_PATH', 'SESSION_DB_PATH', 'SESSION_SQLITE_PATH',
          'AZURE_CREDENTIAL_CACHE_DIR', 'KERBEROS_CCACHE_DIR', 'STORAGE_DIR']
 
     if 'DATA_DIR' in custom_config_settings:
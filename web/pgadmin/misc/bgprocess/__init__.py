@@ -11,15 +11,26 @@
 A blueprint module providing utility functions for the notify the user about
 the long running background-processes.
 """
-from flask import url_for
+import threading
+
+from flask import url_for, request, copy_current_request_context
+from flask_babel import gettext
+from pgadmin import socketio
+from pgadmin.authenticate import socket_login_required
 from pgadmin.user_login_check import pga_login_required
 from pgadmin.utils import PgAdminModule
 from pgadmin.utils.ajax import make_response, gone, success_return,\
     make_json_response
 
+import config
 from .processes import BatchProcess
 
 MODULE_NAME = 'bgprocess'
+SOCKETIO_NAMESPACE = '/{0}'.format(MODULE_NAME)
+
+# Socket id -> subscription to the logs of a process
+_log_subscriptions = dict()
+_log_subscriptions_lock = threading.Lock()
 
 
 class BGProcessModule(PgAdminModule):
@@ -64,13 +75,17 @@ def status(pid, out=-1, err=-1):
         out: position of the last stdout fetched
         err: position of the last stderr fetched
 
+    The 'tail' query argument limits the logs fetched from the start
+    (out and err equal to 0) to their last lines.
+
     Returns:
         Status of the process and logs (if out, and err not equal to -1)
     """
     try:
         process = BatchProcess(id=pid)
+        tail = request.args.get('tail', type=int)
 
-        return make_response(response=process.status(out, err))
+        return make_response(response=process.status(out, err, tail))
     except LookupError as lerr:
         return gone(errormsg=str(lerr))
 
@@ -147,6 +162,103 @@ def stop_process(pid):
         return gone(errormsg=str(lerr))
 
 
+@socketio.on('connect', namespace=SOCKETIO_NAMESPACE)
+def connect():
+    """
+    Connect to the server through socket.
+    """
+    socketio.emit('connected', {'sid': request.sid},
+                  namespace=SOCKETIO_NAMESPACE,
+                  to=request.sid)
+
+
+@socketio.on('subscribe_logs', namespace=SOCKETIO_NAMESPACE)
+@socket_login_required
+def subscribe_logs(params):
+    """
+    Push the logs of a process, and its status, as they are logged, until
+    the process completes or the socket unsubscribes.
+
+    :param params: dict(pid, tail), tail being the number of the last lines
+        of the logs to send first (all of them if not given)
+    """
+    @copy_current_request_context
+    def runner(func):
+        return func()
+
+    try:
+        pid = params['pid']
+        tail = int(params['tail']) if params.get('tail') else None
+        if not pid:
+            raise ValueError(gettext('No process specified.'))
+
+        subscription = object()
+        with _log_subscriptions_lock:
+            _log_subscriptions[request.sid] = subscription
+
+        socketio.emit('subscribe_logs_success', {'pid': pid},
+                      namespace=SOCKETIO_NAMESPACE, to=request.sid)
+        socketio.start_background_task(
+            send_logs, request.sid, subscription, pid, tail, runner)
+    except Exception as e:
+        socketio.emit('subscribe_logs_failed',
+                      {'status': 500, 'errormsg': str(e)},
+                      namespace=SOCKETIO_NAMESPACE, to=request.sid)
+
+
+def send_logs(socket_id, subscription, pid, tail, runner):
+    """
+    Send the lines appended to the logs of the process since the last ones
+    sent, checking the logs every BG_PROCESS_LOG_POLL_INTERVAL seconds.
+    """
+    out = err = 0
+    while _log_subscriptions.get(socket_id) is subscription:
+        try:
+            data = runner(
+                lambda: BatchProcess(id=pid).status(out, err, tail))
+        except Exception as e:
+            socketio.emit('process_logs_failed',
+                          {'status': 410 if isinstance(e, LookupError)
+                           else 500, 'errormsg': str(e)},
+                          namespace=SOCKETIO_NAMESPACE, to=socket_id)
+            break
+
+        socketio.emit('process_logs', data, namespace=SOCKETIO_NAMESPACE,
+                      to=socket_id)
+
+        if data['exit_code'] is not None and data['out']['done'] and \
+                data['err']['done']:
+            break
+
+        # Read the rest of the logs right away, if not read at once.
+        if not data['out']['lines'] and not data['err']['lines']:
+            socketio.sleep(config.BG_PROCESS_LOG_POLL_INTERVAL)
+        out, err = data['out']['pos'], data['err']['pos']
+        tail = None
+
+    unsubscribe(socket_id, subscription)
+
+
+def unsubscribe(socket_id, subscription=None):
+    with _log_subscriptions_lock:
+        if subscription is None or \
+                _log_subscriptions.get(socket_id) is subscription:
+            _log_subscriptions.pop(socket_id, None)
+
+
+@socketio.on('unsubscribe_logs', namespace=SOCKETIO_NAMESPACE)
+def unsubscribe_logs():
+    unsubscribe(request.sid)
+
+
+@socketio.on('disconnect', namespace=SOCKETIO_NAMESPACE)
+def disconnect():
+    """
+    Stop sending the logs on disconnect.
+    """
+    unsubscribe(request.sid)
+
+
 def escape_dquotes_process_arg(arg):
     # Double quotes has special meaning for shell command line and they are
     # run without the double quotes. Add extra quotes to save our double
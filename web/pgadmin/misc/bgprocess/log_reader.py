@@ -0,0 +1,203 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2024, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""
+Reader of the stdout/stderr logs of the background processes.
+
+Every line of the logs is written by the process executor as
+'<timestamp>,<output>', the timestamp formatted as '%y%m%d%H%M%S%f'. The
+log files are kept open between the status polls of a process, along with
+the position read up to, so that every poll only reads what has been
+appended since.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+
+# Number of log files kept open, the least recently read are closed beyond.
+MAX_OPEN_LOGS = 32
+
+# Read size when looking for the last lines of a log.
+TAIL_BLOCK_SIZE = 64 * 1024
+
+
+def split_log_line(line):
+    """
+    Returns the timestamp and the output of a line of the log (without
+    its line ending), or None if the line is not a log line.
+    """
+    ts, sep, output = line.partition(b',')
+    if not sep or not ts.isdigit():
+        return None
+    return ts, output
+
+
+class LogReader:
+    """
+    class LogReader
+
+        Reads the lines of a log file of a background process, from a given
+        position.
+
+    Class-level Methods:
+    ----------- -------
+    * get(logfile)
+      - Returns the reader of the log file, opened if required.
+
+    * close(logfile)
+      - Closes the log file, e.g. before removing it.
+
+    Methods:
+    -------
+    * read(pos, ctime, ended, enc, max_bytes)
+      - Returns the lines logged after pos.
+
+    * tail(count, ctime, ended, enc)
+      - Returns the last count lines of the log.
+    """
+    _lock = threading.Lock()
+    # logfile -> reader, least recently used first
+    _readers = OrderedDict()
+
+    def __init__(self, logfile):
+        self.logfile = logfile
+        self.file = open(logfile, 'rb')
+        self.lock = threading.Lock()
+        # Position and timestamp of the rest of a line read partially, as
+        # it was longer than max_bytes.
+        self.continued = None
+
+    @classmethod
+    def get(cls, logfile):
+        """
+        Returns the reader of the log file, or None if it does not exist.
+        """
+        with cls._lock:
+            reader = cls._readers.get(logfile)
+            if reader is not None:
+                cls._readers.move_to_end(logfile)
+                return reader
+
+            try:
+                reader = cls(logfile)
+            except OSError:
+                return None
+
+            cls._readers[logfile] = reader
+            evicted = [cls._readers.popitem(last=False)[1]
+                       for _ in range(len(cls._readers) - MAX_OPEN_LOGS)]
+
+        # Wait for the reads in progress before closing the evicted logs
+        for log in evicted:
+            with log.lock:
+                log.file.close()
+        return reader
+
+    @classmethod
+    def close(cls, logfile):
+        with cls._lock:
+            reader = cls._readers.pop(logfile, None)
+        if reader is not None:
+            with reader.lock:
+                reader.file.close()
+
+    def read(self, pos, ctime, ended, enc='utf-8', max_bytes=1024 * 1024):
+        """
+        Returns the lines logged from pos, up to the lines logged after
+        ctime (excluded) or max_bytes, along with the position of the next
+        line, and whether the log is complete. Only the complete lines are
+        read until the process has ended, except a line longer than
+        max_bytes, which is returned in parts.
+
+        Args:
+            pos: Position to read from
+            ctime: Time of the request (same format as the timestamps)
+            ended: Whether the process has ended
+            enc: Encoding of the output
+            max_bytes: Maximum number of bytes to read
+        """
+        log = []
+        with self.lock:
+            if self.file.closed:
+                return log, pos, False
+
+            eofs = os.fstat(self.file.fileno()).st_size
+            if pos >= eofs:
+                return log, pos, ended
+
+            self.file.seek(pos)
+            data = self.file.read(min(eofs - pos, max_bytes))
+            continued = self.continued
+
+        truncated = pos + len(data) < eofs
+        start = 0
+        while start < len(data):
+            end = data.find(b'\n', start)
+            partial = end == -1 and start == 0 and len(data) >= max_bytes
+            if end == -1:
+                # The line is being written, or beyond max_bytes. A line
+                # not fitting in max_bytes is returned in parts, not to
+                # stall the reads of the log.
+                if (truncated or not ended) and not partial:
+                    break
+                end = len(data)
+
+            if start == 0 and continued is not None and \
+                    continued[0] == pos:
+                line = continued[1], data[:end]
+            else:
+                line = split_log_line(data[start:end])
+            if partial and line is not None:
+                self.continued = pos + end, line[0]
+            if line is not None:
+                ts = line[0].decode('ascii')
+                if ts > ctime:
+                    return log, pos + start, False
+                log.append([ts, line[1].decode(enc, 'replace')])
+            start = end + 1
+
+        pos += min(start, len(data))
+        return log, pos, ended and pos >= eofs
+
+    def tail(self, count, ctime, ended, enc='utf-8'):
+        """
+        Returns the last count lines of the log, along with the position of
+        the next line and whether the log is complete.
+        """
+        with self.lock:
+            if self.file.closed:
+                return [], 0, False
+
+            eofs = os.fstat(self.file.fileno()).st_size
+            start = eofs
+            data = b''
+            # Read the blocks from the end until there are count lines
+            while start > 0 and data.count(b'\n') <= count:
+                size = min(TAIL_BLOCK_SIZE, start)
+                start -= size
+                self.file.seek(start)
+                data = self.file.read(size) + data
+
+        # Skip the first line, which may be partial
+        if start > 0:
+            skip = data.find(b'\n') + 1
+            start += skip
+            data = data[skip:]
+
+        # Find the position of the count lines before the last (complete)
+        # line.
+        end = len(data) if ended else data.rfind(b'\n') + 1
+        begin = end
+        for _ in range(count):
+            if begin <= 0:
+                break
+            begin = data.rfind(b'\n', 0, begin - 1) + 1
+
+        return self.read(start + begin, ctime, ended, enc)
@@ -16,12 +16,15 @@ import os
 import sys
 import psutil
 from abc import ABCMeta, abstractmethod
+from collections import Counter, namedtuple, OrderedDict
 from datetime import datetime, timedelta, timezone
 from pickle import dumps, loads
 from subprocess import Popen, PIPE
 import logging
 import json
 import shutil
+import threading
+import time
 
 from pgadmin.utils import u_encode, file_quote, fs_encoding, \
     get_complete_file_path, get_storage_directory, IS_WIN
@@ -36,12 +39,18 @@ from flask_security import current_user
 
 import config
 from pgadmin.model import Process, db
+from pgadmin.misc.bgprocess.log_reader import LogReader
 from io import StringIO
 
 PROCESS_NOT_STARTED = 0
 PROCESS_STARTED = 1
 PROCESS_FINISHED = 2
 PROCESS_TERMINATED = 3
+PROCESS_QUEUED = 4
+# Priorities of the processes queued beyond the concurrency limits, the
+# highest is started first.
+PROCESS_PRIORITY_LOW = -1
+PROCESS_PRIORITY_NORMAL = 0
 PROCESS_NOT_FOUND = _("Could not find a process with the specified ID.")
 
 
@@ -113,8 +122,9 @@ class BatchProcess:
 
         self.id = self.desc = self.cmd = self.args = self.log_dir = \
             self.stdout = self.stderr = self.stime = self.etime = \
-            self.ecode = self.manager_obj = None
+            self.ecode = self.manager_obj = self.server_id = None
         self.env = dict()
+        self.priority = kwargs.get('priority', PROCESS_PRIORITY_NORMAL)
 
         if 'id' in kwargs:
             self._retrieve_process(kwargs['id'])
@@ -239,7 +249,8 @@ class BatchProcess:
             arguments=args_val,
             logdir=log_dir,
             desc=tmp_desc,
-            user_id=current_user.id
+            user_id=current_user.id,
+            priority=self.priority
         )
         db.session.add(j)
         db.session.commit()
@@ -249,6 +260,8 @@ class BatchProcess:
         Check start and end time to check process is still executing or not.
         :return:
         """
+        if self.process_state == PROCESS_QUEUED:
+            raise RuntimeError(_('The process has already been queued.'))
         if self.stime is not None:
             if self.etime is None:
                 raise RuntimeError(_('The process has already been started.'))
@@ -276,6 +289,10 @@ class BatchProcess:
         return interpreter if interpreter else 'python'
 
     def start(self, cb=None):
+        """
+        Queue the process, it is started right away unless the maximum number
+        of processes are already running (see ProcessScheduler).
+        """
         self.check_start_end_time()
 
         executor = file_quote(os.path.join(
@@ -313,6 +330,17 @@ class BatchProcess:
 
         if cb is not None:
             cb(env)
+
+        ProcessScheduler.submit(
+            self.id, cmd, env, self.server_id, self.priority)
+        self.process_state = PROCESS_QUEUED
+
+    @staticmethod
+    def launch(pid, cmd, env):
+        """
+        Run the process executor of the process, with the command and the
+        environment prepared on start.
+        """
         if os.name == 'nt':
             DETACHED_PROCESS = 0x00000008
             from subprocess import CREATE_NEW_PROCESS_GROUP
@@ -339,39 +367,40 @@ class BatchProcess:
             # if in debug mode, wait for process to complete and
             # get the stdout and stderr of popen.
             if config.CONSOLE_LOG_LEVEL <= logging.DEBUG:
-                p = self.get_process_output(cmd, env)
+                p = BatchProcess.get_process_output(cmd, env)
             else:
                 p = Popen(
                     cmd, close_fds=True, stdout=None, stderr=None, stdin=None,
                     start_new_session=True, env=env
                 )
 
-        self.ecode = p.poll()
+        ecode = p.poll()
 
         # Execution completed immediately.
         # Process executor cannot update the status, if it was not able to
         # start properly.
-        if self.ecode is not None and self.ecode != 0:
+        if ecode is not None and ecode != 0:
             # There is no way to find out the error message from this process
             # as standard output, and standard error were redirected to
             # devnull.
-            p = Process.query.filter_by(
-                pid=self.id, user_id=current_user.id
-            ).first()
-            p.start_time = p.end_time = get_current_time()
-            if not p.exit_code:
-                p.exit_code = self.ecode
-            p.process_state = PROCESS_FINISHED
-            db.session.commit()
-        else:
-            # Update the process state to "Started"
-            p = Process.query.filter_by(
-                pid=self.id, user_id=current_user.id
-            ).first()
-            p.process_state = PROCESS_STARTED
-            db.session.commit()
+            BatchProcess.set_failed(pid, ecode)
 
-    def get_process_output(self, cmd, env):
+    @staticmethod
+    def set_failed(pid, ecode):
+        """
+        Mark the process, which could not be started, as finished.
+        """
+        p = Process.query.filter_by(pid=pid).first()
+        if p is None:
+            return
+        p.start_time = p.end_time = get_current_time()
+        if not p.exit_code:
+            p.exit_code = ecode
+        p.process_state = PROCESS_FINISHED
+        db.session.commit()
+
+    @staticmethod
+    def get_process_output(cmd, env):
         """
         :param cmd:
         :param env:
@@ -467,43 +496,29 @@ class BatchProcess:
                 return file_quote(exe_file)
         return None
 
-    def read_log(self, logfile, log, pos, ctime, ecode=None, enc='utf-8'):
-        import re
-        completed = True
-        idx = 0
-        c = re.compile(r"(\d+),(.*$)")
-
-        # If file is not present then
-        if not os.path.isfile(logfile):
-            return 0, True
-
-        with open(logfile, 'rb') as f:
-            eofs = os.path.getsize(logfile)
-            f.seek(pos, 0)
-            if pos == eofs and ecode is None:
-                completed = False
-
-            while pos < eofs:
-                idx += 1
-                line = f.readline()
-                line = line.decode(enc, 'replace')
-                r = c.split(line)
-                if len(r) < 3:
-                    # ignore this line
-                    pos = f.tell()
-                    continue
-                if r[1] > ctime:
-                    completed = False
-                    break
-                log.append([r[1], r[2]])
-                pos = f.tell()
-                if idx >= 1024:
-                    completed = False
-                    break
-                if pos == eofs:
-                    if ecode is None:
-                        completed = False
-                    break
+    def read_log(self, logfile, log, pos, ctime, ecode=None, enc='utf-8',
+                 tail=None):
+        """
+        Append the lines logged in the logfile after the position pos (or
+        the last tail lines), up to the time ctime, to the log.
+
+        Returns the position of the next line, and whether the log is
+        complete.
+        """
+        # The logs are created by the process executor once started, they
+        # are complete only if the process has ended.
+        reader = LogReader.get(logfile)
+        if reader is None:
+            return 0, ecode is not None
+
+        if tail is not None and pos == 0:
+            lines, pos, completed = reader.tail(
+                tail, ctime, ecode is not None, enc)
+        else:
+            lines, pos, completed = reader.read(
+                pos, ctime, ecode is not None, enc,
+                config.BG_PROCESS_LOG_READ_SIZE)
+        log.extend(lines)
 
         return pos, completed
 
@@ -563,7 +578,7 @@ class BatchProcess:
             clear_cloud_session(_pid)
         return True, {}
 
-    def status(self, out=0, err=0):
+    def status(self, out=0, err=0, tail=None):
         ctime = get_current_time(format='%y%m%d%H%M%S%f')
 
         stdout = []
@@ -587,6 +602,7 @@ class BatchProcess:
             self.stime = j.start_time
             self.etime = j.end_time
             self.ecode = j.exit_code
+            self.process_state = j.process_state
 
             if self.stime is not None:
                 stime = parser.parse(self.stime)
@@ -594,12 +610,13 @@ class BatchProcess:
 
                 execution_time = BatchProcess.total_seconds(etime - stime)
 
-            if process_output:
+            # The logs of the queued processes are not created yet
+            if process_output and self.process_state != PROCESS_QUEUED:
                 out, out_completed = self.read_log(
-                    self.stdout, stdout, out, ctime, self.ecode, enc
+                    self.stdout, stdout, out, ctime, self.ecode, enc, tail
                 )
                 err, err_completed = self.read_log(
-                    self.stderr, stderr, err, ctime, self.ecode, enc
+                    self.stderr, stderr, err, ctime, self.ecode, enc, tail
                 )
         else:
             out_completed = err_completed = False
@@ -726,31 +743,56 @@ class BatchProcess:
 
         res = []
         for p in [*processes]:
+            if p.process_state == PROCESS_QUEUED and \
+                    ProcessScheduler.is_lost(p):
+                current_app.logger.warning(
+                    _("The background process '{0}' was queued when "
+                      "pgAdmin was stopped, it will not be started.").format(
+                        p.pid)
+                )
+                p.start_time = p.end_time = get_current_time()
+                p.exit_code = -1
+                p.process_state = PROCESS_TERMINATED
+                changed = True
+
             if p.start_time is not None:
                 # remove expired jobs
                 process_expiration_time = \
                     parser.parse(p.start_time) + expiry_add
                 if datetime.now(process_expiration_time.tzinfo) >= \
                         process_expiration_time:
+                    BatchProcess.close_logs(p.logdir)
                     shutil.rmtree(p.logdir, True)
                     db.session.delete(p)
                     changed = True
 
             status, updated = BatchProcess.update_process_info(p)
-            if not status:
+            # The queued processes have no status yet
+            if not status and p.process_state != PROCESS_QUEUED:
                 continue
             elif not changed:
                 changed = updated
 
-            if p.start_time is None or (
+            if (p.start_time is None and
+                p.process_state != PROCESS_QUEUED) or (
                 p.acknowledge is not None and p.end_time is None
             ):
                 continue
 
-            stime = parser.parse(p.start_time)
-            etime = parser.parse(p.end_time or get_current_time())
+            stime = execution_time = None
+            if p.start_time is not None:
+                stime = parser.parse(p.start_time)
+                etime = parser.parse(p.end_time or get_current_time())
 
-            execution_time = BatchProcess.total_seconds(etime - stime)
+                execution_time = BatchProcess.total_seconds(etime - stime)
+
+            # Time spent in the queue
+            wait_time = None
+            if p.queued_time is not None:
+                wait_time = BatchProcess.total_seconds(
+                    (stime or parser.parse(get_current_time())) -
+                    parser.parse(p.queued_time)
+                )
 
             desc, details, type_desc, current_storage_dir = BatchProcess.\
                 _check_process_desc(p)
@@ -765,6 +807,8 @@ class BatchProcess:
                 'exit_code': p.exit_code,
                 'acknowledge': p.acknowledge,
                 'execution_time': execution_time,
+                'qtime': p.queued_time,
+                'wait_time': wait_time,
                 'process_state': p.process_state,
                 'utility_pid': p.utility_pid,
                 'server_id': p.server_id,
@@ -780,6 +824,15 @@ class BatchProcess:
     def total_seconds(dt):
         return round(dt.total_seconds(), 2)
 
+    @staticmethod
+    def close_logs(logdir):
+        """
+        Close the log files of the process kept open by the log reader, they
+        cannot be removed otherwise on Windows.
+        """
+        LogReader.close(os.path.join(logdir, 'out'))
+        LogReader.close(os.path.join(logdir, 'err'))
+
     @staticmethod
     def acknowledge(_pid):
         """
@@ -799,7 +852,7 @@ class BatchProcess:
         if p.end_time is not None:
             logdir = p.logdir
             db.session.delete(p)
-            import shutil
+            BatchProcess.close_logs(logdir)
             shutil.rmtree(logdir, True)
         else:
             p.acknowledge = get_current_time()
@@ -809,6 +862,8 @@ class BatchProcess:
     def set_env_variables(self, server, **kwargs):
         """Set environment variables"""
         if server:
+            self.server_id = server.id
+
             # Set SSL related ENV variables
             if hasattr(server, 'connection_params') and \
                 server.connection_params and \
@@ -870,6 +925,13 @@ class BatchProcess:
         if p is None:
             raise LookupError(PROCESS_NOT_FOUND)
 
+        if ProcessScheduler.cancel(p.pid):
+            p.start_time = p.end_time = get_current_time()
+            p.exit_code = -1
+            p.process_state = PROCESS_TERMINATED
+            db.session.commit()
+            return
+
         try:
             process = psutil.Process(p.utility_pid)
             process.terminate()
@@ -885,6 +947,9 @@ class BatchProcess:
             current_app.logger.exception(e)
         db.session.commit()
 
+        # Start the next queued process, if any
+        ProcessScheduler.schedule()
+
     @staticmethod
     def update_server_id(_pid, _sid):
         p = Process.query.filter_by(
@@ -897,3 +962,225 @@ class BatchProcess:
         # Update the cloud server id
         p.server_id = _sid
         db.session.commit()
+
+
+QueuedProcess = namedtuple(
+    'QueuedProcess',
+    ['pid', 'user_id', 'server_id', 'priority', 'cmd', 'env']
+)
+
+
+class ProcessScheduler:
+    """
+    class ProcessScheduler
+
+        Starts the background processes, keeping at most
+        BG_PROCESS_MAX_RUNNING of them running at once, and at most
+        BG_PROCESS_MAX_RUNNING_PER_SERVER against the same server. The
+        processes beyond are queued, and started as the running ones
+        complete: highest priority first, then for the users having the
+        fewest processes running, then in the order they were queued.
+
+        The processes running are counted from the configuration database.
+        The queue is kept in memory along with the environment of the
+        processes (which holds their passwords), the processes queued when
+        pgAdmin is stopped are not started.
+
+    Class-level Methods:
+    ----------- -------
+    * submit(pid, cmd, env, server_id, priority)
+      - Queues the process, and starts the processes which can be started.
+
+    * schedule()
+      - Starts the queued processes which can be started.
+
+    * cancel(pid)
+      - Removes the process from the queue, returns whether it was queued.
+
+    * is_lost(process)
+      - Returns whether the queued process was queued before pgAdmin was
+        restarted.
+    """
+    _lock = threading.Lock()
+    # pid -> QueuedProcess, in the order queued
+    _queue = OrderedDict()
+    _thread = None
+    _app = None
+    _started_at = get_current_time()
+    # pid -> time.monotonic() when the process was launched (or first seen
+    # running by this pgAdmin process), until its executor logs its start.
+    _launched = dict()
+    # Seconds given to the process executor to log the start of the utility
+    START_TIMEOUT = 120
+
+    @classmethod
+    def submit(cls, pid, cmd, env, server_id=None,
+               priority=PROCESS_PRIORITY_NORMAL):
+        p = Process.query.filter_by(pid=pid).first()
+
+        with cls._lock:
+            cls._queue[pid] = QueuedProcess(
+                pid, current_user.id, server_id,
+                priority or PROCESS_PRIORITY_NORMAL, cmd, env)
+            if p is not None:
+                p.process_state = PROCESS_QUEUED
+                p.queued_time = get_current_time()
+                p.target_server_id = server_id
+                db.session.commit()
+
+        try:
+            cls.schedule(raise_for=pid)
+        finally:
+            with cls._lock:
+                if cls._queue and cls._thread is None:
+                    cls._app = current_app._get_current_object()
+                    cls._thread = threading.Thread(
+                        target=cls._watch, name='ProcessScheduler',
+                        daemon=True)
+                    cls._thread.start()
+
+    @classmethod
+    def schedule(cls, raise_for=None):
+        """
+        Starts the queued processes which can be started.
+
+        Args:
+            raise_for: Raise the error of the process with this id, if it
+                cannot be started (the others are marked as failed)
+        """
+        with cls._lock:
+            if not cls._queue:
+                return
+            selected = cls._select(cls._running())
+            for queued in selected:
+                del cls._queue[queued.pid]
+                p = Process.query.filter_by(pid=queued.pid).first()
+                if p is not None:
+                    p.process_state = PROCESS_STARTED
+                    cls._launched[queued.pid] = time.monotonic()
+            if selected:
+                db.session.commit()
+
+        for queued in selected:
+            current_app.logger.info(
+                "Starting the background process %s", queued.pid)
+            try:
+                BatchProcess.launch(queued.pid, queued.cmd, queued.env)
+            except Exception as e:
+                if queued.pid == raise_for:
+                    BatchProcess.set_failed(queued.pid, -1)
+                    raise
+                current_app.logger.exception(e)
+                BatchProcess.set_failed(queued.pid, -1)
+
+    @classmethod
+    def cancel(cls, pid):
+        with cls._lock:
+            return cls._queue.pop(pid, None) is not None
+
+    @classmethod
+    def is_lost(cls, process):
+        return process.queued_time is not None and \
+            process.queued_time < cls._started_at
+
+    @classmethod
+    def _running(cls):
+        """
+        Returns the processes running, according to their status files.
+        """
+        processes = Process.query.filter(
+            Process.process_state == PROCESS_STARTED,
+            Process.end_time.is_(None)
+        ).all()
+
+        running = []
+        changed = False
+        now = time.monotonic()
+        launched = dict()
+        for p in processes:
+            _, updated = BatchProcess.update_process_info(p)
+            changed = changed or updated
+            if p.end_time is not None:
+                continue
+            if p.start_time is None:
+                launched[p.pid] = cls._launched.get(p.pid, now)
+                # The process executor died before it could log the start
+                # of the utility.
+                if now - launched[p.pid] > cls.START_TIMEOUT:
+                    current_app.logger.warning(
+                        "The background process %s did not start", p.pid)
+                    p.start_time = p.end_time = get_current_time()
+                    if not p.exit_code:
+                        p.exit_code = -1
+                    p.process_state = PROCESS_FINISHED
+                    changed = True
+                    del launched[p.pid]
+                    continue
+            # The process executor was killed before it could log the end
+            # of the utility.
+            elif p.utility_pid and \
+                    not psutil.pid_exists(p.utility_pid):
+                continue
+            running.append(p)
+        cls._launched = launched
+
+        if changed:
+            db.session.commit()
+
+        return running
+
+    @classmethod
+    def _select(cls, running):
+        """
+        Returns the queued processes to start, in the order to start them.
+        """
+        max_running = config.BG_PROCESS_MAX_RUNNING
+        max_per_server = config.BG_PROCESS_MAX_RUNNING_PER_SERVER
+
+        total = len(running)
+        per_server = Counter(p.target_server_id for p in running)
+        per_user = Counter(p.user_id for p in running)
+
+        queued = list(cls._queue.values())
+        selected = []
+        while queued and (not max_running or total < max_running):
+            startable = [
+                (idx, q) for idx, q in enumerate(queued)
+                if q.server_id is None or not max_per_server or
+                per_server[q.server_id] < max_per_server
+            ]
+            if not startable:
+                break
+
+            idx, q = min(
+                startable,
+                key=lambda item: (-item[1].priority,
+                                  per_user[item[1].user_id], item[0])
+            )
+            del queued[idx]
+            selected.append(q)
+            total += 1
+            per_user[q.user_id] += 1
+            if q.server_id is not None:
+                per_server[q.server_id] += 1
+
+        return selected
+
+    @classmethod
+    def _watch(cls):
+        """
+        Starts the queued processes as the running ones complete, checking
+        them every BG_PROCESS_SCHEDULE_INTERVAL seconds.
+        """
+        while True:
+            time.sleep(config.BG_PROCESS_SCHEDULE_INTERVAL)
+            with cls._app.app_context():
+                try:
+                    cls.schedule()
+                except Exception as e:
+                    current_app.logger.exception(e)
+
+            with cls._lock:
+                if not cls._queue:
+                    cls._thread = None
+                    return
@@ -15,6 +15,7 @@ export const BgProcessManagerProcessState = {
   PROCESS_STARTED: 1,
   PROCESS_FINISHED: 2,
   PROCESS_TERMINATED: 3,
+  PROCESS_QUEUED: 4,
   /* Supported by front end only */
   PROCESS_TERMINATING: 10,
   PROCESS_FAILED: 11,
@@ -57,7 +57,9 @@ export default class BgProcessManager {
     let self = this;
     await self.syncProcesses();
     /* Fill the pending jobs initially */
-    self._pendingJobId = this.procList.filter((p)=>(p.process_state == BgProcessManagerProcessState.PROCESS_STARTED)).map((p)=>p.id);
+    self._pendingJobId = this.procList.filter((p)=>([
+      BgProcessManagerProcessState.PROCESS_STARTED,
+      BgProcessManagerProcessState.PROCESS_QUEUED].includes(p.process_state))).map((p)=>p.id);
     this._workerId = setInterval(()=>{
       if(self._pendingJobId.length > 0) {
         self.syncProcesses();
@@ -67,8 +69,12 @@ export default class BgProcessManager {
 
   evaluateProcessState(p) {
     let retState = p.process_state;
-    if((p.etime || p.exit_code !=null) && p.process_state == BgProcessManagerProcessState.PROCESS_STARTED) {
+    if((p.etime || p.exit_code !=null) && [
+      BgProcessManagerProcessState.PROCESS_STARTED,
+      BgProcessManagerProcessState.PROCESS_QUEUED].includes(p.process_state)) {
       retState =  BgProcessManagerProcessState.PROCESS_FINISHED;
+    } else if(p.stime && p.process_state == BgProcessManagerProcessState.PROCESS_QUEUED) {
+      retState = BgProcessManagerProcessState.PROCESS_STARTED;
     }
     if(retState == BgProcessManagerProcessState.PROCESS_FINISHED && p.exit_code != 0) {
       retState = BgProcessManagerProcessState.PROCESS_FAILED;
@@ -84,7 +90,10 @@ export default class BgProcessManager {
         return {
           ...p,
           process_state: processState,
-          canDrop: ![BgProcessManagerProcessState.PROCESS_NOT_STARTED, BgProcessManagerProcessState.PROCESS_STARTED].includes(processState),
+          canDrop: ![
+            BgProcessManagerProcessState.PROCESS_NOT_STARTED,
+            BgProcessManagerProcessState.PROCESS_STARTED,
+            BgProcessManagerProcessState.PROCESS_QUEUED].includes(processState),
         };
       });
       this._eventManager.fireEvent(BgProcessManagerEvents.LIST_UPDATED);
@@ -99,6 +108,7 @@ export default class BgProcessManager {
       if(![
         BgProcessManagerProcessState.PROCESS_NOT_STARTED,
         BgProcessManagerProcessState.PROCESS_STARTED,
+        BgProcessManagerProcessState.PROCESS_QUEUED,
         BgProcessManagerProcessState.PROCESS_TERMINATING].includes(p.process_state)) {
         return true;
       }
@@ -7,7 +7,7 @@
 //
 //////////////////////////////////////////////////////////////
 
-import React, { useState, useMemo } from 'react';
+import React, { useState, useMemo, useEffect } from 'react';
 import gettext from 'sources/gettext';
 import url_for from 'sources/url_for';
 import { Box } from '@mui/material';
@@ -22,6 +22,10 @@ import { useInterval } from '../../../../static/js/custom_hooks';
 import getApiInstance from '../../../../static/js/api_instance';
 import pgAdmin from 'sources/pgadmin';
 import FolderSharedRoundedIcon from '@mui/icons-material/FolderSharedRounded';
+import { openSocket } from '../../../../static/js/socket_instance';
+
+/* Number of the last lines of the logs shown on opening the details */
+const TAIL_LINES = 1000;
 
 
 const useStyles = makeStyles((theme)=>({
@@ -75,7 +79,7 @@ async function getDetailedStatus(api, jobId, out, err) {
       'out': out,
       'err': err,
     }
-  ));
+  ), {params: {tail: TAIL_LINES}});
   return res.data;
 }
 
@@ -87,17 +91,21 @@ export default function ProcessDetails({data}) {
   const [[outPos, errPos], setOutErrPos] = useState([0, 0]);
   const [exitCode, setExitCode] = useState(data.exit_code);
   const [timeTaken, setTimeTaken] = useState(data.execution_time);
+  const [startTime, setStartTime] = useState(data.stime);
   const [stopping, setStopping] = useState(false);
+  const [usePoll, setUsePoll] = useState(false);
 
   let notifyType = MESSAGE_TYPE.INFO;
   let notifyText = gettext('Not started');
 
   let process_state = pgAdmin.Browser.BgProcessManager.evaluateProcessState({
     ...data,
+    stime: startTime,
     exit_code: exitCode,
   });
 
-  if(process_state == BgProcessManagerProcessState.PROCESS_STARTED && stopping) {
+  if([BgProcessManagerProcessState.PROCESS_STARTED,
+    BgProcessManagerProcessState.PROCESS_QUEUED].includes(process_state) && stopping) {
     process_state = BgProcessManagerProcessState.PROCESS_TERMINATING;
   }
   if(process_state == BgProcessManagerProcessState.PROCESS_FAILED && stopping) {
@@ -106,6 +114,8 @@ export default function ProcessDetails({data}) {
 
   if(process_state == BgProcessManagerProcessState.PROCESS_STARTED) {
     notifyText = gettext('Running...');
+  } else if(process_state == BgProcessManagerProcessState.PROCESS_QUEUED) {
+    notifyText = gettext('Queued, waiting for the running processes to complete...');
   } else if(process_state == BgProcessManagerProcessState.PROCESS_FINISHED) {
     notifyType = MESSAGE_TYPE.SUCCESS;
     notifyText = gettext('Successfully completed.');
@@ -119,11 +129,10 @@ export default function ProcessDetails({data}) {
     notifyText = gettext('Terminating the process...');
   }
 
-  useInterval(async ()=>{
+  const onDetailedStatus = (resData)=>{
     const logsSortComp = (l1, l2)=>{
       return l1[0].localeCompare(l2[0]);
     };
-    let resData = await getDetailedStatus(api, data.id, outPos, errPos);
     resData.out.lines.sort(logsSortComp);
     resData.err.lines.sort(logsSortComp);
     if(resData.out?.done && resData.err?.done && resData.exit_code != null) {
@@ -131,6 +140,7 @@ export default function ProcessDetails({data}) {
       setCompleted(true);
     }
     setTimeTaken(resData.execution_time);
+    setStartTime(resData.start_time);
     setOutErrPos([resData.out.pos, resData.err.pos]);
     setLogs((prevLogs)=>{
       return [
@@ -139,8 +149,41 @@ export default function ProcessDetails({data}) {
         ...resData.err.lines.map((l)=>l[1]),
       ];
     });
+  };
+
+  /* The logs are pushed by the server as they are logged, they are polled
+   * if the socket cannot be opened. */
+  useEffect(()=>{
+    let socket = null;
+    let closed = false;
 
-  }, completed ? -1 : 1000);
+    openSocket('/bgprocess')
+      .then((sock)=>{
+        socket = sock;
+        if(closed) {
+          socket.disconnect();
+          return;
+        }
+        socket.on('process_logs', onDetailedStatus);
+        socket.on('subscribe_logs_failed', ()=>setUsePoll(true));
+        socket.on('process_logs_failed', ()=>setUsePoll(true));
+        socket.emit('subscribe_logs', {pid: data.id, tail: TAIL_LINES});
+      })
+      .catch(()=>{
+        if(!closed) {
+          setUsePoll(true);
+        }
+      });
+
+    return ()=>{
+      closed = true;
+      socket?.disconnect();
+    };
+  }, [data.id]);
+
+  useInterval(async ()=>{
+    onDetailedStatus(await getDetailedStatus(api, data.id, outPos, errPos));
+  }, completed || !usePoll ? -1 : 1000);
 
   const onStopProcess = ()=>{
     setStopping(true);
@@ -160,13 +203,15 @@ export default function ProcessDetails({data}) {
         <Box data-test="process-cmd" className={classes.cmd}>{data.details.query}</Box>
       </>}
       <Box display="flex" justifyContent="space-between" alignItems="center" flexWrap="wrap">
-        <Box><span><AccessTimeRoundedIcon /> {gettext('Start time')}: {new Date(data.stime).toString()}</span></Box>
+        <Box><span><AccessTimeRoundedIcon /> {gettext('Start time')}: {startTime ? new Date(startTime).toString() : ''}</span></Box>
         <Box>
           {pgAdmin.server_mode == 'True' && data.current_storage_dir &&
           <PgIconButton icon={<FolderSharedRoundedIcon />} title={gettext('Storage Manager')} onClick={()=>{
             pgAdmin.Tools.FileManager.openStorageManager(data.current_storage_dir);
           }} style={{marginRight: '4px'}} />}
-          <DefaultButton disabled={process_state != BgProcessManagerProcessState.PROCESS_STARTED || data.server_id != null}
+          <DefaultButton disabled={![
+            BgProcessManagerProcessState.PROCESS_STARTED,
+            BgProcessManagerProcessState.PROCESS_QUEUED].includes(process_state) || data.server_id != null}
             startIcon={<HighlightOffRoundedIcon />} className={classes.terminateBtn} onClick={onStopProcess}>
               Stop Process
           </DefaultButton>
@@ -90,6 +90,7 @@ const useStyles = makeStyles((theme) => ({
 const ProcessStateTextAndColor = {
   [BgProcessManagerProcessState.PROCESS_NOT_STARTED]: [gettext('Not started'), 'bgRunning'],
   [BgProcessManagerProcessState.PROCESS_STARTED]: [gettext('Running'), 'bgRunning'],
+  [BgProcessManagerProcessState.PROCESS_QUEUED]: [gettext('Queued'), 'bgRunning'],
   [BgProcessManagerProcessState.PROCESS_FINISHED]: [gettext('Finished'), 'bgSucess'],
   [BgProcessManagerProcessState.PROCESS_TERMINATED]: [gettext('Terminated'), 'bgTerm'],
   [BgProcessManagerProcessState.PROCESS_TERMINATING]: [gettext('Terminating...'), 'bgTerm'],
@@ -130,7 +131,9 @@ export default function Processes() {
           noBorder
           icon={<CancelIcon />}
           className={classes.stopButton}
-          disabled={row.original.process_state != BgProcessManagerProcessState.PROCESS_STARTED
+          disabled={![
+            BgProcessManagerProcessState.PROCESS_STARTED,
+            BgProcessManagerProcessState.PROCESS_QUEUED].includes(row.original.process_state)
             || row.original.server_id != null}
           onClick={(e) => {
             e.preventDefault();
@@ -237,8 +240,8 @@ export default function Processes() {
       disableGlobalFilter: true,
       width: 150,
       minWidth: 150,
-      accessor: (row)=>(new Date(row.stime)),
-      Cell: ({row})=>(new Date(row.original.stime).toLocaleString()),
+      accessor: (row)=>(new Date(row.stime ?? row.qtime)),
+      Cell: ({row})=>(row.original.stime ? new Date(row.original.stime).toLocaleString() : ''),
     },
     {
       Header: gettext('Status'),
@@ -257,6 +260,13 @@ export default function Processes() {
       sortable: true,
       resizable: true,
       disableGlobalFilter: true,
+    },
+    {
+      Header: gettext('Wait Time (sec)'),
+      accessor: 'wait_time',
+      sortable: true,
+      resizable: true,
+      disableGlobalFilter: true,
     }];
   }, []);
 
@@ -0,0 +1,129 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2024, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import os
+import tempfile
+
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.misc.bgprocess.log_reader import LogReader
+
+CTIME = '991231235959999999'
+
+
+def log_line(idx, output=None):
+    return '{0:018d},{1}\n'.format(
+        idx, 'line {0}'.format(idx) if output is None else output).encode()
+
+
+class LogReaderTestCase(BaseTestGenerator):
+    """
+    Check that the lines of the logs are read from the position read up to,
+    or from the end of the logs.
+    """
+
+    scenarios = [
+        ('Read incrementally', dict(action='read')),
+        ('Read up to the request time', dict(action='ctime')),
+        ('Read up to the maximum size', dict(action='max_bytes')),
+        ('Line longer than the maximum size', dict(action='long_line')),
+        ('Last lines', dict(action='tail')),
+        ('Missing log', dict(action='missing')),
+    ]
+
+    def setUp(self):
+        fd, self.logfile = tempfile.mkstemp()
+        self.log = os.fdopen(fd, 'wb', buffering=0)
+
+    def tearDown(self):
+        LogReader.close(self.logfile)
+        self.log.close()
+        os.remove(self.logfile)
+
+    def runTest(self):
+        if self.action == 'missing':
+            self.assertIsNone(LogReader.get(self.logfile + '.missing'))
+            return
+
+        reader = LogReader.get(self.logfile)
+        self.assertIs(LogReader.get(self.logfile), reader)
+
+        if self.action == 'read':
+            self.log.write(log_line(1) + b'not a log line\n' +
+                           log_line(2, 'a,b') + b'000000000000000003,par')
+            lines, pos, completed = reader.read(0, CTIME, False)
+            self.assertEqual([line[1] for line in lines], ['line 1', 'a,b'])
+            self.assertFalse(completed)
+
+            # The partial line is read once complete, or the process ended
+            lines, pos, completed = reader.read(pos, CTIME, False)
+            self.assertEqual(lines, [])
+            self.log.write(b'tial')
+            lines, pos, completed = reader.read(pos, CTIME, True)
+            self.assertEqual(lines, [['000000000000000003', 'partial']])
+            self.assertTrue(completed)
+            self.assertEqual(pos, os.path.getsize(self.logfile))
+
+        elif self.action == 'ctime':
+            self.log.write(log_line(1) + log_line(5) + log_line(6))
+            lines, pos, completed = reader.read(
+                0, '{0:018d}'.format(5), True)
+            self.assertEqual(len(lines), 2)
+            self.assertFalse(completed)
+            lines, pos, completed = reader.read(pos, CTIME, True)
+            self.assertEqual(lines, [['{0:018d}'.format(6), 'line 6']])
+            self.assertTrue(completed)
+
+        elif self.action == 'max_bytes':
+            for idx in range(100):
+                self.log.write(log_line(idx))
+            pos, result = 0, []
+            while True:
+                lines, pos, completed = reader.read(
+                    pos, CTIME, True, max_bytes=100)
+                self.assertLessEqual(len(lines), 3)
+                result.extend(lines)
+                if completed:
+                    break
+            self.assertEqual([line[1] for line in result],
+                             ['line {0}'.format(idx) for idx in range(100)])
+
+        elif self.action == 'long_line':
+            self.log.write(log_line(1, 'x' * 250) + log_line(2))
+            pos, result = 0, []
+            for _ in range(10):
+                lines, pos, completed = reader.read(
+                    pos, CTIME, False, max_bytes=100)
+                result.extend(lines)
+                if pos == os.path.getsize(self.logfile):
+                    break
+            self.assertEqual(pos, os.path.getsize(self.logfile))
+            self.assertEqual({line[0] for line in result[:-1]},
+                             {'{0:018d}'.format(1)})
+            self.assertEqual(''.join(line[1] for line in result[:-1]),
+                             'x' * 250)
+            self.assertEqual(result[-1], ['{0:018d}'.format(2), 'line 2'])
+
+        else:
+            for idx in range(5000):
+                self.log.write(log_line(idx))
+            self.log.write(b'000000000000005000,partial')
+
+            lines, pos, completed = reader.tail(10, CTIME, False)
+            self.assertEqual([line[1] for line in lines],
+                             ['line {0}'.format(idx)
+                              for idx in range(4990, 5000)])
+            self.assertFalse(completed)
+
+            lines, _, completed = reader.tail(2, CTIME, True)
+            self.assertEqual([line[1] for line in lines],
+                             ['line 4999', 'partial'])
+            self.assertTrue(completed)
+
+            lines, _, _ = reader.tail(10000, CTIME, True)
+            self.assertEqual(len(lines), 5001)
@@ -0,0 +1,74 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2024, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import os
+import tempfile
+from unittest.mock import patch, MagicMock
+
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.misc import bgprocess
+from pgadmin.misc.bgprocess.processes import BatchProcess
+
+CTIME = '991231235959999999'
+
+
+def status(exit_code, lines=()):
+    logs = {'pos': 0, 'lines': list(lines), 'done': exit_code is not None}
+    return {'out': logs, 'err': dict(logs), 'start_time': None,
+            'exit_code': exit_code, 'execution_time': None}
+
+
+class ProcessLogsTestCase(BaseTestGenerator):
+    """
+    Check that the logs of a process, which are created by the process
+    executor once started, are not reported complete before the process
+    ends, and are pushed until then.
+    """
+
+    scenarios = [
+        ('Missing log of a running process', dict(action='running')),
+        ('Missing log of an ended process', dict(action='ended')),
+        ('Logs pushed until the process ends', dict(action='push')),
+    ]
+
+    def runTest(self):
+        if self.action == 'push':
+            self._check_push()
+            return
+
+        logfile = os.path.join(tempfile.gettempdir(), 'pga_missing_out')
+        lines = []
+        pos, completed = BatchProcess.read_log(
+            None, logfile, lines, 0, CTIME,
+            ecode=None if self.action == 'running' else 0)
+
+        self.assertEqual((pos, lines), (0, []))
+        self.assertEqual(completed, self.action == 'ended')
+
+    def _check_push(self):
+        # The logs do not exist yet on the first status
+        statuses = [status(None), status(None, [['1', 'line']]), status(0)]
+        socketio = MagicMock()
+        subscription = object()
+
+        def runner(func):
+            return statuses.pop(0)
+
+        with patch.object(bgprocess, 'socketio', socketio), \
+                patch.dict(bgprocess._log_subscriptions,
+                           {'socket': subscription}):
+            statuses[0]['out']['done'] = statuses[0]['err']['done'] = True
+            bgprocess.send_logs('socket', subscription, '1', None, runner)
+
+            self.assertNotIn('socket', bgprocess._log_subscriptions)
+
+        pushed = [call.args[1]['exit_code']
+                  for call in socketio.emit.call_args_list
+                  if call.args[0] == 'process_logs']
+        self.assertEqual(pushed, [None, None, 0])
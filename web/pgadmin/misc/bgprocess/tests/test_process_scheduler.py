@@ -0,0 +1,117 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2024, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import time
+from collections import OrderedDict, namedtuple
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.misc.bgprocess.processes import ProcessScheduler, \
+    QueuedProcess, PROCESS_STARTED, PROCESS_FINISHED
+
+RunningProcess = namedtuple('RunningProcess', ['user_id', 'target_server_id'])
+
+
+def queued(pid, user_id, server_id=None, priority=0):
+    return QueuedProcess(pid, user_id, server_id, priority, [], {})
+
+
+class ProcessSchedulerTestCase(BaseTestGenerator):
+    """
+    Check the queued processes selected to be started, according to the
+    concurrency limits, their priority and their users.
+    """
+
+    scenarios = [
+        ('No limits', dict(
+            max_running=0, max_per_server=0, running=[],
+            queue=[queued('1', 1, 1), queued('2', 1, 1), queued('3', 2)],
+            expected=['1', '3', '2'])),
+        ('Global limit', dict(
+            max_running=3, max_per_server=0,
+            running=[RunningProcess(1, 1)],
+            queue=[queued('1', 1), queued('2', 1), queued('3', 1)],
+            expected=['1', '2'])),
+        ('Limit reached', dict(
+            max_running=1, max_per_server=0,
+            running=[RunningProcess(1, None)],
+            queue=[queued('1', 1)],
+            expected=[])),
+        ('Per server limit', dict(
+            max_running=0, max_per_server=2,
+            running=[RunningProcess(1, 1)],
+            queue=[queued('1', 1, 1), queued('2', 1, 1), queued('3', 1, 2),
+                   queued('4', 1)],
+            expected=['1', '3', '4'])),
+        ('Priority first', dict(
+            max_running=2, max_per_server=0, running=[],
+            queue=[queued('1', 1), queued('2', 2, priority=1),
+                   queued('3', 1, priority=2)],
+            expected=['3', '2'])),
+        ('In turn for the users', dict(
+            max_running=0, max_per_server=0,
+            running=[RunningProcess(1, None)],
+            queue=[queued('1', 1), queued('2', 1), queued('3', 2),
+                   queued('4', 2), queued('5', 3)],
+            expected=['3', '5', '1', '4', '2'])),
+    ]
+
+    def runTest(self):
+        with patch.object(ProcessScheduler, '_queue', OrderedDict(
+                (q.pid, q) for q in self.queue)), \
+                patch('pgadmin.misc.bgprocess.processes.config') as config:
+            config.BG_PROCESS_MAX_RUNNING = self.max_running
+            config.BG_PROCESS_MAX_RUNNING_PER_SERVER = self.max_per_server
+
+            selected = ProcessScheduler._select(self.running)
+
+        self.assertEqual([q.pid for q in selected], self.expected)
+
+
+class ProcessSchedulerRunningTestCase(BaseTestGenerator):
+    """
+    Check that a process, whose executor did not log its start, stops being
+    counted as running after START_TIMEOUT.
+    """
+
+    scenarios = [
+        ('Process started recently', dict(
+            launched_ago=10, expected_running=True)),
+        ('Process executor died before the start', dict(
+            launched_ago=ProcessScheduler.START_TIMEOUT + 10,
+            expected_running=False)),
+    ]
+
+    def runTest(self):
+        process = SimpleNamespace(
+            pid='1', start_time=None, end_time=None, exit_code=None,
+            utility_pid=0, process_state=PROCESS_STARTED)
+        launched = {'1': time.monotonic() - self.launched_ago}
+
+        module = 'pgadmin.misc.bgprocess.processes'
+        with patch.object(ProcessScheduler, '_launched', launched), \
+                patch(module + '.Process') as model, \
+                patch(module + '.db'), patch(module + '.current_app'), \
+                patch(module + '.BatchProcess.update_process_info',
+                      return_value=(False, False)):
+            model.query.filter.return_value.all.return_value = [process]
+            running = ProcessScheduler._running()
+            launched = ProcessScheduler._launched
+
+        if self.expected_running:
+            self.assertEqual(running, [process])
+            self.assertEqual(process.process_state, PROCESS_STARTED)
+            self.assertIn('1', launched)
+        else:
+            self.assertEqual(running, [])
+            self.assertEqual(process.process_state, PROCESS_FINISHED)
+            self.assertIsNotNone(process.end_time)
+            self.assertEqual(process.exit_code, -1)
+            self.assertNotIn('1', launched)
@@ -12,8 +12,11 @@
 import os
 import os.path
 import secrets
+import stat
 import string
+import threading
 import time
+from collections import namedtuple, OrderedDict
 from urllib.parse import unquote
 from sys import platform as _platform
 from flask_security import current_user
@@ -53,6 +56,18 @@ path_exists = os.path.exists
 split_path = os.path.split
 encode_json = json.JSONEncoder().encode
 
+# Maximum number of directory listings cached
+MAX_CACHED_LISTINGS = 32
+
+# Entry of a directory listing, with the stat results needed to show it
+DirListEntry = namedtuple('DirListEntry', [
+    'name', 'is_dir', 'hidden', 'protected', 'ctime', 'mtime', 'size'])
+
+# Directory path -> (expiry time, modification time, entries), the least
+# recently used first
+_listing_cache = OrderedDict()
+_listing_cache_lock = threading.Lock()
+
 
 # utility functions
 # convert bytes type to human readable format
@@ -64,12 +79,6 @@ def sizeof_fmt(num, suffix='B'):
     return "%.1f %s%s" % (num, 'Y', suffix)
 
 
-# return size of file
-def getsize(path):
-    st = os.stat(path)
-    return st.st_size
-
-
 def getdrivesize(path):
     if _platform == "win32":
         free_bytes = ctypes.c_ulonglong(0)
@@ -89,18 +98,100 @@ def splitext(path):
     return ext[1:]
 
 
-# check if file is hidden in windows platform
-def is_folder_hidden(filepath):
-    if _platform == "win32":
-        try:
-            attrs = ctypes.windll.kernel32.GetFileAttributesW(filepath)
-            assert attrs != -1
-            result = bool(attrs & 2)
-        except (AttributeError, AssertionError):
-            result = False
-        return result
+def _is_protected(st, user_ids):
+    """
+    Checks if the entry with the given stat result can not be both read and
+    written, from its permission bits (like os.access but without a system
+    call per entry).
+    """
+    if user_ids is None:
+        # Windows, only files with the read-only attribute are protected
+        return not st.st_mode & stat.S_IWRITE
+
+    uid, gids = user_ids
+    if uid == 0:
+        return False
+    if st.st_uid == uid:
+        mask = stat.S_IRUSR | stat.S_IWUSR
+    elif st.st_gid in gids:
+        mask = stat.S_IRGRP | stat.S_IWGRP
     else:
-        return os.path.basename(filepath).startswith('.')
+        mask = stat.S_IROTH | stat.S_IWOTH
+    return st.st_mode & mask != mask
+
+
+def scan_dir(path):
+    """
+    Returns the entries of the directory as DirListEntry tuples. The
+    directory is read with os.scandir, so that the type of the entries and
+    their stat results need no extra system calls where the platform
+    provides them. The listing is reused for
+    FILE_MANAGER_LISTING_CACHE_TIMEOUT seconds if the directory is not
+    modified.
+    """
+    path = os.path.normpath(path)
+    dir_mtime = os.stat(path).st_mtime_ns
+    now = time.monotonic()
+
+    with _listing_cache_lock:
+        cached = _listing_cache.get(path)
+        if cached is not None and cached[0] > now and \
+                cached[1] == dir_mtime:
+            _listing_cache.move_to_end(path)
+            return cached[2]
+
+    user_ids = None
+    if hasattr(os, 'getuid'):
+        user_ids = (os.getuid(), set(os.getgroups()) | {os.getgid()})
+
+    entries = []
+    with os.scandir(path) as it:
+        for entry in it:
+            try:
+                st = entry.stat()
+                is_dir = entry.is_dir()
+            except OSError:
+                # e.g. broken symbolic link
+                continue
+
+            if hasattr(st, 'st_file_attributes'):
+                hidden = bool(
+                    st.st_file_attributes & stat.FILE_ATTRIBUTE_HIDDEN)
+            else:
+                hidden = entry.name.startswith('.')
+
+            entries.append(DirListEntry(
+                entry.name, is_dir, hidden, _is_protected(st, user_ids),
+                st.st_ctime, st.st_mtime, st.st_size))
+
+    timeout = config.FILE_MANAGER_LISTING_CACHE_TIMEOUT
+    if timeout:
+        with _listing_cache_lock:
+            _listing_cache[path] = (now + timeout, dir_mtime, entries)
+            _listing_cache.move_to_end(path)
+            while len(_listing_cache) > MAX_CACHED_LISTINGS:
+                _listing_cache.popitem(last=False)
+
+    return entries
+
+
+def invalidate_listing(*paths):
+    """
+    Removes the cached listings of the directories containing the given
+    paths, after they have been added, renamed or deleted.
+    """
+    with _listing_cache_lock:
+        for path in paths:
+            _listing_cache.pop(
+                os.path.dirname(os.path.normpath(path)), None)
+
+
+# Sort keys of the entries by column of the file manager
+LISTING_SORT_KEYS = {
+    'Filename': lambda e: (e.name.casefold(), e.name),
+    'Properties.DateModified': lambda e: e.mtime,
+    'Properties.Size': lambda e: -1 if e.is_dir else e.size,
+}
 
 
 class FileManagerModule(PgAdminModule):
@@ -576,7 +667,8 @@ class Filemanager():
     @staticmethod
     def get_files_in_path(
         show_hidden_files, files_only, folders_only, supported_types,
-            file_type, user_dir, orig_path):
+            file_type, user_dir, orig_path, sort_by=None, sort_desc=False,
+            search=None, offset=0, limit=None):
         """
         Get list of files and dirs in the path
         :param show_hidden_files: boolean
@@ -586,60 +678,71 @@ class Filemanager():
         :param file_type: file type
         :param user_dir: base user dir
         :param orig_path: path after user dir
-        :return:
+        :param sort_by: column to sort by, by name if not given
+        :param sort_desc: sort in descending order
+        :param search: text the names must contain (case insensitive)
+        :param offset: number of entries to skip
+        :param limit: maximum number of entries to return
+        :return: list of files and dirs, total number of matching entries
         """
-        files = []
-
-        for f in sorted(os.listdir(orig_path)):
-            system_path = os.path.join(os.path.join(orig_path, f))
+        entries = []
+        search = search.lower() if search else None
 
+        for entry in scan_dir(orig_path):
             # continue if file/folder is hidden (based on user preference)
-            if not show_hidden_files and is_folder_hidden(system_path):
-                continue
-            try:
-                user_path = os.path.join(os.path.join(user_dir, f))
-                created = time.ctime(os.path.getctime(system_path))
-                modified = time.ctime(os.path.getmtime(system_path))
-                file_extension = str(splitext(system_path))
-            except Exception:
+            if not show_hidden_files and entry.hidden:
                 continue
 
-            # set protected to 1 if no write or read permission
-            protected = 0
-            if (not os.access(system_path, os.R_OK) or
-                    not os.access(system_path, os.W_OK)):
-                protected = 1
-
             # list files only or folders only
-            if os.path.isdir(system_path):
+            if entry.is_dir:
                 if files_only == 'true':
                     continue
-                file_extension = "dir"
             # filter files based on file_type
             elif Filemanager._skip_file_extension(
-                    file_type, supported_types, folders_only, file_extension):
+                    file_type, supported_types, folders_only,
+                    str(splitext(entry.name))):
                 continue
 
-            # create a list of files and folders
-            files.append({
-                "Filename": f,
-                "Path": user_path,
-                "file_type": file_extension,
-                "Protected": protected,
-                "Properties": {
-                    "Date Created": created,
-                    "Date Modified": modified,
-                    "Size": sizeof_fmt(getsize(system_path))
-                }
-            })
+            if search and search not in entry.name.lower():
+                continue
 
-        return files
+            entries.append(entry)
+
+        entries.sort(key=LISTING_SORT_KEYS.get(sort_by, lambda e: e.name),
+                     reverse=bool(sort_desc))
+
+        total = len(entries)
+        offset = offset or 0
+        if limit is not None:
+            entries = entries[offset:offset + limit]
+        elif offset:
+            entries = entries[offset:]
+
+        # create a list of files and folders
+        files = [{
+            "Filename": entry.name,
+            "Path": os.path.join(user_dir, entry.name),
+            "file_type": "dir" if entry.is_dir else str(
+                splitext(entry.name)),
+            # set protected to 1 if no write or read permission
+            "Protected": 1 if entry.protected else 0,
+            "Properties": {
+                "Date Created": time.ctime(entry.ctime),
+                "Date Modified": time.ctime(entry.mtime),
+                "Size": sizeof_fmt(entry.size)
+            }
+        } for entry in entries]
+
+        return files, total
 
     @staticmethod
-    def list_filesystem(in_dir, path, trans_data, file_type, show_hidden):
+    def list_filesystem(in_dir, path, trans_data, file_type, show_hidden,
+                        sort_by=None, sort_desc=False, search=None, offset=0,
+                        limit=None):
         """
         It lists all file and folders within the given
-        directory.
+        directory. When a limit is given, the requested page of the
+        listing is returned with the total number of matching entries.
         """
         Filemanager.suspend_windows_warning()
         is_show_hidden_files = show_hidden
@@ -667,6 +770,8 @@ class Filemanager():
                     }
                 })
             Filemanager.resume_windows_warning()
+            if limit is not None:
+                return {'Files': files, 'Total': len(files)}
             return files
 
         orig_path = Filemanager.get_abs_path(in_dir, path)
@@ -684,9 +789,11 @@ class Filemanager():
 
         orig_path = unquote(orig_path)
         try:
-            files = Filemanager.get_files_in_path(
+            files, total = Filemanager.get_files_in_path(
                 is_show_hidden_files, files_only, folders_only,
-                supported_types, file_type, user_dir, orig_path
+                supported_types, file_type, user_dir, orig_path,
+                sort_by=sort_by, sort_desc=sort_desc, search=search,
+                offset=offset, limit=limit
             )
         except Exception as e:
             Filemanager.resume_windows_warning()
@@ -696,6 +803,8 @@ class Filemanager():
                 err_msg = str(e.strerror)
             return unauthorized(err_msg)
         Filemanager.resume_windows_warning()
+        if limit is not None:
+            return {'Files': files, 'Total': total}
         return files
 
     @staticmethod
@@ -763,9 +872,12 @@ class Filemanager():
         trans_data = Filemanager.get_trasaction_selection(self.trans_id)
         return False if capability not in trans_data['capabilities'] else True
 
-    def getfolder(self, path=None, file_type="", show_hidden=False):
+    def getfolder(self, path=None, file_type="", show_hidden=False,
+                  sort_by=None, sort_desc=False, search=None, offset=0,
+                  limit=None):
         """
-        Returns files and folders in give path
+        Returns files and folders in give path, sorted, filtered and
+        paginated as requested
         """
         trans_data = Filemanager.get_trasaction_selection(self.trans_id)
         the_dir = None
@@ -779,7 +891,9 @@ class Filemanager():
                 the_dir += '/'
 
         filelist = self.list_filesystem(
-            the_dir, path, trans_data, file_type, show_hidden)
+            the_dir, path, trans_data, file_type, show_hidden,
+            sort_by=sort_by, sort_desc=sort_desc, search=search,
+            offset=offset, limit=limit)
         return filelist
 
     def check_access(self, ss):
@@ -832,6 +946,8 @@ class Filemanager():
         except OSError as e:
             return internal_server_error("{0} {1}".format(
                 gettext('There was an error renaming the file:'), e.strerror))
+        finally:
+            invalidate_listing(oldpath_sys, newpath_sys)
 
         return {
             'Old Path': old,
@@ -862,6 +978,8 @@ class Filemanager():
         except OSError as e:
             return internal_server_error("{0} {1}".format(
                 gettext('There was an error deleting the file:'), e.strerror))
+        finally:
+            invalidate_listing(orig_path)
 
         return make_json_response(status=200)
 
@@ -903,6 +1021,7 @@ class Filemanager():
                     if not data:
                         break
                     f.write(data)
+            invalidate_listing(new_name)
         except OSError as e:
             return internal_server_error("{0} {1}".format(
                 gettext('There was an error adding the file:'), e.strerror))
@@ -1056,6 +1175,7 @@ class Filemanager():
             os.mkdir(create_path)
         except OSError as e:
             return internal_server_error(str(e.strerror))
+        invalidate_listing(create_path)
 
         result = {
             'Parent': path,
@@ -32,7 +32,6 @@ import Loader from 'sources/components/Loader';
 import url_for from 'sources/url_for';
 import Uploader from './Uploader';
 import GridView from './GridView';
-import convert from 'convert-units';
 import PropTypes from 'prop-types';
 import { downloadBlob } from '../../../../../static/js/utils';
 import ErrorBoundary from '../../../../../static/js/helpers/ErrorBoundary';
@@ -102,47 +101,8 @@ const useStyles = makeStyles((theme)=>({
   }
 }));
 
-export function getComparator(sortColumn) {
-  const key = sortColumn?.columnKey;
-  const dir = sortColumn?.direction == 'ASC' ? 1 : -1;
-  switch (key) {
-  case 'Filename':
-    return (a, b) => {
-      return dir*(a['Filename'].localeCompare(b['Filename']));
-    };
-  case 'Properties.DateModified':
-    return (a, b) => {
-      try {
-        let a1 = new Date(a['Properties']['Date Modified']);
-        let b1 = new Date(b['Properties']['Date Modified']);
-        if(a1 > b1) return dir*1;
-        return dir*(a1 < b1 ? -1 : 0);
-      } catch {
-        return 0;
-      }
-    };
-  case 'Properties.Size':
-    return (a, b) => {
-      const parseAndConvert = (columnVal)=>{
-        if(columnVal.file_type != 'dir' && columnVal.file_type != 'drive' && columnVal['Properties']['Size']) {
-          let [size, unit] = columnVal['Properties']['Size'].split(' ');
-          return convert(size).from(unit.toUpperCase()).to('B');
-        }
-        return -1;
-      };
-      try {
-        let a1 = parseAndConvert(a);
-        let b1 = parseAndConvert(b);
-        if(a1 > b1) return dir*1;
-        return dir*(a1 < b1 ? -1 : 0);
-      } catch {
-        return 0;
-      }
-    };
-  default:
-    return ()=>0;
-  }
-}
+/* Number of the files and folders fetched at a time */
+export const FILES_PAGE_SIZE = 1000;
 
 export class FileManagerUtils {
   constructor(api, params) {
@@ -212,7 +172,9 @@ export class FileManagerUtils {
     return filename.split('.').pop();
   }
 
-  async getFolder(path, sharedFolder=null) {
+  /* Returns a page of the files and folders of the path, and their total
+   * number, sorted and filtered by the server */
+  async getFolder(path, sharedFolder=null, {sortColumn, search, offset=0}={}) {
     const newPath = path || this.fileRoot;
     let res = await this.api.post(this.fileConnectorUrl, {
       'path': newPath,
@@ -220,6 +182,11 @@ export class FileManagerUtils {
       'file_type': this.config.options.last_selected_format || '*',
       'show_hidden': this.showHiddenFiles,
       'storage_folder': sharedFolder,
+      'sort_by': sortColumn?.columnKey,
+      'sort_desc': sortColumn?.direction == 'DESC',
+      'search': search || null,
+      'offset': offset,
+      'limit': FILES_PAGE_SIZE,
     });
     this.currPath = newPath;
     return res.data.data.result;
@@ -413,6 +380,7 @@ export default function FileManager({params, closeModal, onOK, onCancel, sharedS
   const {openMenuName, toggleMenu, onMenuClose} = usePgMenuGroup();
   const [loaderText, setLoaderText] = useState('Loading...');
   const [items, setItems] = useState([]);
+  const [total, setTotal] = useState(0);
   const [path, setPath] = useState('');
   const [errorMsg, setErrorMsg] = useState('');
   const [search, setSearch] = useState('');
@@ -433,21 +401,20 @@ export default function FileManager({params, closeModal, onOK, onCancel, sharedS
     type: null, idx: null
   });
 
-  const sortedItems = useMemo(()=>(
-    [...items].sort(getComparator(sortColumns[0]))
-  ), [items, sortColumns]);
-
-  const filteredItems = useMemo(()=>{
-    return sortedItems.filter((i)=>i.Filename?.toLowerCase().includes(search?.toLocaleLowerCase()));
-  }, [items, sortColumns, search]);
+  /* The items are sorted and filtered by the server */
+  const filteredItems = items;
+  const searchRef = useRef('');
+  const sortColumnsRef = useRef([]);
+  const fetchIdRef = useRef(0);
 
   const itemsText = useMemo(()=>{
-    let suffix = items.length == 1 ? 'item' : 'items';
-    if(items.length == filteredItems.length) {
-      return `${items.length} ${suffix}`;
+    let count = Math.max(total, items.length);
+    let suffix = count == 1 ? 'item' : 'items';
+    if(items.length == count) {
+      return `${count} ${suffix}`;
     }
-    return `${filteredItems.length} of ${items.length} ${suffix}`;
-  }, [items, filteredItems]);
+    return `${items.length} of ${count} ${suffix}`;
+  }, [items, total]);
 
   const changeDir = async(storage) => {
     setSelectedSS(storage);
@@ -461,8 +428,17 @@ export default function FileManager({params, closeModal, onOK, onCancel, sharedS
       if(fmUtilsObj.isWinDrive(dirPath)) {
         dirPath += fmUtilsObj.separator;
       }
-      let newItems = await fmUtilsObj.getFolder(dirPath || fmUtilsObj.currPath, changeStoragePath);
-      setItems(newItems);
+      const fetchId = ++fetchIdRef.current;
+      let newItems = await fmUtilsObj.getFolder(dirPath || fmUtilsObj.currPath, changeStoragePath, {
+        sortColumn: sortColumnsRef.current[0],
+        search: searchRef.current,
+      });
+      /* Ignore the listing if the folder was listed again since */
+      if(fetchId != fetchIdRef.current) {
+        return;
+      }
+      setItems(newItems.Files);
+      setTotal(newItems.Total);
       setPath(fmUtilsObj.currPath);
       setTimeout(()=>{fmUtilsObj.setLastVisitedDir(dirPath || fmUtilsObj.currPath, changeStoragePath);}, 100);
     } catch (error) {
@@ -472,6 +448,43 @@ export default function FileManager({params, closeModal, onOK, onCancel, sharedS
     setLoaderText('');
   };
 
+  const loadMore = async ()=>{
+    setErrorMsg('');
+    setLoaderText('Loading...');
+    try {
+      const fetchId = fetchIdRef.current;
+      let newItems = await fmUtilsObj.getFolder(fmUtilsObj.currPath, selectedSS, {
+        sortColumn: sortColumnsRef.current[0],
+        search: searchRef.current,
+        offset: items.length,
+      });
+      if(fetchId == fetchIdRef.current) {
+        setItems((prev)=>[...prev, ...newItems.Files]);
+        setTotal(newItems.Total);
+      }
+    } catch (error) {
+      console.error(error);
+      setErrorMsg(parseApiError(error));
+    }
+    setLoaderText('');
+  };
+
+  /* Search the folder once the user stops typing */
+  const searchDir = useMemo(()=>_.debounce(()=>openDir(fmUtilsObj.currPath, fmUtilsObj.storage_folder), 500), []);
+  useEffect(()=>()=>searchDir.cancel(), []);
+
+  const onSearchChange = (value)=>{
+    setSearch(value);
+    searchRef.current = value;
+    searchDir();
+  };
+
+  const onSortColumnsChange = (columns)=>{
+    setSortColumns(columns);
+    sortColumnsRef.current = columns;
+    openDir(fmUtilsObj.currPath, selectedSS);
+  };
+
   const completeOperation = async (oldRow, newRow, rowIdx, selectedSS, func)=>{
     setOperation({});
     if(oldRow?.Filename == newRow.Filename) {
@@ -569,6 +582,7 @@ export default function FileManager({params, closeModal, onOK, onCancel, sharedS
           ...prev.slice(0, selectedRowIdx.current),
           ...prev.slice(selectedRowIdx.current+1),
         ]);
+        setTotal((prev)=>prev-1);
       } catch (error) {
         setErrorMsg(parseApiError(error));
         console.error(error);
@@ -724,7 +738,7 @@ export default function FileManager({params, closeModal, onOK, onCancel, sharedS
                 await openDir(path, selectedSS);
               }} icon={<SyncRoundedIcon />} disabled={showUploader} />
             </PgButtonGroup>
-            <InputText type="search" className={classes.inputSearch} data-label="search" placeholder={gettext('Search')} value={search} onChange={setSearch} />
+            <InputText type="search" className={classes.inputSearch} data-label="search" placeholder={gettext('Search')} value={search} onChange={onSearchChange} />
             <PgButtonGroup size="small" style={{marginLeft: '4px'}}>
               {params.dialog_type == 'storage_dialog' &&
               <PgIconButton title={gettext('Download')} icon={<GetAppRoundedIcon />}
@@ -804,10 +818,14 @@ export default function FileManager({params, closeModal, onOK, onCancel, sharedS
                 }}/>}
             {viewMode == 'list' &&
             <ListView key={fmUtilsObj.currPath} items={filteredItems} operation={operation} onItemEnter={onItemEnter}
-              onItemSelect={onItemSelect} onItemClick={onItemClick} sortColumns={sortColumns} onSortColumnsChange={setSortColumns}/>}
+              onItemSelect={onItemSelect} onItemClick={onItemClick} sortColumns={sortColumns} onSortColumnsChange={onSortColumnsChange}/>}
             {viewMode == 'grid' &&
             <GridView key={fmUtilsObj.currPath} items={filteredItems} operation={operation} onItemEnter={onItemEnter}
               onItemSelect={onItemSelect} />}
+            {items.length < total &&
+            <Box textAlign="center" p={0.5}>
+              <DefaultButton size="small" onClick={loadMore} disabled={showUploader}>{gettext('Load more')}</DefaultButton>
+            </Box>}
             <FormFooterMessage type={MESSAGE_TYPE.ERROR} message={_.escape(errorMsg)} closable onClose={()=>setErrorMsg('')}  />
             {params.dialog_type == 'create_file' &&
             <Box className={clsx(modalClasses.footer, classes.footerSaveAs)}>
@@ -0,0 +1,83 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2024, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import os
+import shutil
+import tempfile
+
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.misc.file_manager import Filemanager, scan_dir, \
+    invalidate_listing
+
+
+class FileListingTestCase(BaseTestGenerator):
+    """
+    Check that the files of a directory are listed sorted, filtered and
+    paginated, and that the cached listing is refreshed after changes.
+    """
+
+    scenarios = [
+        ('List by name', dict(
+            kwargs=dict(),
+            expected=['B.backup', 'a.sql', 'c.sql', 'dir'],
+            expected_total=4)),
+        ('List hidden files', dict(
+            kwargs=dict(show_hidden_files=True),
+            expected=['.hidden', 'B.backup', 'a.sql', 'c.sql', 'dir'],
+            expected_total=5)),
+        ('Sort by size, descending', dict(
+            kwargs=dict(sort_by='Properties.Size', sort_desc=True),
+            expected=['c.sql', 'B.backup', 'a.sql', 'dir'],
+            expected_total=4)),
+        ('Filter by name and type', dict(
+            kwargs=dict(search='.SQL', file_type='sql'),
+            expected=['a.sql', 'c.sql'],
+            expected_total=2)),
+        ('Page', dict(
+            kwargs=dict(sort_by='Filename', offset=1, limit=2),
+            expected=['B.backup', 'c.sql'],
+            expected_total=4)),
+        ('Cached listing', dict(
+            kwargs=dict(),
+            expected=['B.backup', 'a.sql', 'c.sql', 'dir', 'new.sql'],
+            expected_total=5,
+            add_file=True)),
+    ]
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        for name, size in (('a.sql', 1), ('B.backup', 2), ('c.sql', 3),
+                           ('.hidden', 0)):
+            with open(os.path.join(self.dir, name), 'wb') as f:
+                f.write(b'x' * size)
+        os.mkdir(os.path.join(self.dir, 'dir'))
+
+    def tearDown(self):
+        invalidate_listing(os.path.join(self.dir, 'any'))
+        shutil.rmtree(self.dir)
+
+    def runTest(self):
+        if getattr(self, 'add_file', False):
+            entries = scan_dir(self.dir)
+            self.assertIs(scan_dir(self.dir), entries)
+
+            new_file = os.path.join(self.dir, 'new.sql')
+            open(new_file, 'wb').close()
+            invalidate_listing(new_file)
+            self.assertIsNot(scan_dir(self.dir), entries)
+
+        kwargs = dict(show_hidden_files=False, files_only='',
+                      folders_only='', supported_types=[], file_type='*',
+                      user_dir='/', orig_path=self.dir)
+        kwargs.update(self.kwargs)
+        files, total = Filemanager.get_files_in_path(**kwargs)
+
+        self.assertEqual([f['Filename'] for f in files], self.expected)
+        self.assertEqual(total, self.expected_total)
+        self.assertEqual(files[0]['Path'], '/' + self.expected[0])
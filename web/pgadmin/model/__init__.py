@@ -33,7 +33,7 @@ import config
 #
 ##########################################################################
 
-SCHEMA_VERSION = 39
+SCHEMA_VERSION = 41
 
 ##########################################################################
 #
@@ -308,6 +308,11 @@ class Process(db.Model):
         db.ForeignKey('server.id'),
         nullable=True
     )
+    queued_time = db.Column(db.String(), nullable=True)
+    priority = db.Column(db.Integer, nullable=False, default=0)
+    # The server the process is run against (server_id is the one of the
+    # cloud deployments)
+    target_server_id = db.Column(db.Integer, nullable=True)
 
 
 class Keys(db.Model):
@@ -330,6 +335,15 @@ class QueryHistoryModel(db.Model):
     dbname = db.Column(db.String(), nullable=False, primary_key=True)
     query_info = db.Column(PgAdminDbBinaryString(), nullable=False)
     last_updated_flag = db.Column(db.String(), nullable=False)
+    # Extracted from query_info
+    start_time = db.Column(db.String(), nullable=True)
+    total_time = db.Column(db.String(), nullable=True)
+    status = db.Column(db.Boolean(), nullable=True)
+    query_text = db.Column(db.String(), nullable=True)
+    __table_args__ = (
+        db.Index('ix_query_history_start_time',
+                 'uid', 'sid', 'dbname', 'start_time'),
+    )
 
 
 class Database(db.Model):
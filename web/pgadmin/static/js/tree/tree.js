@@ -81,6 +81,7 @@ export class Tree {
     this.tree.type = type || 'browser';
     this.tree.onTreeEvents(manageTreeEvents);
 
+    this.manageTree = manageTree;
     this.rootNode = manageTree.tempTree;
     this.Nodes = pgBrowser ? pgBrowser.Nodes : pgAdmin.Browser.Nodes;
 
@@ -92,6 +93,7 @@ export class Tree {
     if(item.children?.length == 0) {
       item._children = null;
     }
+    this.manageTree.markRefresh?.(item.path);
     await this.tree.refresh(item);
   }
 
@@ -22,8 +22,15 @@ export class ManageTreeNodes {
   constructor() {
     this.tree = {};
     this.tempTree = new TreeNode(undefined, {});
+    // Paths of the nodes being refreshed, the children of which must not be
+    // served from the server side cache.
+    this.refreshPaths = new Set();
   }
 
+  public markRefresh = (_path: string) => {
+    this.refreshPaths.add(_path);
+  };
+
   public init = (_root: string) => new Promise((res) => {
     const node = {parent: null, children: [], data: null};
     this.tree = {};
@@ -120,8 +127,12 @@ export class ManageTreeNodes {
 
     let treeData = [];
     if (url) {
+      const headers = {};
+      if (this.refreshPaths.delete(_path)) {
+        headers['X-pgAdmin-Refresh'] = '1';
+      }
       try {
-        const res = await api.get(url);
+        const res = await api.get(url, {headers: headers});
         treeData = res.data.data;
       } catch (error) {
         /* react-aspen does not handle reject case */
@@ -20,6 +20,7 @@ from pgadmin.utils import PgAdminModule, \
 from pgadmin.utils.ajax import make_json_response, bad_request, \
     internal_server_error
 from pgadmin.model import Server
+import config
 from config import PG_DEFAULT_DRIVER
 from pgadmin.utils.driver import get_driver
 from pgadmin.browser.utils import underscore_unescape
@@ -661,6 +662,29 @@ def connect():
                   to=request.sid)
 
 
+def _emit_tables_by_schema(helper, scid):
+    """
+    Send the tables of the database as soon as the tables of each schema are
+    fetched, in chunks of ERD_TABLES_CHUNK_SIZE tables along with the
+    progress, instead of building the list of all the tables first.
+    """
+    chunk_size = max(config.ERD_TABLES_CHUNK_SIZE, 1)
+    done = 0
+    for status, tables, total in helper.get_tables_by_schema(scid):
+        if not status:
+            return status, tables
+
+        done += 1
+        # An empty chunk still reports the progress
+        for start in range(0, max(len(tables), 1), chunk_size):
+            socketio.emit('tables_chunk', {
+                'tables': tables[start:start + chunk_size],
+                'progress': {'done': done, 'total': total}
+            }, namespace=SOCKETIO_NAMESPACE, to=request.sid)
+
+    return True, []
+
+
 @socketio.on('tables', namespace=SOCKETIO_NAMESPACE)
 @socket_login_required
 def tables(params):
@@ -668,8 +692,12 @@ def tables(params):
         helper = ERDHelper(params['trans_id'], params['sid'], params['did'])
         _get_connection(params['sid'], params['did'], params['trans_id'])
 
-        status, tables = helper.get_all_tables(params.get('scid', None),
-                                               params.get('tid', None))
+        if params.get('tid', None) is None:
+            status, tables = _emit_tables_by_schema(
+                helper, params.get('scid', None))
+        else:
+            status, tables = helper.get_all_tables(params.get('scid', None),
+                                                   params.get('tid', None))
 
         if not status:
             tables = tables.json if isinstance(tables, Response) else tables
@@ -602,45 +602,68 @@ export default class ERDCore {
   }
 
   deserializeData(data){
-    let oidUidMap = {};
+    this.deserializeDataChunk(data);
+    this.deserializeDataEnd();
+  }
+
+  /* The tables may be received in chunks, the foreign keys are linked as
+   * soon as both their tables are added.
+   */
+  deserializeDataChunk(data){
+    this.deserializeState = this.deserializeState ?? {oidUidMap: {}, pendingFks: []};
+    let {oidUidMap, pendingFks} = this.deserializeState;
+    let newUids = [];
 
     /* Add the nodes */
     data.forEach((nodeData)=>{
       let newNode = this.addNode(TableSchema.getErdSupportedData(nodeData));
       oidUidMap[nodeData.oid] = newNode.getID();
+      newUids.push(newNode.getID());
     });
 
-    /* Lets use the oidUidMap for creating the links */
     let tableNodesDict = this.getModel().getNodesDict();
-    _.forIn(tableNodesDict, (node, uid)=>{
-      let nodeData = node.getData();
-      if(nodeData.foreign_key) {
-        nodeData.foreign_key = nodeData.foreign_key.filter((theFk)=>{
-          delete theFk.oid;
-          theFk = theFk.columns[0];
-          theFk.references = oidUidMap[theFk.references];
-          let newData = {
-            local_table_uid: uid,
-            local_column_attnum: undefined,
-            referenced_table_uid: theFk.references,
-            referenced_column_attnum: undefined,
-          };
-          let sourceNode = tableNodesDict[newData.referenced_table_uid];
-          let targetNode = tableNodesDict[newData.local_table_uid];
-          // When generating for schema, there may be a reference to another schema table
-          // We'll remove the FK completely in such cases.
-          if(!sourceNode || !targetNode) {
-            return false;
-          }
-
-          newData.local_column_attnum = _.find(targetNode.getColumns(), (col)=>col.name==theFk.local_column).attnum;
-          newData.referenced_column_attnum = _.find(sourceNode.getColumns(), (col)=>col.name==theFk.referenced).attnum;
+    newUids.forEach((uid)=>{
+      tableNodesDict[uid]?.getData().foreign_key?.forEach((theFk)=>{
+        delete theFk.oid;
+        pendingFks.push({uid: uid, fk: theFk});
+      });
+    });
 
-          this.addLink(newData, 'onetomany');
-          return true;
-        });
+    /* Lets use the oidUidMap for creating the links */
+    this.deserializeState.pendingFks = pendingFks.filter(({uid, fk})=>{
+      let theFk = fk.columns[0];
+      let referencedUid = oidUidMap[theFk.references];
+      /* The referenced table is not received yet */
+      if(!referencedUid) {
+        return true;
       }
+      theFk.references = referencedUid;
+      let newData = {
+        local_table_uid: uid,
+        local_column_attnum: undefined,
+        referenced_table_uid: theFk.references,
+        referenced_column_attnum: undefined,
+      };
+      let sourceNode = tableNodesDict[newData.referenced_table_uid];
+      let targetNode = tableNodesDict[newData.local_table_uid];
+
+      newData.local_column_attnum = _.find(targetNode.getColumns(), (col)=>col.name==theFk.local_column).attnum;
+      newData.referenced_column_attnum = _.find(sourceNode.getColumns(), (col)=>col.name==theFk.referenced).attnum;
+
+      this.addLink(newData, 'onetomany');
+      return false;
+    });
+  }
+
+  deserializeDataEnd(){
+    let tableNodesDict = this.getModel().getNodesDict();
+    // When generating for schema, there may be a reference to another schema table
+    // We'll remove the FK completely in such cases.
+    (this.deserializeState?.pendingFks ?? []).forEach(({uid, fk})=>{
+      let nodeData = tableNodesDict[uid].getData();
+      nodeData.foreign_key = nodeData.foreign_key.filter((theFk)=>theFk!==fk);
     });
+    this.deserializeState = null;
 
     setTimeout(this.dagreDistributeNodes.bind(this), 250);
   }
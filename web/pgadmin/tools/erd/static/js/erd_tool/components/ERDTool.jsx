@@ -897,6 +897,12 @@ class ERDTool extends React.Component {
     let socket;
     try {
       socket = await openSocket('/erd');
+      /* The tables of a database are received schema by schema */
+      socket.on('tables_chunk', (chunk)=>{
+        this.diagram.deserializeDataChunk(chunk.tables);
+        this.setLoading(gettext('Fetching schema data (%s of %s schemas)...',
+          chunk.progress.done, chunk.progress.total));
+      });
       resData = await socketApiGet(socket, 'tables', {
         trans_id: parseInt(this.props.params.trans_id),
         sgid: parseInt(this.props.params.sgid),
@@ -81,10 +81,19 @@ class ERDTables(BaseSocketTestGenerator):
         self.socket_client.emit('tables', data,
                                 namespace=self.SOCKET_NAMESPACE)
         received = self.socket_client.get_received(self.SOCKET_NAMESPACE)
-        response_data = received[0]['args'][0]
-        self.assertEqual(received[0]['name'], "tables_success", response_data)
+        response_data = received[-1]['args'][0]
+        self.assertEqual(received[-1]['name'], "tables_success",
+                         response_data)
+
+        # The tables are received schema by schema
+        tables = []
+        for message in received[:-1]:
+            self.assertEqual(message['name'], "tables_chunk")
+            tables.extend(message['args'][0]['tables'])
+        tables.extend(response_data)
+
         self.assertEqual(self.tables, [[tab['schema'], tab['name']]
-                                       for tab in response_data])
+                                       for tab in tables])
 
     def tearDown(self):
         super().tearDown()
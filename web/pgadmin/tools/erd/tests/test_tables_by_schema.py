@@ -0,0 +1,73 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2024, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+from types import SimpleNamespace
+from unittest.mock import patch, MagicMock
+
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.tools import erd
+
+SCHEMAS = [
+    [{'oid': 1, 'name': 'a'}, {'oid': 2, 'name': 'b'},
+     {'oid': 3, 'name': 'c'}],
+    [],
+    [{'oid': 4, 'name': 'd'}],
+]
+
+
+class ERDTablesBySchemaTestCase(BaseTestGenerator):
+    """
+    Check that the tables are sent schema by schema, in chunks of the
+    configured size along with the progress.
+    """
+
+    scenarios = [
+        ('Chunks smaller than the schemas', dict(
+            chunk_size=2, failure=None,
+            expected=[(['a', 'b'], 1), (['c'], 1), ([], 2), (['d'], 3)])),
+        ('Chunks larger than the schemas', dict(
+            chunk_size=100, failure=None,
+            expected=[(['a', 'b', 'c'], 1), ([], 2), (['d'], 3)])),
+        ('Failure while fetching a schema', dict(
+            chunk_size=100, failure=2,
+            expected=[(['a', 'b', 'c'], 1)])),
+    ]
+
+    def get_tables_by_schema(self, scid):
+        for idx, tables in enumerate(SCHEMAS, 1):
+            if idx == self.failure:
+                yield False, 'failed', len(SCHEMAS)
+                return
+            yield True, tables, len(SCHEMAS)
+
+    def runTest(self):
+        helper = SimpleNamespace(
+            get_tables_by_schema=self.get_tables_by_schema)
+        socketio = MagicMock()
+
+        with patch.object(erd, 'socketio', socketio), \
+                patch.object(erd, 'request', SimpleNamespace(sid='sid')), \
+                patch.object(erd, 'config', SimpleNamespace(
+                    ERD_TABLES_CHUNK_SIZE=self.chunk_size)):
+            status, res = erd._emit_tables_by_schema(helper, None)
+
+        if self.failure:
+            self.assertEqual((status, res), (False, 'failed'))
+        else:
+            self.assertEqual((status, res), (True, []))
+
+        chunks = []
+        for call in socketio.emit.call_args_list:
+            self.assertEqual(call.args[0], 'tables_chunk')
+            self.assertEqual(call.kwargs['to'], 'sid')
+            data = call.args[1]
+            self.assertEqual(data['progress']['total'], len(SCHEMAS))
+            chunks.append(([tab['name'] for tab in data['tables']],
+                           data['progress']['done']))
+        self.assertEqual(chunks, self.expected)
@@ -32,24 +32,40 @@ class ERDTableView(BaseTableView, DataTypeReader):
         return DataTypeReader.get_types(self, self.conn, condition, True)
 
     @BaseTableView.check_precondition
-    def fetch_all_tables(self, did=None, sid=None, scid=None):
-        all_tables = []
+    def fetch_tables_by_schema(self, did=None, sid=None, scid=None):
+        """
+        Generates the status, the tables and the number of the schemas, for
+        each schema of the database (or the given schema only), so that the
+        tables of one schema only are held at a time.
+        """
         schemas = {'rows': []}
         if scid is None:
             status, schemas = get_schemas(self.conn, show_system_objects=False)
             if not status:
-                return status, schemas
+                yield status, schemas, 0
+                return
         else:
             schemas['rows'].append({'oid': scid})
 
+        total = len(schemas['rows'])
         for row in schemas['rows']:
             status, res = \
                 BaseTableView.fetch_tables(self, sid, did, row['oid'],
                                            with_serial_cols=True)
+            if not status:
+                yield status, res, total
+                return
+
+            yield True, list(res.values()), total
+
+    def fetch_all_tables(self, did=None, sid=None, scid=None):
+        all_tables = []
+        for status, res, _ in self.fetch_tables_by_schema(
+                did=did, sid=sid, scid=scid):
             if not status:
                 return status, res
 
-            all_tables.extend(res.values())
+            all_tables.extend(res)
 
         return True, all_tables
 
@@ -111,6 +127,10 @@ class ERDHelper:
             data=data, with_drop=with_drop)
         return SQL
 
+    def get_tables_by_schema(self, scid):
+        return self.table_view.fetch_tables_by_schema(
+            did=self.did, sid=self.sid, scid=scid)
+
     def get_all_tables(self, scid, tid):
         if tid is None and scid is None:
             status, res = self.table_view.fetch_all_tables(
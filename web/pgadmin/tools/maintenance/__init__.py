@@ -15,7 +15,8 @@ from flask import url_for, Response, render_template, request, current_app
 from flask_babel import gettext as _
 from flask_security import current_user
 from pgadmin.user_login_check import pga_login_required
-from pgadmin.misc.bgprocess.processes import BatchProcess, IProcessDesc
+from pgadmin.misc.bgprocess.processes import BatchProcess, IProcessDesc, \
+    PROCESS_PRIORITY_LOW
 from pgadmin.utils import PgAdminModule, html, does_utility_exist, get_server
 from pgadmin.utils.ajax import bad_request, make_json_response
 from pgadmin.utils.driver import get_driver
@@ -230,7 +231,10 @@ def create_maintenance_job(sid, did):
     try:
         p = BatchProcess(
             desc=Message(server.id, data, query),
-            cmd=utility, args=args, manager_obj=manager
+            cmd=utility, args=args, manager_obj=manager,
+            # The maintenance operations can wait for the backup, restore,
+            # etc. jobs, once the concurrency limits are reached.
+            priority=PROCESS_PRIORITY_LOW
         )
         p.set_env_variables(server)
         p.start()
@@ -11,6 +11,7 @@ import os
 import json
 
 from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.misc.bgprocess.processes import PROCESS_PRIORITY_LOW
 from regression import parent_node_dict
 from pgadmin.utils import server_utils, does_utility_exist
 from pgadmin.browser.server_groups.servers.databases.tests import utils as \
@@ -853,6 +854,9 @@ class MaintenanceCreateJobTest(BaseTestGenerator):
 
         self.assertTrue(message_mock.called)
         self.assertTrue(batch_process_mock.called)
+        self.assertEqual(
+            batch_process_mock.call_args_list[0][1]['priority'],
+            PROCESS_PRIORITY_LOW)
 
         if self.expected_cmd_opts:
             for opt in self.expected_cmd_opts:
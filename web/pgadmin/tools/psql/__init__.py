@@ -28,6 +28,7 @@ from pgadmin.utils.driver import get_driver
 from ... import socketio as sio
 from pgadmin.utils import get_complete_file_path
 from pgadmin.authenticate import socket_login_required
+from .reactor import PtyReactor
 
 
 if _platform == 'win32':
@@ -47,6 +48,17 @@ pdata = dict()
 cdata = dict()
 
 
+def emit_terminal_output(sid, output, callback):
+    sio.emit('pty-output',
+             {'result': output,
+              'error': False},
+             namespace='/pty', to=sid, callback=callback)
+
+
+# Forwards the output of all the terminals (not on Windows)
+pty_reactor = PtyReactor(emit_terminal_output, sio.start_background_task)
+
+
 class PSQLModule(PgAdminModule):
     """
     class PSQLModule(PgAdminModule)
@@ -202,25 +214,6 @@ def create_pty_terminal(connection_data):
     return p, parent, fd
 
 
-def read_terminal_data(parent, data_ready, max_read_bytes, sid):
-    """
-    Read the terminal output.
-    :param parent:
-    :param data_ready:
-    :param max_read_bytes:
-    :param sid:
-    :return:
-    """
-    if parent in data_ready:
-        # Read the output from parent fd (terminal).
-        output = os.read(parent, max_read_bytes)
-
-        sio.emit('pty-output',
-                 {'result': output.decode(),
-                  'error': False},
-                 namespace='/pty', room=sid)
-
-
 def read_stdout(process, sid, max_read_bytes, win_emit_output=True):
     (data_ready, _, _) = select.select([process.fd], [], [], 0)
     if process.fd in data_ready:
@@ -249,33 +242,15 @@ def windows_platform(connection_data, sid, max_read_bytes):
                     win_emit_output=True)
 
 
-def non_windows_platform(parent, p, fd, data, max_read_bytes, sid):
-    while p and p.poll() is None:
-        if request.sid in app.config['sessions']:
-            # This code is added to make this unit testable.
-            if "is_test" not in data:
-                sio.sleep(0.01)
-            else:
-                data['count'] += 1
-                if data['count'] == 5:
-                    break
-
-            timeout = 0
-            # module provides access to platform-specific I/O
-            # monitoring functions
-            (data_ready, _, _) = select.select([parent, fd], [], [],
-                                               timeout)
-
-            read_terminal_data(parent, data_ready, max_read_bytes, sid)
-
-
 def pty_handel_io(connection_data, data, sid):
     max_read_bytes = 1024 * 20
     if _platform == 'win32':
         windows_platform(connection_data, sid, max_read_bytes)
     else:
-        p, parent, fd = create_pty_terminal(connection_data)
-        non_windows_platform(parent, p, fd, data, max_read_bytes, sid)
+        p, parent, _ = create_pty_terminal(connection_data)
+        if p is not None:
+            # The output of the terminal is forwarded by the reactor
+            pty_reactor.register(sid, parent, p)
 
 
 @sio.on('start_process', namespace='/pty')
@@ -559,6 +534,7 @@ def disconnect_socket():
     else:
         os.write(app.config['sessions'][request.sid], r'\q\n'.encode())
         sio.sleep(1)
+        pty_reactor.unregister(request.sid)
         os.close(app.config['sessions'][request.sid])
         os.close(cdata[request.sid])
         del app.config['sessions'][request.sid]
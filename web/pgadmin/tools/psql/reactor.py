@@ -0,0 +1,249 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2024, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""
+Forwards the output of all the psql terminals of the pgAdmin process to
+their clients from a single thread, waiting for the terminals to be
+readable instead of polling each of them.
+
+The output of a terminal read within COALESCE_DELAY seconds is sent in a
+single message of up to MAX_FRAME_SIZE characters. The client acknowledges
+every message once written to its terminal; when MAX_PENDING_FRAMES
+messages are not acknowledged, the output of the terminal is not read
+anymore until the client catches up, psql then blocks on writing to it.
+"""
+
+import codecs
+import os
+import select
+import selectors
+import threading
+import time
+
+COALESCE_DELAY = 0.01
+MAX_FRAME_SIZE = 64 * 1024
+MAX_PENDING_FRAMES = 4
+# Interval (in seconds) at which the terminated psql processes are looked
+# for.
+PROCESS_CHECK_INTERVAL = 1.0
+
+
+class _Session:
+    __slots__ = ('sid', 'fd', 'process', 'decoder', 'output', 'deadline',
+                 'pending', 'reading')
+
+    def __init__(self, sid, fd, process):
+        self.sid = sid
+        self.fd = fd
+        self.process = process
+        self.decoder = codecs.getincrementaldecoder('utf-8')('replace')
+        self.output = ''
+        # Time by which the output must be sent
+        self.deadline = None
+        # Messages sent and not acknowledged yet
+        self.pending = 0
+        self.reading = False
+
+
+class PtyReactor:
+    """
+    class PtyReactor
+
+        Reads the output of the psql terminals and sends it to their clients.
+
+    Methods:
+    -------
+    * register(sid, fd, process)
+      - Forwards the output of the terminal (parent fd) of the psql process
+        to the client of the given socket id.
+
+    * unregister(sid)
+      - Stops forwarding the output of the terminal of the client, which
+        can be closed afterwards.
+    """
+
+    def __init__(self, emit, start_background_task):
+        """
+        Args:
+            emit: function(sid, output, callback) sending the output to the
+                client, which calls callback on acknowledgement.
+            start_background_task: function starting the thread reading the
+                terminals.
+        """
+        self._emit = emit
+        self._start_background_task = start_background_task
+        self._lock = threading.Lock()
+        self._commands = []
+        self._sessions = dict()
+        self._selector = None
+        self._wakeup_fds = None
+
+    def register(self, sid, fd, process):
+        self._command('register', _Session(sid, fd, process))
+
+    def unregister(self, sid, timeout=1.0):
+        done = threading.Event()
+        self._command('unregister', (sid, done))
+        done.wait(timeout)
+
+    def _command(self, name, arg):
+        with self._lock:
+            if self._selector is None:
+                self._selector = selectors.DefaultSelector()
+                self._wakeup_fds = os.pipe()
+                os.set_blocking(self._wakeup_fds[0], False)
+                self._selector.register(self._wakeup_fds[0],
+                                        selectors.EVENT_READ)
+                self._start_background_task(self._run)
+            self._commands.append((name, arg))
+        self._wakeup()
+
+    def _wakeup(self):
+        try:
+            os.write(self._wakeup_fds[1], b'\0')
+        except OSError:
+            pass
+
+    def _acknowledged(self, session):
+        with self._lock:
+            session.pending -= 1
+            self._commands.append(('resume', session))
+        self._wakeup()
+
+    def _run(self):
+        next_check = time.monotonic() + PROCESS_CHECK_INTERVAL
+        while True:
+            timeout = min([s.deadline for s in self._sessions.values()
+                           if s.deadline is not None] + [next_check])
+            timeout = max(timeout - time.monotonic(), 0)
+
+            for key, _ in self._selector.select(timeout):
+                if key.data is None:
+                    try:
+                        os.read(key.fd, 4096)
+                    except OSError:
+                        pass
+                elif key.data.reading:
+                    self._read(key.data)
+
+            self._apply_commands()
+
+            now = time.monotonic()
+            for session in list(self._sessions.values()):
+                if session.deadline is not None and session.deadline <= now:
+                    self._flush(session)
+
+            if now >= next_check:
+                self._remove_terminated()
+                next_check = now + PROCESS_CHECK_INTERVAL
+
+    def _apply_commands(self):
+        with self._lock:
+            commands, self._commands = self._commands, []
+
+        for name, arg in commands:
+            if name == 'register':
+                self._remove(arg.sid)
+                self._sessions[arg.sid] = arg
+                self._resume(arg)
+            elif name == 'unregister':
+                sid, done = arg
+                self._remove(sid)
+                done.set()
+            elif self._sessions.get(arg.sid) is arg:
+                self._resume(arg)
+                if arg.output and arg.deadline is None:
+                    # Send the output left while paused.
+                    arg.deadline = time.monotonic()
+
+    def _read(self, session):
+        try:
+            data = os.read(session.fd, MAX_FRAME_SIZE)
+        except OSError:
+            data = b''
+
+        if not data:
+            # The terminal is closed
+            self._flush(session, force=True)
+            self._remove(session.sid)
+            return
+
+        session.output += session.decoder.decode(data)
+        if session.deadline is None:
+            session.deadline = time.monotonic() + COALESCE_DELAY
+        if len(session.output) >= MAX_FRAME_SIZE:
+            self._flush(session)
+
+    def _flush(self, session, force=False):
+        with self._lock:
+            if not session.output:
+                return
+            if session.pending >= MAX_PENDING_FRAMES and not force:
+                # Wait for the client to catch up, the output left is sent
+                # on resume.
+                session.deadline = None
+                return
+            session.pending += 1
+            paused = session.pending >= MAX_PENDING_FRAMES
+
+        output = session.output[:MAX_FRAME_SIZE]
+        session.output = session.output[MAX_FRAME_SIZE:]
+        session.deadline = time.monotonic() + COALESCE_DELAY \
+            if session.output else None
+
+        # The client does not keep up, stop reading its terminal.
+        if paused and session.reading:
+            self._selector.unregister(session.fd)
+            session.reading = False
+
+        try:
+            self._emit(session.sid, output,
+                       lambda *args: self._acknowledged(session))
+        except Exception:
+            self._remove(session.sid)
+
+    def _resume(self, session):
+        with self._lock:
+            if session.reading or session.pending >= MAX_PENDING_FRAMES:
+                return
+        try:
+            self._selector.register(session.fd, selectors.EVENT_READ,
+                                    session)
+            session.reading = True
+        except (ValueError, OSError):
+            # The terminal is closed
+            self._sessions.pop(session.sid, None)
+
+    def _remove(self, sid):
+        session = self._sessions.pop(sid, None)
+        if session is not None and session.reading:
+            session.reading = False
+            try:
+                self._selector.unregister(session.fd)
+            except (KeyError, ValueError, OSError):
+                pass
+
+    def _remove_terminated(self):
+        for session in list(self._sessions.values()):
+            if session.process is None or session.process.poll() is None or \
+                    not session.reading:
+                continue
+
+            # Send the output left in the terminal
+            try:
+                while select.select([session.fd], [], [], 0)[0]:
+                    data = os.read(session.fd, MAX_FRAME_SIZE)
+                    if not data:
+                        break
+                    session.output += session.decoder.decode(data)
+            except OSError:
+                pass
+            while session.output:
+                self._flush(session, force=True)
+            self._remove(session.sid)
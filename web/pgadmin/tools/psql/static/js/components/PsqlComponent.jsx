@@ -24,11 +24,13 @@ import gettext from 'sources/gettext';
 function psql_socket_io(socket, is_enable, sid, db, server_type, fitAddon, term, role){
   // Listen all the socket events emit from server.
   let init_psql = true;
-  socket.on('pty-output', function(data){
+  socket.on('pty-output', function(data, ack){
     if(data.error) {
       term.write('\r\n');
     }
-    term.write(data.result);
+    // Acknowledge the output once written, the server stops reading the
+    // terminal when too much output is not acknowledged.
+    term.write(data.result, ()=>ack?.());
     if(data.error) {
       term.write('\r\n');
     }
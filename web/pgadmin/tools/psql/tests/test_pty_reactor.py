@@ -0,0 +1,154 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2024, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import os
+import sys
+import threading
+import time
+from unittest.mock import patch
+
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.tools.psql import reactor as reactor_module
+from pgadmin.tools.psql.reactor import PtyReactor
+
+
+class Process:
+    def __init__(self):
+        self.returncode = None
+
+    def poll(self):
+        return self.returncode
+
+
+class PtyReactorTestCase(BaseTestGenerator):
+    """
+    Check that the output of the terminals is coalesced, and is not read
+    anymore while the client does not acknowledge it.
+    """
+
+    scenarios = [
+        ('Output coalesced', dict(action='coalesce')),
+        ('Client falling behind', dict(action='backpressure')),
+        ('Client falling behind with output left', dict(action='paused')),
+        ('Process terminated', dict(action='terminate')),
+    ]
+
+    def emit(self, sid, output, callback):
+        with self.lock:
+            self.frames.append((sid, output, callback))
+
+    def wait_frames(self, count, timeout=2.0):
+        end = time.monotonic() + timeout
+        while time.monotonic() < end:
+            with self.lock:
+                if len(self.frames) >= count:
+                    return list(self.frames)
+            time.sleep(0.01)
+        with self.lock:
+            return list(self.frames)
+
+    def start_task(self, target):
+        threading.Thread(target=target, daemon=True).start()
+
+    def runTest(self):
+        if sys.platform == 'win32':
+            self.skipTest('PSQL terminals are not served by the reactor on '
+                          'windows')
+
+        self.lock = threading.Lock()
+        self.frames = []
+        reactor = PtyReactor(self.emit, self.start_task)
+        read_fd, write_fd = os.pipe()
+        other_read_fd, other_write_fd = os.pipe()
+        process = Process()
+
+        with patch.object(reactor_module, 'COALESCE_DELAY', 0.2), \
+                patch.object(reactor_module, 'MAX_FRAME_SIZE', 8), \
+                patch.object(reactor_module, 'MAX_PENDING_FRAMES', 2), \
+                patch.object(reactor_module, 'PROCESS_CHECK_INTERVAL', 0.1):
+            reactor.register('sid1', read_fd, process)
+            reactor.register('sid2', other_read_fd, None)
+
+            if self.action == 'coalesce':
+                for char in 'abc':
+                    os.write(write_fd, char.encode())
+                    time.sleep(0.02)
+                os.write(other_write_fd, 'é'.encode()[:1])
+                os.write(other_write_fd, 'é'.encode()[1:])
+                frames = self.wait_frames(2)
+                self.assertEqual(sorted((sid, output)
+                                        for sid, output, _ in frames),
+                                 [('sid1', 'abc'), ('sid2', 'é')])
+
+            elif self.action == 'backpressure':
+                os.write(write_fd, b'x' * 40)
+                frames = self.wait_frames(3, timeout=0.5)
+                # Two frames are sent, the remaining output is not read
+                self.assertEqual([output for _, output, _ in frames],
+                                 ['x' * 8] * 2)
+
+                frames[0][2]()
+                frames = self.wait_frames(3)
+                self.assertEqual(len(frames), 3)
+
+                for frame in frames[1:]:
+                    frame[2]()
+                frames = self.wait_frames(5)
+                self.assertEqual(''.join(output for _, output, _ in frames),
+                                 'x' * 40)
+
+            elif self.action == 'paused':
+                self._check_paused(reactor, write_fd)
+
+            else:
+                os.write(write_fd, b'bye')
+                process.returncode = 0
+                frames = self.wait_frames(1)
+                self.assertEqual(frames[0][:2], ('sid1', 'bye'))
+                time.sleep(0.3)
+                os.write(write_fd, b'more')
+                time.sleep(0.3)
+                self.assertEqual(len(self.wait_frames(2, timeout=0.1)), 1)
+
+            reactor.unregister('sid1')
+            reactor.unregister('sid2')
+
+        for fd in (read_fd, write_fd, other_read_fd, other_write_fd):
+            os.close(fd)
+
+    def _check_paused(self, reactor, write_fd):
+        selects = []
+        select = reactor._selector.select
+
+        def count_select(timeout=None):
+            selects.append(timeout)
+            return select(timeout)
+
+        reactor._selector.select = count_select
+
+        os.write(write_fd, b'x' * 8)
+        self.wait_frames(1)
+        os.write(write_fd, b'ab')
+        time.sleep(0.05)
+        # Sent with the output left, the client falls behind
+        os.write(write_fd, b'y' * 8)
+        frames = self.wait_frames(2)
+        self.assertEqual([output for _, output, _ in frames],
+                         ['x' * 8, 'abyyyyyy'])
+
+        # The reactor waits for the acknowledgement, instead of trying to
+        # send the output left in a loop.
+        del selects[:]
+        time.sleep(0.5)
+        self.assertLess(len(selects), 20)
+        self.assertEqual(len(self.wait_frames(3, timeout=0.1)), 2)
+
+        frames[0][2]()
+        frames = self.wait_frames(3)
+        self.assertEqual([output for _, output, _ in frames][2:], ['yy'])
@@ -133,6 +133,9 @@ class BatchProcessTest(BaseTestGenerator):
                 self.process_state = 0
                 self.utility_pid = 123
                 self.server_id = None
+                self.queued_time = None
+                self.priority = 0
+                self.target_server_id = None
 
         mock_result = process_mock.query.filter_by.return_value
         mock_result.first.return_value = TestMockProcess(
@@ -173,6 +176,9 @@ class BatchProcessTest(BaseTestGenerator):
                 self.process_state = 0
                 self.utility_pid = 123
                 self.server_id = None
+                self.queued_time = None
+                self.priority = 0
+                self.target_server_id = None
 
         process_mock.query.filter_by.return_value = [
             TestMockProcess(restore_obj,
@@ -24,6 +24,7 @@ from pgadmin.utils.ajax import make_json_response, bad_request, \
 from pgadmin.model import Server, SharedServer
 from pgadmin.tools.schema_diff.node_registry import SchemaDiffRegistry
 from pgadmin.tools.schema_diff.model import SchemaDiffModel
+from pgadmin.tools.schema_diff.parallel_compare import run_compare_tasks
 from config import PG_DEFAULT_DRIVER
 from pgadmin.utils.driver import get_driver
 from pgadmin.utils.constants import PREF_LABEL_DISPLAY, MIMETYPE_APP_JS,\
@@ -476,10 +477,16 @@ def compare_database(params):
                                     diff_model_obj)
 
     try:
-        ignore_owner = bool(params['ignore_owner'])
-        ignore_whitespaces = bool(params['ignore_whitespaces'])
-        ignore_tablespace = bool(params['ignore_tablespace'])
-        ignore_grants = bool(params['ignore_grants'])
+        compare_params = {
+            'source_sid': params['source_sid'],
+            'source_did': params['source_did'],
+            'target_sid': params['target_sid'],
+            'target_did': params['target_did'],
+            'ignore_owner': bool(params['ignore_owner']),
+            'ignore_whitespaces': bool(params['ignore_whitespaces']),
+            'ignore_tablespace': bool(params['ignore_tablespace']),
+            'ignore_grants': bool(params['ignore_grants'])
+        }
 
         # Fetch all the schemas of source and target database
         # Compare them and get the status.
@@ -487,104 +494,30 @@ def compare_database(params):
             fetch_compare_schemas(params['source_sid'], params['source_did'],
                                   params['target_sid'], params['target_did'])
 
-        total_schema = len(schema_result['source_only']) + len(
-            schema_result['target_only']) + len(
-            schema_result['in_both_database'])
-
-        node_percent = 0
-        if total_schema > 0:
-            node_percent = round(100 / (total_schema * len(
-                SchemaDiffRegistry.get_registered_nodes())), 2)
-        total_percent = 0
-
         # Compare Database objects
-        comparison_schema_result, total_percent = \
-            compare_database_objects(
-                trans_id=params['trans_id'], session_obj=session_obj,
-                source_sid=params['source_sid'],
-                source_did=params['source_did'],
-                target_sid=params['target_sid'],
-                target_did=params['target_did'],
-                diff_model_obj=diff_model_obj, total_percent=total_percent,
-                node_percent=node_percent, ignore_owner=ignore_owner,
-                ignore_whitespaces=ignore_whitespaces,
-                ignore_tablespace=ignore_tablespace,
-                ignore_grants=ignore_grants)
-        comparison_result = \
-            comparison_result + comparison_schema_result
+        tasks = get_database_compare_tasks(**compare_params)
 
         # Compare Schema objects
-        if 'source_only' in schema_result and \
-                len(schema_result['source_only']) > 0:
-            for item in schema_result['source_only']:
-                comparison_schema_result, total_percent = \
-                    compare_schema_objects(
-                        trans_id=params['trans_id'], session_obj=session_obj,
-                        source_sid=params['source_sid'],
-                        source_did=params['source_did'],
-                        source_scid=item['scid'],
-                        target_sid=params['target_sid'],
-                        target_did=params['target_did'], target_scid=None,
-                        schema_name=item['schema_name'],
-                        diff_model_obj=diff_model_obj,
-                        total_percent=total_percent,
-                        node_percent=node_percent,
-                        is_schema_source_only=True,
-                        ignore_owner=ignore_owner,
-                        ignore_whitespaces=ignore_whitespaces,
-                        ignore_tablespace=ignore_tablespace,
-                        ignore_grants=ignore_grants)
-
-                comparison_result = \
-                    comparison_result + comparison_schema_result
-
-        if 'target_only' in schema_result and \
-                len(schema_result['target_only']) > 0:
-            for item in schema_result['target_only']:
-                comparison_schema_result, total_percent = \
-                    compare_schema_objects(
-                        trans_id=params['trans_id'], session_obj=session_obj,
-                        source_sid=params['source_sid'],
-                        source_did=params['source_did'],
-                        source_scid=None, target_sid=params['target_sid'],
-                        target_did=params['target_did'],
-                        target_scid=item['scid'],
-                        schema_name=item['schema_name'],
-                        diff_model_obj=diff_model_obj,
-                        total_percent=total_percent,
-                        node_percent=node_percent,
-                        ignore_owner=ignore_owner,
-                        ignore_whitespaces=ignore_whitespaces,
-                        ignore_tablespace=ignore_tablespace,
-                        ignore_grants=ignore_grants)
-
-                comparison_result = \
-                    comparison_result + comparison_schema_result
+        for item in schema_result['source_only']:
+            tasks.extend(get_schema_compare_tasks(
+                source_scid=item['scid'], target_scid=None,
+                schema_name=item['schema_name'], is_schema_source_only=True,
+                **compare_params))
+
+        for item in schema_result['target_only']:
+            tasks.extend(get_schema_compare_tasks(
+                source_scid=None, target_scid=item['scid'],
+                schema_name=item['schema_name'], **compare_params))
 
         # Compare the two schema present in both the databases
-        if 'in_both_database' in schema_result and \
-                len(schema_result['in_both_database']) > 0:
-            for item in schema_result['in_both_database']:
-                comparison_schema_result, total_percent = \
-                    compare_schema_objects(
-                        trans_id=params['trans_id'], session_obj=session_obj,
-                        source_sid=params['source_sid'],
-                        source_did=params['source_did'],
-                        source_scid=item['src_scid'],
-                        target_sid=params['target_sid'],
-                        target_did=params['target_did'],
-                        target_scid=item['tar_scid'],
-                        schema_name=item['schema_name'],
-                        diff_model_obj=diff_model_obj,
-                        total_percent=total_percent,
-                        node_percent=node_percent,
-                        ignore_owner=ignore_owner,
-                        ignore_whitespaces=ignore_whitespaces,
-                        ignore_tablespace=ignore_tablespace,
-                        ignore_grants=ignore_grants)
-
-                comparison_result = \
-                    comparison_result + comparison_schema_result
+        for item in schema_result['in_both_database']:
+            tasks.extend(get_schema_compare_tasks(
+                source_scid=item['src_scid'], target_scid=item['tar_scid'],
+                schema_name=item['schema_name'], **compare_params))
+
+        comparison_result = compare_objects(
+            params['trans_id'], session_obj, diff_model_obj, tasks,
+            params['source_sid'], params['target_sid'])
 
         # Update the message and total percentage done in session object
         update_session_diff_transaction(params['trans_id'], session_obj,
@@ -621,34 +554,22 @@ def compare_schema(params):
     update_session_diff_transaction(params['trans_id'], session_obj,
                                     diff_model_obj)
     try:
-        ignore_owner = bool(params['ignore_owner'])
-        ignore_whitespaces = bool(params['ignore_whitespaces'])
-        ignore_tablespace = bool(params['ignore_tablespace'])
-        ignore_grants = bool(params['ignore_grants'])
-        all_registered_nodes = SchemaDiffRegistry.get_registered_nodes()
-        node_percent = round(100 / len(all_registered_nodes), 2)
-        total_percent = 0
-
-        comparison_schema_result, total_percent = \
-            compare_schema_objects(
-                trans_id=params['trans_id'], session_obj=session_obj,
-                source_sid=params['source_sid'],
-                source_did=params['source_did'],
-                source_scid=params['source_scid'],
-                target_sid=params['target_sid'],
-                target_did=params['target_did'],
-                target_scid=params['target_scid'],
-                schema_name=gettext('Schema Objects'),
-                diff_model_obj=diff_model_obj,
-                total_percent=total_percent,
-                node_percent=node_percent,
-                ignore_owner=ignore_owner,
-                ignore_whitespaces=ignore_whitespaces,
-                ignore_tablespace=ignore_tablespace,
-                ignore_grants=ignore_grants)
-
-        comparison_result = \
-            comparison_result + comparison_schema_result
+        tasks = get_schema_compare_tasks(
+            source_sid=params['source_sid'],
+            source_did=params['source_did'],
+            source_scid=params['source_scid'],
+            target_sid=params['target_sid'],
+            target_did=params['target_did'],
+            target_scid=params['target_scid'],
+            schema_name=gettext('Schema Objects'),
+            ignore_owner=bool(params['ignore_owner']),
+            ignore_whitespaces=bool(params['ignore_whitespaces']),
+            ignore_tablespace=bool(params['ignore_tablespace']),
+            ignore_grants=bool(params['ignore_grants']))
+
+        comparison_result = compare_objects(
+            params['trans_id'], session_obj, diff_model_obj, tasks,
+            params['source_sid'], params['target_sid'])
 
         # Update the message and total percentage done in session object
         update_session_diff_transaction(params['trans_id'], session_obj,
@@ -761,132 +682,104 @@ def get_schemas(sid, did):
     return None
 
 
-def compare_database_objects(**kwargs):
+def compare_objects(trans_id, session_obj, diff_model_obj, tasks,
+                    source_sid, target_sid):
+    """
+    This function is used to run the comparison tasks, and report the
+    progress to the client.
+
+    :param trans_id: Transaction id
+    :param session_obj: Session object of the transaction
+    :param diff_model_obj: Schema diff model object
+    :param tasks: List of the tasks (node view and compare parameters)
+    :param source_sid: Source server id
+    :param target_sid: Target server id
+    :return: comparison result
+    """
+    sid = request.sid
+
+    def on_complete(done, total, msg):
+        app.logger.debug(msg)
+        total_percent = round(done * 100 / total, 2)
+        # if total_percent is 100 then set it to less than 100, as the
+        # result is yet to be sent.
+        if total_percent >= 100:
+            total_percent = 96
+        socketio.emit('compare_status', {'diff_percentage': total_percent,
+                      'compare_msg': msg}, namespace=SOCKETIO_NAMESPACE,
+                      to=sid)
+        # Update the message and total percentage in session object
+        update_session_diff_transaction(trans_id, session_obj,
+                                        diff_model_obj)
+
+    return run_compare_tasks(
+        tasks, source_sid, target_sid,
+        'schema_diff_{0}_{1}'.format(trans_id, secrets.token_hex(4)),
+        on_complete=on_complete)
+
+
+def get_database_compare_tasks(**kwargs):
     """
-    This function is used to compare the specified schema and their children.
+    This function is used to list the tasks comparing the database level
+    objects.
 
     :param kwargs:
     :return:
     """
-    trans_id = kwargs.get('trans_id')
-    session_obj = kwargs.get('session_obj')
-    source_sid = kwargs.get('source_sid')
-    source_did = kwargs.get('source_did')
-    target_sid = kwargs.get('target_sid')
-    target_did = kwargs.get('target_did')
-    diff_model_obj = kwargs.get('diff_model_obj')
-    total_percent = kwargs.get('total_percent')
-    node_percent = kwargs.get('node_percent')
-    ignore_owner = kwargs.get('ignore_owner')
-    ignore_whitespaces = kwargs.get('ignore_whitespaces')
-    ignore_tablespace = kwargs.get('ignore_tablespace')
-    ignore_grants = kwargs.get('ignore_grants')
-    comparison_result = []
+    tasks = []
 
     all_registered_nodes = SchemaDiffRegistry.get_registered_nodes(None,
                                                                    'Database')
     for node_name, node_view in all_registered_nodes.items():
-        view = SchemaDiffRegistry.get_node_view(node_name)
-        if hasattr(view, 'compare'):
-            msg = gettext('Comparing {0}'). \
-                format(gettext(view.blueprint.collection_label))
-            app.logger.debug(msg)
-            socketio.emit('compare_status', {'diff_percentage': total_percent,
-                          'compare_msg': msg}, namespace=SOCKETIO_NAMESPACE,
-                          to=request.sid)
-            # Update the message and total percentage in session object
-            update_session_diff_transaction(trans_id, session_obj,
-                                            diff_model_obj)
-
-            res = view.compare(source_sid=source_sid,
-                               source_did=source_did,
-                               target_sid=target_sid,
-                               target_did=target_did,
-                               group_name=gettext('Database Objects'),
-                               ignore_owner=ignore_owner,
-                               ignore_whitespaces=ignore_whitespaces,
-                               ignore_tablespace=ignore_tablespace,
-                               ignore_grants=ignore_grants)
-
-            if res is not None:
-                comparison_result = comparison_result + res
-        total_percent = total_percent + node_percent
-
-    return comparison_result, total_percent
-
-
-def compare_schema_objects(**kwargs):
-    """
-    This function is used to compare the specified schema and their children.
+        if not hasattr(node_view, 'compare'):
+            continue
+
+        msg = gettext('Comparing {0}'). \
+            format(gettext(node_view.blueprint.collection_label))
+        params = dict(kwargs)
+        params['group_name'] = gettext('Database Objects')
+        tasks.append({'node': node_name, 'msg': msg, 'params': params})
+
+    return tasks
+
+
+def get_schema_compare_tasks(**kwargs):
+    """
+    This function is used to list the tasks comparing the objects of the
+    specified schema.
 
     :param kwargs:
     :return:
     """
-    trans_id = kwargs.get('trans_id')
-    session_obj = kwargs.get('session_obj')
-    source_sid = kwargs.get('source_sid')
-    source_did = kwargs.get('source_did')
-    source_scid = kwargs.get('source_scid')
-    target_sid = kwargs.get('target_sid')
-    target_did = kwargs.get('target_did')
-    target_scid = kwargs.get('target_scid')
-    schema_name = kwargs.get('schema_name')
-    diff_model_obj = kwargs.get('diff_model_obj')
-    total_percent = kwargs.get('total_percent')
-    node_percent = kwargs.get('node_percent')
-    is_schema_source_only = kwargs.get('is_schema_source_only', False)
-    ignore_owner = kwargs.get('ignore_owner')
-    ignore_whitespaces = kwargs.get('ignore_whitespaces')
-    ignore_tablespace = kwargs.get('ignore_tablespace')
-    ignore_grants = kwargs.get('ignore_grants')
+    schema_name = kwargs.pop('schema_name')
+    is_schema_source_only = kwargs.pop('is_schema_source_only', False)
 
     source_schema_name = None
     if is_schema_source_only:
         driver = get_driver(PG_DEFAULT_DRIVER)
         source_schema_name = driver.qtIdent(None, schema_name)
 
-    comparison_result = []
+    tasks = []
 
     all_registered_nodes = SchemaDiffRegistry.get_registered_nodes()
     for node_name, node_view in all_registered_nodes.items():
-        view = SchemaDiffRegistry.get_node_view(node_name)
-        if hasattr(view, 'compare'):
-            if schema_name == 'Schema Objects':
-                msg = gettext('Comparing {0} '). \
-                    format(gettext(view.blueprint.collection_label))
-            else:
-                msg = gettext('Comparing {0} of schema \'{1}\''). \
-                    format(gettext(view.blueprint.collection_label),
-                           gettext(schema_name))
-            app.logger.debug(msg)
-            socketio.emit('compare_status', {'diff_percentage': total_percent,
-                          'compare_msg': msg}, namespace=SOCKETIO_NAMESPACE,
-                          to=request.sid)
-            # Update the message and total percentage in session object
-            update_session_diff_transaction(trans_id, session_obj,
-                                            diff_model_obj)
-
-            res = view.compare(source_sid=source_sid,
-                               source_did=source_did,
-                               source_scid=source_scid,
-                               target_sid=target_sid,
-                               target_did=target_did,
-                               target_scid=target_scid,
-                               group_name=gettext(schema_name),
-                               source_schema_name=source_schema_name,
-                               ignore_owner=ignore_owner,
-                               ignore_whitespaces=ignore_whitespaces,
-                               ignore_tablespace=ignore_tablespace,
-                               ignore_grants=ignore_grants)
-
-            if res is not None:
-                comparison_result = comparison_result + res
-        total_percent = total_percent + node_percent
-        # if total_percent is more than 100 then set it to less than 100
-        if total_percent >= 100:
-            total_percent = 96
+        if not hasattr(node_view, 'compare'):
+            continue
+
+        if schema_name == 'Schema Objects':
+            msg = gettext('Comparing {0} '). \
+                format(gettext(node_view.blueprint.collection_label))
+        else:
+            msg = gettext('Comparing {0} of schema \'{1}\''). \
+                format(gettext(node_view.blueprint.collection_label),
+                       gettext(schema_name))
+
+        params = dict(kwargs)
+        params['group_name'] = gettext(schema_name)
+        params['source_schema_name'] = source_schema_name
+        tasks.append({'node': node_name, 'msg': msg, 'params': params})
 
-    return comparison_result, total_percent
+    return tasks
 
 
 def fetch_compare_schemas(source_sid, source_did, target_sid, target_did):
@@ -934,8 +827,15 @@ def fetch_compare_schemas(source_sid, source_did, target_sid, target_did):
                                  'src_scid': src_schema_dict[item],
                                  'tar_scid': tar_schema_dict[item]})
 
-    schema_result = {'source_only': source_only, 'target_only': target_only,
-                     'in_both_database': in_both_database}
+    # Sort by name, the set operations above do not preserve the order.
+    schema_result = {
+        'source_only': sorted(source_only,
+                              key=lambda item: item['schema_name']),
+        'target_only': sorted(target_only,
+                              key=lambda item: item['schema_name']),
+        'in_both_database': sorted(in_both_database,
+                                   key=lambda item: item['schema_name'])
+    }
 
     return schema_result
 
@@ -10,6 +10,7 @@
 """Directory comparison"""
 
 import copy
+import hashlib
 import string
 from flask import current_app
 from flask_babel import gettext
@@ -268,8 +269,6 @@ def _get_identical_and_different_list(intersect_keys, source_dict, target_dict,
     global count
     identical = []
     different = []
-    dict1 = kwargs['dict1']
-    dict2 = kwargs['dict2']
     ignore_keys = kwargs['ignore_keys']
     source_params = kwargs['source_params']
     target_params = kwargs['target_params']
@@ -277,19 +276,33 @@ def _get_identical_and_different_list(intersect_keys, source_dict, target_dict,
     target_schema = kwargs.get('target_schema')
     ignore_whitespaces = kwargs.get('ignore_whitespaces')
     ignore_grants = kwargs.get('ignore_grants', False)
+    identical_status = gettext('Identical')
 
     for key in intersect_keys:
         source_object_id, target_object_id = \
             get_source_target_oid(source_dict, target_dict, key)
 
-        # Recursively Compare the two dictionary
-        current_app.logger.debug(
-            "Schema Diff: Source Dict: {0}".format(dict1[key]))
-        current_app.logger.debug(
-            "Schema Diff: Target Dict: {0}".format(dict2[key]))
+        # Objects with the same digest are identical, compare the others
+        # recursively. The lists of the objects are sorted while comparing,
+        # hence work on copies of them.
+        src_digest = object_digest(source_dict[key], ignore_keys,
+                                   ignore_whitespaces)
+        is_identical = src_digest is not None and src_digest == \
+            object_digest(target_dict[key], ignore_keys, ignore_whitespaces)
 
-        if are_dictionaries_identical(dict1[key], dict2[key], ignore_keys,
-                                      ignore_whitespaces):
+        if not is_identical:
+            dict1 = {key: copy.deepcopy(source_dict[key])}
+            dict2 = {key: copy.deepcopy(target_dict[key])}
+
+            current_app.logger.debug(
+                "Schema Diff: Source Dict: {0}".format(dict1[key]))
+            current_app.logger.debug(
+                "Schema Diff: Target Dict: {0}".format(dict2[key]))
+
+            is_identical = are_dictionaries_identical(
+                dict1[key], dict2[key], ignore_keys, ignore_whitespaces)
+
+        if is_identical:
             title = key
             if node == 'user_mapping':
                 title = _get_user_mapping_name(key)
@@ -302,7 +315,7 @@ def _get_identical_and_different_list(intersect_keys, source_dict, target_dict,
                 'oid': source_object_id,
                 'source_oid': source_object_id,
                 'target_oid': target_object_id,
-                'status': gettext('Identical'),
+                'status': identical_status,
                 'group_name': group_name,
                 'dependencies': [],
                 'source_scid': source_params['scid']
@@ -432,12 +445,9 @@ def compare_dictionaries(**kwargs):
     ignore_tablespace = kwargs.get('ignore_tablespace')
     ignore_grants = kwargs.get('ignore_grants')
 
-    dict1 = copy.deepcopy(source_dict)
-    dict2 = copy.deepcopy(target_dict)
-
     # Find the duplicate keys in both the dictionaries
-    dict1_keys = set(dict1.keys())
-    dict2_keys = set(dict2.keys())
+    dict1_keys = set(source_dict.keys())
+    dict2_keys = set(target_dict.keys())
     intersect_keys = dict1_keys.intersection(dict2_keys)
 
     # Add gid to the params
@@ -483,8 +493,6 @@ def compare_dictionaries(**kwargs):
 
     # Compare the values of duplicates keys.
     other_param = {
-        "dict1": dict1,
-        "dict2": dict2,
         "ignore_keys": ignore_keys,
         "source_params": source_params,
         "target_params": target_params,
@@ -501,6 +509,79 @@ def compare_dictionaries(**kwargs):
     return source_only + target_only + different + identical
 
 
+_WHITESPACES = str.maketrans('', '', string.whitespace)
+
+
+def _canonical_list(value, ignore_keys, ignore_whitespaces):
+    """
+    Return the canonical form of a list, as compared by
+    are_lists_identical() once sorted by sort_list().
+    """
+    if value and isinstance(value[0], dict):
+        sort_key = is_key_exists(list_keys_array, value[0])
+        if sort_key is not None:
+            value = sorted(value, key=lambda k: k[sort_key])
+
+    return tuple(
+        _canonical_dict(item, ignore_keys, ignore_whitespaces)
+        if isinstance(item, dict) else item
+        for item in value)
+
+
+def _canonical_dict(value, ignore_keys, ignore_whitespaces):
+    """
+    Return the canonical form of a dictionary, as compared by
+    are_dictionaries_identical().
+    """
+    canonical = []
+    for key in sorted(value):
+        if key in ignore_keys:
+            continue
+
+        item = value[key]
+        if isinstance(item, dict):
+            item = ('dict', _canonical_dict(item, ignore_keys,
+                                            ignore_whitespaces))
+        elif isinstance(item, list):
+            item = ('list', _canonical_list(item, ignore_keys,
+                                            ignore_whitespaces))
+        elif isinstance(item, str):
+            if ignore_whitespaces:
+                item = item.translate(_WHITESPACES)
+            # An empty string and None are identical.
+            if item == '':
+                item = None
+        canonical.append((key, item))
+
+    return tuple(canonical)
+
+
+def object_digest(value, ignore_keys, ignore_whitespaces):
+    """
+    This function is used to compute the digest of an object dictionary,
+    without the keys to ignore and with the whitespaces removed if
+    ignore_whitespaces is set.
+
+    Two objects with the same digest are identical as per
+    are_dictionaries_identical(), the objects with different digests must
+    still be compared with it.
+
+    :param value: object dict
+    :param ignore_keys: ignore keys to compare
+    :param ignore_whitespaces: ignore whitespaces while comparing
+    :return: digest, or None if the object can not be digested.
+    """
+    try:
+        canonical = _canonical_dict(value, set(ignore_keys),
+                                    ignore_whitespaces)
+    except (KeyError, TypeError):
+        # The lists which can not be sorted are compared recursively.
+        return None
+
+    # The representation of the values tells apart their types as well.
+    return hashlib.sha256(repr(canonical).encode('utf-8')).digest()
+
+
 def are_lists_identical(source_list, target_list, ignore_keys,
                         ignore_whitespaces):
     """
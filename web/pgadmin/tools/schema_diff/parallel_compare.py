@@ -0,0 +1,128 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2024, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""
+Run the comparison of the schema diff nodes (one task per schema and node
+type) on a pool of worker threads.
+
+Every worker fetches the objects over its own dedicated connections to the
+source and target databases, so that the catalog queries of the different
+tasks run concurrently on the servers. The results are assembled in the
+order of the tasks, hence the outcome does not depend on the order in which
+the tasks complete.
+"""
+
+import queue
+import threading
+
+from flask import copy_current_request_context, current_app
+
+import config
+from config import PG_DEFAULT_DRIVER
+from pgadmin.tools.schema_diff.node_registry import SchemaDiffRegistry
+from pgadmin.utils.driver import get_driver
+
+
+def _compare(task):
+    view = SchemaDiffRegistry.get_node_view(task['node'])
+    return view.compare(**task['params'])
+
+
+def _max_workers():
+    return max(getattr(config, 'SCHEMA_DIFF_MAX_WORKERS', 1) or 1, 1)
+
+
+def run_compare_tasks(tasks, source_sid, target_sid, conn_prefix,
+                      on_complete=None):
+    """
+    Compare the nodes as per the given tasks.
+
+    Args:
+        tasks: list of dict(node=node type, msg=status message,
+            params=arguments for the compare function of the node view)
+        source_sid: Source server id
+        target_sid: Target server id
+        conn_prefix: Unique prefix for the ids of the dedicated connections
+        on_complete: function(done, total, msg) called in the calling thread
+            every time a task completes.
+
+    Returns:
+        list of the comparison results, in the order of the tasks.
+    """
+    total = len(tasks)
+    results = [None] * total
+    num_workers = min(_max_workers(), total)
+
+    if num_workers <= 1:
+        # Use the connections of the session.
+        for idx, task in enumerate(tasks):
+            results[idx] = _compare(task)
+            if on_complete:
+                on_complete(idx + 1, total, task['msg'])
+        return _merge(results)
+
+    pending = queue.Queue()
+    for idx in range(total):
+        pending.put(idx)
+    completed = queue.Queue()
+    abort = threading.Event()
+    app = current_app._get_current_object()
+
+    def worker(worker_id):
+        # The request context is copied in the calling thread.
+        @copy_current_request_context
+        def run():
+            with app.app_context():
+                driver = get_driver(PG_DEFAULT_DRIVER)
+                prefix = '{0}_{1}'.format(conn_prefix, worker_id)
+                with driver.connection_manager(source_sid).\
+                        dedicated_connections(prefix), \
+                        driver.connection_manager(target_sid).\
+                        dedicated_connections(prefix):
+                    while not abort.is_set():
+                        try:
+                            idx = pending.get_nowait()
+                        except queue.Empty:
+                            break
+                        completed.put((idx, _compare(tasks[idx]), None))
+
+        def target():
+            try:
+                run()
+            except Exception as e:
+                completed.put((None, None, e))
+
+        return threading.Thread(target=target, daemon=True)
+
+    workers = [worker(worker_id) for worker_id in range(num_workers)]
+    for thread in workers:
+        thread.start()
+
+    try:
+        for done in range(1, total + 1):
+            idx, result, error = completed.get()
+            if error is not None:
+                raise error
+            results[idx] = result
+            if on_complete:
+                on_complete(done, total, tasks[idx]['msg'])
+    finally:
+        abort.set()
+        for thread in workers:
+            thread.join()
+
+    return _merge(results)
+
+
+def _merge(results):
+    comparison_result = []
+    for res in results:
+        if isinstance(res, list):
+            comparison_result.extend(res)
+    return comparison_result
@@ -0,0 +1,123 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2024, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import copy
+
+from pgadmin.tools.schema_diff.directory_compare import object_digest, \
+    are_dictionaries_identical
+from pgadmin.utils.route import BaseTestGenerator
+
+SOURCE = {
+    'oid': 16401, 'name': 'tab', 'owner': 'postgres', 'spcname': 'pg_default',
+    'description': None, 'definition': 'SELECT 1\n  FROM tab',
+    'columns': [
+        {'name': 'id', 'attnum': 1, 'cltype': 'integer',
+         'attacl': [{'grantee': 'reader', 'privileges': ['r']}]},
+        {'name': 'code', 'attnum': 2, 'cltype': 'text', 'attacl': []},
+    ],
+    'relacl': [{'grantee': 'reader', 'grantor': 'postgres',
+                'privileges': ['r'], 'grantable': [False]}],
+    'options': {'fillfactor': 90},
+    'seclabels': ['dummy=classified'],
+}
+
+
+def _changed(**changes):
+    target = copy.deepcopy(SOURCE)
+    for key, value in changes.items():
+        if value is None:
+            del target[key]
+        else:
+            target[key] = value
+    return target
+
+
+class ObjectDigestTestCase(BaseTestGenerator):
+    """
+    Check that the objects with the same digest are identical, and that the
+    digest does not depend on the keys and the differences to ignore.
+    """
+
+    scenarios = [
+        ('Identical objects',
+         dict(target=_changed(), ignore_keys=['oid'],
+              ignore_whitespaces=False, same_digest=True, identical=True)),
+        ('Different oid',
+         dict(target=_changed(oid=16500), ignore_keys=['oid'],
+              ignore_whitespaces=False, same_digest=True, identical=True)),
+        ('Columns in a different order',
+         dict(target=_changed(columns=list(reversed(SOURCE['columns'])),
+                              oid=16500),
+              ignore_keys=['oid'], ignore_whitespaces=False,
+              same_digest=True, identical=True)),
+        ('Empty string instead of None',
+         dict(target=_changed(description=''), ignore_keys=['oid'],
+              ignore_whitespaces=False, same_digest=True, identical=True)),
+        ('Different owner',
+         dict(target=_changed(owner='other'), ignore_keys=['oid'],
+              ignore_whitespaces=False, same_digest=False, identical=False)),
+        ('Different owner, ignoring the owner',
+         dict(target=_changed(owner='other'), ignore_keys=['oid', 'owner'],
+              ignore_whitespaces=False, same_digest=True, identical=True)),
+        ('Different grants',
+         dict(target=_changed(relacl=[]), ignore_keys=['oid'],
+              ignore_whitespaces=False, same_digest=False, identical=False)),
+        ('Different column grants, ignoring the grants',
+         dict(ignore_keys=['oid', 'relacl', 'attacl'],
+              ignore_whitespaces=False, same_digest=True, identical=True,
+              target=_changed(relacl=[], columns=[
+                  dict(SOURCE['columns'][0], attacl=[]),
+                  SOURCE['columns'][1]]))),
+        ('Different tablespace',
+         dict(target=_changed(spcname='fast'), ignore_keys=['oid'],
+              ignore_whitespaces=False, same_digest=False, identical=False)),
+        ('Different whitespaces',
+         dict(target=_changed(definition='SELECT 1 FROM tab'),
+              ignore_keys=['oid'], ignore_whitespaces=False,
+              same_digest=False, identical=False)),
+        ('Different whitespaces, ignoring the whitespaces',
+         dict(target=_changed(definition='SELECT 1 FROM tab'),
+              ignore_keys=['oid'], ignore_whitespaces=True,
+              same_digest=True, identical=True)),
+        ('Different nested value',
+         dict(target=_changed(options={'fillfactor': 100}),
+              ignore_keys=['oid'], ignore_whitespaces=False,
+              same_digest=False, identical=False)),
+        ('Different column type',
+         dict(ignore_keys=['oid'], ignore_whitespaces=False,
+              same_digest=False, identical=False,
+              target=_changed(columns=[
+                  SOURCE['columns'][0],
+                  dict(SOURCE['columns'][1], cltype='varchar')]))),
+        ('Missing key',
+         dict(target=_changed(seclabels=None), ignore_keys=['oid'],
+              ignore_whitespaces=False, same_digest=False, identical=False)),
+        ('Number of the same value',
+         dict(target=_changed(options={'fillfactor': 90.0}),
+              ignore_keys=['oid'], ignore_whitespaces=False,
+              same_digest=False, identical=True)),
+    ]
+
+    def runTest(self):
+        source = copy.deepcopy(SOURCE)
+        target = copy.deepcopy(self.target)
+
+        source_digest = object_digest(source, self.ignore_keys,
+                                      self.ignore_whitespaces)
+        target_digest = object_digest(target, self.ignore_keys,
+                                      self.ignore_whitespaces)
+        # Computing the digest must not modify the objects
+        self.assertEqual(source, SOURCE)
+        self.assertEqual(target, self.target)
+
+        self.assertEqual(source_digest == target_digest, self.same_digest)
+        self.assertEqual(
+            are_dictionaries_identical(source, target, self.ignore_keys,
+                                       self.ignore_whitespaces),
+            self.identical)
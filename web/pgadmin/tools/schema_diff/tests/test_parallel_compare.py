@@ -0,0 +1,101 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2024, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import random
+import threading
+import time
+from contextlib import contextmanager
+from unittest.mock import patch, MagicMock
+
+from flask import Flask
+
+from pgadmin.tools.schema_diff import parallel_compare
+from pgadmin.utils.route import BaseTestGenerator
+
+
+class _FakeManager:
+    def __init__(self):
+        self.threads = set()
+        self.active = 0
+
+    @contextmanager
+    def dedicated_connections(self, prefix):
+        self.threads.add(threading.current_thread().name)
+        self.active += 1
+        try:
+            yield
+        finally:
+            self.active -= 1
+
+
+class _FakeView:
+    def compare(self, **kwargs):
+        # Complete the tasks in an arbitrary order
+        time.sleep(random.random() / 100)
+        if kwargs.get('fail'):
+            raise RuntimeError('comparison failed')
+        return [{'id': kwargs['id']}]
+
+
+class ParallelCompareTestCase(BaseTestGenerator):
+    """
+    Check that the comparison tasks run on the worker threads, each with
+    its own connections, and the result is in the order of the tasks.
+    """
+
+    scenarios = [
+        ('Sequential comparison',
+         dict(max_workers=1, fail=False)),
+        ('Parallel comparison',
+         dict(max_workers=4, fail=False)),
+        ('Parallel comparison with a failure',
+         dict(max_workers=4, fail=True)),
+    ]
+
+    def runTest(self):
+        tasks = [{'node': 'node', 'msg': 'Comparing {0}'.format(idx),
+                  'params': {'id': idx, 'fail': self.fail and idx == 7}}
+                 for idx in range(20)]
+        # Tasks not returning any difference
+        tasks[3]['params']['id'] = None
+
+        manager = _FakeManager()
+        driver = MagicMock()
+        driver.connection_manager.return_value = manager
+        progress = []
+
+        def on_complete(done, total, msg):
+            progress.append((done, total))
+
+        with patch.object(parallel_compare, 'config',
+                          MagicMock(SCHEMA_DIFF_MAX_WORKERS=(
+                              self.max_workers))), \
+                patch.object(parallel_compare, 'get_driver',
+                             return_value=driver), \
+                patch.object(parallel_compare.SchemaDiffRegistry,
+                             'get_node_view', return_value=_FakeView()), \
+                Flask(__name__).test_request_context():
+            if self.fail:
+                with self.assertRaises(RuntimeError):
+                    parallel_compare.run_compare_tasks(
+                        tasks, 1, 2, 'test', on_complete=on_complete)
+                self.assertEqual(manager.active, 0)
+                return
+
+            result = parallel_compare.run_compare_tasks(
+                tasks, 1, 2, 'test', on_complete=on_complete)
+
+        self.assertEqual(result, [{'id': task['params']['id']}
+                                  for task in tasks])
+        self.assertEqual(progress, [(idx, 20) for idx in range(1, 21)])
+        self.assertEqual(manager.active, 0)
+        if self.max_workers == 1:
+            self.assertEqual(manager.threads, set())
+        else:
+            self.assertEqual(len(manager.threads), self.max_workers)
@@ -0,0 +1,245 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2024, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""
+Process local index of the names of the objects of a database, used by the
+Search Objects tool.
+
+The objects of all the types are fetched once per database, and searched in
+memory afterwards with a trigram index of their names, instead of scanning
+the catalogs for every search. The index is keyed by the server, the
+database, the server version, the catalog generation of the database (see
+CatalogCache.generation) and the options the fetched objects depend on, so
+it is built again once the objects of the database are changed through
+pgAdmin, on the notifications of the changes of the catalogs, and after
+SEARCH_OBJECTS_INDEX_TIMEOUT seconds. The index is built by a single
+request at a time, the other searches of the database are run in the
+catalogs meanwhile. The indexes take up to SEARCH_OBJECTS_INDEX_MEMORY bytes
+(estimated), the least recently used ones are evicted beyond that. The
+databases whose index would not fit are searched in the catalogs, whatever
+the changes of their catalogs, until TOO_LARGE_RECHECK_INTERVAL seconds
+have elapsed.
+"""
+
+import time
+from array import array
+from collections import OrderedDict
+from threading import Lock
+
+import config
+from pgadmin.browser.catalog_cache import CatalogCache
+
+# Estimated memory used by an object and by a trigram of the index, in
+# addition to the characters of the names.
+ROW_OVERHEAD = 400
+TRIGRAM_OVERHEAD = 200
+
+# Interval (in seconds) after which the index of a database, which was too
+# large to be kept, is built again.
+TOO_LARGE_RECHECK_INTERVAL = 3600
+
+# The types searched along with the type selected
+TYPE_GROUPS = {
+    'constraints': ('check_constraint', 'foreign_key', 'primary_key',
+                    'unique_constraint', 'exclusion_constraint'),
+}
+
+
+def trigrams(text):
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class ObjectNameIndex:
+    """
+    class ObjectNameIndex
+
+        Trigram index of the names of the objects of a database.
+
+    Methods:
+    -------
+    * search(text, obj_type)
+      - Returns the objects (of the type, if given) whose name contains the
+        text, case insensitively, in the order they were added.
+
+    Class-level Methods:
+    ----------- -------
+    * key(sid, did, version, *options)
+      - Returns the key of the current index of the database.
+
+    * get(key)
+      - Returns whether the index is known, and the index. Otherwise, the
+        caller must build it.
+
+    * put(key, rows)
+      - Builds the index of the objects and keeps it if it fits in memory.
+
+    * release(key)
+      - Gives up building the index.
+    """
+    _lock = Lock()
+    # key -> (index, built at), least recently used first
+    _indexes = OrderedDict()
+    # Keys of the indexes being built
+    _building = set()
+    # key without the catalog generation -> time at which the index of the
+    # database was found too large
+    _too_large = dict()
+    _size = 0
+
+    def __init__(self, rows):
+        """
+        Args:
+            rows: The objects, as tuples starting with their name and type,
+                sorted
+        """
+        self.rows = []
+        self.names = []
+        self._trigrams = dict()
+        self.size = 0
+
+        for row in rows:
+            if row[0] is None:
+                continue
+            name = row[0].lower()
+            idx = len(self.rows)
+            self.rows.append(row)
+            self.names.append(name)
+            self.size += ROW_OVERHEAD + sum(
+                len(value) for value in row if isinstance(value, str))
+
+            for trigram in trigrams(name):
+                posting = self._trigrams.get(trigram)
+                if posting is None:
+                    posting = self._trigrams[trigram] = array('I')
+                    self.size += TRIGRAM_OVERHEAD
+                posting.append(idx)
+                self.size += posting.itemsize
+
+    def search(self, text, obj_type=None):
+        text = text.lower()
+        types = None
+        if obj_type is not None and obj_type != 'all':
+            types = TYPE_GROUPS.get(obj_type, (obj_type,))
+
+        if len(text) < 3:
+            candidates = range(len(self.rows))
+        else:
+            # The objects having the least common trigram of the text
+            candidates = None
+            for trigram in trigrams(text):
+                posting = self._trigrams.get(trigram)
+                if posting is None:
+                    return []
+                if candidates is None or len(posting) < len(candidates):
+                    candidates = posting
+
+        return [
+            self.rows[idx] for idx in candidates
+            if text in self.names[idx] and
+            (types is None or self.rows[idx][1] in types)
+        ]
+
+    @staticmethod
+    def enabled():
+        return (getattr(config, 'SEARCH_OBJECTS_INDEX_MEMORY', 0) or 0) > 0
+
+    @staticmethod
+    def timeout():
+        return getattr(config, 'SEARCH_OBJECTS_INDEX_TIMEOUT', 0) or 0
+
+    @staticmethod
+    def key(sid, did, version, *options):
+        """
+        Returns the key of the current index of the database, which changes
+        along with its catalogs.
+
+        Args:
+            options: Hashable values of the options the objects fetched
+                depend on
+        """
+        CatalogCache.poll(sid, did)
+        return (sid, did, version, CatalogCache.generation(sid, did)) + \
+            options
+
+    @staticmethod
+    def _database_key(key):
+        # The key of the index, whatever the state of the catalogs
+        return key[:3] + key[4:]
+
+    @classmethod
+    def get(cls, key):
+        """
+        Returns whether the index is known, and the index, None if the
+        database must be searched in the catalogs: its index does not fit
+        in memory, or is being built by another request.
+
+        If the index is not known, the caller is expected to build it with
+        put(), or to give up with release().
+        """
+        now = time.time()
+        with cls._lock:
+            entry = cls._indexes.get(key)
+            if entry is not None and now - entry[1] >= cls.timeout():
+                cls._drop(key)
+                entry = None
+            if entry is not None:
+                cls._indexes.move_to_end(key)
+                return True, entry[0]
+
+            database_key = cls._database_key(key)
+            found_at = cls._too_large.get(database_key)
+            if found_at is not None:
+                if now - found_at < TOO_LARGE_RECHECK_INTERVAL:
+                    return True, None
+                del cls._too_large[database_key]
+
+            if key in cls._building:
+                return True, None
+            cls._building.add(key)
+            return False, None
+
+    @classmethod
+    def put(cls, key, rows):
+        """
+        Returns the index of the objects, which is kept for the next
+        searches if it fits in memory. Otherwise, the database is remembered
+        to be searched in the catalogs.
+        """
+        index = cls(rows)
+        with cls._lock:
+            cls._drop(key)
+            # Drop the indexes of the previous states of the database
+            for old_key in [k for k in cls._indexes
+                            if k[:2] == key[:2] and k[3] != key[3]]:
+                cls._drop(old_key)
+
+            cls._building.discard(key)
+            if index.size <= config.SEARCH_OBJECTS_INDEX_MEMORY:
+                cls._indexes[key] = (index, time.time())
+                cls._size += index.size
+                while cls._size > config.SEARCH_OBJECTS_INDEX_MEMORY:
+                    cls._drop(next(iter(cls._indexes)))
+            else:
+                cls._too_large[cls._database_key(key)] = time.time()
+        return index
+
+    @classmethod
+    def release(cls, key):
+        """
+        Gives up building the index, e.g. when the objects could not be
+        fetched, so that the next search builds it.
+        """
+        with cls._lock:
+            cls._building.discard(key)
+
+    @classmethod
+    def _drop(cls, key):
+        entry = cls._indexes.pop(key, None)
+        if entry is not None:
+            cls._size -= entry[0].size
@@ -0,0 +1,227 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2024, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+from collections import OrderedDict
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from pgadmin.browser.catalog_cache import CatalogCache
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.tools.search_objects import name_index
+from pgadmin.tools.search_objects.name_index import ObjectNameIndex
+
+ROWS = [
+    ('customer_id', 'column', ':schema.1:/public/:column.1:/customer_id'),
+    ('orders_customer_fk', 'foreign_key', ':schema.1:/public/:fk.2:/o'),
+    ('Customers', 'table', ':schema.1:/public/:table.3:/Customers'),
+    ('orders', 'table', ':schema.1:/public/:table.4:/orders'),
+    (None, 'cast', ':cast.5:/'),
+]
+
+
+class ObjectNameIndexSearchTestCase(BaseTestGenerator):
+    """
+    Check that the names containing the search text are found in the
+    index, in the order of the objects.
+    """
+
+    scenarios = [
+        ('Trigrams', dict(text='CUSTOM', obj_type=None,
+                          expected=['customer_id', 'orders_customer_fk',
+                                    'Customers'])),
+        ('Short text', dict(text='rs', obj_type='all',
+                            expected=['orders_customer_fk', 'Customers',
+                                      'orders'])),
+        ('Type', dict(text='customer', obj_type='table',
+                      expected=['Customers'])),
+        ('Type group', dict(text='customer', obj_type='constraints',
+                            expected=['orders_customer_fk'])),
+        ('Unknown trigram', dict(text='customerz', obj_type=None,
+                                 expected=[])),
+        ('No wildcards', dict(text='customer%', obj_type=None,
+                              expected=[])),
+    ]
+
+    def runTest(self):
+        index = ObjectNameIndex(ROWS)
+        self.assertEqual(
+            [row[0] for row in index.search(self.text, self.obj_type)],
+            self.expected)
+
+
+class ObjectNameIndexCacheTestCase(BaseTestGenerator):
+    """
+    Check that the index of a database is kept until the catalogs of the
+    database change, or it expires, and that a database whose index does
+    not fit in memory is searched in the catalogs, even once its catalogs
+    change.
+    """
+
+    scenarios = [
+        ('Index kept', dict(action=None, expected_builds=1)),
+        ('Objects of the database changed', dict(
+            action=lambda: CatalogCache.invalidate(1, 5),
+            expected_builds=2)),
+        ('Objects of another database changed', dict(
+            action=lambda: CatalogCache.invalidate(1, 6),
+            expected_builds=1)),
+        ('Index expired', dict(action=None, timeout=0, expected_builds=2)),
+        ('Index too large', dict(action=None, memory=100, expected_builds=1,
+                                 expected_index=None, expected_indexes=0)),
+        ('Index too large, objects of the database changed', dict(
+            action=lambda: CatalogCache.invalidate(1, 5), memory=100,
+            expected_builds=1, expected_index=None, expected_indexes=0)),
+    ]
+
+    def runTest(self):
+        config = SimpleNamespace(
+            SEARCH_OBJECTS_INDEX_MEMORY=getattr(self, 'memory', 1000000),
+            SEARCH_OBJECTS_INDEX_TIMEOUT=getattr(self, 'timeout', 60))
+
+        with patch.object(name_index, 'config', config), \
+                patch.object(CatalogCache, 'poll',
+                             staticmethod(lambda sid, did: None)), \
+                patch.object(CatalogCache, '_generations', dict()), \
+                patch.object(ObjectNameIndex, '_indexes', OrderedDict()), \
+                patch.object(ObjectNameIndex, '_building', set()), \
+                patch.object(ObjectNameIndex, '_too_large', dict()), \
+                patch.object(ObjectNameIndex, '_size', 0):
+            builds = 0
+            for _ in range(2):
+                key = ObjectNameIndex.key(1, 5, 160000, False)
+                found, index = ObjectNameIndex.get(key)
+                if not found:
+                    builds += 1
+                    index = ObjectNameIndex.put(key, ROWS)
+                    self.assertEqual(len(index.search('orders')), 2)
+                elif hasattr(self, 'expected_index'):
+                    self.assertEqual(index, self.expected_index)
+
+                if self.action is not None:
+                    self.action()
+
+            self.assertEqual(builds, self.expected_builds)
+            self.assertLessEqual(ObjectNameIndex._size,
+                                 config.SEARCH_OBJECTS_INDEX_MEMORY)
+            self.assertEqual(len(ObjectNameIndex._indexes),
+                             getattr(self, 'expected_indexes', 1))
+            self.assertEqual(ObjectNameIndex._building, set())
+
+
+class ObjectNameIndexBuildTestCase(BaseTestGenerator):
+    """
+    Check that the index of a database is built by a single request, the
+    others searching the catalogs meanwhile, and that it is built by the
+    next search if the objects could not be fetched.
+    """
+
+    def runTest(self):
+        from pgadmin.tools.search_objects.utils import SearchObjectsHelper
+
+        config = SimpleNamespace(SEARCH_OBJECTS_INDEX_MEMORY=1000000,
+                                 SEARCH_OBJECTS_INDEX_TIMEOUT=60)
+        fetched = []
+
+        def fetch(conn, text, obj_type, show_node_prefs,
+                  skip_obj_type=None):
+            fetched.append(text)
+            if text == '' and len(fetched) == 1:
+                # Another search of the database while building the index
+                status, res = helper.search('orders')
+                self.assertTrue(status)
+                return False, 'Failed'
+            return True, [tuple(row) + (True, None, 'N') for row in ROWS
+                          if row[0] is not None and text in row[0]]
+
+        with patch.object(name_index, 'config', config), \
+                patch.object(CatalogCache, 'poll',
+                             staticmethod(lambda sid, did: None)), \
+                patch.object(CatalogCache, '_generations', dict()), \
+                patch.object(ObjectNameIndex, '_indexes', OrderedDict()), \
+                patch.object(ObjectNameIndex, '_building', set()), \
+                patch.object(ObjectNameIndex, '_too_large', dict()), \
+                patch.object(ObjectNameIndex, '_size', 0), \
+                patch('pgadmin.tools.search_objects.utils.get_driver'), \
+                patch('pgadmin.tools.search_objects.utils.get_locale',
+                      return_value='en'), \
+                patch.object(SearchObjectsHelper, 'get_show_node_prefs',
+                             return_value={}), \
+                patch.object(SearchObjectsHelper, 'get_supported_types',
+                             return_value={'table': 'Tables',
+                                           'foreign_key': 'Foreign Keys',
+                                           'column': 'Columns'}), \
+                patch.object(SearchObjectsHelper, '_check_permission',
+                             lambda self, obj_type, conn, skip: []):
+            helper = SearchObjectsHelper(1, 5)
+            helper._fetch = fetch
+
+            status, _ = helper.search('orders')
+            self.assertFalse(status)
+            self.assertEqual(ObjectNameIndex._building, set())
+
+            for _ in range(2):
+                status, res = helper.search('orders')
+                self.assertTrue(status)
+                self.assertEqual([obj['name'] for obj in res],
+                                 ['orders_customer_fk', 'orders'])
+
+            # Built once by the next search, the concurrent search was run
+            # in the catalogs.
+            self.assertEqual(fetched, ['', 'orders', ''])
+
+
+class ObjectNameIndexPermissionTestCase(BaseTestGenerator):
+    """
+    Check that the index built for a role allowed to see the subscriptions
+    is not searched for the roles which are not.
+    """
+
+    def runTest(self):
+        from pgadmin.tools.search_objects.utils import SearchObjectsHelper
+
+        rows = ROWS[:-1] + [
+            ('orders_sub', 'subscription', ':subscription.6:/orders_sub')]
+        config = SimpleNamespace(SEARCH_OBJECTS_INDEX_MEMORY=1000000,
+                                 SEARCH_OBJECTS_INDEX_TIMEOUT=60)
+
+        def fetch(conn, text, obj_type, show_node_prefs, skip_obj_type):
+            return True, [tuple(row) + (True, None, 'N') for row in rows
+                          if row[1] not in skip_obj_type]
+
+        with patch.object(name_index, 'config', config), \
+                patch.object(CatalogCache, 'poll',
+                             staticmethod(lambda sid, did: None)), \
+                patch.object(CatalogCache, '_generations', dict()), \
+                patch.object(ObjectNameIndex, '_indexes', OrderedDict()), \
+                patch.object(ObjectNameIndex, '_building', set()), \
+                patch.object(ObjectNameIndex, '_size', 0), \
+                patch('pgadmin.tools.search_objects.utils.get_driver'), \
+                patch('pgadmin.tools.search_objects.utils.get_locale',
+                      return_value='en'), \
+                patch.object(SearchObjectsHelper, 'get_show_node_prefs',
+                             return_value={}), \
+                patch.object(SearchObjectsHelper, 'get_supported_types',
+                             return_value={'table': 'Tables',
+                                           'foreign_key': 'Foreign Keys',
+                                           'subscription': 'Subscriptions'}):
+            found = dict()
+            for role, skip_obj_type in (('superuser', []),
+                                        ('user', ['subscription'])):
+                helper = SearchObjectsHelper(1, 5)
+                helper._check_permission = \
+                    lambda obj_type, conn, skip, s=skip_obj_type: list(s)
+                helper._fetch = fetch
+                status, res = helper.search('orders')
+                self.assertTrue(status)
+                found[role] = [obj['name'] for obj in res]
+
+            self.assertEqual(found['superuser'],
+                             ['orders_customer_fk', 'orders', 'orders_sub'])
+            self.assertEqual(found['user'], ['orders_customer_fk', 'orders'])
+            self.assertEqual(len(ObjectNameIndex._indexes), 2)
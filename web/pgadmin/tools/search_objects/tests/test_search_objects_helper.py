@@ -116,5 +116,5 @@ class SearchObjectsHelperTest(BaseTestGenerator):
             self.assertEqual(so_obj.get_supported_types(skip_check=True),
                              self.expected_supported_types_skip)
 
-            self.assertEqual(so_obj.search('searchtext', 'all'),
+            self.assertEqual(so_obj.search('name', 'all'),
                              self.expected_search_op)
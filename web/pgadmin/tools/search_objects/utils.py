@@ -8,11 +8,12 @@
 ##########################################################################
 
 from flask import current_app, render_template
-from flask_babel import gettext
+from flask_babel import gettext, get_locale
 
 from pgadmin.utils.driver import get_driver
 from config import PG_DEFAULT_DRIVER
 from pgadmin.utils.constants import DATABASE_LAST_SYSTEM_OID
+from pgadmin.tools.search_objects.name_index import ObjectNameIndex
 
 
 def get_node_blueprint(node_type):
@@ -109,17 +110,15 @@ class SearchObjectsHelper:
 
         return skip_obj_type
 
-    def search(self, text, obj_type=None):
-        skip_obj_type = []
-        conn = self.manager.connection(did=self.did)
-        last_system_oid = DATABASE_LAST_SYSTEM_OID
-
-        show_node_prefs = self.get_show_node_prefs()
-        node_labels = self.get_supported_types(skip_check=True)
-        # escape the single quote from search text
-        text = text.replace("'", "''")
-        skip_obj_type = self._check_permission(obj_type, conn,
-                                               skip_obj_type)
+    def _fetch(self, conn, text, obj_type, show_node_prefs,
+               skip_obj_type=None):
+        """
+        Returns the objects (of the type, if given) whose name contains the
+        text, from the catalogs, as tuples of the columns of the search
+        results.
+        """
+        if skip_obj_type is None:
+            skip_obj_type = self._check_permission(obj_type, conn, [])
 
         # Column catalog_level has values as
         # N - Not a catalog schema
@@ -127,26 +126,73 @@ class SearchObjectsHelper:
         # O - Catalog schema with object support only - info schema, sys
         status, res = conn.execute_dict(
             self.get_sql('search.sql',
-                         search_text=text.lower(), obj_type=obj_type,
+                         # escape the single quote from search text
+                         search_text=text.replace("'", "''").lower(),
+                         obj_type=obj_type,
                          show_system_objects=self.show_system_objects,
                          show_node_prefs=show_node_prefs, _=gettext,
-                         last_system_oid=last_system_oid,
+                         last_system_oid=DATABASE_LAST_SYSTEM_OID,
                          skip_obj_type=skip_obj_type)
         )
 
         if not status:
             return status, res
 
+        return True, [
+            (row['obj_name'], row['obj_type'], row['obj_path'],
+             row['show_node'], row['other_info'], row['catalog_level'])
+            for row in res['rows']
+        ]
+
+    def search(self, text, obj_type=None):
+        """
+        Returns the objects (of the type, if given) whose name contains the
+        text. The objects are searched in the name index of the database,
+        built on the first search, if enabled.
+        """
+        conn = self.manager.connection(did=self.did)
+        show_node_prefs = self.get_show_node_prefs()
+        node_labels = self.get_supported_types(skip_check=True)
+
+        index = None
+        if ObjectNameIndex.enabled():
+            # The objects the role of the user cannot see are not indexed,
+            # the index is shared with the roles having the same privileges.
+            skip_obj_type = self._check_permission('all', conn, [])
+            key = ObjectNameIndex.key(
+                self.sid, self.did, self.manager.version,
+                self.show_system_objects,
+                tuple(sorted(show_node_prefs.items())), str(get_locale()),
+                tuple(skip_obj_type))
+            found, index = ObjectNameIndex.get(key)
+            if not found:
+                try:
+                    status, rows = self._fetch(conn, '', 'all',
+                                               show_node_prefs, skip_obj_type)
+                    if not status:
+                        return status, rows
+                    index = ObjectNameIndex.put(key, rows)
+                finally:
+                    ObjectNameIndex.release(key)
+
+        if index is not None:
+            rows = index.search(text, obj_type)
+        else:
+            status, rows = self._fetch(conn, text, obj_type, show_node_prefs)
+            if not status:
+                return status, rows
+
         ret_val = [
             {
-                'name': row['obj_name'],
-                'type': row['obj_type'],
-                'type_label': node_labels[row['obj_type']],
-                'path': row['obj_path'],
-                'show_node': row['show_node'],
-                'other_info': row['other_info'],
-                'catalog_level': row['catalog_level'],
+                'name': name,
+                'type': obj_type,
+                'type_label': node_labels[obj_type],
+                'path': path,
+                'show_node': show_node,
+                'other_info': other_info,
+                'catalog_level': catalog_level,
             }
-            for row in res['rows']
+            for name, obj_type, path, show_node, other_info, catalog_level
+            in rows
         ]
         return True, ret_val
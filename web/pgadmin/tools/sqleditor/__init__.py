@@ -9,7 +9,6 @@
 
 """A blueprint module implementing the sqleditor frame."""
 import os
-import pickle
 import re
 import secrets
 from urllib.parse import unquote
@@ -33,14 +32,20 @@ from pgadmin.tools.sqleditor.utils.constant_definition import ASYNC_OK, \
 from pgadmin.tools.sqleditor.utils.start_running_query import StartRunningQuery
 from pgadmin.tools.sqleditor.utils.update_session_grid_transaction import \
     update_session_grid_transaction
+from pgadmin.tools.sqleditor.utils.transaction_registry import \
+    TransactionRegistry
+from pgadmin.tools.sqleditor.utils.result_cache import ResultCache
 from pgadmin.utils import PgAdminModule
 from pgadmin.utils import get_storage_directory
 from pgadmin.utils.ajax import make_json_response, bad_request, \
     success_return, internal_server_error, service_unavailable
+from pgadmin.utils.columnar import client_accepts_columnar, \
+    make_columnar_response
 from pgadmin.utils.driver import get_driver
 from pgadmin.utils.exception import ConnectionLost, SSHTunnelConnectionLost, \
     CryptKeyMissing, ObjectGone
 from pgadmin.browser.utils import underscore_unescape, underscore_escape
+from pgadmin.browser.catalog_cache import CatalogCache
 from pgadmin.utils.menu import MenuItem
 from pgadmin.utils.sqlautocomplete.autocomplete import SQLAutoComplete
 from pgadmin.tools.sqleditor.utils.query_tool_preferences import \
@@ -252,12 +257,11 @@ def initialize_viewdata(trans_id, cmd_type, obj_type, sgid, sid, did, obj_id):
     else:
         sql_grid_data = session['gridData']
 
-    # Use pickle to store the command object which will be used later by the
+    # Store the command object which will be used later by the
     # sql grid module.
-    sql_grid_data[str(trans_id)] = {
-        # -1 specify the highest protocol version available
-        'command_obj': pickle.dumps(command_obj, -1)
-    }
+    session_obj = dict()
+    TransactionRegistry.checkpoint(session, trans_id, session_obj, command_obj)
+    sql_grid_data[str(trans_id)] = session_obj
 
     # Store the grid dictionary into the session variable
     session['gridData'] = sql_grid_data
@@ -505,12 +509,11 @@ def _init_sqleditor(trans_id, connect, sgid, sid, did, dbname=None, **kwargs):
 
     # Set the value of database name, that will be used later
     command_obj.dbname = dbname if dbname else None
-    # Use pickle to store the command object which will be used
+    # Store the command object which will be used
     # later by the sql grid module.
-    sql_grid_data[str(trans_id)] = {
-        # -1 specify the highest protocol version available
-        'command_obj': pickle.dumps(command_obj, -1)
-    }
+    session_obj = dict()
+    TransactionRegistry.checkpoint(session, trans_id, session_obj, command_obj)
+    sql_grid_data[str(trans_id)] = session_obj
 
     # Store the grid dictionary into the session variable
     session['gridData'] = sql_grid_data
@@ -606,7 +609,7 @@ def close(trans_id):
     with sqleditor_close_session_lock:
         # delete the SQLAutoComplete object
         if trans_id in auto_complete_objects:
-            del auto_complete_objects[trans_id]
+            auto_complete_objects.pop(trans_id).close()
 
         if 'gridData' not in session:
             return make_json_response(data={'status': True})
@@ -673,9 +676,10 @@ def close_sqleditor_session(trans_id):
     :return:
     """
     if 'gridData' in session and str(trans_id) in session['gridData']:
-        cmd_obj_str = session['gridData'][str(trans_id)]['command_obj']
-        # Use pickle.loads function to get the command object
-        cmd_obj = pickle.loads(cmd_obj_str)
+        cmd_obj = TransactionRegistry.get(
+            session, trans_id, session['gridData'][str(trans_id)])
+        TransactionRegistry.remove(session, trans_id)
+        ResultCache.remove(session, trans_id)
 
         # if connection id is None then no need to release the connection
         if cmd_obj.conn_id is not None:
@@ -729,9 +733,8 @@ def check_transaction_status(trans_id, auto_comp=False):
         return False, ERROR_MSG_TRANS_ID_NOT_FOUND, None, None, None
 
     # Fetch the object for the specified transaction id.
-    # Use pickle.loads function to get the command object
     session_obj = grid_data[str(trans_id)]
-    trans_obj = pickle.loads(session_obj['command_obj'])
+    trans_obj = TransactionRegistry.get(session, trans_id, session_obj)
 
     if auto_comp:
         conn_id = trans_obj.conn_id_ac
@@ -810,14 +813,16 @@ def start_view_data(trans_id):
     if status and conn is not None and \
             trans_obj is not None and session_obj is not None:
 
-        # set fetched row count to 0 as we are executing query again.
-        trans_obj.update_fetched_row_cnt(0)
+        with TransactionRegistry.changing(session, trans_id):
+            # set fetched row count to 0 as we are executing query again.
+            trans_obj.update_fetched_row_cnt(0)
 
-        # Fetch the sql and primary_keys from the object
-        sql = trans_obj.get_sql(default_conn)
-        _, primary_keys = trans_obj.get_primary_keys(default_conn)
+            # Fetch the sql and primary_keys from the object
+            sql = trans_obj.get_sql(default_conn)
+            _, primary_keys = trans_obj.get_primary_keys(default_conn)
 
-        session_obj['command_obj'] = pickle.dumps(trans_obj, -1)
+            TransactionRegistry.checkpoint(
+                session, trans_id, session_obj, trans_obj)
 
         has_oids = False
         if trans_obj.object_type == 'table':
@@ -890,6 +895,20 @@ def start_query_tool(trans_id):
     )
 
 
+def make_result_response(data):
+    """
+    Send the result of poll/fetch to the client. The rows are sent as a
+    columnar frame when the client negotiated it using the Accept header,
+    otherwise as the regular JSON response.
+
+    Args:
+        data: Response data, rows are in data['result']
+    """
+    if isinstance(data['result'], list) and client_accepts_columnar():
+        return make_columnar_response(data)
+    return make_json_response(data=data)
+
+
 def extract_sql_from_network_parameters(request_data, request_arguments,
                                         request_form_data):
     if request_data:
@@ -995,6 +1014,14 @@ def poll(trans_id):
             status = 'Success'
             rows_affected = conn.rows_affected()
 
+            # The objects of the database may have been changed by the query,
+            # which is encoded with the encoding of the database.
+            query = conn._Connection__async_cursor._query
+            if query is not None and CatalogCache.changes_catalogs(
+                    query.query.decode(conn.python_encoding,
+                                       errors='replace')):
+                CatalogCache.invalidate(trans_obj.sid, trans_obj.did)
+
             st, result = conn.async_fetchmany_2darray(on_demand_record_count)
 
             # There may be additional messages even if result is present
@@ -1021,9 +1048,6 @@ def poll(trans_id):
                         trans_obj.check_updatable_results_pkeys_oids():
                     _, primary_keys = trans_obj.get_primary_keys()
                     session_obj['has_oids'] = trans_obj.has_oids()
-                    # Update command_obj in session obj
-                    session_obj['command_obj'] = pickle.dumps(
-                        trans_obj, -1)
                     # If primary_keys exist, add them to the session_obj to
                     # allow for saving any changes to the data
                     if primary_keys is not None:
@@ -1070,22 +1094,29 @@ def poll(trans_id):
 
                 # status of async_fetchmany_2darray is True and result is none
                 # means nothing to fetch
-                if result and rows_affected > -1:
-                    res_len = len(result)
-                    if res_len == on_demand_record_count:
-                        has_more_rows = True
-
-                    if res_len > 0:
-                        rows_fetched_from = trans_obj.get_fetched_row_cnt()
-                        trans_obj.update_fetched_row_cnt(
-                            rows_fetched_from + res_len)
-                        rows_fetched_from += 1
-                        rows_fetched_to = trans_obj.get_fetched_row_cnt()
-                        session_obj['command_obj'] = pickle.dumps(
-                            trans_obj, -1)
-
-                # As we changed the transaction object we need to
-                # restore it and update the session variable.
+                with TransactionRegistry.changing(session, trans_id):
+                    if result and rows_affected > -1:
+                        res_len = len(result)
+                        if res_len == on_demand_record_count:
+                            has_more_rows = True
+
+                        ResultCache.store(
+                            session, trans_id, conn.async_query_id(),
+                            trans_obj.get_fetched_row_cnt(), result,
+                            complete=not has_more_rows)
+
+                        if res_len > 0:
+                            rows_fetched_from = \
+                                trans_obj.get_fetched_row_cnt()
+                            trans_obj.update_fetched_row_cnt(
+                                rows_fetched_from + res_len)
+                            rows_fetched_from += 1
+                            rows_fetched_to = trans_obj.get_fetched_row_cnt()
+
+                    # As we changed the transaction object we need to
+                    # restore it and update the session variable.
+                    TransactionRegistry.checkpoint(
+                        session, trans_id, session_obj, trans_obj)
                 update_session_grid_transaction(trans_id, session_obj)
 
             # Procedure/Function output may comes in the form of Notices
@@ -1117,7 +1148,7 @@ def poll(trans_id):
     data_obj['db_id'] = trans_obj.did \
         if trans_obj is not None and hasattr(trans_obj, 'did') else 0
 
-    return make_json_response(
+    return make_result_response(
         data={
             'status': status, 'result': result,
             'rows_affected': rows_affected,
@@ -1174,18 +1205,29 @@ def fetch(trans_id, fetch_all=None):
             if fetch_row_cnt != -1 and res_len == on_demand_record_count:
                 has_more_rows = True
 
+            ResultCache.store(
+                session, trans_id, conn.async_query_id(),
+                trans_obj.get_fetched_row_cnt(), result,
+                complete=not has_more_rows)
+
             if res_len:
-                rows_fetched_from = trans_obj.get_fetched_row_cnt()
-                trans_obj.update_fetched_row_cnt(rows_fetched_from + res_len)
-                rows_fetched_from += 1
-                rows_fetched_to = trans_obj.get_fetched_row_cnt()
-                session_obj['command_obj'] = pickle.dumps(trans_obj, -1)
+                with TransactionRegistry.changing(session, trans_id):
+                    rows_fetched_from = trans_obj.get_fetched_row_cnt()
+                    trans_obj.update_fetched_row_cnt(
+                        rows_fetched_from + res_len)
+                    rows_fetched_from += 1
+                    rows_fetched_to = trans_obj.get_fetched_row_cnt()
+
+                    # As we changed the transaction object we need to
+                    # restore it and update the session variable.
+                    TransactionRegistry.checkpoint(
+                        session, trans_id, session_obj, trans_obj)
                 update_session_grid_transaction(trans_id, session_obj)
     else:
         status = 'NotConnected'
         result = error_msg
 
-    return make_json_response(
+    return make_result_response(
         data={
             'status': status,
             'result': result,
@@ -1216,22 +1258,42 @@ def fetch_all_from_start(trans_id, limit=-1):
                                   status=404)
 
     if status and conn is not None and session_obj is not None:
-        # Reset the cursor to start to fetch all the records.
-        conn.reset_cursor_at(0)
+        # The rows fetched earlier are served from the result cache.
+        query_id = conn.async_query_id()
+        result, covered = ResultCache.get(session, trans_id, query_id, limit)
+        status = 'Success'
+
+        if not covered:
+            # Reset the cursor to fetch the rest of the records.
+            start = len(result)
+            conn.reset_cursor_at(start)
+
+            status, rows = conn.async_fetchmany_2darray(
+                -1 if limit == -1 else limit - start)
+            if not status:
+                status = 'Error'
+                result = rows
+            else:
+                status = 'Success'
+                ResultCache.count_misses(len(rows) if rows else 0)
+                ResultCache.store(
+                    session, trans_id, query_id, start, rows,
+                    complete=limit == -1 or len(rows or []) < limit - start)
+                if rows is not None or start:
+                    result.extend(rows or [])
+                else:
+                    result = None
 
-        status, result = conn.async_fetchmany_2darray(limit)
-        if not status:
-            status = 'Error'
-        else:
-            status = 'Success'
+            # Reset the cursor back to it's actual position
+            conn.reset_cursor_at(trans_obj.get_fetched_row_cnt())
 
-        # Reset the cursor back to it's actual position
-        conn.reset_cursor_at(trans_obj.get_fetched_row_cnt())
+        current_app.logger.debug(
+            'Query Tool result cache: {0}'.format(ResultCache.stats()))
     else:
         status = 'NotConnected'
         result = error_msg
 
-    return make_json_response(
+    return make_result_response(
         data={
             'status': status,
             'result': result
@@ -1440,11 +1502,13 @@ def append_filter_inclusive(trans_id):
                     conn, column_name
                 ) + ' = ' + driver.qtLiteral(column_value, conn)
 
-        trans_obj.append_filter(filter_sql)
+        with TransactionRegistry.changing(session, trans_id):
+            trans_obj.append_filter(filter_sql)
 
-        # As we changed the transaction object we need to
-        # restore it and update the session variable.
-        session_obj['command_obj'] = pickle.dumps(trans_obj, -1)
+            # As we changed the transaction object we need to
+            # restore it and update the session variable.
+            TransactionRegistry.checkpoint(
+                session, trans_id, session_obj, trans_obj)
         update_session_grid_transaction(trans_id, session_obj)
     else:
         status = False
@@ -1495,12 +1559,14 @@ def append_filter_exclusive(trans_id):
                     conn, column_name
                 ) + ' IS DISTINCT FROM ' + driver.qtLiteral(column_value, conn)
 
-        # Call the append_filter method of transaction object
-        trans_obj.append_filter(filter_sql)
+        with TransactionRegistry.changing(session, trans_id):
+            # Call the append_filter method of transaction object
+            trans_obj.append_filter(filter_sql)
 
-        # As we changed the transaction object we need to
-        # restore it and update the session variable.
-        session_obj['command_obj'] = pickle.dumps(trans_obj, -1)
+            # As we changed the transaction object we need to
+            # restore it and update the session variable.
+            TransactionRegistry.checkpoint(
+                session, trans_id, session_obj, trans_obj)
         update_session_grid_transaction(trans_id, session_obj)
     else:
         status = False
@@ -1536,12 +1602,14 @@ def remove_filter(trans_id):
 
         res = None
 
-        # Call the remove_filter method of transaction object
-        trans_obj.remove_filter()
+        with TransactionRegistry.changing(session, trans_id):
+            # Call the remove_filter method of transaction object
+            trans_obj.remove_filter()
 
-        # As we changed the transaction object we need to
-        # restore it and update the session variable.
-        session_obj['command_obj'] = pickle.dumps(trans_obj, -1)
+            # As we changed the transaction object we need to
+            # restore it and update the session variable.
+            TransactionRegistry.checkpoint(
+                session, trans_id, session_obj, trans_obj)
         update_session_grid_transaction(trans_id, session_obj)
     else:
         status = False
@@ -1580,12 +1648,14 @@ def set_limit(trans_id):
 
         res = None
 
-        # Call the set_limit method of transaction object
-        trans_obj.set_limit(limit)
+        with TransactionRegistry.changing(session, trans_id):
+            # Call the set_limit method of transaction object
+            trans_obj.set_limit(limit)
 
-        # As we changed the transaction object we need to
-        # restore it and update the session variable.
-        session_obj['command_obj'] = pickle.dumps(trans_obj, -1)
+            # As we changed the transaction object we need to
+            # restore it and update the session variable.
+            TransactionRegistry.checkpoint(
+                session, trans_id, session_obj, trans_obj)
         update_session_grid_transaction(trans_id, session_obj)
     else:
         status = False
@@ -1657,9 +1727,8 @@ def cancel_transaction(trans_id):
             info='DATAGRID_TRANSACTION_REQUIRED', status=404)
 
     # Fetch the object for the specified transaction id.
-    # Use pickle.loads function to get the command object
     session_obj = grid_data[str(trans_id)]
-    trans_obj = pickle.loads(session_obj['command_obj'])
+    trans_obj = TransactionRegistry.get(session, trans_id, session_obj)
 
     if trans_obj is not None and session_obj is not None:
 
@@ -1735,7 +1804,8 @@ def check_and_upgrade_to_qt(trans_id, connect):
     errmsg = None
 
     if 'gridData' in session and str(trans_id) in session['gridData']:
-        data = pickle.loads(session['gridData'][str(trans_id)]['command_obj'])
+        data = TransactionRegistry.get(
+            session, trans_id, session['gridData'][str(trans_id)])
         if data.object_type == 'table' or data.object_type == 'view' or\
                 data.object_type == 'mview':
             manager = get_driver(PG_DEFAULT_DRIVER).connection_manager(
@@ -1793,12 +1863,14 @@ def set_auto_commit(trans_id):
 
         res = None
 
-        # Call the set_auto_commit method of transaction object
-        trans_obj.set_auto_commit(auto_commit)
+        with TransactionRegistry.changing(session, trans_id):
+            # Call the set_auto_commit method of transaction object
+            trans_obj.set_auto_commit(auto_commit)
 
-        # As we changed the transaction object we need to
-        # restore it and update the session variable.
-        session_obj['command_obj'] = pickle.dumps(trans_obj, -1)
+            # As we changed the transaction object we need to
+            # restore it and update the session variable.
+            TransactionRegistry.checkpoint(
+                session, trans_id, session_obj, trans_obj)
         update_session_grid_transaction(trans_id, session_obj)
     else:
         status = False
@@ -1846,12 +1918,14 @@ def set_auto_rollback(trans_id):
 
         res = None
 
-        # Call the set_auto_rollback method of transaction object
-        trans_obj.set_auto_rollback(auto_rollback)
+        with TransactionRegistry.changing(session, trans_id):
+            # Call the set_auto_rollback method of transaction object
+            trans_obj.set_auto_rollback(auto_rollback)
 
-        # As we changed the transaction object we need to
-        # restore it and update the session variable.
-        session_obj['command_obj'] = pickle.dumps(trans_obj, -1)
+            # As we changed the transaction object we need to
+            # restore it and update the session variable.
+            TransactionRegistry.checkpoint(
+                session, trans_id, session_obj, trans_obj)
         update_session_grid_transaction(trans_id, session_obj)
     else:
         status = False
@@ -2095,25 +2169,44 @@ def start_query_download_tool(trans_id):
         )
 
     try:
+        csv_options = dict(
+            quote=blueprint.csv_quoting.get(),
+            quote_char=blueprint.csv_quote_char.get(),
+            field_separator=blueprint.csv_field_separator.get(),
+            replace_nulls_with=blueprint.replace_nulls_with.get()
+        )
 
-        # This returns generator of records.
-        status, gen, conn_obj = \
-            sync_conn.execute_on_server_as_csv(records=10)
+        status = False
+        if blueprint.csv_download_with_copy.get():
+            # This returns generator of the CSV output of COPY.
+            status, gen = sync_conn.execute_on_server_as_copy(**csv_options)
+            if status:
+                response = gen()
+            else:
+                current_app.logger.info(
+                    'Download using COPY not possible: {0}'.format(gen))
 
+        # Fallback to the records of the cursor.
         if not status:
-            return make_json_response(
-                data={
-                    'status': status, 'result': gen
-                }
-            )
+            # This returns generator of records.
+            status, gen, conn_obj = \
+                sync_conn.execute_on_server_as_csv(records=10)
+
+            if not status:
+                return make_json_response(
+                    data={
+                        'status': status, 'result': gen
+                    }
+                )
+            response = gen(
+                conn_obj, trans_obj,
+                cached_rows=ResultCache.iter_blocks(
+                    session, trans_id, sync_conn.async_query_id(),
+                    row_count=sync_conn.rows_affected()),
+                **csv_options)
 
         r = Response(
-            gen(conn_obj,
-                trans_obj,
-                quote=blueprint.csv_quoting.get(),
-                quote_char=blueprint.csv_quote_char.get(),
-                field_separator=blueprint.csv_field_separator.get(),
-                replace_nulls_with=blueprint.replace_nulls_with.get()),
+            response,
             mimetype='text/csv' if
             blueprint.csv_field_separator.get() == ','
             else 'text/plain'
@@ -2646,11 +2739,17 @@ def get_query_history(trans_id):
     Args:
         sid: server id
         did: database id
+
+    The query arguments 'search', 'before' and 'limit' filter the entries
+    whose query contains the search words, and page through the entries.
     """
 
     _, _, conn, trans_obj, _ = check_transaction_status(trans_id)
 
-    return QueryHistory.get(current_user.id, trans_obj.sid, conn.db)
+    return QueryHistory.get(current_user.id, trans_obj.sid, conn.db,
+                            search=request.args.get('search'),
+                            before=request.args.get('before', type=int),
+                            limit=request.args.get('limit', type=int))
 
 
 @blueprint.route(
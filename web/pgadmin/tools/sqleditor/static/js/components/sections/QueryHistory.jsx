@@ -21,7 +21,7 @@ import PlayArrowRoundedIcon from '@mui/icons-material/PlayArrowRounded';
 import AssessmentRoundedIcon from '@mui/icons-material/AssessmentRounded';
 import ExplicitRoundedIcon from '@mui/icons-material/ExplicitRounded';
 import { SaveDataIcon, CommitIcon, RollbackIcon, ViewDataIcon } from '../../../../../../static/js/components/ExternalIcon';
-import { InputSwitch } from '../../../../../../static/js/components/FormComponents';
+import { InputSwitch, InputText } from '../../../../../../static/js/components/FormComponents';
 import CodeMirror from '../../../../../../static/js/components/ReactCodeMirror';
 import { DefaultButton } from '../../../../../../static/js/components/Buttons';
 import { useDelayedCaller } from '../../../../../../static/js/custom_hooks';
@@ -89,9 +89,15 @@ const useStyles = makeStyles((theme)=>({
   },
   queryMargin: {
     marginTop: '12px',
-  }
+  },
+  searchBox: {
+    padding: '0 0.25rem 0.25rem',
+  },
 }));
 
+/* Number of the history entries fetched at a time */
+const HISTORY_PAGE_SIZE = 100;
+
 export const QuerySources = {
   EXECUTE: {
     ICON_CSS_CLASS: 'fa fa-play',
@@ -378,6 +384,11 @@ export function QueryHistory() {
   const [selectedItemKey, setSelectedItemKey] = React.useState(1);
   const [showInternal, setShowInternal] = React.useState(true);
   const [loaderText, setLoaderText] = React.useState('');
+  const [search, setSearch] = React.useState('');
+  /* The entry to fetch the next page of the history from, if any */
+  const [nextEntry, setNextEntry] = React.useState(null);
+  const searchRef = React.useRef('');
+  const fetchIdRef = React.useRef(0);
   const selectedEntry = qhu.current.getEntry(selectedItemKey);
   const layoutDocker = useContext(LayoutDockerContext);
   const listRef = React.useRef();
@@ -388,15 +399,26 @@ export function QueryHistory() {
     });
   }, []);
 
-  React.useEffect(async ()=>{
-    if(!queryToolConnCtx.connected) {
-      return;
-    }
+  const fetchHistory = async (before=null)=>{
+    const fetchId = ++fetchIdRef.current;
     setLoaderText(gettext('Fetching history...'));
     try {
       let {data: respData} = await queryToolCtx.api.get(url_for('sqleditor.get_query_history', {
         'trans_id': queryToolCtx.params.trans_id,
-      }));
+      }), {
+        params: {
+          limit: HISTORY_PAGE_SIZE,
+          ...(before == null ? {} : {before: before}),
+          ...(searchRef.current.trim() ? {search: searchRef.current} : {}),
+        }
+      });
+      /* Ignore the response if the history was fetched again since */
+      if(fetchId != fetchIdRef.current) {
+        return;
+      }
+      if(before == null) {
+        qhu.current.clear();
+      }
       respData.data.result.forEach((h)=>{
         try {
           h = JSON.parse(h);
@@ -408,12 +430,36 @@ export function QueryHistory() {
           return;
         }
       });
-      setSelectedItemKey(qhu.current.getNextItemKey());
+      setNextEntry(respData.data.next);
+      if(before == null) {
+        setSelectedItemKey(qhu.current.getNextItemKey());
+      } else {
+        setSelectedItemKey((key)=>key ?? qhu.current.getNextItemKey());
+      }
     } catch (error) {
       console.error(error);
       pgAdmin.Browser.notifier.error(gettext('Failed to fetch query history.') + parseApiError(error));
     }
-    setLoaderText('');
+    if(fetchId == fetchIdRef.current) {
+      setLoaderText('');
+    }
+  };
+
+  /* Search the history once the user stops typing */
+  const searchHistory = React.useMemo(()=>_.debounce(()=>fetchHistory(), 500), []);
+  React.useEffect(()=>()=>searchHistory.cancel(), []);
+
+  const onSearchChange = (value)=>{
+    setSearch(value);
+    searchRef.current = value;
+    searchHistory();
+  };
+
+  React.useEffect(async ()=>{
+    if(!queryToolConnCtx.connected) {
+      return;
+    }
+    await fetchHistory();
 
     const pushHistory = (h)=>{
       // Do not store query text if max lenght exceeds.
@@ -423,6 +469,10 @@ export function QueryHistory() {
           query: gettext(`-- Query text not stored as it exceeds maximum length of ${MAX_QUERY_LENGTH}`)
         };
       }
+      /* The new queries are fetched with the search results if searching */
+      if(searchRef.current.trim()) {
+        return;
+      }
       qhu.current.addEntry(h);
     };
 
@@ -461,6 +511,7 @@ export function QueryHistory() {
             'trans_id': queryToolCtx.params.trans_id,
           }));
           qhu.current.clear();
+          setNextEntry(null);
           setSelectedItemKey(null);
         } catch (error) {
           console.error(error);
@@ -490,7 +541,7 @@ export function QueryHistory() {
       <Loader message={loaderText} />
       {React.useMemo(()=>(
         <Box display="flex" height="100%">
-          {qhu.current.size() == 0 ?
+          {qhu.current.size() == 0 && !search ?
             <EmptyPanelMessage text={gettext('No history found')} />:
             <>
               <Box flexBasis="50%" maxWidth="50%" className={classes.leftRoot}>
@@ -509,7 +560,12 @@ export function QueryHistory() {
                       className={classes.removeBtnMargin} onClick={onRemoveAll}>{gettext('Remove All')}</DefaultButton>
                   </Box>
                 </Box>
+                <Box className={classes.searchBox}>
+                  <InputText size="small" value={search} placeholder={gettext('Search queries')}
+                    onChange={onSearchChange} />
+                </Box>
                 <Box flexGrow="1" overflow="auto" className={classes.listRoot}>
+                  {qhu.current.size() == 0 && <Box padding="0.5rem">{gettext('No history found')}</Box>}
                   <List ref={listRef} className={classes.root} subheader={<li />} tabIndex="0" onKeyDown={onKeyPressed}>
                     {qhu.current.getGroups().map(([groupKey, groupHeader]) => (
                       <ListItem key={`section-${groupKey}`} className={classes.removePadding}>
@@ -523,6 +579,9 @@ export function QueryHistory() {
                       </ListItem>
                     ))}
                   </List>
+                  {nextEntry != null && <Box padding="0.25rem" textAlign="center">
+                    <DefaultButton size="small" onClick={()=>fetchHistory(nextEntry)}>{gettext('Load more')}</DefaultButton>
+                  </Box>}
                 </Box>
               </Box>
               <Box flexBasis="50%" maxWidth="50%" overflow="auto">
@@ -530,7 +589,7 @@ export function QueryHistory() {
               </Box>
             </>}
         </Box>
-      ), [selectedItemKey, showInternal, qhu.current.size()])}
+      ), [selectedItemKey, showInternal, qhu.current.size(), search, nextEntry])}
     </>
   );
 }
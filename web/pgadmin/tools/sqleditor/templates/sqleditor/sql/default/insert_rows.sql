@@ -0,0 +1,10 @@
+{# Insert the new rows, the parameters of the n-th row are suffixed with __n #}
+INSERT INTO {{ conn|qtIdent(nsp_name, object_name) | replace("%", "%%") }} (
+{% for col in data_to_be_saved %}
+{% if not loop.first %}, {% endif %}{{ conn|qtIdent(col) | replace("%", "%%") }}{% endfor %}
+) VALUES
+{% for row in range(rows_count) %}
+{% if not loop.first %}, {% endif %}({% for col in data_to_be_saved %}{% if not loop.first %}, {% endif %}{% if data_to_be_saved[col] == 'set_default' and use_default %} DEFAULT {% else %}%({{ pgadmin_alias[col] }}__{{ row }})s{% if type_cast_required[col] %}::{{ data_type[col] }}{% endif %}{% endif %}{% endfor %}){% endfor %}
+
+{% if pk_names and not has_oids %} returning {{pk_names | replace("%", "%%")}}{% endif %}
+{% if has_oids %} returning oid{% endif %};
@@ -0,0 +1,12 @@
+{# Select the table rows having any of the given keys, the parameters of the n-th key are suffixed with __n #}
+SELECT {% if has_oids %}oid, {% endif %}* FROM {{ conn|qtIdent(nsp_name, object_name) | replace("%", "%%") }}
+WHERE
+{% if has_oids %}
+  oid IN ({% for row in range(rows_count) %}{% if not loop.first %}, {% endif %}%(oid__{{ row }})s{% endfor %})
+{% elif primary_keys|length > 0 %}
+  ({% for pk in primary_keys %}{% if not loop.first %}, {% endif %}{{ conn|qtIdent(pk) | replace("%", "%%") }}{% endfor %}) IN (
+{% for row in range(rows_count) %}
+{% if not loop.first %}, {% endif %}({% for pk in primary_keys %}{% if not loop.first %}, {% endif %}%({{ pgadmin_alias[pk] }}__{{ row }})s{% endfor %}){% endfor %}
+
+  )
+{% endif %};
@@ -48,6 +48,31 @@ class TestEditorHistory(BaseTestGenerator):
              clear=False,
              expected_len=2
          )),
+        ('When searched',
+         dict(
+             entry=json.dumps({
+                 'query': 'SELECT * FROM pg_class',
+                 'start_time': '2018-04-03T14:03:15.99Z',
+                 'status': True,
+                 'total_time': '14 msec',
+             }),
+             params={'search': 'pg_cla'},
+             clear=False,
+             expected_len=1
+         )),
+        ('When fetched by page',
+         dict(
+             entry=json.dumps({
+                 'query': 'SELECT 1',
+                 'start_time': '2018-04-03T14:04:15.99Z',
+                 'status': True,
+                 'total_time': '1 msec',
+             }),
+             params={'limit': 3},
+             clear=False,
+             expected_len=3,
+             expected_next=True
+         )),
         ('When cleared',
          dict(
              clear=True,
@@ -84,12 +109,15 @@ class TestEditorHistory(BaseTestGenerator):
             response = self.tester.post(url, data=self.entry)
             self.assertEqual(response.status_code, 200)
 
-            response = self.tester.get(url)
+            response = self.tester.get(
+                url, query_string=getattr(self, 'params', None))
             self.assertEqual(response.status_code, 200)
 
             response_data = json.loads(response.data.decode('utf-8'))
             self.assertEqual(len(response_data['data']['result']),
                              self.expected_len)
+            self.assertEqual(response_data['data']['next'] is not None,
+                             getattr(self, 'expected_next', False))
         else:
             response = self.tester.delete(url)
             self.assertEqual(response.status_code, 200)
@@ -8,13 +8,14 @@
 ##########################################################################
 
 """Code to handle data sorting in view data mode."""
-import pickle
 import json
 from flask_babel import gettext
-from flask import current_app
+from flask import current_app, session
 from pgadmin.utils.ajax import make_json_response, internal_server_error
 from pgadmin.tools.sqleditor.utils.update_session_grid_transaction import \
     update_session_grid_transaction
+from pgadmin.tools.sqleditor.utils.transaction_registry import \
+    TransactionRegistry
 from pgadmin.utils.exception import ConnectionLost, SSHTunnelConnectionLost
 from pgadmin.utils.constants import ERROR_MSG_TRANS_ID_NOT_FOUND
 
@@ -87,12 +88,19 @@ class FilterDialog():
 
         if status and conn is not None and \
            trans_obj is not None and session_obj is not None:
-            trans_obj.set_data_sorting(data, True)
-            status, res = trans_obj.set_filter(data.get('sql'))
+            with TransactionRegistry.changing(session, trans_id):
+                trans_obj.set_data_sorting(data, True)
+                status, res = trans_obj.set_filter(data.get('sql'))
+                if status:
+                    # As we changed the transaction object we need to
+                    # restore it and update the session variable.
+                    TransactionRegistry.checkpoint(
+                        session, trans_id, session_obj, trans_obj)
+                else:
+                    # Discard the partially updated live object, it will be
+                    # restored from the last checkpoint.
+                    TransactionRegistry.remove(session, trans_id)
             if status:
-                # As we changed the transaction object we need to
-                # restore it and update the session variable.
-                session_obj['command_obj'] = pickle.dumps(trans_obj, -1)
                 update_session_grid_transaction(trans_id, session_obj)
                 res = gettext('Data sorting object updated successfully')
         else:
@@ -0,0 +1,57 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2024, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""
+Base of the process local registries of the Query Tool/View Data
+transactions (see TransactionRegistry and ResultCache).
+"""
+
+import time
+
+import config
+
+
+class IdleExpiringRegistry:
+    """
+    class IdleExpiringRegistry
+
+        Entries of the transactions of the current process, keyed by the
+        session id and the transaction id. The entries, which were not
+        accessed for longer than MAX_SESSION_IDLE_TIME (i.e. the session was
+        abandoned without closing the Query Tool), are removed.
+
+        Subclasses define their own _lock and _entries (key -> entry having
+        a last_access attribute), and override _drop(key) to release the
+        resources of an entry. _drop is called with the lock held.
+    """
+    _lock = None
+    _entries = None
+    _last_purge = time.time()
+    # Minimum interval between two purges, in seconds
+    PURGE_INTERVAL = 60
+
+    @staticmethod
+    def _key(http_session, trans_id):
+        return getattr(http_session, 'sid', None), str(trans_id)
+
+    @classmethod
+    def _drop(cls, key):
+        cls._entries.pop(key, None)
+
+    @classmethod
+    def _purge_idle(cls, now):
+        max_idle = max(config.MAX_SESSION_IDLE_TIME or 60, 20) * 60
+        if now - cls._last_purge < cls.PURGE_INTERVAL:
+            return
+
+        with cls._lock:
+            cls._last_purge = now
+            for key in [key for key, entry in cls._entries.items()
+                        if now - entry.last_access > max_idle]:
+                cls._drop(key)
@@ -1,32 +1,204 @@
+import json
+import threading
+import time
+from itertools import groupby
+
+from flask import current_app
+from sqlalchemy import and_, text
+
 from pgadmin.utils.ajax import make_json_response
 from pgadmin.model import db, QueryHistoryModel
 from config import MAX_QUERY_HIST_STORED
-import json
+import config
+
+
+class QueryHistoryWriter:
+    """
+    class QueryHistoryWriter
+
+        Writes the query history entries saved by the requests from a
+        background thread, gathering the entries saved within
+        QUERY_HISTORY_WRITE_DELAY seconds in a single transaction.
+
+    Methods:
+    -------
+    * add(entry)
+      - Adds the entry (the column values of QueryHistoryModel, except the
+        serial number) to the entries to write.
+
+    * flush()
+      - Writes the entries added so far, e.g. before reading the history.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # Held while writing the entries
+        self._write_lock = threading.Lock()
+        self._entries = []
+        self._wakeup = threading.Event()
+        self._thread = None
+        self._app = None
+
+    def add(self, entry):
+        if not config.QUERY_HISTORY_WRITE_DELAY:
+            with self._write_lock:
+                self._write([entry])
+            return
+
+        with self._lock:
+            self._entries.append(entry)
+            if self._thread is None or not self._thread.is_alive():
+                self._app = current_app._get_current_object()
+                self._thread = threading.Thread(
+                    target=self._run, name='QueryHistoryWriter', daemon=True)
+                self._thread.start()
+        self._wakeup.set()
+
+    def flush(self):
+        with self._write_lock:
+            with self._lock:
+                entries, self._entries = self._entries, []
+            if entries:
+                self._write(entries)
+
+    def _run(self):
+        while True:
+            self._wakeup.wait()
+            time.sleep(config.QUERY_HISTORY_WRITE_DELAY)
+            self._wakeup.clear()
+            with self._app.app_context():
+                self.flush()
+
+    @staticmethod
+    def _write(entries):
+        def history_key(entry):
+            return entry['uid'], entry['sid'], entry['dbname']
+
+        try:
+            for (uid, sid, dbname), key_entries in groupby(
+                    sorted(entries, key=history_key), key=history_key):
+                key_entries = list(key_entries)
+                filters = [QueryHistoryModel.uid == uid,
+                           QueryHistoryModel.sid == sid,
+                           QueryHistoryModel.dbname == dbname]
+
+                max_srno = db.session \
+                    .query(db.func.max(QueryHistoryModel.srno)) \
+                    .filter(*filters) \
+                    .scalar() or 0
+
+                # last updated flag is used to recognise the last
+                # inserted record.
+                db.session.query(QueryHistoryModel) \
+                    .filter(QueryHistoryModel.last_updated_flag == 'Y',
+                            *filters) \
+                    .update({QueryHistoryModel.last_updated_flag: 'N'},
+                            synchronize_session=False)
+
+                for idx, entry in enumerate(key_entries, 1):
+                    db.session.add(QueryHistoryModel(
+                        srno=max_srno + idx,
+                        last_updated_flag='Y'
+                        if idx == len(key_entries) else 'N',
+                        **entry))
+
+                # Remove the oldest entries beyond the limit
+                db.session.query(QueryHistoryModel) \
+                    .filter(QueryHistoryModel.srno <=
+                            max_srno + len(key_entries) -
+                            MAX_QUERY_HIST_STORED,
+                            *filters) \
+                    .delete(synchronize_session=False)
+
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            # do not affect query execution if history saving fails
+
+
+history_writer = QueryHistoryWriter()
+
+# Database URL -> whether the full text index of the history exists
+_search_index = dict()
 
 
 class QueryHistory:
     @staticmethod
-    def get(uid, sid, dbname):
+    def get(uid, sid, dbname, search=None, before=None, limit=None):
+        """
+        Returns the history entries of the user/server/database, from the
+        most recent.
+
+        Args:
+            search: Words (or prefixes of words) the queries must contain
+            before: Return the entries before this one (the next entry
+                returned previously)
+            limit: Maximum number of entries to return
+        """
+        history_writer.flush()
 
-        result = db.session \
-            .query(QueryHistoryModel.query_info) \
-            .filter(QueryHistoryModel.uid == uid,
-                    QueryHistoryModel.sid == sid,
-                    QueryHistoryModel.dbname == dbname) \
-            .all()
+        filters = [QueryHistoryModel.uid == uid,
+                   QueryHistoryModel.sid == sid,
+                   QueryHistoryModel.dbname == dbname]
+        if before is not None:
+            filters.append(QueryHistoryModel.srno < before)
+        if search is not None and search.split():
+            filters.append(
+                QueryHistory.search_filter(uid, sid, dbname, search.split()))
 
-        result = [rec.query_info for rec in list(result)]
+        query = db.session \
+            .query(QueryHistoryModel.srno, QueryHistoryModel.query_info) \
+            .filter(*filters) \
+            .order_by(QueryHistoryModel.srno.desc())
+        if limit:
+            query = query.limit(limit + 1)
+
+        result = query.all()
+
+        next_srno = None
+        if limit and len(result) > limit:
+            result = result[:limit]
+            next_srno = result[-1].srno
 
         return make_json_response(
             data={
                 'status': True,
                 'msg': '',
-                'result': result
+                'result': [rec.query_info for rec in result],
+                'next': next_srno
             }
         )
 
+    @staticmethod
+    def search_filter(uid, sid, dbname, terms):
+        """
+        Returns the filter of the entries whose query contains all the
+        terms, using the full text index of the history if available.
+        """
+        url = str(db.engine.url)
+        if url not in _search_index:
+            _search_index[url] = db.inspect(db.engine).has_table(
+                'query_history_fts')
+
+        if not _search_index[url]:
+            return and_(*[
+                QueryHistoryModel.query_text.icontains(term, autoescape=True)
+                for term in terms
+            ])
+
+        match = ' '.join(
+            '"{0}"*'.format(term.replace('"', '""')) for term in terms)
+        return QueryHistoryModel.srno.in_(
+            text("SELECT srno FROM query_history_fts "
+                 "WHERE query_history_fts MATCH :match AND uid = :uid "
+                 "AND sid = :sid AND dbname = :dbname")
+            .bindparams(match=match, uid=uid, sid=sid, dbname=dbname)
+            .columns(srno=db.Integer)
+        )
+
     @staticmethod
     def update_history_dbname(uid, sid, old_dbname, new_dbname):
+        history_writer.flush()
         try:
             db.session \
                 .query(QueryHistoryModel) \
@@ -43,62 +215,23 @@ class QueryHistory:
     @staticmethod
     def save(uid, sid, dbname, request):
         try:
-            max_srno = db.session\
-                .query(db.func.max(QueryHistoryModel.srno)) \
-                .filter(QueryHistoryModel.uid == uid,
-                        QueryHistoryModel.sid == sid,
-                        QueryHistoryModel.dbname == dbname)\
-                .scalar()
-
-            # if no records present
-            if max_srno is None:
-                new_srno = 1
-            else:
-                new_srno = max_srno + 1
+            query_info = json.loads(request.data)
+        except Exception:
+            query_info = None
+        if not isinstance(query_info, dict):
+            query_info = {}
 
-                # last updated flag is used to recognise the last
-                # inserted/updated record.
-                # It is helpful to cycle the records
-                last_updated_rec = db.session.query(QueryHistoryModel) \
-                    .filter(QueryHistoryModel.uid == uid,
-                            QueryHistoryModel.sid == sid,
-                            QueryHistoryModel.dbname == dbname,
-                            QueryHistoryModel.last_updated_flag == 'Y') \
-                    .first()
-
-                # there should be a last updated record
-                # if not present start from sr no 1
-                if last_updated_rec is not None:
-                    last_updated_rec.last_updated_flag = 'N'
-
-                    # if max limit reached then recycle
-                    if new_srno > MAX_QUERY_HIST_STORED:
-                        new_srno = (
-                            last_updated_rec.srno % MAX_QUERY_HIST_STORED) + 1
-                else:
-                    new_srno = 1
-
-                # if the limit is lowered and number of records present is
-                # more, then cleanup
-                if max_srno > MAX_QUERY_HIST_STORED:
-                    db.session.query(QueryHistoryModel)\
-                        .filter(QueryHistoryModel.uid == uid,
-                                QueryHistoryModel.sid == sid,
-                                QueryHistoryModel.dbname == dbname,
-                                QueryHistoryModel.srno >
-                                MAX_QUERY_HIST_STORED)\
-                        .delete()
-
-            history_entry = QueryHistoryModel(
-                srno=new_srno, uid=uid, sid=sid, dbname=dbname,
-                query_info=request.data, last_updated_flag='Y')
-
-            db.session.merge(history_entry)
+        def text_value(name):
+            value = query_info.get(name)
+            return value if isinstance(value, str) else None
 
-            db.session.commit()
-        except Exception:
-            db.session.rollback()
-            # do not affect query execution if history saving fails
+        status = query_info.get('status')
+        history_writer.add(dict(
+            uid=uid, sid=sid, dbname=dbname, query_info=request.data,
+            start_time=text_value('start_time'),
+            total_time=text_value('total_time'),
+            status=status if isinstance(status, bool) else None,
+            query_text=text_value('query')))
 
         return make_json_response(
             data={
@@ -109,6 +242,7 @@ class QueryHistory:
 
     @staticmethod
     def clear_history(uid, sid, dbname=None, filter=None):
+        history_writer.flush()
         try:
             filters = [
                 QueryHistoryModel.uid == uid,
@@ -116,17 +250,14 @@ class QueryHistory:
             ]
             if dbname is not None:
                 filters.append(QueryHistoryModel.dbname == dbname)
-
-            history = db.session.query(QueryHistoryModel) \
-                .filter(*filters)
             if filter is not None:
-                for row in history:
-                    query_info = json.loads(row.query_info.decode())
-                    if query_info['query'] == filter['query'] and \
-                            query_info['start_time'] == filter['start_time']:
-                        db.session.delete(row)
-            else:
-                history.delete()
+                filters.append(
+                    QueryHistoryModel.start_time == filter['start_time'])
+                filters.append(QueryHistoryModel.query_text == filter['query'])
+
+            db.session.query(QueryHistoryModel) \
+                .filter(*filters) \
+                .delete(synchronize_session=False)
 
             db.session.commit()
         except Exception:
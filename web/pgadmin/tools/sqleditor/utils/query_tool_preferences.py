@@ -246,6 +246,20 @@ def register_query_tool_preferences(self):
         allow_blanks=True
     )
 
+    self.csv_download_with_copy = self.preference.register(
+        'CSV_output', 'csv_download_with_copy',
+        gettext("Use COPY to download results?"), 'boolean', False,
+        category_label=PREF_LABEL_CSV_TXT,
+        help_str=gettext('If set to True, a single SELECT query is executed '
+                         'again, wrapped in COPY ... TO STDOUT, to let the '
+                         'server generate the CSV output, which is much '
+                         'faster for large results. The values are written '
+                         'in their PostgreSQL text representation. Other '
+                         'queries, queries run inside a transaction and '
+                         'the quoting set to None use the regular '
+                         'download.')
+    )
+
     self.results_grid_quoting = self.preference.register(
         'Results_grid', 'results_grid_quoting',
         gettext("Result copy quoting"), 'options', 'strings',
@@ -0,0 +1,323 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2024, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""
+Process local cache of the rows fetched for the Query Tool/View Data
+transactions.
+
+The grid fetches the rows of the result page by page (poll/fetch). Fetching
+all the rows from the start (select all, copy) and the download used to
+scroll the cursor back to the first row, and convert all the rows fetched
+earlier once again.
+
+The cache keeps the rows fetched so far for every transaction, in the order
+of the result set, so that these re-reads are served locally. Only the rows
+beyond the cached ones are fetched from the cursor.
+
+The rows are stored as pickled blocks (one block per fetch). The blocks of
+all the transactions are kept in memory up to QUERY_TOOL_RESULT_CACHE_MEMORY
+bytes, beyond that the least recently used transactions are evicted. If
+QUERY_TOOL_RESULT_CACHE_DISK is set, their blocks are spilled to a temporary
+file (unencrypted) instead, and they are evicted once the spilled blocks
+exceed QUERY_TOOL_RESULT_CACHE_DISK bytes.
+
+A cached result is identified by the id of the query (of the connection) it
+belongs to, so that running a new query in the transaction invalidates it.
+"""
+
+import pickle
+import tempfile
+import time
+from collections import OrderedDict
+from threading import Lock
+
+import config
+from pgadmin.tools.sqleditor.utils.idle_registry import IdleExpiringRegistry
+
+
+class _CachedResult:
+    """
+    Rows of a result set, from the first row onwards, stored in blocks of
+    [row count, data (None when spilled), offset in spill file, length].
+    """
+
+    def __init__(self, query_id):
+        self.query_id = query_id
+        self.row_count = 0
+        self.complete = False
+        self.blocks = []
+        self.memory_bytes = 0
+        self.disk_bytes = 0
+        self.spill_file = None
+        self.last_access = time.time()
+
+    def append(self, rows):
+        data = pickle.dumps(rows, pickle.HIGHEST_PROTOCOL)
+        self.blocks.append([len(rows), data, 0, len(data)])
+        self.row_count += len(rows)
+        self.memory_bytes += len(data)
+        return len(data)
+
+    def spill(self):
+        """
+        Move the blocks kept in memory to the spill file, which is not
+        encrypted.
+
+        Returns: number of bytes moved.
+        """
+        if self.spill_file is None:
+            self.spill_file = tempfile.TemporaryFile(prefix='pgadmin_rs_')
+
+        self.spill_file.seek(0, 2)
+        moved = 0
+        for block in self.blocks:
+            if block[1] is None:
+                continue
+            block[2] = self.spill_file.tell()
+            self.spill_file.write(block[1])
+            block[1] = None
+            moved += block[3]
+
+        self.memory_bytes -= moved
+        self.disk_bytes += moved
+        return moved
+
+    def read(self, block):
+        if block[1] is not None:
+            return pickle.loads(block[1])
+        self.spill_file.seek(block[2])
+        return pickle.loads(self.spill_file.read(block[3]))
+
+    def close(self):
+        if self.spill_file is not None:
+            self.spill_file.close()
+            self.spill_file = None
+
+
+class ResultCache(IdleExpiringRegistry):
+    """
+    class ResultCache
+
+        Caches the rows fetched for the transactions of the current process.
+
+    Class-level Methods:
+    ----------- -------
+    * store(http_session, trans_id, query_id, start, rows, complete)
+      - Adds the rows fetched from the given position of the result.
+
+    * get(http_session, trans_id, query_id, limit)
+      - Returns the cached rows from the start of the result.
+
+    * iter_blocks(http_session, trans_id, query_id, row_count)
+      - Generates the cached rows from the start of the result, block by
+        block.
+
+    * count_misses(count)
+      - Records the rows, which had to be fetched from the cursor again.
+
+    * remove(http_session, trans_id)
+      - Removes the cached rows of the transaction.
+
+    * stats()
+      - Returns the cache usage, and the hit ratio of the re-reads.
+
+    The results of the Query Tools left open are removed once idle.
+    """
+    _lock = Lock()
+    # Least recently used first
+    _entries = OrderedDict()
+    _memory_bytes = 0
+    _disk_bytes = 0
+    _hits = 0
+    _misses = 0
+
+    @staticmethod
+    def enabled():
+        return (getattr(config, 'QUERY_TOOL_RESULT_CACHE_MEMORY', 0) or 0) > 0
+
+    @classmethod
+    def store(cls, http_session, trans_id, query_id, start, rows,
+              complete=False):
+        """
+        Adds the rows fetched from the given (0 based) position of the
+        result set. The rows already cached are skipped, and the rows which
+        would leave a gap in the cache are ignored.
+
+        Args:
+            http_session: Flask session
+            trans_id: Transaction id
+            query_id: Id of the query, the result belongs to
+            start: Position of the first row
+            rows: List of the rows fetched
+            complete: True, if there are no more rows after these rows
+        """
+        if not cls.enabled() or query_id is None:
+            return
+
+        key = cls._key(http_session, trans_id)
+        rows = rows or []
+        now = time.time()
+
+        with cls._lock:
+            result = cls._entries.get(key)
+            if result is not None and result.query_id != query_id:
+                cls._drop(key)
+                result = None
+
+            if result is None:
+                if start != 0:
+                    return
+                result = _CachedResult(query_id)
+                cls._entries[key] = result
+
+            cls._entries.move_to_end(key)
+            result.last_access = now
+
+            if start > result.row_count:
+                return
+
+            new_rows = rows[result.row_count - start:]
+            if new_rows:
+                cls._memory_bytes += result.append(new_rows)
+            if complete and start + len(rows) >= result.row_count:
+                result.complete = True
+
+            cls._enforce_limits()
+
+        cls._purge_idle(now)
+
+    @classmethod
+    def get(cls, http_session, trans_id, query_id, limit=-1):
+        """
+        Returns the cached rows from the start of the result set.
+
+        Args:
+            http_session: Flask session
+            trans_id: Transaction id
+            query_id: Id of the query, the result belongs to
+            limit: Maximum number of rows, -1 for all
+
+        Returns: (rows, covered) - covered is True when the rows returned
+            are all the requested rows, otherwise the remaining rows must
+            be fetched from the cursor, starting at len(rows).
+        """
+        rows = []
+        for block in cls.iter_blocks(http_session, trans_id, query_id):
+            rows.extend(block)
+            if limit != -1 and len(rows) >= limit:
+                break
+
+        with cls._lock:
+            result = cls._entries.get(cls._key(http_session, trans_id))
+            complete = result is not None and \
+                result.query_id == query_id and result.complete and \
+                len(rows) == result.row_count
+
+        if limit != -1 and len(rows) > limit:
+            rows = rows[:limit]
+
+        return rows, complete or (limit != -1 and len(rows) >= limit)
+
+    @classmethod
+    def iter_blocks(cls, http_session, trans_id, query_id, row_count=None):
+        """
+        Generates the cached rows from the start of the result set, block by
+        block. Stops early, if the result is evicted in the meantime.
+
+        Args:
+            http_session: Flask session
+            trans_id: Transaction id
+            query_id: Id of the query, the result belongs to
+            row_count: Total rows in the result, if given the rows not
+                served from the cache are counted as misses.
+        """
+        # The key is evaluated right away, as the generator may be consumed
+        # outside of the request context (i.e. streamed response).
+        return cls._iter_blocks(
+            cls._key(http_session, trans_id), query_id, row_count)
+
+    @classmethod
+    def _iter_blocks(cls, key, query_id, row_count):
+        idx = 0
+        served = 0
+        while cls.enabled():
+            with cls._lock:
+                result = cls._entries.get(key)
+                if result is None or result.query_id != query_id or \
+                        idx >= len(result.blocks):
+                    break
+                cls._entries.move_to_end(key)
+                result.last_access = time.time()
+                rows = result.read(result.blocks[idx])
+                cls._hits += len(rows)
+            idx += 1
+            served += len(rows)
+            yield rows
+
+        if row_count is not None and row_count > served:
+            cls.count_misses(row_count - served)
+
+    @classmethod
+    def count_misses(cls, count):
+        with cls._lock:
+            cls._misses += count
+
+    @classmethod
+    def remove(cls, http_session, trans_id):
+        with cls._lock:
+            cls._drop(cls._key(http_session, trans_id))
+
+    @classmethod
+    def stats(cls):
+        """
+        Returns the cache usage, and the ratio of the rows re-read from the
+        cache (against the rows re-read from the cursor).
+        """
+        with cls._lock:
+            reads = cls._hits + cls._misses
+            return {
+                'results': len(cls._entries),
+                'memory_bytes': cls._memory_bytes,
+                'disk_bytes': cls._disk_bytes,
+                'hits': cls._hits,
+                'misses': cls._misses,
+                'hit_ratio': cls._hits / reads if reads else 0.0,
+            }
+
+    @classmethod
+    def _drop(cls, key):
+        result = cls._entries.pop(key, None)
+        if result is not None:
+            cls._memory_bytes -= result.memory_bytes
+            cls._disk_bytes -= result.disk_bytes
+            result.close()
+
+    @classmethod
+    def _enforce_limits(cls):
+        """
+        Spill the least recently used results to disk when above the memory
+        limit, and evict them when above the disk limit.
+        """
+        memory_limit = config.QUERY_TOOL_RESULT_CACHE_MEMORY
+        disk_limit = getattr(config, 'QUERY_TOOL_RESULT_CACHE_DISK', 0) or 0
+
+        for key in list(cls._entries.keys()):
+            if cls._memory_bytes <= memory_limit:
+                break
+            if disk_limit <= 0:
+                cls._drop(key)
+                continue
+            moved = cls._entries[key].spill()
+            cls._memory_bytes -= moved
+            cls._disk_bytes += moved
+
+        for key in list(cls._entries.keys()):
+            if cls._disk_bytes <= disk_limit:
+                break
+            cls._drop(key)
@@ -10,10 +10,14 @@
 from flask import render_template
 from collections import OrderedDict
 
+import config
 from pgadmin.tools.sqleditor.utils.constant_definition import TX_STATUS_IDLE
 
 ignore_type_cast_list = ['character', 'character[]', 'bit', 'bit[]']
 
+# Maximum number of parameters of a statement supported by PostgreSQL
+MAX_STATEMENT_PARAMS = 65535
+
 
 def save_changed_data(changed_data, columns_info, conn, command_obj,
                       client_primary_key, auto_commit=True):
@@ -41,6 +45,7 @@ def save_changed_data(changed_data, columns_info, conn, command_obj,
         col_name: col_info['pgadmin_alias']
         for col_name, col_info in columns_info.items()
     }
+    has_oids = command_obj.has_oids()
 
     is_savepoint = False
     # Start the transaction if the session is idle
@@ -104,6 +109,18 @@ def save_changed_data(changed_data, columns_info, conn, command_obj,
             column_data = {}
             pk_names, primary_keys = command_obj.get_primary_keys()
 
+            select_sql = render_template(
+                "/".join([command_obj.sql_path, 'select.sql']),
+                object_name=command_obj.object_name,
+                nsp_name=command_obj.nsp_name,
+                pgadmin_alias=pgadmin_alias,
+                primary_keys=primary_keys,
+                has_oids=has_oids
+            )
+            # The insert statement of the rows having the same columns, and
+            # its template arguments
+            insert_sqls = {}
+
             for each_row in added_index:
                 # Get the row index to match with the added rows
                 # dict key
@@ -114,7 +131,7 @@ def save_changed_data(changed_data, columns_info, conn, command_obj,
                 data.pop('is_row_copied', None)
 
                 # Remove oid col
-                if command_obj.has_oids():
+                if has_oids:
                     data.pop('oid', None)
 
                 # Update columns value with columns having
@@ -127,34 +144,34 @@ def save_changed_data(changed_data, columns_info, conn, command_obj,
                             column_data[each_col] = 'set_default'
                             use_default = True
 
-                sql = render_template(
-                    "/".join([command_obj.sql_path, 'insert.sql']),
-                    data_to_be_saved=column_data,
-                    pgadmin_alias=pgadmin_alias,
-                    primary_keys=None,
-                    object_name=command_obj.object_name,
-                    nsp_name=command_obj.nsp_name,
-                    data_type=column_type,
-                    pk_names=pk_names,
-                    has_oids=command_obj.has_oids(),
-                    type_cast_required=type_cast_required,
-                    use_default=use_default
-                )
-
-                select_sql = render_template(
-                    "/".join([command_obj.sql_path, 'select.sql']),
-                    object_name=command_obj.object_name,
-                    nsp_name=command_obj.nsp_name,
-                    pgadmin_alias=pgadmin_alias,
-                    primary_keys=primary_keys,
-                    has_oids=command_obj.has_oids()
-                )
+                columns = (tuple(column_data), use_default)
+                if columns not in insert_sqls:
+                    template_args = dict(
+                        data_to_be_saved=column_data,
+                        pgadmin_alias=pgadmin_alias,
+                        object_name=command_obj.object_name,
+                        nsp_name=command_obj.nsp_name,
+                        data_type=column_type,
+                        pk_names=pk_names,
+                        has_oids=has_oids,
+                        type_cast_required=type_cast_required,
+                        use_default=use_default
+                    )
+                    sql = render_template(
+                        "/".join([command_obj.sql_path, 'insert.sql']),
+                        primary_keys=None, **template_args
+                    )
+                    template_args['primary_keys'] = primary_keys
+                    insert_sqls[columns] = sql, template_args
 
+                sql, template_args = insert_sqls[columns]
                 list_of_sql[of_type].append({
                     'sql': sql, 'data': data,
                     'client_row': tmp_row_index,
                     'select_sql': select_sql,
-                    'row_id': data.get(client_primary_key)
+                    'row_id': data.get(client_primary_key),
+                    'columns': columns,
+                    'template_args': template_args
                 })
                 # Reset column data
                 column_data = {}
@@ -229,7 +246,7 @@ def save_changed_data(changed_data, columns_info, conn, command_obj,
             )
             list_of_sql[of_type].append({'sql': sql, 'data': {}})
 
-    def failure_handle(res, row_id):
+    def failure_handle(res, item):
         mogrified_sql = conn.mogrify(item['sql'], item['data'])
         mogrified_sql = mogrified_sql if mogrified_sql is not None \
             else item['sql']
@@ -260,15 +277,38 @@ def save_changed_data(changed_data, columns_info, conn, command_obj,
             if query['status']:
                 query['result'] = msg
 
-        return False, res, query_results, row_id
+        return False, res, query_results, item.get('row_id', 0)
 
     for opr, sqls in list_of_sql.items():
         for item in sqls:
-            if item['sql']:
-                item['data'] = {
-                    pgadmin_alias[k] if k in pgadmin_alias else k: v
-                    for k, v in item['data'].items()
-                }
+            item['data'] = {
+                pgadmin_alias[k] if k in pgadmin_alias else k: v
+                for k, v in item['data'].items()
+            }
+
+        if opr == 'added':
+            batches = get_added_rows_batches(
+                sqls, config.DATA_GRID_SAVE_BATCH_SIZE)
+        else:
+            batches = ([item] for item in sqls)
+
+        for batch in batches:
+            if len(batch) > 1:
+                try:
+                    status, res = save_added_rows(
+                        batch, conn, command_obj.sql_path, query_results)
+                except Exception:
+                    failure_handle(res, batch[0])
+                    raise
+
+                if status:
+                    continue
+                # Insert the rows of the batch one by one, to find the row
+                # in error.
+
+            for item in batch:
+                if not item['sql']:
+                    continue
 
                 row_added = None
 
@@ -281,11 +321,11 @@ def save_changed_data(changed_data, columns_info, conn, command_obj,
                         status, res = conn.execute_void(
                             item['sql'], item['data'])
                 except Exception:
-                    failure_handle(res, item.get('row_id', 0))
+                    failure_handle(res, item)
                     raise
 
                 if not status:
-                    return failure_handle(res, item.get('row_id', 0))
+                    return failure_handle(res, item)
 
                 # Select added row from the table
                 if 'select_sql' in item:
@@ -297,7 +337,7 @@ def save_changed_data(changed_data, columns_info, conn, command_obj,
                         item['select_sql'], params)
 
                     if not status:
-                        return failure_handle(sel_res, item.get('row_id', 0))
+                        return failure_handle(sel_res, item)
 
                     if 'rows' in sel_res and len(sel_res['rows']) > 0:
                         row_added = {
@@ -326,6 +366,102 @@ def save_changed_data(changed_data, columns_info, conn, command_obj,
     return status, res, query_results, _rowid
 
 
+def get_added_rows_batches(items, batch_size):
+    """
+    Returns the batches of the consecutive added rows having the same
+    columns, of up to batch_size rows and MAX_STATEMENT_PARAMS parameters.
+    """
+    batch = []
+    max_rows = batch_size
+    for item in items:
+        if batch and (item['columns'] != batch[0]['columns'] or
+                      len(batch) >= max_rows):
+            yield batch
+            batch = []
+
+        if not batch:
+            max_rows = min(batch_size, max(
+                MAX_STATEMENT_PARAMS // max(len(item['data']), 1), 1))
+        batch.append(item)
+
+    if batch:
+        yield batch
+
+
+def save_added_rows(batch, conn, sql_path, query_results):
+    """
+    Inserts the added rows of the batch with a single statement, and
+    selects them back with another one. The result of every row is added
+    to query_results, as when the rows are inserted one by one.
+
+    Returns False (and the error) if the rows could not be inserted, the
+    changes of the batch are then rolled back.
+    """
+    template_args = batch[0]['template_args']
+    params = {}
+    for idx, item in enumerate(batch):
+        params.update(
+            ('{0}__{1}'.format(k, idx), v) for k, v in item['data'].items())
+
+    conn.execute_void('SAVEPOINT save_data_rows;')
+    status, res = conn.execute_dict(render_template(
+        "/".join([sql_path, 'insert_rows.sql']),
+        rows_count=len(batch), **template_args), params)
+    if status and len(res['rows']) != len(batch):
+        status = False
+
+    if status:
+        # Select the added rows from the table
+        pgadmin_alias = template_args['pgadmin_alias']
+        params = {}
+        for idx, row in enumerate(res['rows']):
+            params.update(
+                ('{0}__{1}'.format(pgadmin_alias.get(k, k), idx), v)
+                for k, v in row.items())
+
+        status, sel_res = conn.execute_dict(render_template(
+            "/".join([sql_path, 'select_rows.sql']),
+            rows_count=len(batch), **template_args), params)
+
+    if not status:
+        conn.execute_void('ROLLBACK TO SAVEPOINT save_data_rows;')
+        conn.execute_void('RELEASE SAVEPOINT save_data_rows;')
+        return False, res
+
+    conn.execute_void('RELEASE SAVEPOINT save_data_rows;')
+
+    # The rows are returned in the order of the values inserted
+    keys = list(res['rows'][0].keys())
+    rows_selected = {
+        _row_key(row[k] for k in keys): row for row in sel_res['rows']
+    }
+    for item, row in zip(batch, res['rows']):
+        row_selected = rows_selected.get(_row_key(row.values()))
+        row_added = {item['client_row']: row_selected} \
+            if row_selected is not None else None
+
+        mogrified_sql = conn.mogrify(item['sql'], item['data'])
+        mogrified_sql = mogrified_sql if mogrified_sql is not None \
+            else item['sql']
+        query_results.append({
+            'status': True,
+            'result': None if row_added else res,
+            'sql': mogrified_sql,
+            'rows_affected': 1 if row_added else 0,
+            'row_added': row_added
+        })
+
+    return True, res
+
+
+def _row_key(values):
+    # Array keys are returned as lists
+    return tuple(
+        _row_key(value) if isinstance(value, list) else value
+        for value in values
+    )
+
+
 def execute_void_wrapper(conn, sql, query_results):
     """
     Executes a sql query with no return and adds it to query_results
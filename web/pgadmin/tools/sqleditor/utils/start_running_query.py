@@ -9,7 +9,6 @@
 
 """Start executing the query in async mode."""
 
-import pickle
 import secrets
 from threading import Thread
 from flask import Response, current_app, copy_current_request_context
@@ -23,6 +22,8 @@ from pgadmin.tools.sqleditor.utils.constant_definition import TX_STATUS_IDLE, \
 from pgadmin.tools.sqleditor.utils.is_begin_required import is_begin_required
 from pgadmin.tools.sqleditor.utils.update_session_grid_transaction import \
     update_session_grid_transaction
+from pgadmin.tools.sqleditor.utils.transaction_registry import \
+    TransactionRegistry
 from pgadmin.utils.ajax import make_json_response, internal_server_error
 from pgadmin.utils.driver import get_driver
 from pgadmin.utils.exception import ConnectionLost, SSHTunnelConnectionLost,\
@@ -39,6 +40,7 @@ class StartRunningQuery:
         self.logger = logger
 
     def execute(self, sql, trans_id, http_session, connect=False):
+        self.http_session = http_session
         session_obj = StartRunningQuery.retrieve_session_information(
             http_session,
             trans_id
@@ -50,7 +52,8 @@ class StartRunningQuery:
         session_obj.pop('primary_keys', None)
         session_obj.pop('oids', None)
 
-        transaction_object = pickle.loads(session_obj['command_obj'])
+        transaction_object = TransactionRegistry.get(
+            http_session, trans_id, session_obj)
         can_edit = False
         can_filter = False
         notifies = None
@@ -58,8 +61,6 @@ class StartRunningQuery:
         status = -1
         result = None
         if transaction_object is not None and session_obj is not None:
-            # set fetched row count to 0 as we are executing query again.
-            transaction_object.update_fetched_row_cnt(0)
             self.__retrieve_connection_id(transaction_object)
 
             try:
@@ -90,13 +91,17 @@ class StartRunningQuery:
             effective_sql_statement = apply_explain_plan_wrapper_if_needed(
                 manager, sql)
 
-            self.__execute_query(
-                conn,
-                session_obj,
-                effective_sql_statement,
-                trans_id,
-                transaction_object
-            )
+            with TransactionRegistry.changing(http_session, trans_id):
+                # set fetched row count to 0 as we are executing query again.
+                transaction_object.update_fetched_row_cnt(0)
+
+                self.__execute_query(
+                    conn,
+                    session_obj,
+                    effective_sql_statement,
+                    trans_id,
+                    transaction_object
+                )
 
             can_edit = transaction_object.can_edit()
             can_filter = transaction_object.can_filter()
@@ -130,8 +135,8 @@ class StartRunningQuery:
         if hasattr(trans_obj, 'set_connection_id'):
             trans_obj.set_connection_id(self.connection_id)
 
-        StartRunningQuery.save_transaction_in_session(session_obj,
-                                                      trans_id, trans_obj)
+        StartRunningQuery.save_transaction_in_session(
+            session_obj, trans_id, trans_obj, self.http_session)
 
         # If auto commit is False and transaction status is Idle
         # then call is_begin_not_required() function to check BEGIN
@@ -169,8 +174,8 @@ class StartRunningQuery:
         _native_id = _thread.native_id if hasattr(_thread, 'native_id'
                                                   ) else _thread.ident
         trans_obj.set_thread_native_id(_native_id)
-        StartRunningQuery.save_transaction_in_session(session_obj,
-                                                      trans_id, trans_obj)
+        StartRunningQuery.save_transaction_in_session(
+            session_obj, trans_id, trans_obj, self.http_session)
 
     @staticmethod
     def is_begin_required_for_sql_query(trans_obj, conn, sql):
@@ -187,10 +192,12 @@ class StartRunningQuery:
         )
 
     @staticmethod
-    def save_transaction_in_session(session, transaction_id, transaction):
+    def save_transaction_in_session(session, transaction_id, transaction,
+                                    http_session=None):
         # As we changed the transaction object we need to
         # restore it and update the session variable.
-        session['command_obj'] = pickle.dumps(transaction, -1)
+        TransactionRegistry.checkpoint(
+            http_session, transaction_id, session, transaction)
         update_session_grid_transaction(transaction_id, session)
 
     @staticmethod
@@ -211,7 +218,6 @@ class StartRunningQuery:
                 status=404
             )
         # Fetch the object for the specified transaction id.
-        # Use pickle.loads function to get the command object
         return grid_data[str(transaction_id)]
 
 
@@ -0,0 +1,119 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2024, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+from unittest.mock import patch, MagicMock
+
+from pgadmin.tools.sqleditor.utils.result_cache import ResultCache
+from pgadmin.utils.route import BaseTestGenerator
+
+ROWS = [(idx, 'row {0}'.format(idx), None) for idx in range(300)]
+
+
+class ResultCacheTest(BaseTestGenerator):
+    """
+    Check that the rows fetched for a transaction are served from the cache,
+    spilled to the disk above the memory limit, and evicted above the disk
+    limit.
+    """
+
+    scenarios = [
+        ('Rows are served from memory',
+         dict(
+             memory_limit=1024 * 1024,
+             disk_limit=1024 * 1024,
+             expected_spilled=False,
+             expected_first_evicted=False,
+         )),
+        ('Least recently used rows are spilled to the disk',
+         dict(
+             memory_limit=2048,
+             disk_limit=1024 * 1024,
+             expected_spilled=True,
+             expected_first_evicted=False,
+         )),
+        ('Least recently used rows are evicted above the disk limit',
+         dict(
+             memory_limit=2048,
+             disk_limit=4096,
+             expected_spilled=True,
+             expected_first_evicted=True,
+         )),
+    ]
+
+    def runTest(self):
+        http_session = MagicMock(sid='test-session')
+
+        with patch('pgadmin.tools.sqleditor.utils.result_cache'
+                   '.config') as config_mock, \
+                patch.object(ResultCache, '_entries', type(
+                    ResultCache._entries)()), \
+                patch.object(ResultCache, '_memory_bytes', 0), \
+                patch.object(ResultCache, '_disk_bytes', 0), \
+                patch.object(ResultCache, '_hits', 0), \
+                patch.object(ResultCache, '_misses', 0):
+            config_mock.QUERY_TOOL_RESULT_CACHE_MEMORY = self.memory_limit
+            config_mock.QUERY_TOOL_RESULT_CACHE_DISK = self.disk_limit
+            config_mock.MAX_SESSION_IDLE_TIME = 60
+
+            # Two transactions, fetched page by page. The first one is the
+            # least recently used.
+            for trans_id in (1, 2):
+                for start in range(0, 200, 100):
+                    ResultCache.store(http_session, trans_id, 'q1', start,
+                                      ROWS[start:start + 100])
+
+            # Rows overlapping the cached rows, and rows leaving a gap
+            ResultCache.store(http_session, 2, 'q1', 150, ROWS[150:250])
+            ResultCache.store(http_session, 2, 'q1', 280, ROWS[280:])
+
+            stats = ResultCache.stats()
+            self.assertEqual(stats['disk_bytes'] > 0, self.expected_spilled)
+
+            rows, covered = ResultCache.get(http_session, 1, 'q1', -1)
+            if self.expected_first_evicted:
+                self.assertEqual(rows, [])
+            else:
+                self.assertEqual(rows, ROWS[:200])
+            self.assertFalse(covered)
+
+            rows, covered = ResultCache.get(http_session, 2, 'q1', 120)
+            self.assertEqual(rows, ROWS[:120])
+            self.assertTrue(covered)
+
+            # Rest of the rows fetched from the cursor, marked complete
+            ResultCache.count_misses(50)
+            ResultCache.store(http_session, 2, 'q1', 250, ROWS[250:],
+                              complete=True)
+            rows, covered = ResultCache.get(http_session, 2, 'q1', -1)
+            self.assertEqual(rows, ROWS)
+            self.assertTrue(covered)
+
+            # Blocks can be iterated while the result is cached, the rows
+            # not served are counted as misses
+            served = sum(len(block) for block in ResultCache.iter_blocks(
+                http_session, 2, 'q1', row_count=len(ROWS) + 10))
+            self.assertEqual(served, len(ROWS))
+
+            stats = ResultCache.stats()
+            self.assertEqual(stats['misses'], 60)
+            self.assertEqual(stats['hit_ratio'],
+                             stats['hits'] / (stats['hits'] + 60))
+
+            # A new query in the transaction invalidates the cached rows
+            ResultCache.store(http_session, 2, 'q2', 0, ROWS[:10])
+            rows, covered = ResultCache.get(http_session, 2, 'q1', -1)
+            self.assertEqual(rows, [])
+            self.assertFalse(covered)
+
+            ResultCache.remove(http_session, 1)
+            ResultCache.remove(http_session, 2)
+            stats = ResultCache.stats()
+            self.assertEqual(stats['results'], 0)
+            self.assertEqual(stats['memory_bytes'], 0)
+            self.assertEqual(stats['disk_bytes'], 0)
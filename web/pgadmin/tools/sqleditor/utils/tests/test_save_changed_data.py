@@ -408,6 +408,141 @@ class TestSaveChangedData(BaseTestGenerator):
                       "WHERE pk_col = 1 AND normal_col = 'four'",
             check_result='SELECT 0'
         )),
+        ('When inserting new valid rows', dict(
+            save_payload={
+                "updated": {},
+                "added": {
+                    "2": {
+                        "err": False,
+                        "data": {
+                            "pk_col": "3",
+                            "__temp_PK": "2",
+                            "normal_col": "three"
+                        }
+                    },
+                    "3": {
+                        "err": False,
+                        "data": {
+                            "pk_col": "4",
+                            "__temp_PK": "3",
+                            "normal_col": "four"
+                        }
+                    },
+                    "4": {
+                        "err": False,
+                        "data": {
+                            "pk_col": "5",
+                            "__temp_PK": "4",
+                            "normal_col": "five"
+                        }
+                    }
+                },
+                "staged_rows": {},
+                "deleted": {},
+                "updated_index": {},
+                "added_index": {"2": "2", "3": "3", "4": "4"},
+                "columns": [
+                    {
+                        "name": "pk_col",
+                        "display_name": "pk_col",
+                        "column_type": "[PK] integer",
+                        "column_type_internal": "integer",
+                        "pos": 0,
+                        "label": "pk_col<br>[PK] integer",
+                        "cell": "number",
+                        "can_edit": True,
+                        "type": "integer",
+                        "not_null": True,
+                        "has_default_val": False,
+                        "is_array": False
+                    }, {
+                        "name": "normal_col",
+                        "display_name": "normal_col",
+                        "column_type": "character varying",
+                        "column_type_internal": "character varying",
+                        "pos": 1,
+                        "label": "normal_col<br>character varying",
+                        "cell": "string",
+                        "can_edit": True,
+                        "type": "character varying",
+                        "not_null": False,
+                        "has_default_val": False,
+                        "is_array": False
+                    }
+                ]
+            },
+            save_status=True,
+            check_sql='SELECT * FROM %s WHERE pk_col > 2 ORDER BY pk_col',
+            check_result=[[3, "three", None, None], [4, "four", None, None],
+                          [5, "five", None, None]]
+        )),
+        ('When inserting new rows with an invalid row', dict(
+            save_payload={
+                "updated": {},
+                "added": {
+                    "2": {
+                        "err": False,
+                        "data": {
+                            "pk_col": "3",
+                            "__temp_PK": "2",
+                            "normal_col": "three"
+                        }
+                    },
+                    "3": {
+                        "err": False,
+                        "data": {
+                            "pk_col": "1",
+                            "__temp_PK": "3",
+                            "normal_col": "one"
+                        }
+                    },
+                    "4": {
+                        "err": False,
+                        "data": {
+                            "pk_col": "4",
+                            "__temp_PK": "4",
+                            "normal_col": "four"
+                        }
+                    }
+                },
+                "staged_rows": {},
+                "deleted": {},
+                "updated_index": {},
+                "added_index": {"2": "2", "3": "3", "4": "4"},
+                "columns": [
+                    {
+                        "name": "pk_col",
+                        "display_name": "pk_col",
+                        "column_type": "[PK] integer",
+                        "column_type_internal": "integer",
+                        "pos": 0,
+                        "label": "pk_col<br>[PK] integer",
+                        "cell": "number",
+                        "can_edit": True,
+                        "type": "integer",
+                        "not_null": True,
+                        "has_default_val": False,
+                        "is_array": False
+                    }, {
+                        "name": "normal_col",
+                        "display_name": "normal_col",
+                        "column_type": "character varying",
+                        "column_type_internal": "character varying",
+                        "pos": 1,
+                        "label": "normal_col<br>character varying",
+                        "cell": "string",
+                        "can_edit": True,
+                        "type": "character varying",
+                        "not_null": False,
+                        "has_default_val": False,
+                        "is_array": False
+                    }
+                ]
+            },
+            save_status=False,
+            check_sql='SELECT * FROM %s WHERE pk_col > 2',
+            check_result='SELECT 0'
+        )),
         ('When updating a row in a valid way', dict(
             save_payload={
                 "updated": {
@@ -0,0 +1,106 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2024, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+from unittest.mock import patch, MagicMock
+
+from pgadmin.tools.sqleditor.utils.transaction_registry import \
+    TransactionRegistry
+from pgadmin.utils.route import BaseTestGenerator
+
+
+class TransactionObject:
+    def __init__(self):
+        self.fetched_row_cnt = 0
+
+
+class TransactionRegistryTest(BaseTestGenerator):
+    """
+    Check that the live transaction objects are kept in memory, restored
+    from the checkpoint in the session when required, and discarded when a
+    change fails before its checkpoint.
+    """
+
+    scenarios = [
+        ('When registry is enabled, the live object is used',
+         dict(
+             registry_enabled=True,
+             other_process_checkpoint=False,
+             failed_change=False,
+             expected_same_object=True,
+             expected_row_cnt=1000,
+         )),
+        ('When registry is disabled, the object is restored from the '
+         'session',
+         dict(
+             registry_enabled=False,
+             other_process_checkpoint=False,
+             failed_change=False,
+             expected_same_object=False,
+             expected_row_cnt=1000,
+         )),
+        ('When checkpoint is written by another process, the object is '
+         'restored from the session',
+         dict(
+             registry_enabled=True,
+             other_process_checkpoint=True,
+             failed_change=False,
+             expected_same_object=False,
+             expected_row_cnt=500,
+         )),
+        ('When a change fails, the object is restored from the session',
+         dict(
+             registry_enabled=True,
+             other_process_checkpoint=False,
+             failed_change=True,
+             expected_same_object=False,
+             expected_row_cnt=0,
+         )),
+    ]
+
+    def runTest(self):
+        http_session = MagicMock(sid='test-session')
+        trans_id = 1234
+        session_obj = dict()
+
+        with patch('pgadmin.tools.sqleditor.utils.transaction_registry'
+                   '.config') as config_mock:
+            config_mock.QUERY_TOOL_TRANSACTION_REGISTRY = \
+                self.registry_enabled
+            config_mock.MAX_SESSION_IDLE_TIME = 60
+
+            trans_obj = TransactionObject()
+            TransactionRegistry.checkpoint(
+                http_session, trans_id, session_obj, trans_obj)
+
+            if self.other_process_checkpoint:
+                other_obj = TransactionObject()
+                other_obj.fetched_row_cnt = 500
+                TransactionRegistry.checkpoint(
+                    MagicMock(sid='other-process'), trans_id, session_obj,
+                    other_obj)
+            else:
+                live_obj = TransactionRegistry.get(
+                    http_session, trans_id, session_obj)
+                try:
+                    with TransactionRegistry.changing(http_session,
+                                                      trans_id):
+                        live_obj.fetched_row_cnt = 1000
+                        if self.failed_change:
+                            raise ValueError('Failed')
+                        TransactionRegistry.checkpoint(
+                            http_session, trans_id, session_obj, live_obj)
+                except ValueError:
+                    self.assertTrue(self.failed_change)
+
+            live_obj = TransactionRegistry.get(
+                http_session, trans_id, session_obj)
+            self.assertEqual(live_obj is trans_obj, self.expected_same_object)
+            self.assertEqual(live_obj.fetched_row_cnt, self.expected_row_cnt)
+
+            TransactionRegistry.remove(http_session, trans_id)
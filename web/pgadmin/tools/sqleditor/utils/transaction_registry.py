@@ -0,0 +1,162 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2024, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""
+Process local registry of the live Query Tool/View Data transaction objects.
+
+The command objects (QueryToolCommand, TableCommand, ...) used to be
+unpickled from the session on every request of the Query Tool (poll, fetch,
+save, ...), only to read their state.
+
+The registry keeps the live objects in memory, keyed by the session id and
+the transaction id. The session only keeps a checkpoint of the object along
+with a small token identifying that checkpoint:
+
+    gridData[trans_id] = {
+        'command_obj': <pickled checkpoint>,
+        'command_obj_token': <token of the checkpoint>,
+        ...
+    }
+
+The checkpoint is written whenever the object is changed (filters, limit,
+auto commit, new query, fetched rows, ...), so that the object restored
+from the session is up to date. A change failing before its checkpoint
+discards the live object (see changing()), so that the next request does
+not use a partially changed object.
+
+When the registry has no object for the transaction, or the token in the
+session does not match the one of the live object (i.e. the checkpoint was
+written by another process), the object is restored from the checkpoint.
+That allows the registry to work with multiple worker processes too. As the
+database connections are also process local, such deployments should use
+sticky sessions anyway; if that is not possible, set
+QUERY_TOOL_TRANSACTION_REGISTRY to False to restore the object from the
+session on every request, as earlier.
+"""
+
+import pickle
+import secrets
+import time
+from contextlib import contextmanager
+from threading import Lock
+
+import config
+from pgadmin.tools.sqleditor.utils.idle_registry import IdleExpiringRegistry
+
+
+class _LiveObject:
+    __slots__ = ('obj', 'token', 'last_access')
+
+    def __init__(self, obj, token, last_access):
+        self.obj = obj
+        self.token = token
+        self.last_access = last_access
+
+
+class TransactionRegistry(IdleExpiringRegistry):
+    """
+    class TransactionRegistry
+
+        Holds the live transaction objects of the current process.
+
+    Class-level Methods:
+    ----------- -------
+    * get(http_session, trans_id, session_obj)
+      - Returns the live transaction object, restores it from the
+        checkpoint stored in the session object if not found.
+
+    * checkpoint(http_session, trans_id, session_obj, trans_obj)
+      - Updates the live transaction object and serialises it into the
+        session object.
+
+    * changing(http_session, trans_id)
+      - Context of a change of the live transaction object, which is
+        discarded if the change fails.
+
+    * remove(http_session, trans_id)
+      - Removes the live transaction object.
+
+    The objects of the abandoned sessions are removed, they can still be
+    restored from the checkpoint if required.
+    """
+    _lock = Lock()
+    _entries = dict()
+
+    @staticmethod
+    def enabled():
+        return getattr(config, 'QUERY_TOOL_TRANSACTION_REGISTRY', True)
+
+    @classmethod
+    def get(cls, http_session, trans_id, session_obj):
+        """
+        Returns the live transaction object for the given transaction.
+
+        Args:
+            http_session: Flask session
+            trans_id: Transaction id
+            session_obj: gridData entry of the transaction
+        """
+        token = session_obj.get('command_obj_token')
+        key = cls._key(http_session, trans_id)
+
+        with cls._lock:
+            entry = cls._entries.get(key)
+            if entry is not None and token is not None and \
+                    entry.token == token:
+                entry.last_access = time.time()
+                return entry.obj
+
+        # Not found, or the checkpoint has been written by someone else -
+        # restore it from the checkpoint.
+        trans_obj = pickle.loads(session_obj['command_obj'])
+        if cls.enabled() and token is not None:
+            cls._register(key, trans_obj, token)
+        return trans_obj
+
+    @classmethod
+    def checkpoint(cls, http_session, trans_id, session_obj, trans_obj):
+        """
+        Serialises the transaction object into the session object, and
+        updates the live transaction object. Caller must store the session
+        object in the session.
+        """
+        token = secrets.token_hex(8)
+        # -1 specify the highest protocol version available
+        session_obj['command_obj'] = pickle.dumps(trans_obj, -1)
+        session_obj['command_obj_token'] = token
+
+        if cls.enabled():
+            cls._register(cls._key(http_session, trans_id), trans_obj, token)
+
+    @classmethod
+    @contextmanager
+    def changing(cls, http_session, trans_id):
+        """
+        Context of a change of the live transaction object, up to its
+        checkpoint. If the change fails, the partially changed object is
+        discarded, and restored from the last checkpoint on the next
+        request, as the object unpickled from the session used to be.
+        """
+        try:
+            yield
+        except Exception:
+            cls.remove(http_session, trans_id)
+            raise
+
+    @classmethod
+    def remove(cls, http_session, trans_id):
+        with cls._lock:
+            cls._drop(cls._key(http_session, trans_id))
+
+    @classmethod
+    def _register(cls, key, trans_obj, token):
+        now = time.time()
+        with cls._lock:
+            cls._entries[key] = _LiveObject(trans_obj, token, now)
+        cls._purge_idle(now)
@@ -29,6 +29,7 @@ from pgadmin.utils.validation_utils import validate_email
 from pgadmin.model import db, Role, User, UserPreference, Server, \
     ServerGroup, Process, Setting, roles_users, SharedServer
 from pgadmin.utils.paths import create_users_storage_directory
+from pgadmin.utils.preferences import Preferences
 
 # set template path for sql scripts
 MODULE_NAME = 'user_management'
@@ -610,6 +611,7 @@ def delete_user(uid):
         db.session.delete(usr)
 
         db.session.commit()
+        Preferences.invalidate_cache(uid)
     except Exception as e:
         return False, str(e)
 
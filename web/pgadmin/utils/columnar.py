@@ -0,0 +1,332 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2024, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""
+Compact columnar encoding of result sets.
+
+The Query Tool sends rows to the client as a JSON list of lists. For wide
+result sets the cost of serialising (and parsing) that JSON dominates the
+query time, so clients may opt in to a binary columnar frame by sending
+``Accept: application/vnd.pgadmin.columnar``. Clients that don't ask for it
+keep getting the regular JSON response.
+
+Frame layout (all integers are little-endian):
+
+    magic           4 bytes   b'PGAC'
+    version         uint8
+    envelope_len    uint32
+    envelope        JSON document, same shape as make_json_response() with
+                    the rows key of 'data' set to null
+    row_count       uint32
+    column_count    uint32
+    columns         column_count column blocks
+
+Each column block is:
+
+    type            uint8     one of COL_NULL, COL_BOOL, COL_INT64,
+                              COL_FLOAT64, COL_TEXT
+    validity        ceil(row_count / 8) bytes, bit set when value not null
+                    (absent for COL_NULL)
+    payload
+        COL_BOOL    ceil(row_count / 8) bytes bitmap of values
+        COL_INT64   row_count * int64
+        COL_FLOAT64 row_count * float64
+        COL_TEXT    row_count * uint32 byte lengths, then the UTF-8 data
+                    of all the values (sum of the lengths) back to back
+
+Values that are neither bool, int nor float are sent as text, using the
+same conversion the JSON response would have applied.
+"""
+
+import json
+import struct
+import sys
+from array import array
+from itertools import repeat
+from operator import is_not
+
+from flask import Response, request
+
+from pgadmin.utils.ajax import DataTypeJSONEncoder, get_no_cache_header
+from pgadmin.utils.constants import MIMETYPE_APP_COLUMNAR
+
+FRAME_MAGIC = b'PGAC'
+FRAME_VERSION = 1
+
+COL_NULL = 0
+COL_BOOL = 1
+COL_INT64 = 2
+COL_FLOAT64 = 3
+COL_TEXT = 4
+
+_HEADER = struct.Struct('<4sBI')
+_SHAPE = struct.Struct('<II')
+_BIG_ENDIAN = sys.byteorder == 'big'
+_NONE_TYPE = type(None)
+_json_encoder = DataTypeJSONEncoder(separators=(',', ':'))
+
+
+def client_accepts_columnar():
+    """
+    Check whether the client negotiated the columnar frame through the
+    Accept header of the current request. The frame must be listed
+    explicitly, the wildcards sent by default (e.g. */*) do not select it.
+    """
+    return any(
+        value.lower() == MIMETYPE_APP_COLUMNAR and quality > 0
+        for value, quality in request.accept_mimetypes
+    )
+
+
+def _pack_bitmap(flags):
+    """
+    Pack a sequence of booleans into a LSB-first bitmap.
+
+    The flags are turned into a byte string of 0/1 and every bit plane is
+    folded in using big integer arithmetic, which avoids a Python level loop
+    per value.
+    """
+    flags = bytes(map(bool, flags))
+    size = (len(flags) + 7) >> 3
+    bits = 0
+    for plane in range(8):
+        bits |= int.from_bytes(flags[plane::8], 'little') << plane
+    return bits.to_bytes(size, 'little')
+
+
+def _unpack_bitmap(buf, count):
+    bits = int.from_bytes(buf, 'little')
+    planes = [
+        ((bits >> plane) & _BYTE_LSB_MASKS[len(buf)]).to_bytes(
+            len(buf), 'little')
+        for plane in range(8)
+    ]
+    flags = bytearray(len(buf) * 8)
+    for plane in range(8):
+        flags[plane::8] = planes[plane]
+    return list(map(bool, flags[:count]))
+
+
+class _ByteMasks(dict):
+    """Lazily built integers having the lowest bit of every byte set."""
+    def __missing__(self, size):
+        mask = int.from_bytes(b'\x01' * size, 'little')
+        self[size] = mask
+        return mask
+
+
+_BYTE_LSB_MASKS = _ByteMasks()
+
+
+def _to_text(value):
+    if isinstance(value, str):
+        return value
+    if isinstance(value, (dict, list)):
+        return _json_encoder.encode(value)
+    value = _json_encoder.default(value)
+    return value if isinstance(value, str) else str(value)
+
+
+def _column_type(types):
+    """
+    Find the narrowest column type which can hold all the non-null values.
+
+    Args:
+        types: set of the python types of the non-null values.
+    """
+    if not types:
+        return COL_NULL
+    if len(types) > 1:
+        return COL_TEXT
+
+    col_type = next(iter(types))
+    if col_type is bool:
+        return COL_BOOL
+    if col_type is float:
+        return COL_FLOAT64
+    if col_type is int:
+        return COL_INT64
+    return COL_TEXT
+
+
+def _pack_numbers(typecode, values):
+    arr = array(typecode, values)
+    if _BIG_ENDIAN:
+        arr.byteswap()
+    return arr.tobytes()
+
+
+def _encode_text(values, types, has_nulls):
+    """Return the value lengths and the UTF-8 data of a text column."""
+    if types != {str}:
+        values = [None if v is None else _to_text(v) for v in values]
+    if has_nulls:
+        values = ['' if v is None else v for v in values]
+
+    data = ''.join(values)
+    if data.isascii():
+        # Character and byte lengths are the same, so encode in one go.
+        lengths = map(len, values)
+        data = data.encode('ascii')
+    else:
+        encoded = [v.encode('utf-8') for v in values]
+        lengths = map(len, encoded)
+        data = b''.join(encoded)
+    return _pack_numbers('I', lengths), data
+
+
+def _encode_values(col_type, values, types, has_nulls):
+    if col_type == COL_BOOL:
+        return [_pack_bitmap(values)]
+    if col_type == COL_INT64:
+        return [_pack_numbers(
+            'q', [0 if v is None else v for v in values]
+            if has_nulls else values)]
+    if col_type == COL_FLOAT64:
+        return [_pack_numbers(
+            'd', [0.0 if v is None else v for v in values]
+            if has_nulls else values)]
+    return list(_encode_text(values, types, has_nulls))
+
+
+def _encode_column(values):
+    types = set(map(type, values))
+    has_nulls = _NONE_TYPE in types
+    types.discard(_NONE_TYPE)
+
+    col_type = _column_type(types)
+    if col_type == COL_NULL:
+        return [struct.pack('<B', col_type)]
+
+    try:
+        payload = _encode_values(col_type, values, types, has_nulls)
+    except OverflowError:
+        # Integers beyond the int64 range are sent as text.
+        col_type = COL_TEXT
+        payload = _encode_values(col_type, values, types, has_nulls)
+
+    if has_nulls:
+        valid = _pack_bitmap(list(map(is_not, values, repeat(None))))
+    else:
+        valid = _pack_bitmap([True] * len(values))
+
+    return [struct.pack('<B', col_type), valid] + payload
+
+
+def encode_frame(envelope, rows):
+    """
+    Encode the envelope and the rows (list of tuples/lists) to a columnar
+    frame.
+
+    Args:
+        envelope: JSON serialisable dict sent along with the rows.
+        rows: list of rows, all rows must have the same number of columns.
+
+    Returns: bytes
+    """
+    rows = rows or []
+    envelope = _json_encoder.encode(envelope).encode('utf-8')
+    columns = list(zip(*rows))
+
+    chunks = [
+        _HEADER.pack(FRAME_MAGIC, FRAME_VERSION, len(envelope)),
+        envelope,
+        _SHAPE.pack(len(rows), len(columns))
+    ]
+    for values in columns:
+        chunks.extend(_encode_column(values))
+    return b''.join(chunks)
+
+
+def _read_numbers(typecode, buf, offset, count):
+    arr = array(typecode)
+    end = offset + count * arr.itemsize
+    arr.frombytes(buf[offset:end])
+    if _BIG_ENDIAN:
+        arr.byteswap()
+    return arr.tolist(), end
+
+
+def decode_frame(buf):
+    """
+    Decode a columnar frame back to the envelope and list of rows.
+
+    This is the reference implementation of the layout for clients,
+    tests and benchmarks.
+
+    Returns: (envelope, rows)
+    """
+    magic, version, env_len = _HEADER.unpack_from(buf, 0)
+    if magic != FRAME_MAGIC or version != FRAME_VERSION:
+        raise ValueError('Invalid columnar frame.')
+
+    offset = _HEADER.size
+    envelope = json.loads(buf[offset:offset + env_len].decode('utf-8'))
+    offset += env_len
+
+    row_count, col_count = _SHAPE.unpack_from(buf, offset)
+    offset += _SHAPE.size
+    bitmap_len = (row_count + 7) >> 3
+
+    columns = []
+    for _ in range(col_count):
+        col_type = buf[offset]
+        offset += 1
+        if col_type == COL_NULL:
+            columns.append([None] * row_count)
+            continue
+
+        valid = _unpack_bitmap(buf[offset:offset + bitmap_len], row_count)
+        offset += bitmap_len
+
+        if col_type == COL_BOOL:
+            values = _unpack_bitmap(buf[offset:offset + bitmap_len],
+                                    row_count)
+            offset += bitmap_len
+        elif col_type == COL_INT64:
+            values, offset = _read_numbers('q', buf, offset, row_count)
+        elif col_type == COL_FLOAT64:
+            values, offset = _read_numbers('d', buf, offset, row_count)
+        elif col_type == COL_TEXT:
+            lengths, offset = _read_numbers('I', buf, offset, row_count)
+            values = []
+            for length in lengths:
+                values.append(buf[offset:offset + length].decode('utf-8'))
+                offset += length
+        else:
+            raise ValueError('Invalid column type {0}.'.format(col_type))
+
+        columns.append([v if ok else None for v, ok in zip(values, valid)])
+
+    return envelope, [list(row) for row in zip(*columns)]
+
+
+def make_columnar_response(data, rows_key='result', status=200):
+    """
+    Create a response carrying the rows of data[rows_key] as a columnar
+    frame. The rest of the data is sent in the envelope exactly as
+    make_json_response() would have sent it.
+    """
+    data = dict(data)
+    rows = data.get(rows_key)
+    data[rows_key] = None
+
+    envelope = {
+        'success': 1, 'errormsg': '', 'info': '', 'result': None,
+        'data': data
+    }
+    headers = get_no_cache_header()
+    headers['Vary'] = 'Accept'
+
+    return Response(
+        response=encode_frame(envelope, rows),
+        status=status,
+        mimetype=MIMETYPE_APP_COLUMNAR,
+        headers=headers
+    )
@@ -14,6 +14,7 @@ from flask_babel import gettext
 MIMETYPE_APP_HTML = 'text/html'
 MIMETYPE_APP_JS = 'application/javascript'
 MIMETYPE_APP_JSON = 'application/json'
+MIMETYPE_APP_COLUMNAR = 'application/vnd.pgadmin.columnar'
 
 # Preference labels
 PREF_LABEL_KEYBOARD_SHORTCUTS = gettext('Keyboard shortcuts')
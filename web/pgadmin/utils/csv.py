@@ -56,12 +56,15 @@ Agreement.
 # Handle the null value if value is None or equal to
 # 'replace_nulls_with' then it represents the null value, so no need to
 # quote it.
+# Added BatchWriter to write the batches of row tuples column wise, with the
+# same output as Writer.
 ############################################################################
 
 __all__ = ["QUOTE_MINIMAL", "QUOTE_ALL", "QUOTE_NONNUMERIC", "QUOTE_NONE",
            "Error", "Dialect", "__doc__", "Excel", "ExcelTab",
-           "field_size_limit", "Reader", "Writer", "register_dialect",
-           "get_dialect", "list_dialects", "unregister_dialect",
+           "field_size_limit", "Reader", "Writer", "BatchWriter",
+           "register_dialect", "get_dialect", "list_dialects",
+           "unregister_dialect",
            "__version__", "DictReader", "DictWriter"]
 
 import re
@@ -253,6 +256,150 @@ class Writer():
             self.writerow(row)
 
 
+class BatchWriter():
+    """
+    Writes the batches of row tuples (as returned by cursor.fetchmany()),
+    producing exactly the same output as Writer.writerows().
+
+    Instead of preparing every field through the quote strategy, the batch
+    is transposed into columns and every column is formatted in one go. For
+    QUOTE_NONNUMERIC the formatter is chosen based on the python types of
+    the column values (which are decided by the type casters of the column
+    data type):
+
+    * numeric  - str() of the values, not quoted.
+    * text     - str (incl. json, date/time etc. type casted to str) and
+                 other non numeric values, quoted with the quotechar
+                 doubled, when present in the batch.
+    * mixed    - fall back to the quote strategy for every value.
+
+    Dialects using an escapechar, doublequote=False or single column rows
+    are handled by the Writer itself.
+    """
+
+    def __init__(self, fileobj, dialect='excel', **fmtparams):
+        self.writer = Writer(fileobj, dialect, **fmtparams)
+        self.fileobj = fileobj
+        self.dialect = self.writer.dialect
+        self.strategy = self.writer.strategy
+        self._numeric_types = dict()
+
+        dialect = self.dialect
+        self.vectorized = dialect.escapechar is None and \
+            dialect.doublequote and \
+            (dialect.quotechar is not None or dialect.quoting == QUOTE_NONE)
+        self.null_value = str(dialect.replace_nulls_with) \
+            if dialect.replace_nulls_with is not None else ''
+
+    def writeheader(self, fieldnames):
+        return self.writer.writerow(fieldnames)
+
+    def writerows(self, rows):
+        if not rows:
+            return
+        if not self.vectorized or len(rows[0]) == 1:
+            replace_nulls_with = self.dialect.replace_nulls_with
+            if replace_nulls_with is not None:
+                rows = ([replace_nulls_with if value is None else value
+                         for value in row] for row in rows)
+            return self.writer.writerows(rows)
+
+        lineterminator = self.dialect.lineterminator
+        columns = [self._format_column(col) for col in zip(*rows)]
+        self.fileobj.write(
+            lineterminator.join(
+                map(self.dialect.delimiter.join, zip(*columns))
+            ) + lineterminator
+        )
+
+    def _is_numeric(self, col_type):
+        numeric = self._numeric_types.get(col_type)
+        if numeric is None:
+            numeric = issubclass(col_type, numbers.Number)
+            self._numeric_types[col_type] = numeric
+        return numeric
+
+    def _format_column(self, values):
+        types = set(map(type, values))
+        has_nulls = type(None) in types
+        types.discard(type(None))
+
+        if not types:
+            return [self.null_value] * len(values)
+
+        quoting = self.dialect.quoting
+        if quoting == QUOTE_NONE:
+            return self._format_unquoted(values, types, has_nulls)
+        if quoting == QUOTE_MINIMAL:
+            return self._format_minimal(values, types, has_nulls)
+        if quoting == QUOTE_ALL:
+            return self._format_quoted(values, types, has_nulls)
+
+        numeric = [self._is_numeric(t) for t in types]
+        if all(numeric):
+            return self._format_unquoted(values, types, has_nulls)
+        if not any(numeric):
+            return self._format_quoted(values, types, has_nulls)
+
+        # Mixed numeric and non numeric values in the column.
+        prepare = self.strategy.prepare
+        replace_nulls_with = self.dialect.replace_nulls_with
+        return [prepare(replace_nulls_with if value is None else value)
+                for value in values]
+
+    def _format_unquoted(self, values, types, has_nulls):
+        # No escapechar, so the unquoted fields are written as they are.
+        if not has_nulls:
+            return values if types == {str} else list(map(str, values))
+
+        null_value = self.null_value
+        return [null_value if value is None else str(value)
+                for value in values]
+
+    def _format_quoted(self, values, types, has_nulls):
+        replace_nulls_with = self.dialect.replace_nulls_with
+        fields = values if types == {str} else [
+            None if value is None else str(value) for value in values
+        ]
+
+        quotechar = self.dialect.quotechar
+        if quotechar in ''.join(
+                filter(None, fields) if has_nulls else fields):
+            doubled = quotechar + quotechar
+            fields = [None if field is None
+                      else field.replace(quotechar, doubled)
+                      for field in fields]
+
+        if replace_nulls_with is None:
+            if not has_nulls:
+                return [quotechar + field + quotechar for field in fields]
+            return ['' if field is None else quotechar + field + quotechar
+                    for field in fields]
+
+        # The values equal to replace_nulls_with are not quoted either.
+        null_value = self.null_value
+        return [
+            null_value if value is None
+            else str(value) if value == replace_nulls_with
+            else quotechar + field + quotechar
+            for value, field in zip(values, fields)
+        ]
+
+    def _format_minimal(self, values, types, has_nulls):
+        fields = self._format_unquoted(values, types, has_nulls)
+        quoted_re = self.strategy.quoted_re
+        if not quoted_re.search(''.join(fields)):
+            return fields
+
+        quotechar = self.dialect.quotechar
+        doubled = quotechar + quotechar
+        return [
+            quotechar + field.replace(quotechar, doubled) + quotechar
+            if quoted_re.search(field) else field
+            for field in fields
+        ]
+
+
 START_RECORD = 0
 START_FIELD = 1
 ESCAPED_CHAR = 2
@@ -14,6 +14,7 @@ object.
 """
 
 import os
+import sys
 import secrets
 import datetime
 import asyncio
@@ -35,6 +36,7 @@ from .typecast import register_global_typecasters,\
     register_string_typecasters, register_binary_typecasters, \
     register_array_to_string_typecasters, ALL_JSON_TYPES
 from .encoding import get_encoding, configure_driver_encodings
+from .copy_csv import get_copy_csv_statement
 from pgadmin.utils import csv
 from pgadmin.utils.master_password import get_crypt_key
 from io import StringIO
@@ -858,34 +860,32 @@ WHERE db.datname = current_database()""")
             return False, \
                 gettext('The query executed did not return any data.')
 
-        def handle_null_values(results, replace_nulls_with):
-            """
-            This function is used to replace null values with the given string
-
-            :param results:
-            :param replace_nulls_with: null values will be replaced by this
-            string.
-            :return: modified result
-            """
-
-            temp_results = []
-            for row in results:
-                res = dict()
-                for k, v in row.items():
-                    if v is None:
-                        res[k] = replace_nulls_with
-                    else:
-                        res[k] = v
-                temp_results.append(res)
-            results = temp_results
+        def fetch_batches(cached_rows):
+            # The rows cached by the caller (if any) are served first, and
+            # only the rest is fetched from the cursor.
+            position = 0
+            for results in cached_rows or ():
+                position += len(results)
+                yield results
 
-            return results
+            try:
+                cur.scroll(position, mode='absolute')
+            except (psycopg.Error, IndexError):
+                # End of records
+                return
+
+            while True:
+                results = cur.fetchmany(records, _tupples=True)
+                if not results:
+                    return
+                yield results
 
         def gen(conn_obj, trans_obj, quote='strings', quote_char="'",
-                field_separator=',', replace_nulls_with=None):
+                field_separator=',', replace_nulls_with=None,
+                cached_rows=None):
 
-            cur.scroll(0, mode='absolute')
-            results = cur.fetchmany(records)
+            batches = fetch_batches(cached_rows)
+            results = next(batches, None)
             if not results:
                 yield gettext('The query executed did not return any data.')
                 return
@@ -900,8 +900,6 @@ WHERE db.datname = current_database()""")
                 if c.to_dict()['type_code'] in ALL_JSON_TYPES:
                     json_columns.append(column_name)
 
-            res_io = StringIO()
-
             if quote == 'strings':
                 quote = csv.QUOTE_NONNUMERIC
             elif quote == 'all':
@@ -909,41 +907,26 @@ WHERE db.datname = current_database()""")
             else:
                 quote = csv.QUOTE_NONE
 
-            csv_writer = csv.DictWriter(
-                res_io, fieldnames=header, delimiter=field_separator,
+            # The buffer is reused for all the batches, the null values are
+            # replaced with the given string (if configured) by the writer.
+            res_io = StringIO()
+            csv_writer = csv.BatchWriter(
+                res_io, delimiter=field_separator,
                 quoting=quote,
                 quotechar=quote_char,
                 replace_nulls_with=replace_nulls_with
             )
 
-            csv_writer.writeheader()
-            # Replace the null values with given string if configured.
-            if replace_nulls_with is not None:
-                results = handle_null_values(results, replace_nulls_with)
-            csv_writer.writerows(results)
-
-            yield res_io.getvalue()
+            csv_writer.writeheader(header)
 
-            while True:
-                results = cur.fetchmany(records)
-
-                if not results:
-                    break
-                res_io = StringIO()
-
-                csv_writer = csv.DictWriter(
-                    res_io, fieldnames=header, delimiter=field_separator,
-                    quoting=quote,
-                    quotechar=quote_char,
-                    replace_nulls_with=replace_nulls_with
-                )
-
-                # Replace the null values with given string if configured.
-                if replace_nulls_with is not None:
-                    results = handle_null_values(results, replace_nulls_with)
+            while results:
                 csv_writer.writerows(results)
                 yield res_io.getvalue()
 
+                res_io.seek(0)
+                res_io.truncate()
+                results = next(batches, None)
+
             try:
                 # try to reset the cursor scroll back to where it was,
                 # bypass error, if cannot scroll back
@@ -961,6 +944,151 @@ WHERE db.datname = current_database()""")
         register_string_typecasters(self.conn)
         return True, gen, self
 
+    def execute_on_server_as_copy(self, quote='strings', quote_char="'",
+                                  field_separator=',',
+                                  replace_nulls_with=None,
+                                  chunk_size=65536):
+        """
+        To execute the query of the async cursor again, wrapped in
+        COPY (query) TO STDOUT, and stream the CSV output generated by the
+        server.
+
+        Args:
+            quote: 'strings', 'all' or 'none'
+            quote_char: Quote character
+            field_separator: Field separator
+            replace_nulls_with: String to represent the null values
+            chunk_size: Minimum size of the chunks yielded
+        Returns:
+            (True, generator of the CSV chunks), or (False, reason) when the
+            query cannot be wrapped in COPY, in which case the caller should
+            use execute_on_server_as_csv.
+        """
+        cur = self.__async_cursor
+        if not cur or cur.query is None:
+            return False, self.CURSOR_NOT_FOUND
+
+        if self.conn.pgconn.connect_poll() != 3:
+            return False, gettext(
+                "Asynchronous query execution/operation underway."
+            )
+
+        if cur.description is None:
+            return False, \
+                gettext('The query executed did not return any data.')
+
+        # An error in COPY would abort the transaction block of the user,
+        # hence only used outside of the transaction block.
+        if self.transaction_status() != psycopg.pq.TransactionStatus.IDLE:
+            return False, gettext(
+                "The query cannot be wrapped in COPY inside a transaction."
+            )
+
+        encoding = self.python_encoding
+        description = [c.to_dict() for c in cur.ordered_description()]
+        try:
+            query = str(cur.query, encoding)
+        except Exception:
+            return False, gettext('Error encoding query with {0}').format(
+                encoding)
+
+        statement = get_copy_csv_statement(
+            query,
+            [(c['display_name'], c['type_code']) for c in description],
+            quote=quote, quote_char=quote_char,
+            field_separator=field_separator,
+            replace_nulls_with=replace_nulls_with
+        )
+        if statement is None:
+            return False, gettext("The query cannot be wrapped in COPY.")
+
+        current_app.logger.log(
+            25,
+            "Execute (copy) by {pga_user} on "
+            "{db_user}@{db_host}/{db_name} #{server_id} - "
+            "{conn_id} (Query-id: {query_id}):\n{query}".format(
+                pga_user=current_user.email,
+                db_user=self.conn.info.user,
+                db_host=self.conn.info.host,
+                db_name=self.conn.info.dbname,
+                server_id=self.manager.sid,
+                conn_id=self.conn_id,
+                query=query,
+                query_id=self.__async_query_id
+            )
+        )
+
+        # The COPY is read across multiple requests to the generator, hence
+        # a dedicated event loop is used until it is complete.
+        loop = asyncio.new_event_loop()
+
+        def close_loop():
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.close()
+
+        copy_ctx = self.conn.cursor().copy(statement)
+        try:
+            copy = loop.run_until_complete(copy_ctx.__aenter__())
+        except psycopg.Error as pe:
+            close_loop()
+            errmsg = self._formatted_exception_msg(pe, True)
+            current_app.logger.warning(
+                "Failed to execute query (copy) for the server "
+                "#{server_id} - {conn_id}:\nError Message:{errmsg}".format(
+                    server_id=self.manager.sid,
+                    conn_id=self.conn_id,
+                    errmsg=errmsg
+                )
+            )
+            return False, errmsg
+
+        # The header is written as in execute_on_server_as_csv, but with the
+        # line terminator used by COPY.
+        res_io = StringIO()
+        csv.Writer(
+            res_io, delimiter=field_separator,
+            quoting=csv.QUOTE_ALL if quote == 'all' else
+            csv.QUOTE_NONNUMERIC,
+            quotechar=quote_char,
+            lineterminator='\n',
+            replace_nulls_with=replace_nulls_with
+        ).writerow([c['name'] for c in description])
+
+        # The generator is consumed outside of the application context.
+        logger = current_app.logger
+
+        def gen():
+            exc_info = (None, None, None)
+            try:
+                chunks = [res_io.getvalue()]
+                size = 0
+                while True:
+                    data = loop.run_until_complete(copy.read())
+                    if not data:
+                        break
+                    chunks.append(str(data, encoding))
+                    size += len(data)
+                    if size >= chunk_size:
+                        yield ''.join(chunks)
+                        chunks = []
+                        size = 0
+                if chunks:
+                    yield ''.join(chunks)
+            except BaseException:
+                exc_info = sys.exc_info()
+                raise
+            finally:
+                # In case of error (or the client went away), this cancels
+                # the COPY on the server.
+                try:
+                    loop.run_until_complete(copy_ctx.__aexit__(*exc_info))
+                except psycopg.Error as pe:
+                    logger.warning(str(pe))
+                finally:
+                    close_loop()
+
+        return True, gen
+
     def execute_scalar(self, query, params=None,
                        formatted_exception_msg=False):
         status, cur = self.__cursor()
@@ -1442,6 +1570,15 @@ Failed to reset the connection to the server due to following error:
     def async_query_error(self):
         return self.__async_query_error
 
+    def async_query_id(self):
+        """
+        Returns the id of the query executed asynchronously, which
+        identifies the result of the async cursor.
+        """
+        if not self.__async_cursor:
+            return None
+        return '{0}#{1}'.format(self.conn_id, self.__async_query_id)
+
     def ping(self):
         return self.execute_scalar('SELECT 1')
 
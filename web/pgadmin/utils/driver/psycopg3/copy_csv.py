@@ -0,0 +1,122 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2024, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""
+Wrap the query of the Query Tool in COPY ... TO STDOUT, to let the server
+generate the CSV output for the download.
+
+Only a single plain SELECT statement (optionally with read-only CTEs) is
+wrapped, as the query is executed again. The statements modifying data,
+creating tables (SELECT INTO) or locking rows are left to the regular path.
+"""
+
+import sqlparse
+from psycopg import sql
+from sqlparse import tokens as T
+
+# The data types, which are not quoted when quoting is set to 'strings'
+# (int2, int4, int8, oid, float4, float8, numeric, bool).
+NON_STRING_TYPES = (21, 23, 20, 26, 700, 701, 1700, 16)
+
+_DISALLOWED_KEYWORDS = ('INTO',)
+
+
+def get_plain_select(query):
+    """
+    Returns the query without comments and trailing semicolon if it is a
+    single plain SELECT statement, otherwise None.
+    """
+    query = sqlparse.format(query, strip_comments=True)
+    statements = [stmt for stmt in sqlparse.parse(query)
+                  if stmt.value.strip().rstrip(';').strip()]
+    if len(statements) != 1 or statements[0].get_type() != 'SELECT':
+        return None
+
+    for token in statements[0].flatten():
+        if token.ttype in T.DML and token.normalized != 'SELECT':
+            # Data modifying CTE, or SELECT ... FOR UPDATE
+            return None
+        if token.ttype in T.Keyword and \
+                token.normalized in _DISALLOWED_KEYWORDS:
+            return None
+
+    query = statements[0].value.strip()
+    while query.endswith(';'):
+        query = query[:-1].rstrip()
+    return query
+
+
+def _valid_char(char):
+    return char is not None and len(char.encode('utf-8')) == 1 and \
+        char not in ('\r', '\n', '\\')
+
+
+def get_copy_csv_statement(query, columns, quote='strings', quote_char="'",
+                           field_separator=',', replace_nulls_with=None):
+    """
+    Build the COPY (query) TO STDOUT statement producing the CSV output as
+    per the CSV preferences.
+
+    Args:
+        query: Query executed in the Query Tool
+        columns: list of (column name, type oid) of the query result
+        quote: 'strings', 'all' or 'none'
+        quote_char: Quote character
+        field_separator: Field separator
+        replace_nulls_with: String to represent the null values
+
+    Returns:
+        psycopg.sql.Composed object, or None when the query (or the
+        preferences) cannot be expressed with COPY.
+    """
+    # COPY always quotes the values having the separator, quote character
+    # or a new line in CSV format, hence 'none' can't be honoured.
+    if quote not in ('strings', 'all'):
+        return None
+
+    if not _valid_char(quote_char) or not _valid_char(field_separator) or \
+            quote_char == field_separator:
+        return None
+
+    null_string = replace_nulls_with or ''
+    if any(char in null_string for char in
+           (quote_char, field_separator, '\r', '\n', '\\')):
+        return None
+
+    query = get_plain_select(query)
+    if not query:
+        return None
+
+    options = [
+        sql.SQL('FORMAT csv'),
+        sql.SQL('DELIMITER {0}').format(sql.Literal(field_separator)),
+        sql.SQL('QUOTE {0}').format(sql.Literal(quote_char)),
+        sql.SQL('NULL {0}').format(sql.Literal(null_string)),
+    ]
+
+    names = [name for name, _ in columns]
+    if quote == 'all':
+        quoted = names
+    else:
+        quoted = [name for name, type_code in columns
+                  if type_code not in NON_STRING_TYPES]
+
+    if quoted and len(quoted) == len(names):
+        options.append(sql.SQL('FORCE_QUOTE *'))
+    elif quoted:
+        # Columns are referred by name, which must not be ambiguous.
+        if len(set(names)) != len(names):
+            return None
+        options.append(sql.SQL('FORCE_QUOTE ({0})').format(
+            sql.SQL(', ').join(map(sql.Identifier, quoted))))
+
+    # The query is kept on its own lines, so that a trailing comment (if
+    # any) can't swallow the closing parenthesis.
+    return sql.SQL('COPY (\n{0}\n) TO STDOUT WITH ({1})').format(
+        sql.SQL(query), sql.SQL(', ').join(options))
@@ -11,9 +11,12 @@
 Implementation of ServerManager
 """
 import os
+import copy
 import datetime
 import config
 import logging
+import threading
+from contextlib import contextmanager
 from flask import current_app, session
 from flask_security import current_user
 from flask_babel import gettext
@@ -37,6 +40,10 @@ if config.SUPPORT_SSH_TUNNEL:
 CONN_STRING = 'CONN:{0}'
 DB_STRING = 'DB:{0}'
 
+# Per thread: {sid: (prefix, ids of the dedicated connections)}, see
+# ServerManager.dedicated_connections()
+_dedicated = threading.local()
+
 
 class ServerManager(object):
     """
@@ -49,6 +56,9 @@ class ServerManager(object):
 
     def __init__(self, server):
         self.connections = dict()
+        self.dedicated_conn_ids = set()
+        # Whether the manager is restored from the session (see detached())
+        self.in_session = True
         self.local_bind_host = '127.0.0.1'
         self.local_bind_port = None
         self.tunnel_object = None
@@ -163,8 +173,12 @@ class ServerManager(object):
 
         connections = res['connections'] = dict()
 
-        for conn_id in self.connections:
-            conn = self.connections[conn_id].as_dict()
+        # The connections may be added by the worker threads meanwhile.
+        for conn_id, conn in list(self.connections.items()):
+            # Dedicated connections are not restored in the later requests.
+            if conn_id in self.dedicated_conn_ids:
+                continue
+            conn = conn.as_dict()
 
             if conn is not None:
                 connections[conn_id] = conn
@@ -254,6 +268,13 @@ WHERE db.oid = {0}""".format(did))
             else:
                 raise ConnectionLost(self.sid, None, None)
 
+        dedicated = getattr(_dedicated, 'managers', dict()).get(self.sid) \
+            if conn_id is None else None
+        if dedicated is not None:
+            conn_id = '{0}:{1}'.format(dedicated[0], database)
+            if async_ is None:
+                async_ = False
+
         my_id = (CONN_STRING.format(conn_id)) if conn_id is not None else \
             (DB_STRING.format(database))
 
@@ -266,15 +287,54 @@ WHERE db.oid = {0}""".format(did))
                 async_ = 1 if conn_id is not None else 0
             else:
                 async_ = 1 if async_ is True else 0
-            self.connections[my_id] = Connection(
+            conn = Connection(
                 self, my_id, database, auto_reconnect=auto_reconnect,
                 async_=async_,
                 use_binary_placeholder=use_binary_placeholder,
                 array_to_string=array_to_string
             )
+            if dedicated is not None:
+                # Unlike the default connections, these are not connected
+                # by anyone else.
+                status, msg = conn.connect()
+                if not status:
+                    raise InternalServerError(msg)
+                dedicated[1].add(conn_id)
+                self.dedicated_conn_ids.add(my_id)
+            self.connections[my_id] = conn
 
             return self.connections[my_id]
 
+    @contextmanager
+    def dedicated_connections(self, prefix):
+        """
+        Within this context, the connections requested by the current thread
+        without a connection id are dedicated to the thread (one for each
+        database), instead of the default connections shared by the session.
+        That allows the worker threads to run the queries of the views on
+        the server concurrently. The dedicated connections are released on
+        exit.
+
+        :param prefix: Unique prefix for the ids of the dedicated connections
+        """
+        managers = getattr(_dedicated, 'managers', None)
+        if managers is None:
+            managers = _dedicated.managers = dict()
+
+        if self.sid in managers:
+            # Nested, the outermost context releases the connections.
+            yield
+            return
+
+        managers[self.sid] = (prefix, set())
+        try:
+            yield
+        finally:
+            _, conn_ids = managers.pop(self.sid)
+            for conn_id in conn_ids:
+                self.release(conn_id=conn_id)
+                self.dedicated_conn_ids.discard(CONN_STRING.format(conn_id))
+
     @staticmethod
     def _get_password_to_conn(data, masterpass_processed):
         """
@@ -390,8 +450,7 @@ WHERE db.oid = {0}""".format(did))
             self._check_and_reconnect_server(conn, conn_info, data)
 
     def _restore_connections(self):
-        for conn_id in self.connections:
-            conn = self.connections[conn_id]
+        for conn_id, conn in list(self.connections.items()):
             # only try to reconnect if connection was connected previously
             # and auto_reconnect is true.
             was_connected = conn.wasConnected
@@ -511,7 +570,26 @@ WHERE db.oid = {0}""".format(did))
             if conn.conn is not None or conn.wasConnected is True:
                 conn.password = passwd
 
+    def detached(self):
+        """
+        Returns a copy of the manager with the same credentials, and the
+        information of the databases, but none of its connections. The copy
+        is owned by pgAdmin rather than by the session (e.g. the shared
+        samplers of the dashboards), and must be released by its owner.
+        Connecting it requires the request context of a user, whose manager
+        was copied, to decrypt the password.
+        """
+        manager = copy.copy(self)
+        manager.connections = dict()
+        manager.dedicated_conn_ids = set()
+        manager.db_info = copy.deepcopy(self.db_info)
+        manager.in_session = False
+        return manager
+
     def update_session(self):
+        if not self.in_session:
+            return
+
         managers = session['__pgsql_server_managers'] \
             if '__pgsql_server_managers' in session else dict()
         updated_mgr = self.as_dict()
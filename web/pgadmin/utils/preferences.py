@@ -14,17 +14,109 @@ module within the system.
 
 import decimal
 import json
+import time
+from threading import Lock
 
 import dateutil.parser as dateutil_parser
 from flask import current_app
 from flask_babel import gettext
 from flask_security import current_user
 
+import config
 from pgadmin.model import db, Preferences as PrefTable, \
     ModulePreference as ModulePrefTable, UserPreference as UserPrefTable, \
     PreferenceCategory as PrefCategoryTbl
 
 
+class _UserPreferenceCache():
+    """
+    class _UserPreferenceCache
+
+        Process local cache of the preference values of the users.
+
+    All the preference values of a user are loaded with a single query on
+    first use, and served from the cache afterwards, until they are older
+    than USER_PREFERENCES_CACHE_TIMEOUT seconds, or invalidated by a change
+    of the preferences made in this process.
+
+    Class-level Methods:
+    ----------- -------
+    * value(uid, pid)
+      - Returns the value (in string format) of the preference for the user,
+        None if the user has not set it.
+
+    * invalidate(uid)
+      - Removes the cached values of the user (all users if uid is None).
+
+    * stats()
+      - Returns the number of cache hits, and misses.
+    """
+    _lock = Lock()
+    # uid -> (time loaded at, {pid: value})
+    _users = dict()
+    # Incremented on every invalidation, the values loaded before that are
+    # not added to the cache.
+    _generation = 0
+    _hits = 0
+    _misses = 0
+
+    @staticmethod
+    def timeout():
+        return getattr(config, 'USER_PREFERENCES_CACHE_TIMEOUT', 0) or 0
+
+    @classmethod
+    def value(cls, uid, pid):
+        timeout = cls.timeout()
+        now = time.time()
+
+        with cls._lock:
+            entry = cls._users.get(uid)
+            if entry is not None and now - entry[0] < timeout:
+                cls._hits += 1
+                return entry[1].get(pid)
+            cls._misses += 1
+            generation = cls._generation
+
+        if timeout <= 0:
+            res = UserPrefTable.query.filter_by(
+                pid=pid
+            ).filter_by(uid=uid).first()
+            return None if res is None else res.value
+
+        values = dict(
+            (pref.pid, pref.value)
+            for pref in UserPrefTable.query.filter_by(uid=uid).all()
+        )
+
+        with cls._lock:
+            if generation == cls._generation:
+                # Remove the expired entries of the other users too.
+                for key in [key for key, (loaded_at, _) in cls._users.items()
+                            if now - loaded_at >= timeout]:
+                    del cls._users[key]
+                cls._users[uid] = (now, values)
+
+        return values.get(pid)
+
+    @classmethod
+    def invalidate(cls, uid=None):
+        with cls._lock:
+            cls._generation += 1
+            if uid is None:
+                cls._users.clear()
+            else:
+                cls._users.pop(uid, None)
+
+    @classmethod
+    def stats(cls):
+        with cls._lock:
+            return {
+                'users': len(cls._users),
+                'hits': cls._hits,
+                'misses': cls._misses,
+            }
+
+
 class _Preference():
     """
     Internal class representing module, and categoy bound preference.
@@ -105,21 +197,19 @@ class _Preference():
 
         :returns: value for this preference.
         """
-        res = UserPrefTable.query.filter_by(
-            pid=self.pid
-        ).filter_by(uid=current_user.id).first()
+        value = _UserPreferenceCache.value(current_user.id, self.pid)
 
         # Could not find any preference for this user, return default value.
-        if res is None:
+        if value is None:
             return self.default
 
         # The data stored in the configuration will be in string format, we
         # need to convert them in proper format.
-        is_format_data, data = self._get_format_data(res)
+        is_format_data, data = self._get_format_data(value)
         if is_format_data:
             return data
 
-        if self._type == 'text' and res.value == '' and not self.allow_blanks:
+        if self._type == 'text' and value == '' and not self.allow_blanks:
             return self.default
 
         parser_map = {
@@ -130,37 +220,36 @@ class _Preference():
             'keyboardshortcut': json.loads
         }
         try:
-            return parser_map.get(self._type, lambda v: v)(res.value)
+            return parser_map.get(self._type, lambda v: v)(value)
         except Exception as e:
             current_app.logger.exception(e)
             return self.default
-        return res.value
 
-    def _get_format_data(self, res):
+    def _get_format_data(self, value):
         """
         Configuration data get stored in string format, convert it in to
         required format.
-        :param res: type value.
+        :param value: value stored in the configuration.
         """
         if self._type in ('boolean', 'switch', 'node'):
-            return True, res.value == 'True'
+            return True, value == 'True'
         if self._type == 'options':
             for opt in self.options:
-                if 'value' in opt and opt['value'] == res.value:
-                    return True, res.value
+                if 'value' in opt and opt['value'] == value:
+                    return True, value
 
             if self.control_props and self.control_props['creatable']:
-                return True, res.value
+                return True, value
 
             if self.select and self.select['tags']:
-                return True, res.value
+                return True, value
             return True, self.default
         if self._type == 'select':
-            if res.value:
-                res.value = res.value.replace('[', '')
-                res.value = res.value.replace(']', '')
-                res.value = res.value.replace('\'', '')
-                return True, [val.strip() for val in res.value.split(',')]
+            if value:
+                value = value.replace('[', '')
+                value = value.replace(']', '')
+                value = value.replace('\'', '')
+                return True, [val.strip() for val in value.split(',')]
             return True, None
 
         return False, None
@@ -230,6 +319,7 @@ class _Preference():
         else:
             pref.value = value
         db.session.commit()
+        _UserPreferenceCache.invalidate(current_user.id)
 
         return True, None
 
@@ -537,12 +627,6 @@ class Preferences():
 
     @staticmethod
     def raw_value(_module, _preference, _category=None, _user_id=None):
-        # Find the entry for this module in the configuration database.
-        module = ModulePrefTable.query.filter_by(name=_module).first()
-
-        if module is None:
-            return None
-
         if _category is None:
             _category = _module
 
@@ -551,6 +635,19 @@ class Preferences():
             if _user_id is None:
                 return None
 
+        # The preferences registered in this process know their id already.
+        if _module in Preferences.modules:
+            cat = Preferences.modules[_module].categories.get(_category)
+            pref = cat['preferences'].get(_preference) if cat else None
+            if pref is not None:
+                return _UserPreferenceCache.value(_user_id, pref.pid)
+
+        # Find the entry for this module in the configuration database.
+        module = ModulePrefTable.query.filter_by(name=_module).first()
+
+        if module is None:
+            return None
+
         cat = PrefCategoryTbl.query.filter_by(
             mid=module.id).filter_by(name=_category).first()
 
@@ -563,14 +660,7 @@ class Preferences():
         if pref is None:
             return None
 
-        user_pref = UserPrefTable.query.filter_by(
-            pid=pref.id
-        ).filter_by(uid=_user_id).first()
-
-        if user_pref is not None:
-            return user_pref.value
-
-        return None
+        return _UserPreferenceCache.value(_user_id, pref.id)
 
     @classmethod
     def module(cls, name, create=True):
@@ -619,6 +709,7 @@ class Preferences():
         else:
             pref.value = value
         db.session.commit()
+        _UserPreferenceCache.invalidate(user_id)
 
         return True, None
 
@@ -683,6 +774,26 @@ class Preferences():
 
         return True, None
 
+    @classmethod
+    def invalidate_cache(cls, user_id=None):
+        """
+        invalidate_cache
+        Remove the cached preference values of the user, required when the
+        values are changed directly in the configuration database.
+
+        :param user_id: User ID (all users if None)
+        """
+        _UserPreferenceCache.invalidate(user_id)
+
+    @classmethod
+    def cache_stats(cls):
+        """
+        cache_stats
+        Returns the number of the preference values served from the cache
+        (hits) and loaded from the configuration database (misses).
+        """
+        return _UserPreferenceCache.stats()
+
     def migrate_user_preferences(self, pid, converter_func):
         """
         This function is used to migrate user preferences.
@@ -694,3 +805,4 @@ class Preferences():
             pref.value = converter_func(pref.value)
 
         db.session.commit()
+        _UserPreferenceCache.invalidate()
@@ -21,15 +21,16 @@ import hmac
 import hashlib
 import os
 import secrets
+import sqlite3
 import string
 import time
 import config
 from uuid import uuid4
-from threading import Lock
+from threading import Lock, local
 from flask import current_app, request, flash, redirect
 from flask_login import login_url
 
-from pickle import dump, load
+from pickle import dump, load, dumps, loads
 from collections import OrderedDict
 
 from flask.sessions import SessionInterface, SessionMixin
@@ -283,6 +284,203 @@ class FileBackedSessionManager(SessionManager):
             )
 
 
+class SQLiteSessionManager(SessionManager):
+    """
+    Stores the sessions in a SQLite database.
+
+    Every top level key of a session is stored as a separate row, and only
+    the keys, which have been modified since the last write are rewritten
+    (or deleted) when the session is stored. A digest of each stored value
+    is kept with the session object to find the modified keys, which also
+    catches in-place modifications of the nested objects.
+    """
+
+    def __init__(self, path, secret, disk_write_delay, skip_paths=None):
+        self.path = path
+        self.secret = secret
+        self.disk_write_delay = disk_write_delay
+        self.skip_paths = [] if skip_paths is None else skip_paths
+        self._local = local()
+
+        dirname = os.path.dirname(self.path)
+        if dirname and not os.path.exists(dirname):
+            os.makedirs(dirname)
+
+        conn = self._connection()
+        with conn:
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS pga_session ('
+                'sid TEXT PRIMARY KEY, randval TEXT, hmac_digest TEXT, '
+                'last_write REAL NOT NULL)'
+            )
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS pga_session_data ('
+                'sid TEXT NOT NULL, key TEXT NOT NULL, value BLOB, '
+                'PRIMARY KEY (sid, key)) WITHOUT ROWID'
+            )
+
+    def _connection(self):
+        """One connection per thread, as sqlite3 connections can not be
+        shared between the threads."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(
+                self.path, timeout=getattr(config, 'SQLITE_TIMEOUT', 500)
+            )
+            # Readers do not block the writer in WAL mode
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+        return conn
+
+    @staticmethod
+    def _digest(value):
+        return hashlib.blake2b(value, digest_size=16).digest()
+
+    def _skip_path(self):
+        for sp in self.skip_paths:
+            if request.path.startswith(sp):
+                return True
+        return False
+
+    def exists(self, sid):
+        return self._connection().execute(
+            'SELECT 1 FROM pga_session WHERE sid = ?', (sid,)
+        ).fetchone() is not None
+
+    def remove(self, sid):
+        conn = self._connection()
+        with conn:
+            conn.execute('DELETE FROM pga_session_data WHERE sid = ?', (sid,))
+            conn.execute('DELETE FROM pga_session WHERE sid = ?', (sid,))
+
+    def new_session(self):
+        sid = str(uuid4())
+        while self.exists(sid):
+            sid = str(uuid4())
+
+        session = ManagedSession(sid=sid)
+        session.stored_digests = dict()
+
+        # Do not store the session if skip paths
+        if self._skip_path():
+            return session
+
+        conn = self._connection()
+        with conn:
+            conn.execute(
+                'INSERT INTO pga_session (sid, last_write) VALUES (?, ?)',
+                (sid, time.time())
+            )
+        return session
+
+    def get(self, sid, digest):
+        'Retrieve a managed session by session-id, checking the HMAC digest'
+        conn = self._connection()
+        row = conn.execute(
+            'SELECT randval, hmac_digest FROM pga_session WHERE sid = ?',
+            (sid,)
+        ).fetchone()
+
+        data = dict()
+        stored_digests = dict()
+        if row is not None:
+            for key, value in conn.execute(
+                'SELECT key, value FROM pga_session_data WHERE sid = ?',
+                (sid,)
+            ):
+                try:
+                    data[key] = loads(value)
+                    stored_digests[key] = self._digest(value)
+                except Exception:
+                    pass
+
+        if not data:
+            return self.new_session()
+
+        randval, hmac_digest = row
+        if hmac_digest != digest:
+            return self.new_session()
+
+        session = ManagedSession(
+            data, sid=sid, randval=randval, hmac_digest=hmac_digest
+        )
+        session.stored_digests = stored_digests
+        return session
+
+    def put(self, session):
+        """Store the modified keys of a managed session"""
+        current_time = time.time()
+        if not session.hmac_digest:
+            session.sign(self.secret)
+        elif not session.force_write and session.last_write is not None and \
+            (current_time - float(session.last_write)) < \
+                self.disk_write_delay:
+            return
+
+        session.last_write = current_time
+        session.force_write = False
+
+        # Do not store the session if skip paths
+        if self._skip_path():
+            return
+
+        stored_digests = getattr(session, 'stored_digests', None)
+        if stored_digests is None:
+            stored_digests = session.stored_digests = dict()
+
+        changed = []
+        digests = dict()
+        for key, value in dict(session).items():
+            value = dumps(value, -1)
+            digests[key] = self._digest(value)
+            if stored_digests.get(key) != digests[key]:
+                changed.append((session.sid, key, value))
+        removed = [(session.sid, key) for key in stored_digests
+                   if key not in digests]
+
+        self._write_keys(session, changed, removed, current_time)
+        session.stored_digests = digests
+
+    def _write_keys(self, session, changed, removed, current_time):
+        conn = self._connection()
+        with conn:
+            conn.execute(
+                'INSERT OR REPLACE INTO pga_session '
+                '(sid, randval, hmac_digest, last_write) VALUES (?, ?, ?, ?)',
+                (session.sid, session.randval, session.hmac_digest,
+                 current_time)
+            )
+            if changed:
+                conn.executemany(
+                    'INSERT OR REPLACE INTO pga_session_data '
+                    '(sid, key, value) VALUES (?, ?, ?)', changed
+                )
+            if removed:
+                conn.executemany(
+                    'DELETE FROM pga_session_data WHERE sid = ? AND key = ?',
+                    removed
+                )
+
+    def cleanup(self, expiration_time):
+        """
+        Remove the sessions, which have not been written for more than
+        expiration_time (timedelta).
+        """
+        expired_before = time.time() - expiration_time.total_seconds()
+        conn = self._connection()
+        with conn:
+            conn.execute(
+                'DELETE FROM pga_session_data WHERE sid IN ('
+                'SELECT sid FROM pga_session WHERE last_write < ?)',
+                (expired_before,)
+            )
+            conn.execute(
+                'DELETE FROM pga_session WHERE last_write < ?',
+                (expired_before,)
+            )
+
+
 class ManagedSessionInterface(SessionInterface):
     def __init__(self, manager):
         self.manager = manager
@@ -332,14 +530,24 @@ class ManagedSessionInterface(SessionInterface):
 
 
 def create_session_interface(app, skip_paths=[]):
+    if getattr(config, 'SESSION_STORE', 'file') == 'sqlite':
+        session_manager = SQLiteSessionManager(
+            config.SESSION_SQLITE_PATH,
+            app.config['SECRET_KEY'],
+            app.config.get('PGADMIN_SESSION_DISK_WRITE_DELAY', 10),
+            skip_paths
+        )
+    else:
+        session_manager = FileBackedSessionManager(
+            app.config['SESSION_DB_PATH'],
+            app.config['SECRET_KEY'],
+            app.config.get('PGADMIN_SESSION_DISK_WRITE_DELAY', 10),
+            skip_paths
+        )
+
     return ManagedSessionInterface(
         CachingSessionManager(
-            FileBackedSessionManager(
-                app.config['SESSION_DB_PATH'],
-                app.config['SECRET_KEY'],
-                app.config.get('PGADMIN_SESSION_DISK_WRITE_DELAY', 10),
-                skip_paths
-            ),
+            session_manager,
             1000,
             skip_paths
         ))
@@ -393,6 +601,16 @@ def cleanup_session_files():
         LAST_CHECK_SESSION_FILES = datetime.datetime.now()
 
     if iterate_session_files:
+        session_manager = getattr(
+            getattr(current_app.session_interface, 'manager', None),
+            'parent', None
+        )
+        if isinstance(session_manager, SQLiteSessionManager):
+            session_manager.cleanup(
+                current_app.permanent_session_lifetime +
+                datetime.timedelta(days=1)
+            )
+
         for root, dirs, files in os.walk(
                 current_app.config['SESSION_DB_PATH']):
             for file_name in files:
@@ -11,6 +11,7 @@
 
 import re
 import operator
+from bisect import bisect_left
 from itertools import count
 from .completion import Completion
 from collections import namedtuple, defaultdict, OrderedDict
@@ -34,6 +35,7 @@ from .parseutils.meta import FunctionMetadata, ColumnMetadata, ForeignKey
 from .parseutils.utils import last_word
 from .parseutils.tables import TableReference
 from .prioritization import PrevalenceCounter
+from .metadata_cache import MetadataCache
 from flask import render_template
 from pgadmin.utils.driver import get_driver
 from config import PG_DEFAULT_DRIVER
@@ -68,6 +70,21 @@ def Candidate(
 # Used to strip trailing '::some_type' from default-value expressions
 arg_default_type_strip_regex = re.compile(r"::[\w\.]+(\[\])?$")
 
+# The collections of completions with fewer items are scanned, the larger
+# ones are indexed. The indexes of the last few collections are kept.
+MATCH_INDEX_MIN_SIZE = 1000
+MATCH_INDEX_CACHE_SIZE = 8
+
+
+class _LexicalOrder(dict):
+    """The lexical priority of the characters, see find_matches."""
+    def __missing__(self, char):
+        self[char] = 0 if char in " _" else -ord(char)
+        return self[char]
+
+
+_lexical_order = _LexicalOrder()
+
 
 def normalize_ref(ref):
     return ref if ref[0] == '"' else '"' + ref.lower() + '"'
@@ -86,6 +103,79 @@ def generate_alias(tbl):
     )
 
 
+def _unescape_name(name):
+    if name and name[0] == '"' and name[-1] == '"':
+        name = name[1:-1]
+
+    return name
+
+
+class _MatchIndex:
+    """
+    Index of the names (and synonyms) of a collection of completions, used to
+    find the candidates matching the text without scanning all of them:
+     - the unescaped lower case names are sorted, to find the ones starting
+       with the text (strict mode) with a binary search,
+     - the bitmap of the names containing every character, to only match the
+       names containing all the characters of the text against the regex
+       (fuzzy mode).
+    """
+
+    def __init__(self, names, positions):
+        # names[i] is a name of the candidate at positions[i]
+        self.names = names
+        self.positions = positions
+        keys = sorted(zip((_unescape_name(name.lower()) for name in names),
+                          positions))
+        self.keys = [key for key, _ in keys]
+        self.key_positions = [pos for _, pos in keys]
+        self.bitmaps = None
+
+    def starting_with(self, text):
+        """
+        Returns the positions of the candidates with a name starting with
+        the text.
+        """
+        found = set()
+        idx = bisect_left(self.keys, text)
+        while idx < len(self.keys) and self.keys[idx].startswith(text):
+            found.add(self.key_positions[idx])
+            idx += 1
+        return found
+
+    def containing(self, text):
+        """
+        Returns the positions of the candidates with a name containing all
+        the characters of the text.
+        """
+        if self.bitmaps is None:
+            self._build_bitmaps()
+
+        mask = (1 << len(self.names)) - 1
+        for char in set(text):
+            mask &= self.bitmaps.get(char, 0)
+            if not mask:
+                return set()
+
+        # The bits of the mask from the lowest one
+        bits = bin(mask)[:1:-1]
+        return {self.positions[m.start()] for m in re.finditer('1', bits)}
+
+    def _build_bitmaps(self):
+        indexes = defaultdict(list)
+        for idx, name in enumerate(self.names):
+            for char in set(name.lower()):
+                indexes[char].append(idx)
+
+        self.bitmaps = {}
+        size = len(self.names) // 8 + 1
+        for char, idxs in indexes.items():
+            bitmap = bytearray(size)
+            for idx in idxs:
+                bitmap[idx >> 3] |= 1 << (idx & 7)
+            self.bitmaps[char] = int.from_bytes(bitmap, 'little')
+
+
 class SQLAutoComplete():
     """
     class SQLAutoComplete
@@ -104,7 +194,10 @@ class SQLAutoComplete():
         """
 
         self.sid = kwargs['sid'] if 'sid' in kwargs else None
+        self.did = kwargs['did'] if 'did' in kwargs else None
         self.conn = kwargs['conn'] if 'conn' in kwargs else None
+        self.metadata_key = None
+        self.match_indexes = OrderedDict()
         self.keywords = []
         self.name_pattern = re.compile(r"^[_a-z][_a-z0-9\$]*$")
 
@@ -118,6 +211,7 @@ class SQLAutoComplete():
         manager = get_driver(PG_DEFAULT_DRIVER).connection_manager(self.sid)
 
         # we will set template path for sql scripts
+        self.version = manager.version
         self.sql_path = 'sqlautocomplete/sql/#{0}#'.format(manager.version)
 
         self.search_path = []
@@ -140,7 +234,7 @@ class SQLAutoComplete():
             if keywords_in_uppercase:
                 query = render_template(
                     "/".join([self.sql_path, 'keywords.sql']), upper_case=True)
-            status, res = self.conn.execute_dict(query)
+            status, res = self._execute_dict(query)
             if status:
                 for record in res['rows']:
                     # 'public' is a keyword in EPAS database server. Don't add
@@ -174,6 +268,32 @@ class SQLAutoComplete():
         self.qualify_columns = 'if_more_than_one_table'
         self.asterisk_column_order = 'table_order'
 
+    def _execute_dict(self, query):
+        """
+        Runs the query fetching the metadata of the database, the result of
+        which is shared with the other Query Tool tabs connected to it.
+        """
+        if not MetadataCache.enabled():
+            return self.conn.execute_dict(query)
+
+        key = MetadataCache.key(self.sid, self.did, self.version)
+        if key != self.metadata_key:
+            MetadataCache.acquire(key)
+            if self.metadata_key is not None:
+                MetadataCache.release(self.metadata_key)
+            self.metadata_key = key
+
+        return MetadataCache.execute_dict(key, self.conn, query)
+
+    def close(self):
+        """
+        Releases the metadata of the database shared with the other Query
+        Tool tabs.
+        """
+        if self.metadata_key is not None:
+            MetadataCache.release(self.metadata_key)
+            self.metadata_key = None
+
     def _set_search_path(self):
         query = render_template(
             "/".join([self.sql_path, 'schema.sql']), search_path=True)
@@ -184,7 +304,7 @@ class SQLAutoComplete():
 
     def _fetch_schema_name(self, schema_names):
         query = render_template("/".join([self.sql_path, 'schema.sql']))
-        status, res = self.conn.execute_dict(query)
+        status, res = self._execute_dict(query)
         if status:
             for record in res['rows']:
                 schema_names.append(record['schema'])
@@ -204,10 +324,7 @@ class SQLAutoComplete():
 
     def unescape_name(self, name):
         """ Unquote a string."""
-        if name and name[0] == '"' and name[-1] == '"':
-            name = name[1:-1]
-
-        return name
+        return _unescape_name(name)
 
     def escaped_names(self, names):
         return [self.escape_name(name) for name in names]
@@ -466,8 +583,19 @@ class SQLAutoComplete():
                     # fuzzy matches
                     return -float("Infinity"), -match_point
 
+        # Only the candidates which may match are matched against the text
+        if not isinstance(collection, (list, tuple)):
+            collection = list(collection)
+        if len(collection) < MATCH_INDEX_MIN_SIZE:
+            candidates = collection
+        else:
+            index = self._get_match_index(collection)
+            positions = index.containing(text) if fuzzy \
+                else index.starting_with(text)
+            candidates = [collection[pos] for pos in sorted(positions)]
+
         matches = []
-        for cand in collection:
+        for cand in candidates:
             if isinstance(cand, _Candidate):
                 item, prio, display_meta, synonyms, prio2, display = cand
                 if display_meta is None:
@@ -496,12 +624,10 @@ class SQLAutoComplete():
                 # We also use the unescape_name to make sure quoted names have
                 # the same priority as unquoted names.
                 lexical_priority = (
-                    tuple(
-                        0 if c in " _" else -ord(c)
-                        for c in self.unescape_name(item.lower())
-                    ) +
+                    tuple(map(_lexical_order.__getitem__,
+                              self.unescape_name(item.lower()))) +
                     (1,) +
-                    tuple(c for c in item)
+                    tuple(item)
                 )
 
                 priority = (
@@ -525,6 +651,38 @@ class SQLAutoComplete():
                 )
         return matches
 
+    def _get_match_index(self, collection):
+        """
+        Returns the index of the names of the collection, which is built
+        once for the collections with the same names.
+        """
+        if set(map(type, collection)) == {str}:
+            key = tuple(collection)
+        else:
+            key = tuple(
+                tuple(cand.synonyms) if isinstance(cand, _Candidate) else cand
+                for cand in collection)
+
+        index = self.match_indexes.get(key)
+        if index is not None:
+            self.match_indexes.move_to_end(key)
+            return index
+
+        names, positions = [], []
+        for pos, synonyms in enumerate(key):
+            if isinstance(synonyms, tuple):
+                names.extend(synonyms)
+                positions.extend([pos] * len(synonyms))
+            else:
+                names.append(synonyms)
+                positions.append(pos)
+
+        index = _MatchIndex(names, positions)
+        self.match_indexes[key] = index
+        while len(self.match_indexes) > MATCH_INDEX_CACHE_SIZE:
+            self.match_indexes.popitem(last=False)
+        return index
+
     def get_completions(self, text, text_before_cursor):
         self.text_before_cursor = text_before_cursor
 
@@ -1174,7 +1332,7 @@ class SQLAutoComplete():
         query, in_clause = self._get_schema_obj_query(schema, obj_type)
 
         if self.conn.connected():
-            status, res = self.conn.execute_dict(query)
+            status, res = self._execute_dict(query)
             if status:
                 for record in res['rows']:
                     data.append(
@@ -1248,7 +1406,7 @@ class SQLAutoComplete():
         query, _ = self._get_function_sql(schema)
 
         if self.conn.connected():
-            status, res = self.conn.execute_dict(query)
+            status, res = self._execute_dict(query)
             if status:
                 self._get_function_meta_data(res, data)
 
@@ -1272,7 +1430,7 @@ class SQLAutoComplete():
                                     schema_names=schemas,
                                     object_name='view')
         if self.conn.connected():
-            status, res = self.conn.execute_dict(query)
+            status, res = self._execute_dict(query)
             if status:
                 for row in res['rows']:
                     data.append((
@@ -1295,7 +1453,7 @@ class SQLAutoComplete():
                                 schema_names=schemas)
 
         if self.conn.connected():
-            status, res = self.conn.execute_dict(query)
+            status, res = self._execute_dict(query)
             if status:
                 for row in res['rows']:
                     data.append(ForeignKey(
@@ -0,0 +1,182 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2024, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""
+Process local store of the metadata used by the autocompletion of the
+Query Tool.
+
+The results of the queries fetching the keywords, schemas, tables, columns,
+functions, etc. of a database are shared by all the Query Tool tabs
+connected to it, as long as any of them is open. The metadata is keyed by
+the server, the database, the server version and the catalog generation of
+the database (see CatalogCache.generation), so it is fetched again once the
+objects of the database are changed through pgAdmin, on the notifications
+of the changes of the catalogs, and after AUTOCOMPLETE_CACHE_TIMEOUT
+seconds. Up to AUTOCOMPLETE_CACHE_ROWS rows are kept, the least recently
+used results are evicted beyond that.
+"""
+
+import time
+from collections import OrderedDict
+from threading import Lock
+
+import config
+from pgadmin.browser.catalog_cache import CatalogCache
+
+
+class _Result:
+    __slots__ = ('rows', 'fetched_at')
+
+    def __init__(self, rows, fetched_at):
+        self.rows = rows
+        self.fetched_at = fetched_at
+
+
+class MetadataCache:
+    """
+    class MetadataCache
+
+        Shares the autocompletion metadata of a database between the Query
+        Tool tabs connected to it.
+
+    Class-level Methods:
+    ----------- -------
+    * key(sid, did, version)
+      - Returns the key of the current metadata of the database.
+
+    * acquire(key)
+      - Adds a reference to the metadata, which is kept until all the
+        references are released.
+
+    * release(key)
+      - Removes a reference to the metadata, which is dropped along with
+        the last one.
+
+    * execute_dict(key, conn, query)
+      - Returns the cached result of the query, or runs it on the given
+        connection and caches its result.
+
+    * stats()
+      - Returns the cache usage and hit ratio.
+    """
+    _lock = Lock()
+    # key -> number of references
+    _refs = dict()
+    # (key, query) -> result, least recently used first
+    _results = OrderedDict()
+    _rows = 0
+    _hits = 0
+    _misses = 0
+    _evictions = 0
+
+    @staticmethod
+    def enabled():
+        return (getattr(config, 'AUTOCOMPLETE_CACHE_ROWS', 0) or 0) > 0
+
+    @staticmethod
+    def timeout():
+        return getattr(config, 'AUTOCOMPLETE_CACHE_TIMEOUT', 0) or 0
+
+    @staticmethod
+    def key(sid, did, version):
+        """
+        Returns the key of the current metadata of the database, which
+        changes along with its catalogs.
+        """
+        CatalogCache.poll(sid, did)
+        return sid, did, version, CatalogCache.generation(sid, did)
+
+    @classmethod
+    def acquire(cls, key):
+        with cls._lock:
+            cls._refs[key] = cls._refs.get(key, 0) + 1
+
+    @classmethod
+    def release(cls, key):
+        with cls._lock:
+            refs = cls._refs.get(key, 0) - 1
+            if refs > 0:
+                cls._refs[key] = refs
+                return
+
+            cls._refs.pop(key, None)
+            for result_key in [k for k in cls._results if k[0] == key]:
+                cls._drop(result_key)
+
+    @classmethod
+    def execute_dict(cls, key, conn, query):
+        """
+        Returns the result of the query run on the connection, from the
+        cache if the metadata of the database is referenced.
+
+        The rows returned must not be modified.
+
+        Args:
+            key: Key of the metadata returned by key()
+            conn: Connection to the database
+            query: Query fetching the metadata
+        """
+        result_key = (key, query)
+        now = time.time()
+
+        with cls._lock:
+            result = cls._results.get(result_key)
+            if result is not None and \
+                    now - result.fetched_at >= cls.timeout():
+                cls._drop(result_key)
+                result = None
+
+            if result is not None:
+                cls._results.move_to_end(result_key)
+                cls._hits += 1
+                return True, {'rows': result.rows}
+
+            cls._misses += 1
+
+        status, res = conn.execute_dict(query)
+        if not status or not cls.enabled():
+            return status, res
+
+        rows = res['rows']
+        with cls._lock:
+            if key in cls._refs and \
+                    len(rows) <= config.AUTOCOMPLETE_CACHE_ROWS:
+                cls._drop(result_key)
+                cls._results[result_key] = _Result(rows, now)
+                cls._rows += len(rows)
+                cls._evict()
+
+        return status, res
+
+    @classmethod
+    def _drop(cls, result_key):
+        result = cls._results.pop(result_key, None)
+        if result is not None:
+            cls._rows -= len(result.rows)
+
+    @classmethod
+    def _evict(cls):
+        while cls._results and cls._rows > config.AUTOCOMPLETE_CACHE_ROWS:
+            cls._drop(next(iter(cls._results)))
+            cls._evictions += 1
+
+    @classmethod
+    def stats(cls):
+        with cls._lock:
+            requests = cls._hits + cls._misses
+            return {
+                'databases': len(cls._refs),
+                'references': sum(cls._refs.values()),
+                'results': len(cls._results),
+                'rows': cls._rows,
+                'hits': cls._hits,
+                'misses': cls._misses,
+                'hit_ratio': cls._hits / requests if requests else 0.0,
+                'evictions': cls._evictions,
+            }
@@ -0,0 +1,76 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2024, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import random
+from collections import OrderedDict
+from unittest.mock import patch
+
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.utils.sqlautocomplete import autocomplete
+from pgadmin.utils.sqlautocomplete.autocomplete import SQLAutoComplete, \
+    Candidate
+from pgadmin.utils.sqlautocomplete.prioritization import PrevalenceCounter
+
+
+def names(count):
+    rand = random.Random(count)
+    words = ['user', 'order', 'item', 'Account', 'log', 'x', 'a_b']
+    result = []
+    for idx in range(count):
+        name = '_'.join(rand.choice(words) for _ in range(rand.randint(1, 3)))
+        if idx % 7 == 0:
+            name = '"{0} {1}"'.format(name, idx)
+        result.append('{0}{1}'.format(name, idx % 13))
+    return result
+
+
+class AutoCompleteFindMatchesTestCase(BaseTestGenerator):
+    """
+    Check that the indexed collections of completions give the same matches,
+    in the same order, as scanning the collections.
+    """
+
+    scenarios = [
+        ('Strings, strict', dict(
+            candidates=False, mode='strict',
+            texts=['', 'u', 'USER_', 'ord', '"acc', 'x_a', 'zzz', '_'])),
+        ('Strings, fuzzy', dict(
+            candidates=False, mode='fuzzy',
+            texts=['', 'usr', 'oi', '"ac', 'ordit', 'zzz', 'a b', 'ab1'])),
+        ('Candidates with synonyms, strict', dict(
+            candidates=True, mode='strict',
+            texts=['', 'it', 'lo', 'ac', 'zzz'])),
+        ('Candidates with synonyms, fuzzy', dict(
+            candidates=True, mode='fuzzy',
+            texts=['', 'it', 'lg', 'ac', 'zzz'])),
+    ]
+
+    def find_matches(self, text, collection, min_size):
+        with patch.object(autocomplete, 'MATCH_INDEX_MIN_SIZE', min_size):
+            return self.completer.find_matches(
+                text, collection, mode=self.mode, meta='table')
+
+    def runTest(self):
+        self.completer = SQLAutoComplete.__new__(SQLAutoComplete)
+        self.completer.prioritizer = PrevalenceCounter([])
+        self.completer.match_indexes = OrderedDict()
+
+        collection = names(3000)
+        if self.candidates:
+            collection = [
+                Candidate(name, synonyms=[name, name.split('_')[-1]])
+                for name in collection]
+
+        for text in self.texts:
+            expected = self.find_matches(text, collection, float('inf'))
+            result = self.find_matches(text, collection, 0)
+            self.assertEqual(result, expected, text)
+
+        # The index is built once for the collection
+        self.assertEqual(len(self.completer.match_indexes), 1)
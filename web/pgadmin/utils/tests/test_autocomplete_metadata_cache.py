@@ -0,0 +1,128 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2024, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+from collections import OrderedDict
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from pgadmin.browser.catalog_cache import CatalogCache
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.utils.sqlautocomplete import metadata_cache
+from pgadmin.utils.sqlautocomplete.metadata_cache import MetadataCache
+
+TABLES_SQL = 'SELECT tables'
+COLUMNS_SQL = 'SELECT columns'
+
+
+class Connection:
+    def __init__(self):
+        self.queries = []
+
+    def execute_dict(self, query):
+        self.queries.append(query)
+        return True, {'rows': [{'name': query}] * 10}
+
+
+class AutoCompleteMetadataCacheTestCase(BaseTestGenerator):
+    """
+    Check that the autocompletion metadata of a database is fetched once for
+    all the Query Tool tabs, until the catalogs of the database change, the
+    last tab is closed, or the metadata is evicted.
+    """
+
+    scenarios = [
+        ('Metadata shared by the tabs', dict(
+            action=None,
+            expected=[TABLES_SQL, COLUMNS_SQL])),
+        ('Objects of the database changed', dict(
+            action=lambda: CatalogCache.invalidate(1, 5),
+            expected=[TABLES_SQL, COLUMNS_SQL, TABLES_SQL, COLUMNS_SQL])),
+        ('Objects of another database changed', dict(
+            action=lambda: CatalogCache.invalidate(1, 6),
+            expected=[TABLES_SQL, COLUMNS_SQL])),
+        ('Objects of the server changed', dict(
+            action=lambda: CatalogCache.invalidate(1),
+            expected=[TABLES_SQL, COLUMNS_SQL, TABLES_SQL, COLUMNS_SQL])),
+        ('All the tabs closed', dict(
+            action='close',
+            expected=[TABLES_SQL, COLUMNS_SQL, TABLES_SQL, COLUMNS_SQL])),
+        ('Metadata expired', dict(
+            action=None, timeout=0,
+            expected=[TABLES_SQL, COLUMNS_SQL] * 6)),
+        ('Row limit', dict(
+            # Only one of the results fits, the least recently used is
+            # evicted every time.
+            action=None, rows=15,
+            expected=[TABLES_SQL, COLUMNS_SQL] * 6)),
+    ]
+
+    def tab(self):
+        tab = SimpleNamespace(key=MetadataCache.key(1, 5, 160000))
+        MetadataCache.acquire(tab.key)
+        return tab
+
+    def complete(self, tab, conn):
+        for query in (TABLES_SQL, COLUMNS_SQL):
+            status, res = MetadataCache.execute_dict(tab.key, conn, query)
+            self.assertTrue(status)
+            self.assertEqual(res['rows'][0]['name'], query)
+
+    def runTest(self):
+        conn = Connection()
+        config = SimpleNamespace(
+            AUTOCOMPLETE_CACHE_ROWS=getattr(self, 'rows', 1000),
+            AUTOCOMPLETE_CACHE_TIMEOUT=getattr(self, 'timeout', 60))
+
+        with patch.object(metadata_cache, 'config', config), \
+                patch.object(CatalogCache, 'poll',
+                             staticmethod(lambda sid, did: None)), \
+                patch.object(CatalogCache, '_generations', dict()), \
+                patch.object(MetadataCache, '_refs', dict()), \
+                patch.object(MetadataCache, '_results', OrderedDict()), \
+                patch.object(MetadataCache, '_rows', 0), \
+                patch.object(MetadataCache, '_hits', 0), \
+                patch.object(MetadataCache, '_misses', 0):
+            tabs = [self.tab() for _ in range(3)]
+            for tab in tabs:
+                self.complete(tab, conn)
+
+            if self.action == 'close':
+                for tab in tabs:
+                    MetadataCache.release(tab.key)
+                self.assertEqual(MetadataCache.stats()['rows'], 0)
+                tabs = [self.tab()]
+            elif self.action is not None:
+                self.action()
+                tabs = [self.tab()]
+
+            for tab in tabs:
+                self.complete(tab, conn)
+
+            self.assertEqual(conn.queries, self.expected)
+            self.assertLessEqual(MetadataCache.stats()['rows'],
+                                 config.AUTOCOMPLETE_CACHE_ROWS)
+
+
+class ChangesCatalogsTestCase(BaseTestGenerator):
+    """Check the detection of the statements changing the catalogs."""
+
+    scenarios = [
+        ('Query', dict(sql='SELECT * FROM t;', expected=False)),
+        ('DML', dict(sql="INSERT INTO t VALUES ('drop table')",
+                     expected=False)),
+        ('CREATE', dict(sql='create table t (id int)', expected=True)),
+        ('After a comment', dict(sql='-- new column\nALTER TABLE t ADD c int',
+                                 expected=True)),
+        ('In a script', dict(sql='SELECT 1;\n DROP VIEW v;', expected=True)),
+        ('ROLLBACK', dict(sql='ROLLBACK', expected=True)),
+    ]
+
+    def runTest(self):
+        self.assertEqual(CatalogCache.changes_catalogs(self.sql),
+                         self.expected)
@@ -0,0 +1,127 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2024, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import datetime
+import decimal
+
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.utils.columnar import encode_frame, decode_frame, \
+    client_accepts_columnar, COL_NULL, COL_BOOL, COL_INT64, COL_FLOAT64, \
+    COL_TEXT
+from pgadmin.utils.constants import MIMETYPE_APP_COLUMNAR
+
+
+class TestColumnarFrame(BaseTestGenerator):
+    """ This class will test the columnar result frame encoding. """
+
+    scenarios = [
+        ('Columnar frame with typed columns and nulls',
+         dict(
+             rows=[
+                 (1, 'one', True, 1.5, None),
+                 (None, None, False, None, None),
+                 (-(1 << 63), 'ßüñ', None, -0.25, None),
+             ],
+             expected_rows=[
+                 [1, 'one', True, 1.5, None],
+                 [None, None, False, None, None],
+                 [-(1 << 63), 'ßüñ', None, -0.25, None],
+             ],
+             expected_types=[COL_INT64, COL_TEXT, COL_BOOL, COL_FLOAT64,
+                             COL_NULL]
+         )),
+        ('Columnar frame with mixed and non-native values',
+         dict(
+             rows=[
+                 (1, decimal.Decimal('1.10'), {'a': [1, 2]},
+                  datetime.date(2024, 1, 2), 1 << 70),
+                 ('1', decimal.Decimal('2'), None, None, 2),
+             ],
+             expected_rows=[
+                 ['1', '1.1', '{"a":[1,2]}', '2024-01-02',
+                  str(1 << 70)],
+                 ['1', '2.0', None, None, '2'],
+             ],
+             expected_types=[COL_TEXT, COL_TEXT, COL_TEXT, COL_TEXT,
+                             COL_TEXT]
+         )),
+        ('Columnar frame without rows',
+         dict(
+             rows=[],
+             expected_rows=[],
+             expected_types=[]
+         )),
+    ]
+
+    def runTest(self):
+        envelope = {'success': 1, 'data': {'status': 'Success',
+                                           'result': None}}
+        frame = encode_frame(envelope, self.rows)
+        decoded_envelope, decoded_rows = decode_frame(frame)
+
+        self.assertEqual(decoded_envelope, envelope)
+        self.assertEqual(decoded_rows, self.expected_rows)
+        self.assertEqual(self._column_types(frame), self.expected_types)
+
+    def _column_types(self, frame):
+        # Walk the column blocks and collect the type tags.
+        from pgadmin.utils.columnar import _HEADER, _SHAPE
+        _, _, env_len = _HEADER.unpack_from(frame, 0)
+        offset = _HEADER.size + env_len
+        row_count, col_count = _SHAPE.unpack_from(frame, offset)
+        offset += _SHAPE.size
+        bitmap_len = (row_count + 7) >> 3
+
+        types = []
+        for _ in range(col_count):
+            col_type = frame[offset]
+            types.append(col_type)
+            offset += 1
+            if col_type == COL_NULL:
+                continue
+            offset += bitmap_len
+            if col_type == COL_BOOL:
+                offset += bitmap_len
+            elif col_type in (COL_INT64, COL_FLOAT64):
+                offset += row_count * 8
+            else:
+                lengths = frame[offset:offset + row_count * 4]
+                offset += row_count * 4 + sum(
+                    int.from_bytes(lengths[idx:idx + 4], 'little')
+                    for idx in range(0, len(lengths), 4))
+        return types
+
+
+class TestColumnarNegotiation(BaseTestGenerator):
+    """ This class will test the negotiation of the columnar frame. """
+
+    scenarios = [
+        ('Default Accept header of the Query Tool client',
+         dict(accept='application/json, text/plain, */*', expected=False)),
+        ('Wildcard of the application types',
+         dict(accept='application/*', expected=False)),
+        ('Columnar frame requested',
+         dict(accept=MIMETYPE_APP_COLUMNAR + ', application/json',
+              expected=True)),
+        ('Columnar frame refused',
+         dict(accept=MIMETYPE_APP_COLUMNAR + ';q=0, */*', expected=False)),
+    ]
+
+    def runTest(self):
+        from pgadmin.tools.sqleditor import make_result_response
+
+        with self.app.test_request_context(headers={'Accept': self.accept}):
+            self.assertEqual(client_accepts_columnar(), self.expected)
+
+            response = make_result_response({'status': 'Success',
+                                             'result': [[1, 'one']]})
+            self.assertEqual(
+                response.mimetype,
+                MIMETYPE_APP_COLUMNAR if self.expected else
+                'application/json')
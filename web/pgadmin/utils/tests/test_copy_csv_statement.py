@@ -0,0 +1,111 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2024, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+from pgadmin.utils.driver.psycopg3.copy_csv import get_copy_csv_statement
+from pgadmin.utils.route import BaseTestGenerator
+
+TEXT_COLUMNS = [('name', 25), ('data', 3802)]
+
+
+class TestCopyCSVStatement(BaseTestGenerator):
+    """ This class will test the COPY statement generated for the CSV
+    download, and the queries/preferences falling back to the regular
+    download. """
+
+    scenarios = [
+        ('Plain SELECT with comment and semicolon',
+         dict(
+             query="SELECT name, data FROM t; -- comment",
+             columns=TEXT_COLUMNS,
+             options=dict(quote='strings', quote_char='"',
+                          field_separator=';', replace_nulls_with='NULL'),
+             expected="COPY (\nSELECT name, data FROM t\n) TO STDOUT WITH "
+                      "(FORMAT csv, DELIMITER ';', QUOTE '\"', "
+                      "NULL 'NULL', FORCE_QUOTE *)"
+         )),
+        ('SELECT with CTE, only numeric columns',
+         dict(
+             query="/* c */ WITH a AS (SELECT 1 AS id) SELECT * FROM a",
+             columns=[('id', 23), ('price', 1700)],
+             options=dict(quote='strings', quote_char="'",
+                          field_separator=',', replace_nulls_with=None),
+             expected="COPY (\nWITH a AS (SELECT 1 AS id) SELECT * FROM a\n)"
+                      " TO STDOUT WITH (FORMAT csv, DELIMITER ',', "
+                      "QUOTE '''', NULL '')"
+         )),
+        ('Quote all',
+         dict(
+             query="SELECT 1 AS id, 'a;b' AS name",
+             columns=[('id', 23), ('name', 25)],
+             options=dict(quote='all', quote_char="'",
+                          field_separator='\t', replace_nulls_with=''),
+             expected="COPY (\nSELECT 1 AS id, 'a;b' AS name\n) TO STDOUT "
+                      "WITH (FORMAT csv, DELIMITER '\t', QUOTE '''', "
+                      "NULL '', FORCE_QUOTE *)"
+         )),
+        ('Multiple statements',
+         dict(
+             query="SELECT 1; SELECT 2", columns=TEXT_COLUMNS,
+             options=dict(quote='strings'), expected=None
+         )),
+        ('Data modifying CTE',
+         dict(
+             query="WITH d AS (DELETE FROM t RETURNING *) SELECT * FROM d",
+             columns=TEXT_COLUMNS, options=dict(quote='strings'),
+             expected=None
+         )),
+        ('SELECT INTO',
+         dict(
+             query="SELECT * INTO t2 FROM t", columns=TEXT_COLUMNS,
+             options=dict(quote='strings'), expected=None
+         )),
+        ('SELECT FOR UPDATE',
+         dict(
+             query="SELECT * FROM t FOR UPDATE", columns=TEXT_COLUMNS,
+             options=dict(quote='strings'), expected=None
+         )),
+        ('Not a SELECT',
+         dict(
+             query="EXPLAIN SELECT 1", columns=TEXT_COLUMNS,
+             options=dict(quote='strings'), expected=None
+         )),
+        ('Quoting none',
+         dict(
+             query="SELECT 1", columns=TEXT_COLUMNS,
+             options=dict(quote='none'), expected=None
+         )),
+        ('Null string with separator',
+         dict(
+             query="SELECT 1", columns=TEXT_COLUMNS,
+             options=dict(quote='strings', field_separator=',',
+                          replace_nulls_with='a,b'),
+             expected=None
+         )),
+        ('Same quote character and separator',
+         dict(
+             query="SELECT 1", columns=TEXT_COLUMNS,
+             options=dict(quote='strings', quote_char='|',
+                          field_separator='|'),
+             expected=None
+         )),
+        ('Some string columns with duplicate names',
+         dict(
+             query="SELECT 1 AS a, 'x' AS a", columns=[('a', 23), ('a', 25)],
+             options=dict(quote='strings'), expected=None
+         )),
+    ]
+
+    def runTest(self):
+        statement = get_copy_csv_statement(
+            self.query, self.columns, **self.options)
+
+        if self.expected is None:
+            self.assertIsNone(statement)
+        else:
+            self.assertEqual(statement.as_string(None), self.expected)
@@ -0,0 +1,86 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2024, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import datetime
+import decimal
+import uuid
+from io import StringIO
+
+from pgadmin.utils import csv
+from pgadmin.utils.route import BaseTestGenerator
+
+HEADER = ['id', 'name', 'price', 'flag', 'data', 'id-2', 'mixed', 'empty']
+
+ROWS = [
+    (1, 'plain', '10.5', True, '{"a": "b"}', decimal.Decimal('1.10'),
+     1, None),
+    (2, "it's", None, False, '[1, 2, "x,y"]', 2.5, 'text', None),
+    (None, 'say "hi"', '-1e+10', None, None, None, None, None),
+    (4, 'multi\r\nline', 'NaN', True, '{}', -3, decimal.Decimal(0), None),
+    (5, '', 'NULL', False, 'NULL', 0, uuid.UUID(int=5), None),
+    (6, 'sep,;|\t', '', True, "''", 7, datetime.date(2024, 1, 2), None),
+    (7, 'ßüñ \'"', '1', None, None, 1 << 70, 'NULL', None),
+]
+
+SINGLE_COLUMN_ROWS = [('a',), (None,), ("b'c",), (1,)]
+
+
+class TestCSVBatchWriter(BaseTestGenerator):
+    """ This class will test that the BatchWriter output is identical to the
+    DictWriter output (as used by the CSV download earlier). """
+
+    scenarios = [
+        ('Quote strings', dict(quoting=csv.QUOTE_NONNUMERIC)),
+        ('Quote all', dict(quoting=csv.QUOTE_ALL)),
+        ('Quote none', dict(quoting=csv.QUOTE_NONE)),
+        ('Quote minimal', dict(quoting=csv.QUOTE_MINIMAL)),
+    ]
+
+    def runTest(self):
+        for quotechar in ("'", '"'):
+            for delimiter in (',', ';', '|', '\t'):
+                for replace_nulls_with in (None, '', 'NULL'):
+                    params = dict(
+                        delimiter=delimiter, quoting=self.quoting,
+                        quotechar=quotechar,
+                        replace_nulls_with=replace_nulls_with
+                    )
+                    with self.subTest(**params):
+                        self.assertEqual(
+                            self._batch_writer(HEADER, ROWS, params),
+                            self._dict_writer(HEADER, ROWS, params))
+
+        params = dict(quoting=self.quoting, quotechar="'",
+                      replace_nulls_with='NULL')
+        self.assertEqual(
+            self._batch_writer(['col'], SINGLE_COLUMN_ROWS, params),
+            self._dict_writer(['col'], SINGLE_COLUMN_ROWS, params))
+
+    @staticmethod
+    def _dict_writer(header, rows, params):
+        res_io = StringIO()
+        writer = csv.DictWriter(res_io, fieldnames=header, **params)
+        writer.writeheader()
+        replace_nulls_with = params['replace_nulls_with']
+        for row in rows:
+            if replace_nulls_with is not None:
+                row = [replace_nulls_with if v is None else v for v in row]
+            writer.writerow(dict(zip(header, row)))
+        return res_io.getvalue()
+
+    @staticmethod
+    def _batch_writer(header, rows, params):
+        res_io = StringIO()
+        writer = csv.BatchWriter(res_io, **params)
+        writer.writeheader(header)
+        # Write in more than one batch, to check the buffer is appended to.
+        writer.writerows(rows[:3])
+        writer.writerows(rows[3:])
+        writer.writerows([])
+        return res_io.getvalue()
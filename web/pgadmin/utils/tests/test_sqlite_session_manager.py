@@ -0,0 +1,91 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2024, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import os
+import tempfile
+from unittest.mock import patch
+
+from flask import Flask
+
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.utils.session import SQLiteSessionManager
+
+
+class TestSQLiteSessionManager(BaseTestGenerator):
+    """ This class will test that the SQLite session manager stores the
+    session, and rewrites only the modified keys. """
+
+    scenarios = [
+        ('Only the modified key is rewritten',
+         dict(
+             update=lambda session: session.update(
+                 {'gridData': {'1': 'modified'}}),
+             expected_changed_keys=['gridData'],
+             expected_removed_keys=[],
+         )),
+        ('In-place modification of a nested value is detected',
+         dict(
+             update=lambda session: session['gridData'].update(
+                 {'2': 'added'}),
+             expected_changed_keys=['gridData'],
+             expected_removed_keys=[],
+         )),
+        ('Removed key is deleted',
+         dict(
+             update=lambda session: session.pop('user_info'),
+             expected_changed_keys=[],
+             expected_removed_keys=['user_info'],
+         )),
+        ('Unchanged session does not rewrite any key',
+         dict(
+             update=lambda session: None,
+             expected_changed_keys=[],
+             expected_removed_keys=[],
+         )),
+    ]
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.manager = SQLiteSessionManager(
+            os.path.join(self.tmp_dir.name, 'sessions.db'), 'secret', 0)
+        self.flask_app = Flask(__name__)
+
+    def runTest(self):
+        with self.flask_app.test_request_context('/'):
+            session = self.manager.new_session()
+            session['gridData'] = {'1': 'initial'}
+            session['user_info'] = {'name': 'pgadmin'}
+            session['_id'] = 'some id'
+            self.manager.put(session)
+
+            session = self.manager.get(session.sid, session.hmac_digest)
+            self.assertEqual(session['gridData'], {'1': 'initial'})
+
+            self.update(session)
+            expected = dict(session)
+
+            with patch.object(self.manager, '_write_keys',
+                              wraps=self.manager._write_keys) as write_mock:
+                self.manager.put(session)
+                _, changed, removed, _ = write_mock.call_args[0]
+
+            self.assertEqual([key for _, key, _ in changed],
+                             self.expected_changed_keys)
+            self.assertEqual([key for _, key in removed],
+                             self.expected_removed_keys)
+
+            stored = self.manager.get(session.sid, session.hmac_digest)
+            self.assertEqual(dict(stored), expected)
+
+            self.manager.remove(session.sid)
+            self.assertFalse(self.manager.exists(session.sid))
+
+    def tearDown(self):
+        self.manager._connection().close()
+        self.tmp_dir.cleanup()
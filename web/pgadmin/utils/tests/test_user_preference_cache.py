@@ -0,0 +1,91 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2024, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+from unittest.mock import patch, MagicMock
+
+from pgadmin.utils import preferences
+from pgadmin.utils.preferences import _Preference, _UserPreferenceCache
+from pgadmin.utils.route import BaseTestGenerator
+
+
+def _preference(pid, _type, default):
+    # Skip the constructor, which registers the preference in the
+    # configuration database.
+    pref = _Preference.__new__(_Preference)
+    pref.pid = pid
+    pref._type = _type
+    pref.default = default
+    pref.allow_blanks = None
+    pref.options = None
+    pref.control_props = None
+    pref.select = None
+    return pref
+
+
+class UserPreferenceCacheTest(BaseTestGenerator):
+    """
+    Check that the preference values of a user are loaded with a single
+    query, and loaded again once invalidated or expired.
+    """
+
+    scenarios = [
+        ('Values are served from the cache',
+         dict(timeout=60, expected_queries=2)),
+        ('Cache disabled',
+         dict(timeout=0, expected_queries=8)),
+    ]
+
+    def runTest(self):
+        user_prefs = {
+            1: MagicMock(pid=1, value='250'),
+            2: MagicMock(pid=2, value="['a', 'b']"),
+        }
+        table_mock = MagicMock()
+
+        def filter_by(**kwargs):
+            query = MagicMock()
+            if 'pid' in kwargs:
+                query.filter_by.return_value.first.side_effect = \
+                    lambda: user_prefs.get(kwargs['pid'])
+            else:
+                query.all.side_effect = lambda: list(user_prefs.values())
+            return query
+
+        table_mock.query.filter_by.side_effect = filter_by
+
+        with patch.object(preferences, 'UserPrefTable', table_mock), \
+                patch.object(preferences, 'current_user',
+                             MagicMock(id=10)), \
+                patch.object(preferences, 'config',
+                             MagicMock(USER_PREFERENCES_CACHE_TIMEOUT=(
+                                 self.timeout))), \
+                patch.object(_UserPreferenceCache, '_users', dict()), \
+                patch.object(_UserPreferenceCache, '_hits', 0), \
+                patch.object(_UserPreferenceCache, '_misses', 0):
+            count = _preference(1, 'integer', 100)
+            columns = _preference(2, 'select', None)
+            unset = _preference(3, 'boolean', True)
+
+            for _ in range(2):
+                self.assertEqual(count.get(), 250)
+                # The cached value must not be modified while parsed
+                self.assertEqual(columns.get(), ['a', 'b'])
+                self.assertEqual(unset.get(), True)
+
+            # Saving a preference invalidates the values of the user
+            user_prefs[1].value = '500'
+            _UserPreferenceCache.invalidate(10)
+            self.assertEqual(count.get(), 500)
+            self.assertEqual(columns.get(), ['a', 'b'])
+
+            stats = _UserPreferenceCache.stats()
+            self.assertEqual(stats['misses'], self.expected_queries)
+            self.assertEqual(stats['hits'], 8 - self.expected_queries)
+            self.assertEqual(
+                table_mock.query.filter_by.call_count, self.expected_queries)
@@ -231,6 +231,59 @@ describe('ERDCore', ()=>{
       }));
     });
 
+    it('deserializeDataChunk', (done)=>{
+      /* The referencing tables are received before the referenced ones */
+      let tablesData = JSON.parse(JSON.stringify(TEST_TABLES_DATA)).reverse();
+      let nodesDict = {};
+      tablesData.forEach((table)=>{
+        nodesDict[`id-${table.name}`] = {
+          getColumns: function() {
+            return table.columns;
+          },
+          getPortName: function(attnum) {
+            return `port-${attnum}`;
+          },
+          getPort: function(name) {
+            return {'name': name};
+          },
+          addPort: function() {
+            /*This is intentional (SonarQube)*/
+          },
+          getData: function() {
+            return table;
+          }
+        };
+      });
+      jest.spyOn(erdEngine.getModel(), 'getNodesDict').mockReturnValue(nodesDict);
+
+      jest.spyOn(erdCoreObj, 'getNewLink').mockImplementation(function() {
+        return {
+          setSourcePort: function() {/*This is intentional (SonarQube)*/},
+          setTargetPort: function() {/*This is intentional (SonarQube)*/},
+        };
+      });
+      jest.spyOn(erdCoreObj, 'getNewPort').mockReturnValue({id: 'id'});
+      jest.spyOn(erdCoreObj, 'addNode').mockImplementation(function(data) {
+        return new FakeNode({}, `id-${data.name}`);
+      });
+      jest.spyOn(erdCoreObj, 'addLink');
+      jest.spyOn(erdCoreObj, 'dagreDistributeNodes').mockImplementation(()=>{/* intentionally empty */});
+
+      erdCoreObj.deserializeDataChunk(tablesData.slice(0, 1));
+      expect(erdCoreObj.addLink).not.toHaveBeenCalled();
+      erdCoreObj.deserializeDataChunk(tablesData.slice(1));
+      expect(erdCoreObj.addNode).toHaveBeenCalledTimes(tablesData.length);
+      expect(erdCoreObj.addLink).toHaveBeenCalledTimes(1);
+      expect(erdCoreObj.dagreDistributeNodes).not.toHaveBeenCalled();
+      erdCoreObj.deserializeDataEnd();
+      expect(tablesData[0].foreign_key.length).toBe(1);
+
+      setTimeout(()=>{
+        expect(erdCoreObj.dagreDistributeNodes).toHaveBeenCalled();
+        done();
+      }, 500);
+    });
+
     it('deserializeData', (done)=>{
       let nodesDict = {};
       TEST_TABLES_DATA.forEach((table)=>{
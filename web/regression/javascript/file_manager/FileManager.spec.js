@@ -12,7 +12,7 @@ import React from 'react';
 
 import { render } from '@testing-library/react';
 import Theme from '../../../pgadmin/static/js/Theme';
-import FileManager, { FileManagerUtils, getComparator } from '../../../pgadmin/misc/file_manager/static/js/components/FileManager';
+import FileManager, { FileManagerUtils, FILES_PAGE_SIZE } from '../../../pgadmin/misc/file_manager/static/js/components/FileManager';
 import MockAdapter from 'axios-mock-adapter';
 import axios from 'axios';
 import getApiInstance from '../../../pgadmin/static/js/api_instance';
@@ -100,7 +100,7 @@ describe('FileManger', ()=>{
 
   beforeAll(()=>{
     networkMock = new MockAdapter(axios);
-    networkMock.onPost(`/file_manager/filemanager/${transId}/`).reply(200, {data: {result: files}});
+    networkMock.onPost(`/file_manager/filemanager/${transId}/`).reply(200, {data: {result: {Files: files, Total: files.length}}});
     networkMock.onPost(`/file_manager/save_file_dialog_view/${transId}`).reply(200, {});
     networkMock.onDelete(`/file_manager/delete_trans_id/${transId}`).reply(200, {});
   });
@@ -179,38 +179,6 @@ describe('FileManger', ()=>{
       await user.click(ctrl.container.querySelector('[data-label="My Storage"]'));
       expect(ctrl.container.querySelector('button[aria-label="My Storage"]')).not.toBeNull();
     });
-
-    describe('getComparator', ()=>{
-      it('Filename', ()=>{
-        expect(getComparator({columnKey: 'Filename', direction: 'ASC'})({Filename:'a'}, {Filename:'b'})).toBe(-1);
-        expect(getComparator({columnKey: 'Filename', direction: 'DESC'})({Filename:'a'}, {Filename:'b'})).toBe(1);
-        expect(getComparator({columnKey: 'Filename', direction: 'ASC'})({Filename:'a'}, {Filename:'A'})).toBe(-1);
-      });
-
-      it('Properties.DateModified', ()=>{
-        expect(getComparator({columnKey: 'Properties.DateModified', direction: 'ASC'})(
-          {Properties:{'Date Modified':'Tue Feb 25 11:36:28 2020'}}, {Properties:{'Date Modified':'Tue Feb 26 11:36:28 2020'}})
-        ).toBe(-1);
-        expect(getComparator({columnKey: 'Properties.DateModified', direction: 'DESC'})(
-          {Properties:{'Date Modified':'Tue Feb 25 11:36:28 2020'}}, {Properties:{'Date Modified':'Tue Feb 26 11:36:28 2020'}})
-        ).toBe(1);
-        expect(getComparator({columnKey: 'Properties.DateModified', direction: 'ASC'})(
-          {Properties:{'Date Modified':'Tue Feb 25 11:36:28 2020'}}, {Properties:{'Date Modified':'Tue Feb 25 11:36:28 2020'}})
-        ).toBe(0);
-      });
-
-      it('Properties.Size', ()=>{
-        expect(getComparator({columnKey: 'Properties.Size', direction: 'ASC'})(
-          {Properties:{'Size':'1 KB'}}, {Properties:{'Size':'1 MB'}})
-        ).toBe(-1);
-        expect(getComparator({columnKey: 'Properties.Size', direction: 'DESC'})(
-          {Properties:{'Size':'1 MB'}}, {Properties:{'Size':'1 GB'}})
-        ).toBe(1);
-        expect(getComparator({columnKey: 'Properties.Size', direction: 'ASC'})(
-          {Properties:{'Size':'1 MB'}}, {Properties:{'Size':'1 MB'}})
-        ).toBe(0);
-      });
-    });
   });
 });
 
@@ -223,7 +191,12 @@ describe('FileManagerUtils', ()=>{
       let retVal = {};
       let apiData = JSON.parse(config.data);
       let headers = {};
-      if(apiData.mode == 'addfolder') {
+      if(apiData.mode == 'getfolder') {
+        retVal = {data: {result: {
+          Files: files.filter((f)=>f.Filename.includes(apiData.search ?? '')).slice(apiData.offset),
+          Total: files.length,
+        }}};
+      } else if(apiData.mode == 'addfolder') {
         retVal = {data: {result: {
           Name: apiData.name,
           Path: '/home/'+apiData.name,
@@ -286,6 +259,17 @@ describe('FileManagerUtils', ()=>{
     expect(fmObj.join('/dir1/dir2/', 'file1')).toBe('/dir1/dir2/file1');
   });
 
+  it('getFolder', async ()=>{
+    let res = await fmObj.getFolder('/home/', null, {
+      sortColumn: {columnKey: 'Filename', direction: 'DESC'}, search: 'folder', offset: 0,
+    });
+    expect(res).toEqual({Files: [files[1]], Total: files.length});
+    expect(fmObj.currPath).toBe('/home/');
+    expect(JSON.parse(networkMock.history.post[0].data)).toEqual(expect.objectContaining({
+      sort_by: 'Filename', sort_desc: true, search: 'folder', offset: 0, limit: FILES_PAGE_SIZE,
+    }));
+  });
+
   it('addFolder', async ()=>{
     let res = await fmObj.addFolder({Filename: 'newfolder', 'storage_folder': 'my_storage'});
     expect(res).toEqual({
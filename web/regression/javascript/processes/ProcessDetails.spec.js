@@ -10,7 +10,7 @@
 
 import React from 'react';
 
-import { render, waitFor } from '@testing-library/react';
+import { act, render, waitFor } from '@testing-library/react';
 import Theme from '../../../pgadmin/static/js/Theme';
 import MockAdapter from 'axios-mock-adapter';
 import axios from 'axios';
@@ -19,6 +19,11 @@ import { BgProcessManagerProcessState } from '../../../pgadmin/misc/bgprocess/st
 import BgProcessManager from '../../../pgadmin/misc/bgprocess/static/js/BgProcessManager';
 import pgAdmin from 'sources/pgadmin';
 import _ from 'lodash';
+import { openSocket } from '../../../pgadmin/static/js/socket_instance';
+
+jest.mock('../../../pgadmin/static/js/socket_instance', ()=>({
+  openSocket: jest.fn(),
+}));
 
 
 const processData = {
@@ -90,11 +95,36 @@ describe('ProcessDetails', ()=>{
     };
 
     it('running and success', async ()=>{
+      openSocket.mockImplementation(()=>Promise.reject(new Error('socket')));
       let ctrl = ctrlMount({});
       expect(ctrl.container.querySelector('[data-test="notifier-message"]')).toHaveTextContent('Running...');
       await waitFor(()=>{
         expect(ctrl.container.querySelector('[data-test="notifier-message"]')).toHaveTextContent('Successfully completed.');
       }, {timeout: 2000});
     });
+
+    it('logs pushed by the server', async ()=>{
+      let handlers = {};
+      let socket = {
+        on: (event, handler)=>{handlers[event] = handler;},
+        emit: jest.fn(),
+        disconnect: jest.fn(),
+      };
+      openSocket.mockImplementation(()=>Promise.resolve(socket));
+      let ctrl = ctrlMount({});
+      await waitFor(()=>{
+        expect(socket.emit).toHaveBeenCalledWith('subscribe_logs', {pid: processData.id, tail: 1000});
+      });
+
+      let resp = _.cloneDeep(detailsResponse);
+      resp.err.lines = [];
+      act(()=>handlers['process_logs'](resp));
+      await waitFor(()=>{
+        expect(ctrl.container.querySelector('[data-test="notifier-message"]')).toHaveTextContent('Successfully completed.');
+      });
+      expect(ctrl.container.querySelector('[data-test="process-details"]')).toHaveTextContent('INFO: operation log out');
+      ctrl.unmount();
+      expect(socket.disconnect).toHaveBeenCalled();
+    });
   });
 });